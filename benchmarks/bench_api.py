@@ -0,0 +1,111 @@
+"""API 동시 요청 처리량 벤치마크 (ASGI 인프로세스, 대역 서비스).
+
+동시성 수준별로 같은 수의 요청을 보내 처리량(req/s)과 요청 지연 시간을 측정합니다.
+네트워크/서버 프로세스 없이 앱만 측정하며, 실제 서버 부하 테스트는 ps loadtest를
+사용합니다.
+
+사용법:
+    python -m benchmarks.bench_api
+    python -m benchmarks.bench_api --requests 200 --concurrency 1 16 64 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks.stubs import load_corpus, offline_services
+from benchmarks.timing import summarize
+
+CONCURRENCY = (1, 8, 32)
+
+
+def scenarios(companies: list[str]) -> dict:
+    """시나리오 이름 → (메서드, 경로, 요청 본문 생성 함수, 캐시 사용 여부)."""
+    return {
+        "health": ("GET", "/health", None, False),
+        "analyze": (
+            "POST",
+            "/analyze/company",
+            lambda i: {"company_name": companies[i % len(companies)]},
+            False,
+        ),
+        "report_cached": (
+            "POST",
+            "/reports/generate",
+            lambda i: {"company_name": companies[i % len(companies)], "format": "markdown"},
+            True,
+        ),
+    }
+
+
+async def run_scenario(client: AsyncClient, method: str, path: str, body, requests: int, concurrency: int) -> dict:
+    """요청을 동시에 concurrency개씩 보내고 처리량과 지연 시간을 측정합니다."""
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+    errors = 0
+
+    async def send(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.request(method, path, json=body(i) if body else None)
+            samples.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        **summarize(samples),
+        "errors": errors,
+        "requests_per_sec": round(requests / elapsed, 1),
+    }
+
+
+async def run(
+    requests: int = 60,
+    concurrency: tuple[int, ...] = CONCURRENCY,
+    latency: float = 0.0,
+) -> list[dict]:
+    """시나리오별, 동시성 수준별 처리량을 측정합니다."""
+    from src.api.main import create_app
+
+    companies = sorted({d["company"] for d in load_corpus()["documents"]})
+    results = []
+
+    for scenario, (method, path, body, cache) in scenarios(companies).items():
+        async with offline_services(latency=latency, cache=cache):
+            transport = ASGITransport(app=create_app())
+            async with AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+                # 워밍업 (캐시 시나리오는 기업별 분석 결과를 미리 저장)
+                await run_scenario(client, method, path, body, len(companies), len(companies))
+                for level in concurrency:
+                    stats = await run_scenario(client, method, path, body, requests, level)
+                    results.append({
+                        "name": "api",
+                        "scenario": scenario,
+                        "concurrency": level,
+                        "stub_latency_s": latency,
+                        **stats,
+                    })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=60, help="동시성 수준별 요청 수")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(CONCURRENCY))
+    parser.add_argument("--latency", type=float, default=0.0, help="외부 호출 지연 (초)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.requests, tuple(args.concurrency), args.latency))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""임베딩 파이프라인 처리량 벤치마크 (docs/sec).
+
+사용법:
+    python -m benchmarks.bench_embedding                  # hashing (오프라인)
+    python -m benchmarks.bench_embedding --backend onnx   # 로컬 ONNX 모델
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from config.settings import Settings
+from src.graph.embeddings import EmbeddingPipeline, create_embedding_function
+
+BATCH_SIZES = (1, 32, 256)
+
+
+def make_documents(n: int) -> list[str]:
+    """벤치마크용 결정적 문서를 생성합니다."""
+    return [
+        f"{i}번 문서: 삼성전자가 HBM 반도체 공급을 확대하고 3분기 실적을 발표했습니다. " * 4
+        for i in range(n)
+    ]
+
+
+async def run(backend: str, n_docs: int, concurrency: int) -> list[dict]:
+    """배치 크기별 처리량을 측정합니다."""
+    settings = Settings(embedding_backend=backend)
+    function = create_embedding_function(settings)
+    documents = make_documents(n_docs)
+
+    # 모델 로딩 시간 제외
+    function(documents[:1])
+
+    results = []
+    for batch_size in BATCH_SIZES:
+        pipeline = EmbeddingPipeline(
+            function,
+            batch_size=batch_size,
+            max_batch_chars=10_000_000,
+            concurrency=concurrency,
+        )
+        start = time.perf_counter()
+        await pipeline.embed(documents)
+        elapsed = time.perf_counter() - start
+        pipeline.close()
+
+        results.append({
+            "name": "embedding_pipeline",
+            "backend": backend,
+            "batch_size": batch_size,
+            "docs": n_docs,
+            "seconds": round(elapsed, 4),
+            "docs_per_sec": round(n_docs / elapsed, 1),
+        })
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", default="hashing")
+    parser.add_argument("--docs", type=int, default=1024)
+    parser.add_argument("--concurrency", type=int, default=2)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.backend, args.docs, args.concurrency))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""기술적 지표 계산 벤치마크 (데이터 크기별 지연 시간).
+
+사용법:
+    python -m benchmarks.bench_indicators
+    python -m benchmarks.bench_indicators --sizes 100 1000 --iterations 50
+"""
+
+import argparse
+import json
+
+from benchmarks.stubs import make_price_frame
+from benchmarks.timing import measure
+from src.stock.indicators import TechnicalIndicators
+
+SIZES = (63, 252, 2520, 25200)
+
+
+def run(sizes: tuple[int, ...] = SIZES, iterations: int = 20) -> list[dict]:
+    """지표별, 크기별 지연 시간을 측정합니다."""
+    indicators = TechnicalIndicators()
+    results = []
+
+    for size in sizes:
+        frame = make_price_frame("BENCH", size)
+        close, high, low = frame["Close"], frame["High"], frame["Low"]
+        cases = {
+            "rsi": lambda: indicators.rsi(close),
+            "macd": lambda: indicators.macd(close),
+            "bollinger_bands": lambda: indicators.bollinger_bands(close),
+            "sma": lambda: indicators.sma(close, 20),
+            "ema": lambda: indicators.ema(close, 20),
+            "stochastic": lambda: indicators.stochastic(high, low, close),
+            "atr": lambda: indicators.atr(high, low, close),
+        }
+        for indicator, func in cases.items():
+            results.append({
+                "name": "indicators",
+                "indicator": indicator,
+                "size": size,
+                **measure(func, iterations),
+            })
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print(json.dumps(run(tuple(args.sizes), args.iterations), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""CompanyInfoAgent.analyze 전체 파이프라인 벤치마크.
+
+검색, 뉴스, 주식, Graph RAG, LLM 요약 노드를 모두 대역 서비스로 실행합니다.
+외부 호출 지연이 없을 때(0ms)는 프레임워크/직렬화 오버헤드를, 있을 때는
+지연이 파이프라인 전체에 어떻게 누적되는지를 보여줍니다.
+
+사용법:
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --latency 0 0.05 --iterations 5
+"""
+
+import argparse
+import asyncio
+import json
+
+from benchmarks.stubs import offline_services
+from benchmarks.timing import measure_async
+from src.agents import CompanyInfoAgent
+
+LATENCIES = (0.0, 0.02)
+COMPANIES = ("삼성전자", "SK하이닉스", "현대차")
+
+
+async def run(latencies: tuple[float, ...] = LATENCIES, iterations: int = 5) -> list[dict]:
+    """외부 호출 지연별 기업 분석 지연 시간을 측정합니다."""
+    results = []
+    for latency in latencies:
+        async with offline_services(latency=latency) as env:
+            agent = CompanyInfoAgent(env.settings)
+            calls = iter(range(10**9))
+
+            async def analyze():
+                # 기업을 번갈아 분석 (같은 기업 반복으로 인한 캐시 효과 배제)
+                return await agent.analyze(COMPANIES[next(calls) % len(COMPANIES)])
+
+            stats = await measure_async(analyze, iterations)
+            results.append({
+                "name": "agent_analyze",
+                "stub_latency_s": latency,
+                **stats,
+            })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, nargs="+", default=list(LATENCIES))
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(tuple(args.latency), args.iterations))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""리포트 렌더링 벤치마크 (형식별, 뉴스 건수별).
+
+사용법:
+    python -m benchmarks.bench_reports
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+from benchmarks.stubs import quiet_logging
+from benchmarks.timing import measure_async
+from src.models.schemas import CompanyInfo, CompanyReport, NewsItem
+from src.reports import ReportGenerator
+
+FORMATS = ("html", "markdown", "json")
+NEWS_COUNTS = (5, 50)
+
+
+def make_report(news_count: int) -> CompanyReport:
+    """벤치마크용 결정적 분석 결과를 생성합니다."""
+    return CompanyReport(
+        company=CompanyInfo(name="삼성전자", ticker="005930.KS", industry="반도체"),
+        news=[
+            NewsItem(
+                title=f"삼성전자 뉴스 {i}",
+                url=f"https://news.example.com/{i}",
+                source="offline",
+                published_date=datetime(2026, 1, 1) - timedelta(days=i),
+                summary="HBM 공급 확대와 파운드리 수주 동향. " * 5,
+            )
+            for i in range(news_count)
+        ],
+        summary="삼성전자는 메모리 반도체 업황 회복에 힘입어 실적이 개선되고 있습니다. " * 20,
+        generated_at=datetime(2026, 1, 2),
+        sources=[f"https://web.example.com/{i}" for i in range(10)],
+    )
+
+
+async def run(iterations: int = 50) -> list[dict]:
+    """형식별 리포트 렌더링 지연 시간을 측정합니다."""
+    generator = ReportGenerator()
+    results = []
+    with quiet_logging():
+        for news_count in NEWS_COUNTS:
+            report = make_report(news_count)
+            for format in FORMATS:
+                content = await generator.generate(report, format=format)
+                stats = await measure_async(
+                    lambda: generator.generate(report, format=format), iterations
+                )
+                results.append({
+                    "name": "report_render",
+                    "format": format,
+                    "news": news_count,
+                    "bytes": len(content.encode("utf-8")),
+                    **stats,
+                })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.iterations)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""HybridRetriever.search 벤치마크 (임시 ChromaDB + 인메모리 그래프).
+
+캐시를 끈 상태(매번 벡터/그래프 브랜치 실행)와 켠 상태(반복 쿼리)를 비교합니다.
+검색 품질(recall@k)은 benchmarks.eval_retrieval을 사용합니다.
+
+사용법:
+    python -m benchmarks.bench_retrieval
+    python -m benchmarks.bench_retrieval --latency 0.01
+"""
+
+import argparse
+import asyncio
+import json
+
+from benchmarks.stubs import load_corpus, offline_services
+from benchmarks.timing import measure_async
+from src.graph.hybrid import HybridRetriever
+
+
+async def run(latency: float = 0.0, iterations: int = 20) -> list[dict]:
+    """캐시 사용 여부별 하이브리드 검색 지연 시간을 측정합니다."""
+    queries = load_corpus()["queries"]
+    results = []
+
+    for cache in (False, True):
+        async with offline_services(latency=latency, cache=cache) as env:
+            retriever = HybridRetriever(settings=env.settings)
+            calls = iter(range(10**9))
+
+            async def search():
+                query = queries[next(calls) % len(queries)]
+                return await retriever.search(query["query"], query.get("company_name"), n_results=5)
+
+            stats = await measure_async(search, iterations, warmup=len(queries) if cache else 1)
+            results.append({
+                "name": "hybrid_search",
+                "cache": cache,
+                "stub_latency_s": latency,
+                **stats,
+            })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.0, help="그래프 조회 지연 (초)")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.latency, args.iterations))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""StockClient.analyze 벤치마크 (고정 일봉 데이터, yfinance 대역).
+
+사용법:
+    python -m benchmarks.bench_stock
+    python -m benchmarks.bench_stock --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+
+from benchmarks.stubs import offline_services
+from benchmarks.timing import measure_async
+from src.stock import StockClient
+
+PERIODS = ("1mo", "3mo", "1y", "5y")
+
+
+async def run(latency: float = 0.0, iterations: int = 20) -> list[dict]:
+    """조회 기간별 주식 분석 지연 시간을 측정합니다."""
+    results = []
+    async with offline_services(latency=latency) as env:
+        client = StockClient(env.settings)
+        for period in PERIODS:
+            stats = await measure_async(lambda: client.analyze("삼성전자", period=period), iterations)
+            results.append({
+                "name": "stock_analyze",
+                "period": period,
+                "stub_latency_s": latency,
+                **stats,
+            })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.0, help="yfinance 호출 지연 (초)")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.latency, args.iterations))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""하이브리드 검색 융합 전략 오프라인 평가 (recall@k, 지연 시간).
+
+라벨링된 쿼리(benchmarks/data/retrieval_eval.json)를 임시 ChromaDB(hashing 임베딩)와
+인메모리 그래프 저장소로 실행해 융합 전략별 recall@k와 지연 시간을 비교합니다.
+
+사용법:
+    python -m benchmarks.eval_retrieval
+    python -m benchmarks.eval_retrieval --k 3 --fusion rrf
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+
+from benchmarks.stubs import InMemoryGraphRepository
+from config.settings import Settings
+from src.graph.evaluation import evaluate_retriever, load_labeled_queries
+from src.graph.fusion import FUSION_STRATEGIES
+from src.graph.hybrid import HybridRetriever
+from src.graph.vector_store import VectorStore
+
+DATA_PATH = Path(__file__).parent / "data" / "retrieval_eval.json"
+
+
+async def run(fusions: list[str], k: int) -> list[dict]:
+    """융합 전략별 평가 결과를 반환합니다."""
+    data = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    queries = load_labeled_queries(DATA_PATH)
+    graph_repo = InMemoryGraphRepository(data)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = Settings(chroma_persist_dir=tmp, embedding_backend="hashing")
+        store = VectorStore(settings)
+        await store.add_documents([
+            {
+                "id": d["id"],
+                "content": f"{d['title']}\n\n{d['content']}",
+                "metadata": {"company": d["company"], "url": d["url"]},
+            }
+            for d in data["documents"]
+        ])
+
+        results = []
+        for fusion in fusions:
+            retriever = HybridRetriever(store, graph_repo, settings=settings, fusion=fusion)
+            report = await evaluate_retriever(retriever, queries, k=k)
+            report.pop("per_query")
+            results.append({"name": "hybrid_retrieval", "fusion": fusion, **report})
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--fusion", action="append", choices=sorted(FUSION_STRATEGIES))
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.fusion or sorted(FUSION_STRATEGIES), args.k))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""오프라인 대역 서비스로 인프로세스 API 부하 테스트.
+
+`ps loadtest`는 실행 중인 서버(--url)를 대상으로 하고, 이 모듈은 저장소
+체크아웃에서 외부 서비스 없이 같은 부하 생성기(src.api.loadtest)로 앱을 측정합니다.
+
+사용법:
+    python -m benchmarks.loadtest --duration 30 --rps 50
+    python -m benchmarks.loadtest --concurrency 20 --no-cache --output loadtest.json
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks.stubs import offline_services, quiet_logging
+from src.api.loadtest import DEFAULT_MIX, LoadTestResult, parse_mix, run_load_test
+
+
+async def run(
+    mix: str = DEFAULT_MIX,
+    duration: float = 10.0,
+    rps: float | None = None,
+    concurrency: int = 10,
+    latency: float = 0.05,
+    cache: bool = True,
+) -> LoadTestResult:
+    """대역 서비스로 앱을 띄우고 부하 테스트를 실행합니다."""
+    from src.api.main import create_app
+
+    async with offline_services(latency=latency, cache=cache):
+        transport = ASGITransport(app=create_app())
+        async with AsyncClient(
+            transport=transport, base_url="http://loadtest", timeout=60.0
+        ) as client:
+            return await run_load_test(
+                client, mix=parse_mix(mix), duration=duration, rps=rps, concurrency=concurrency
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=10.0, help="요청 생성 시간 (초)")
+    parser.add_argument("--rps", type=float, default=None, help="목표 초당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="엔드포인트 비율")
+    parser.add_argument("--latency", type=float, default=0.05, help="대역 서비스 호출 지연 (초)")
+    parser.add_argument("--no-cache", action="store_true", help="캐시 없이 실행")
+    parser.add_argument("--interval", type=float, default=1.0, help="처리량 집계 구간 (초)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    with quiet_logging():
+        result = asyncio.run(run(
+            args.mix, args.duration, args.rps, args.concurrency, args.latency, not args.no_cache
+        ))
+
+    text = json.dumps(result.to_dict(args.interval), ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""전체 벤치마크 실행 및 커밋 간 비교.
+
+모든 외부 서비스를 대역으로 실행하므로 네트워크/API 키 없이 재현 가능합니다.
+결과는 커밋/환경 정보와 함께 JSON으로 저장하고, 기준 결과와 비교해 지연 시간이
+threshold 이상 늘거나 처리량이 그만큼 줄어든 항목을 회귀로 보고합니다.
+
+사용법:
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --quick --only indicators reports
+    python -m benchmarks.run --output new.json --compare bench.json --threshold 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks import (
+    bench_api,
+    bench_embedding,
+    bench_indicators,
+    bench_pipeline,
+    bench_reports,
+    bench_retrieval,
+    bench_stock,
+    eval_retrieval,
+)
+from benchmarks.stubs import quiet_logging
+from src.graph.fusion import FUSION_STRATEGIES
+
+# 이름 → (기본 실행, 빠른 실행)
+SUITES = {
+    "indicators": (
+        lambda: bench_indicators.run(),
+        lambda: bench_indicators.run((63, 2520), iterations=5),
+    ),
+    "stock": (
+        lambda: asyncio.run(bench_stock.run()),
+        lambda: asyncio.run(bench_stock.run(iterations=3)),
+    ),
+    "pipeline": (
+        lambda: asyncio.run(bench_pipeline.run()),
+        lambda: asyncio.run(bench_pipeline.run((0.0,), iterations=2)),
+    ),
+    "retrieval": (
+        lambda: asyncio.run(bench_retrieval.run()),
+        lambda: asyncio.run(bench_retrieval.run(iterations=5)),
+    ),
+    "retrieval_quality": (
+        lambda: asyncio.run(eval_retrieval.run(sorted(FUSION_STRATEGIES), 5)),
+        lambda: asyncio.run(eval_retrieval.run(["rrf"], 5)),
+    ),
+    "embedding": (
+        lambda: asyncio.run(bench_embedding.run("hashing", 1024, 2)),
+        lambda: asyncio.run(bench_embedding.run("hashing", 128, 2)),
+    ),
+    "reports": (
+        lambda: asyncio.run(bench_reports.run()),
+        lambda: asyncio.run(bench_reports.run(iterations=5)),
+    ),
+    "api": (
+        lambda: asyncio.run(bench_api.run()),
+        lambda: asyncio.run(bench_api.run(requests=16, concurrency=(1, 8))),
+    ),
+}
+
+# 비교 대상이 아닌 측정값 (결과 식별에서 제외)
+MEASUREMENTS = ("iterations", "errors", "bytes", "seconds", "queries")
+# 회귀 판정에 사용하는 대표 지표 (평균/최솟값 등은 기록만 함)
+PRIMARY_METRICS = ("p50_ms", "latency_ms.p50", "requests_per_sec", "docs_per_sec", "recall_at_k")
+
+
+def git_commit() -> str | None:
+    """현재 git 커밋 해시를 반환합니다 (git 저장소가 아니면 None)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def direction(key: str) -> int:
+    """지표 방향 (1: 높을수록 좋음, -1: 낮을수록 좋음, 0: 지표 아님)."""
+    if key.endswith("_per_sec") or key.startswith("recall"):
+        return 1
+    if "_ms" in key:
+        return -1
+    return 0
+
+
+def flatten(result: dict) -> dict:
+    """중첩 지표(예: latency_ms.p50)를 한 단계로 펼칩니다."""
+    flat = {}
+    for key, value in result.items():
+        if isinstance(value, dict):
+            flat.update({f"{key}.{k}": v for k, v in value.items()})
+        else:
+            flat[key] = value
+    return flat
+
+
+def result_key(result: dict) -> tuple:
+    """결과 식별자 (이름과 파라미터)."""
+    return tuple(sorted(
+        (k, v) for k, v in flatten(result).items()
+        if not direction(k) and k not in MEASUREMENTS
+    ))
+
+
+def compare(baseline: list[dict], current: list[dict], threshold: float) -> list[dict]:
+    """기준 대비 threshold 이상 나빠진 지표를 반환합니다."""
+    previous = {result_key(r): flatten(r) for r in baseline}
+    regressions = []
+    for result in current:
+        before = previous.get(result_key(result))
+        if before is None:
+            continue
+        for key, value in flatten(result).items():
+            old = before.get(key)
+            if key not in PRIMARY_METRICS or not isinstance(old, (int, float)) or not old:
+                continue
+            change = (value - old) / old
+            if change * direction(key) < -threshold:
+                regressions.append({
+                    **dict(result_key(result)),
+                    "metric": key,
+                    "baseline": old,
+                    "current": value,
+                    "change": round(change, 3),
+                })
+    return regressions
+
+
+def run(names: list[str], quick: bool = False) -> dict:
+    """선택한 벤치마크를 실행하고 환경 정보와 함께 반환합니다."""
+    results = []
+    with quiet_logging():
+        for name in names:
+            full, fast = SUITES[name]
+            print(f"[bench] {name}...", file=sys.stderr)
+            results.extend((fast if quick else full)())
+
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=list(SUITES), help="실행할 벤치마크")
+    parser.add_argument("--quick", action="store_true", help="반복 횟수를 줄여 빠르게 실행")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (없으면 stdout)")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀 판정 변화율")
+    args = parser.parse_args()
+
+    report = run(args.only or list(SUITES), args.quick)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        report["baseline_commit"] = baseline.get("commit")
+        report["regressions"] = compare(baseline["results"], report["results"], args.threshold)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+        print(f"[bench] 저장: {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    for regression in report.get("regressions", []):
+        print(f"[bench] 회귀: {regression}", file=sys.stderr)
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
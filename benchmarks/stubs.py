@@ -0,0 +1,319 @@
+"""벤치마크용 외부 서비스 대역 (yfinance, Tavily/SerpAPI, OpenAI, Neo4j, Chroma).
+
+모든 대역은 입력만으로 결과가 정해지고(결정적), 네트워크를 사용하지 않으며,
+지정한 고정 지연 시간으로 실제 호출의 대기 시간을 흉내 냅니다.
+
+사용 예:
+    async with offline_services(latency=0.05) as env:
+        report = await CompanyInfoAgent(env.settings).analyze("삼성전자")
+"""
+
+import asyncio
+import json
+import logging
+import tempfile
+import time
+import zlib
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from langchain_core.messages import AIMessage
+
+from config.settings import Settings
+from src.graph.schema import Document, Event
+from src.models.schemas import SearchResponse, SearchResult
+from src.search.base import BaseSearchProvider
+
+DATA_PATH = Path(__file__).parent / "data" / "retrieval_eval.json"
+
+# yfinance period → 거래일 수
+PERIOD_DAYS = {"1d": 1, "5d": 5, "1mo": 21, "3mo": 63, "6mo": 126, "1y": 252, "2y": 504, "5y": 1260}
+
+
+def load_corpus() -> dict:
+    """기업 문서/이벤트/라벨 쿼리 데이터셋을 읽습니다."""
+    return json.loads(DATA_PATH.read_text(encoding="utf-8"))
+
+
+def make_price_frame(symbol: str, days: int) -> pd.DataFrame:
+    """심볼별로 고정된 난수 시드의 OHLCV 일봉을 생성합니다."""
+    rng = np.random.default_rng(zlib.crc32(symbol.encode()))
+    close = 50_000 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, days)))
+    spread = close * rng.uniform(0.005, 0.02, days)
+    index = pd.bdate_range(end=datetime(2026, 1, 2), periods=days, tz="Asia/Seoul")
+    return pd.DataFrame(
+        {
+            "Open": close - spread / 2,
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 20_000_000, days),
+        },
+        index=index,
+    )
+
+
+class FakeTicker:
+    """yfinance.Ticker 대역 (info, history)."""
+
+    def __init__(self, symbol: str, latency: float = 0.0):
+        self.symbol = symbol
+        self.latency = latency
+
+    @property
+    def info(self) -> dict:
+        FakeYFinance.wait(self.latency)
+        return {
+            "symbol": self.symbol,
+            "longName": f"{self.symbol} Corp.",
+            "sector": "Technology",
+            "industry": "Semiconductors",
+            "marketCap": 400_000_000_000_000,
+            "currency": "KRW",
+            "exchange": "KSC",
+            "country": "South Korea",
+        }
+
+    def history(self, period: str = "1mo", interval: str = "1d") -> pd.DataFrame:
+        FakeYFinance.wait(self.latency)
+        return FakeYFinance.frame(self.symbol, PERIOD_DAYS.get(period, 63)).copy()
+
+
+class FakeYFinance:
+    """yfinance 모듈 대역. 같은 (심볼, 기간)의 일봉은 한 번만 생성해 재사용합니다."""
+
+    _frames: dict[tuple[str, int], pd.DataFrame] = {}
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def Ticker(self, symbol: str) -> FakeTicker:  # noqa: N802 (yfinance API 이름)
+        return FakeTicker(symbol, self.latency)
+
+    @classmethod
+    def frame(cls, symbol: str, days: int) -> pd.DataFrame:
+        key = (symbol, days)
+        if key not in cls._frames:
+            cls._frames[key] = make_price_frame(symbol, days)
+        return cls._frames[key]
+
+    @staticmethod
+    def wait(latency: float) -> None:
+        # yfinance는 동기 호출이므로 실제처럼 이벤트 루프를 막음
+        if latency:
+            time.sleep(latency)
+
+
+class FakeSearchProvider(BaseSearchProvider):
+    """검색 프로바이더 대역 (쿼리별 고정 결과)."""
+
+    def __init__(self, latency: float = 0.0, max_results: int = 10):
+        self.latency = latency
+        self.max_results = max_results
+
+    @property
+    def name(self) -> str:
+        return "offline"
+
+    @property
+    def is_available(self) -> bool:
+        return True
+
+    async def _respond(self, query: str, kind: str, max_results: int | None) -> SearchResponse:
+        await asyncio.sleep(self.latency)
+        seed = zlib.crc32(query.encode())
+        results = [
+            SearchResult(
+                title=f"{query} {kind} {i + 1}",
+                url=f"https://{kind}.example.com/{seed:x}/{i}",
+                snippet=f"{query} 관련 {kind} 결과 {i + 1}. 실적, 투자, 공급 계약 동향을 다룹니다. " * 3,
+                source=self.name,
+                published_date=datetime(2026, 1, 1) - timedelta(days=i),
+            )
+            for i in range(max_results or self.max_results)
+        ]
+        return SearchResponse(
+            query=query,
+            results=results,
+            total_results=len(results),
+            search_time=self.latency,
+            provider=self.name,
+        )
+
+    async def search(self, query: str, max_results: int = 10, **kwargs) -> SearchResponse:
+        return await self._respond(query, "web", max_results)
+
+    async def news_search(self, query: str, max_results: int = 10, **kwargs) -> SearchResponse:
+        return await self._respond(query, "news", max_results)
+
+
+class FakeChatModel:
+    """ChatOpenAI 대역 (고정 지연 후 고정 응답과 usage_metadata 반환)."""
+
+    def __init__(self, latency: float = 0.0, **kwargs):
+        self.latency = latency
+        self.model_name = kwargs.get("model", "offline")
+
+    async def ainvoke(self, messages, **kwargs) -> AIMessage:
+        await asyncio.sleep(self.latency)
+        prompt = "\n".join(str(m.content) for m in messages)
+        return AIMessage(
+            content="오프라인 분석 결과입니다. " * 40,
+            usage_metadata={
+                "input_tokens": len(prompt) // 4,
+                "output_tokens": 300,
+                "total_tokens": len(prompt) // 4 + 300,
+            },
+        )
+
+
+class InMemoryGraphRepository:
+    """인메모리 그래프 저장소 (GraphRepository 조회 메서드 일부, Neo4j 대역)."""
+
+    is_available = True
+
+    def __init__(self, data: dict | None = None, latency: float = 0.0):
+        data = data or load_corpus()
+        self.documents = data["documents"]
+        self.events = data["events"]
+        self.latency = latency
+
+    async def get_company_documents(self, company_name: str, limit: int = 20) -> list[Document]:
+        await asyncio.sleep(self.latency)
+        return [
+            Document(id=d["id"], type="news", title=d["title"], url=d["url"])
+            for d in self.documents
+            if d["company"] == company_name
+        ][:limit]
+
+    async def get_company_events(self, company_name: str, limit: int = 10) -> list[Event]:
+        await asyncio.sleep(self.latency)
+        return [
+            Event(id=e["id"], type=e["type"], title=e["title"], date=datetime(2026, 1, 1))
+            for e in self.events
+            if e["company"] == company_name
+        ][:limit]
+
+    async def search_by_text(self, text: str, limit: int = 10) -> list[dict]:
+        await asyncio.sleep(self.latency)
+        return [
+            {"node": {"id": d["id"], "name": d["title"], "url": d["url"]}, "labels": ["Document"]}
+            for d in self.documents
+            if text in d["title"] or text in d["content"]
+        ][:limit]
+
+
+@contextmanager
+def quiet_logging(level: int = logging.ERROR):
+    """애플리케이션 로그 수준을 높입니다 (로그 출력이 측정값과 JSON 출력을 왜곡하지 않도록)."""
+    from src.utils.logging import setup_logging
+
+    logger = setup_logging()
+    previous = logger.level
+    logger.setLevel(level)
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
+
+
+@dataclass
+class OfflineEnvironment:
+    """offline_services()가 구성한 실행 환경."""
+
+    settings: Settings
+    latency: float
+    graph_repo: InMemoryGraphRepository
+
+
+# 실행 간 공유되면 결과가 왜곡되는 프로세스 싱글톤 (모듈, 속성)
+SINGLETONS = (
+    ("src.agents.orchestrator", "_analysis_flight"),
+    ("src.cache.shared", "_default_cache"),
+    ("src.cache.workers", "_default_registry"),
+    ("src.graph.cache", "_default_retrieval_cache"),
+    ("src.graph.embeddings", "_default_query_cache"),
+    ("src.graph.reranker", "_default_reranker"),
+    ("src.graph.vector_store", "_default_store"),
+    ("src.reports.store", "_default_report_store"),
+    ("src.stock.client", "_default_client"),
+    ("src.utils.tracing", "_default_tracer"),
+)
+
+
+@asynccontextmanager
+async def offline_services(latency: float = 0.0, cache: bool = False, **overrides):
+    """외부 서비스를 대역으로 바꾸고 임시 ChromaDB에 데이터셋을 적재합니다.
+
+    Args:
+        latency: 외부 호출당 고정 지연 시간 (초)
+        cache: 검색/분석 결과 캐시 사용 여부 (False면 매 호출이 전체 경로를 실행)
+        **overrides: 추가 설정 값
+
+    Yields:
+        OfflineEnvironment
+    """
+    import importlib
+
+    from config.settings import settings
+
+    with tempfile.TemporaryDirectory() as tmp, ExitStack() as stack:
+        stack.enter_context(quiet_logging())
+        values = {
+            "openai_api_key": "offline",
+            "tavily_api_key": "offline",
+            "serpapi_key": "",
+            "foundry_token": "",
+            "chroma_persist_dir": tmp,
+            "embedding_backend": "hashing",
+            "query_embedding_cache_path": "",
+            "rerank_backend": "",
+            "tracing_exporter": "",
+            "ingest_enabled": False,
+            "analyze_memo_ttl": 5.0 if cache else 0.0,
+            "retrieval_cache_size": 256 if cache else 0,
+            "report_freshness": 900 if cache else 0,
+            "cache_backend": "memory",
+            "search_cache_ttl": 900 if cache else 0,
+            "llm_cache_ttl": 3600 if cache else 0,
+            "price_cache_ttl": 300 if cache else 0,
+            **overrides,
+        }
+        for name, value in values.items():
+            stack.enter_context(mock.patch.object(settings, name, value))
+        for module, attribute in SINGLETONS:
+            stack.enter_context(mock.patch.object(importlib.import_module(module), attribute, None))
+
+        graph_repo = InMemoryGraphRepository(latency=latency)
+        yfinance = FakeYFinance(latency)
+
+        class FakeSearchFactory:
+            @staticmethod
+            def create(settings=None) -> BaseSearchProvider:
+                return FakeSearchProvider(latency)
+
+        stack.enter_context(mock.patch("src.stock.client.yf", yfinance))
+        stack.enter_context(mock.patch("src.agents.nodes.SearchProviderFactory", FakeSearchFactory))
+        stack.enter_context(
+            mock.patch("src.utils.llm.ChatOpenAI", lambda **kw: FakeChatModel(latency, **kw))
+        )
+        stack.enter_context(mock.patch("src.graph.hybrid.GraphRepository", lambda: graph_repo))
+
+        from src.graph.vector_store import get_vector_store
+
+        store = get_vector_store(settings)
+        await store.add_documents([
+            {
+                "id": d["id"],
+                "content": f"{d['title']}\n\n{d['content']}",
+                "metadata": {"company": d["company"], "url": d["url"]},
+            }
+            for d in graph_repo.documents
+        ])
+
+        yield OfflineEnvironment(settings=settings, latency=latency, graph_repo=graph_repo)
@@ -0,0 +1,51 @@
+"""벤치마크 시간 측정 도구."""
+
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+
+def summarize(samples: list[float]) -> dict:
+    """초 단위 측정값 목록을 ms 통계로 요약합니다."""
+    ordered = sorted(samples)
+
+    def percentile(q: float) -> float:
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    return {
+        "iterations": len(samples),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+        "p50_ms": round(percentile(0.50) * 1000, 3),
+        "p95_ms": round(percentile(0.95) * 1000, 3),
+        "min_ms": round(ordered[0] * 1000, 3),
+    }
+
+
+def measure(func: Callable[[], object], iterations: int, warmup: int = 1) -> dict:
+    """동기 함수를 반복 실행해 지연 시간을 측정합니다."""
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+async def measure_async(
+    func: Callable[[], Awaitable[object]],
+    iterations: int,
+    warmup: int = 1,
+) -> dict:
+    """코루틴 함수를 반복 실행해 지연 시간을 측정합니다."""
+    for _ in range(warmup):
+        await func()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
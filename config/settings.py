@@ -1,7 +1,12 @@
 """설정 관리 모듈."""
 
+from pathlib import Path
+
 from pydantic_settings import BaseSettings
 
+# 실행 위치와 관계없이 같은 파일을 쓰도록 수집 상태 파일은 프로젝트 data 디렉토리에 고정
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
 
 class Settings(BaseSettings):
     """애플리케이션 설정."""
@@ -18,9 +23,84 @@ class Settings(BaseSettings):
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = ""
+    neo4j_fetch_size: int = 1000  # 스트리밍 조회 시 드라이버 fetch 크기
+    graph_stats_ttl: int = 30  # 그래프 통계 캐시 (초)
+
+    # Entity Extraction
+    extraction_chunk_size: int = 2000  # 청크 최대 길이 (글자)
+    extraction_chunk_overlap: int = 200  # 청크 간 겹침 (글자)
+    extraction_concurrency: int = 4  # 동시 LLM 추출 호출 수
+
+    # Ingestion
+    ingest_index_path: str = str(DATA_DIR / "ingest_index.txt")  # 수집 문서 지문 인덱스
+    ingest_enabled: bool = True  # 분석 시 백그라운드 수집 (Neo4j가 설정된 경우에만)
+    ingest_workers: int = 2  # 수집 워커 수
+    ingest_queue_size: int = 256  # 수집 큐 크기 (넘치면 spool 파일로)
+    ingest_batch_size: int = 8  # 워커당 배치 문서 수
+    ingest_max_retries: int = 3  # 문서당 최대 재시도 횟수
+    ingest_retry_backoff: float = 1.0  # 재시도 백오프 기본값 (초)
+    ingest_spool_path: str = str(DATA_DIR / "ingest_spool.jsonl")  # 대기 문서 spool
+    ingest_dead_letter_path: str = str(DATA_DIR / "ingest_dead_letter.jsonl")  # 실패 문서
 
     # Vector Database
     chroma_persist_dir: str = "./data/chroma"
+    embedding_backend: str = "default"  # default/onnx/sentence-transformers/hashing
+    embedding_model: str = "all-MiniLM-L6-v2"  # sentence-transformers 모델명
+    embedding_batch_size: int = 32  # 배치당 최대 문서 수
+    embedding_max_batch_chars: int = 64000  # 배치당 최대 글자 수
+    embedding_concurrency: int = 2  # 동시 임베딩 배치 수
+    query_embedding_cache_size: int = 1024  # 쿼리 임베딩 LRU 크기
+    query_embedding_cache_path: str = ""  # 쿼리 임베딩 캐시 파일 (비우면 메모리 전용)
+    chroma_executor_workers: int = 4  # ChromaDB 호출 전용 스레드 수
+    vector_search_batch_window_ms: int = 5  # 검색이 몰릴 때만 쓰는 묶음 시간 창 (0이면 비활성)
+    vector_search_max_batch: int = 32  # 검색 배치당 최대 쿼리 수
+    vector_chunking: bool = True  # 문서를 청크 단위로 임베딩
+    vector_chunk_size: int = 500  # 임베딩 청크 크기 (글자)
+    vector_chunk_overlap: int = 50  # 임베딩 청크 간 겹침 (글자)
+    vector_chunk_fetch_factor: int = 3  # 부모 문서당 조회할 청크 배수
+    vector_max_spans: int = 2  # 검색 결과당 반환할 최대 청크 수
+
+    # Hybrid Retrieval
+    retrieval_vector_timeout: float = 3.0  # 벡터 검색 브랜치 타임아웃 (초)
+    retrieval_graph_timeout: float = 3.0  # 그래프 검색 브랜치 타임아웃 (초)
+    retrieval_fusion: str = "rrf"  # 결과 융합 전략 (rrf/weighted)
+    retrieval_rrf_k: int = 60  # RRF 순위 완화 상수
+    retrieval_fetch_factor: float = 1.5  # 소스별 조회 깊이 = n_results * factor
+    rerank_backend: str = ""  # 재순위화 백엔드 (비우면 비활성, cross-encoder/lexical)
+    rerank_model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"  # cross-encoder 모델명
+    rerank_top_n: int = 20  # 재순위화할 상위 후보 수
+    rerank_batch_size: int = 16  # 채점 배치 크기
+    rerank_budget_ms: int = 300  # 재순위화 지연 예산 (ms)
+    rerank_cache_size: int = 4096  # (쿼리, 문서) 점수 캐시 크기
+    context_max_tokens: int = 800  # Graph RAG 컨텍스트 토큰 예산
+    context_n_results: int = 20  # 컨텍스트 후보 검색 결과 수
+    context_dedup_threshold: float = 0.8  # 근사 중복 구간 판정 Jaccard 임계값
+    retrieval_cache_size: int = 256  # 검색 결과 캐시 크기 (0이면 비활성)
+    # 세대 카운터는 프로세스 로컬이므로 다른 프로세스(ps ingest 등)의 쓰기는 TTL로만 반영
+    retrieval_cache_ttl: int = 120  # 검색 결과 캐시 유효 시간 (초, 0이면 무제한)
+
+    # Jobs
+    job_backend: str = "memory"  # 작업 큐 백엔드 (memory/sqlite/redis)
+    redis_url: str = "redis://localhost:6379/0"
+    job_workers: int = 2  # 프로세스당 작업 워커 수
+    job_timeout: int = 300  # 작업당 최대 실행 시간 (초)
+    job_result_ttl: int = 3600  # 작업 상태/결과 보관 시간 (초)
+    job_max_per_user: int = 2  # 사용자당 동시 (대기+실행) 작업 수
+    job_lease: int = 30  # 실행 중 작업 lease (초, 갱신이 끊긴 작업은 다시 대기열로)
+
+    # Shared Cache (ps serve --workers N에서 워커 간 공유하려면 sqlite/redis)
+    cache_backend: str = "memory"  # 공유 캐시 백엔드 (memory/sqlite/redis)
+    cache_path: str = "./data/shared_cache.sqlite3"  # sqlite 캐시/작업 백엔드 파일
+    cache_memory_max_entries: int = 10000  # memory 캐시 백엔드 최대 항목 수 (LRU)
+    search_cache_ttl: int = 900  # 검색 결과 캐시 (초, 0이면 비활성)
+    llm_cache_ttl: int = 3600  # 동일 프롬프트 LLM 응답 캐시 (초, 0이면 비활성)
+    price_cache_ttl: int = 300  # 주식 정보/주가 캐시 (초, 0이면 비활성)
+    worker_heartbeat: float = 5.0  # 워커 상태 갱신 간격 (초)
+
+    # Reports
+    report_freshness: int = 900  # 같은 기업 분석 결과 재사용 기간 (초)
+    report_store_size: int = 128  # 보관할 분석 결과 수
+    report_store_ttl: int = 86400  # analysis_id로 조회 가능한 기간 (초)
 
     # Stock Data
     alpha_vantage_key: str = ""
@@ -29,8 +109,21 @@ class Settings(BaseSettings):
     foundry_token: str = ""
     foundry_host: str = ""
 
+    # Observability
+    tracing_exporter: str = ""  # span exporter (비우면 비활성, console/otlp/memory, 쉼표로 여러 개)
+    otlp_endpoint: str = "http://localhost:4318/v1/traces"  # OTLP/HTTP collector
+    tracing_service_name: str = "palantir-stock"
+    profile_dir: str = "./data/profiles"  # --profile / ?profile=1 결과 저장 디렉토리
+    profile_top: int = 30  # 프로파일 요약 상위 함수 수
+    profile_interval: float = 0.005  # 스택 샘플링 간격 (초)
+    admin_token: str = ""  # 관리자 전용 API 기능 토큰 (X-Admin-Token, 비우면 비활성)
+
+    # API
+    compression_min_size: int = 1024  # 응답 압축(br/gzip) 최소 크기 (바이트, 0이면 비활성)
+
     # App Settings
     cache_ttl: int = 3600  # 1 hour
+    analyze_memo_ttl: float = 5.0  # 동일 기업 분석 결과 재사용 시간 (초, 동시 요청 병합 후)
     max_search_results: int = 10
     log_level: str = "INFO"
 
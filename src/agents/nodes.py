@@ -1,10 +1,14 @@
 """LangGraph 에이전트 노드 정의."""
 
+from dataclasses import asdict
+
 from config.settings import settings
 from src.models.schemas import AgentState, NewsItem, SearchResult
 from src.palantir import OntologyExplorer, get_foundry_client
-from src.search import SearchProviderError, SearchProviderFactory
+from src.search import SearchProviderError, SearchProviderFactory, with_cache
 from src.utils import LLMClient, get_logger
+from src.utils.metrics import instrumented
+from src.utils.tracing import current_span
 
 logger = get_logger("agents.nodes")
 
@@ -29,6 +33,7 @@ def _get_stock_client():
         return None
 
 
+@instrumented("node")
 async def search_node(state: AgentState) -> AgentState:
     """웹 검색을 수행하는 노드.
 
@@ -44,11 +49,12 @@ async def search_node(state: AgentState) -> AgentState:
         return state
 
     try:
-        provider = SearchProviderFactory.create(settings)
+        provider = with_cache(SearchProviderFactory.create(settings), settings)
         query = f"{company_name} 기업 정보 현황"
 
         logger.info(f"웹 검색 시작: {query}")
         response = await provider.search(query)
+        current_span().set_attributes({"query": query, "result_count": len(response.results)})
 
         state["search_results"] = response.results
         logger.info(f"검색 완료: {len(response.results)}개 결과")
@@ -61,6 +67,7 @@ async def search_node(state: AgentState) -> AgentState:
     return state
 
 
+@instrumented("node")
 async def news_node(state: AgentState) -> AgentState:
     """뉴스 검색을 수행하는 노드.
 
@@ -75,11 +82,12 @@ async def news_node(state: AgentState) -> AgentState:
         return state
 
     try:
-        provider = SearchProviderFactory.create(settings)
+        provider = with_cache(SearchProviderFactory.create(settings), settings)
         query = f"{company_name} 최신 뉴스"
 
         logger.info(f"뉴스 검색 시작: {query}")
         response = await provider.news_search(query)
+        current_span().set_attributes({"query": query, "result_count": len(response.results)})
 
         news_items = [
             NewsItem(
@@ -102,6 +110,7 @@ async def news_node(state: AgentState) -> AgentState:
     return state
 
 
+@instrumented("node")
 async def palantir_node(state: AgentState) -> AgentState:
     """Palantir 데이터를 조회하는 노드.
 
@@ -142,6 +151,7 @@ async def palantir_node(state: AgentState) -> AgentState:
     return state
 
 
+@instrumented("node")
 async def stock_node(state: AgentState) -> AgentState:
     """주식 데이터를 조회하는 노드.
 
@@ -190,6 +200,7 @@ async def stock_node(state: AgentState) -> AgentState:
     return state
 
 
+@instrumented("node")
 async def graph_rag_node(state: AgentState) -> AgentState:
     """Graph RAG로 추가 컨텍스트를 수집하는 노드.
 
@@ -215,15 +226,18 @@ async def graph_rag_node(state: AgentState) -> AgentState:
 
         # 하이브리드 검색 수행
         logger.info(f"Graph RAG 검색: {company_name}")
-        context = await retriever.get_context_for_query(
+        context = await retriever.build_context(
             query=company_name,
             company_name=company_name,
-            max_context_length=2000,
         )
 
         if context:
-            state["graph_context"] = context
-            logger.info(f"Graph RAG 컨텍스트 수집 완료: {len(context)}자")
+            state["graph_context"] = context.text
+            state["graph_citations"] = [asdict(c) for c in context.citations]
+            logger.info(
+                f"Graph RAG 컨텍스트 수집 완료: {context.tokens}토큰, "
+                f"{len(context.citations)}개 인용"
+            )
         else:
             state["graph_context"] = None
             logger.debug("Graph RAG 컨텍스트 없음")
@@ -235,6 +249,7 @@ async def graph_rag_node(state: AgentState) -> AgentState:
     return state
 
 
+@instrumented("node")
 async def summarize_node(state: AgentState) -> AgentState:
     """수집된 정보를 요약하는 노드.
 
@@ -277,6 +292,7 @@ async def summarize_node(state: AgentState) -> AgentState:
             search_results=search_dicts,
             news_items=news_dicts,
             palantir_data=palantir_data,
+            graph_context=graph_context,
         )
 
         state["summary"] = summary
@@ -303,6 +319,7 @@ def should_continue(state: AgentState) -> str:
     return "continue"
 
 
+@instrumented("node")
 async def error_handler_node(state: AgentState) -> AgentState:
     """에러를 처리하는 노드.
 
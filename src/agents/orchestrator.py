@@ -15,11 +15,67 @@ from src.agents.nodes import (
     stock_node,
     summarize_node,
 )
+from src.graph.resolver import get_entity_resolver
 from src.models.schemas import AgentState, CompanyInfo, CompanyReport
 from src.utils.logging import get_logger
+from src.utils.metrics import PREFIX, Collected, get_registry
+from src.utils.singleflight import SingleFlight
+from src.utils.tracing import start_span
 
 logger = get_logger("agents.orchestrator")
 
+# 프로세스 내 동일 기업 분석 병합기 (에이전트 인스턴스 간 공유)
+_analysis_flight: SingleFlight | None = None
+
+
+def get_analysis_flight(app_settings: Settings | None = None) -> SingleFlight:
+    """기업 분석 single-flight 병합기를 반환합니다."""
+    global _analysis_flight
+
+    if _analysis_flight is None:
+        app_settings = app_settings or settings
+        _analysis_flight = SingleFlight(memo_ttl=app_settings.analyze_memo_ttl)
+
+    return _analysis_flight
+
+
+def _cache_stats() -> dict[str, dict]:
+    """메트릭 수집용 분석 memo 통계 (병합기가 없으면 빈 dict)."""
+    flight = _analysis_flight
+    if flight is None:
+        return {}
+    memo_hits = flight.stats["memo_hits"]
+    return {"analysis_memo": {"hits": memo_hits, "misses": flight.stats["calls"] - memo_hits}}
+
+
+def _metrics() -> list[Collected]:
+    """기업 분석 병합 메트릭을 수집합니다."""
+    flight = _analysis_flight
+    if flight is None:
+        return []
+    return [
+        (
+            f"{PREFIX}_analysis_requests_total",
+            "counter",
+            "기업 분석 요청 수 (result: executed/coalesced/memoized)",
+            [
+                ({"result": "executed"}, flight.stats["executions"]),
+                ({"result": "coalesced"}, flight.stats["coalesced"]),
+                ({"result": "memoized"}, flight.stats["memo_hits"]),
+            ],
+        ),
+        (
+            f"{PREFIX}_analysis_in_flight",
+            "gauge",
+            "진행 중인 기업 분석 수",
+            [({}, flight.inflight)],
+        ),
+    ]
+
+
+get_registry().register_cache_source(_cache_stats)
+get_registry().register_collector(_metrics)
+
 
 def create_company_info_graph() -> StateGraph:
     """기업 정보 수집 LangGraph 워크플로우를 생성합니다.
@@ -85,12 +141,24 @@ class CompanyInfoAgent:
     async def analyze(self, company_name: str) -> CompanyReport:
         """기업을 분석합니다.
 
+        해소기로 같은 기업(alias, 티커 포함)으로 판단되는 동시 호출은 하나의
+        파이프라인 실행을 함께 기다리고, 완료된 결과는 analyze_memo_ttl 동안
+        재사용합니다. 호출자마다 리포트 사본을 받으므로 서로의 결과를 바꾸지 않습니다.
+
         Args:
             company_name: 분석할 기업명
 
         Returns:
             기업 분석 리포트
         """
+        key = get_entity_resolver().canonical_key(company_name) or company_name
+        report = await get_analysis_flight(self.settings).do(
+            key, lambda: self._run_pipeline(company_name)
+        )
+        return report.model_copy(deep=True)
+
+    async def _run_pipeline(self, company_name: str) -> CompanyReport:
+        """워크플로우를 실행해 기업을 분석합니다."""
         logger.info(f"기업 분석 시작: {company_name}")
 
         # 초기 상태 설정
@@ -105,7 +173,8 @@ class CompanyInfoAgent:
         }
 
         # 워크플로우 실행
-        result = await self.graph.ainvoke(initial_state)
+        with start_span("agent.analyze", company=company_name):
+            result = await self.graph.ainvoke(initial_state)
 
         # 결과를 CompanyReport로 변환
         report = CompanyReport(
@@ -117,9 +186,35 @@ class CompanyInfoAgent:
             palantir_data=result.get("palantir_data"),
         )
 
+        if self.settings.ingest_enabled:
+            self._schedule_ingestion(result)
+
         logger.info(f"기업 분석 완료: {company_name}")
         return report
 
+    def _schedule_ingestion(self, state: dict) -> None:
+        """검색/뉴스 결과를 백그라운드 수집 큐에 넣습니다 (처리를 기다리지 않음).
+
+        그래프 저장소(Neo4j)가 설정되지 않았으면 수집하지 않습니다.
+
+        Args:
+            state: 워크플로우 실행 결과 상태
+        """
+        try:
+            from src.graph.ingestion import get_ingestion_pipeline, items_from_agent_state
+
+            pipeline = get_ingestion_pipeline(self.settings)
+            if not pipeline.repository.is_available:
+                logger.debug("그래프 저장소 미설정, 수집 건너뜀")
+                return
+
+            items = items_from_agent_state(state)
+            if items:
+                queued = pipeline.offer(items)
+                logger.debug(f"수집 예약: {queued}/{len(items)}개 문서")
+        except Exception as e:
+            logger.warning(f"수집 예약 실패: {e}")
+
     async def quick_search(self, query: str) -> list[dict]:
         """빠른 검색을 수행합니다.
 
@@ -129,10 +224,10 @@ class CompanyInfoAgent:
         Returns:
             검색 결과 목록
         """
-        from src.search import SearchProviderFactory
+        from src.search import SearchProviderFactory, with_cache
 
         try:
-            provider = SearchProviderFactory.create(self.settings)
+            provider = with_cache(SearchProviderFactory.create(self.settings), self.settings)
             response = await provider.search(query)
 
             return [
@@ -156,10 +251,10 @@ class CompanyInfoAgent:
         Returns:
             뉴스 결과 목록
         """
-        from src.search import SearchProviderFactory
+        from src.search import SearchProviderFactory, with_cache
 
         try:
-            provider = SearchProviderFactory.create(self.settings)
+            provider = with_cache(SearchProviderFactory.create(self.settings), self.settings)
             response = await provider.news_search(query)
 
             return [
@@ -0,0 +1,257 @@
+"""API 부하 테스트 생성기.
+
+엔드포인트 혼합 비율에 따라 요청을 만들어 목표 RPS(open-loop) 또는 고정
+동시성(closed-loop)으로 보내고, 지연 시간 분위수, 오류율, 구간별 처리량을
+집계합니다. 대상은 httpx.AsyncClient이므로 실행 중인 서버(base_url)나
+인프로세스 앱(ASGITransport) 모두 사용할 수 있습니다.
+
+목표 RPS 모드의 지연 시간은 요청이 예정된 시각부터 측정하므로, 서버가 밀려
+요청이 늦게 나가는 대기 시간도 꼬리 지연에 반영됩니다 (coordinated omission 방지).
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import httpx
+
+from src.utils.logging import get_logger
+
+logger = get_logger("api.loadtest")
+
+# 시나리오 이름 → (메서드, 경로, 기업명 → 요청 본문)
+ENDPOINTS: dict[str, tuple[str, str, Callable[[str], dict]]] = {
+    "analyze": ("POST", "/analyze/company", lambda company: {"company_name": company}),
+    "stock": ("POST", "/stock/analyze", lambda company: {"company_name": company}),
+    "graph": (
+        "POST",
+        "/graph/search",
+        lambda company: {"query": f"{company} 실적 전망", "company_name": company},
+    ),
+    "report": (
+        "POST",
+        "/reports/generate",
+        lambda company: {"company_name": company, "format": "markdown"},
+    ),
+}
+
+DEFAULT_MIX = "analyze=1,stock=2,graph=3,report=4"
+DEFAULT_COMPANIES = ("삼성전자", "SK하이닉스", "현대차", "카카오", "KB금융", "LG에너지솔루션")
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """"analyze=1,report=4" 형식의 혼합 비율을 파싱합니다.
+
+    Raises:
+        ValueError: 알 수 없는 엔드포인트이거나 비율이 잘못된 경우
+    """
+    mix = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"알 수 없는 엔드포인트: {name} (사용 가능: {', '.join(ENDPOINTS)})")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"잘못된 비율: {part}") from None
+        if mix[name] < 0:
+            raise ValueError(f"비율은 0 이상이어야 합니다: {part}")
+
+    if not any(mix.values()):
+        raise ValueError("하나 이상의 엔드포인트 비율이 필요합니다")
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def percentile(values: list[float], q: float) -> float:
+    """최근접 순위 분위수 (values는 정렬되어 있어야 함)."""
+    if not values:
+        return 0.0
+    return values[min(int(q * len(values)), len(values) - 1)]
+
+
+@dataclass
+class RequestRecord:
+    """개별 요청 결과."""
+
+    endpoint: str
+    started: float  # 테스트 시작 기준 오프셋 (초)
+    latency: float  # 초
+    status: int  # HTTP 상태 (연결 오류 등은 0)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status < 400
+
+
+def _stats(records: list[RequestRecord], duration: float) -> dict:
+    latencies = sorted(r.latency for r in records)
+    errors = sum(1 for r in records if not r.ok)
+    return {
+        "requests": len(records),
+        "errors": errors,
+        "error_rate": round(errors / len(records), 4) if records else 0.0,
+        "throughput": round(len(records) / duration, 2) if duration else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+    }
+
+
+@dataclass
+class LoadTestResult:
+    """부하 테스트 결과."""
+
+    records: list[RequestRecord]
+    duration: float
+    config: dict = field(default_factory=dict)
+
+    def summary(self) -> dict:
+        """전체 및 엔드포인트별 통계를 반환합니다."""
+        by_endpoint: dict[str, list[RequestRecord]] = {}
+        for record in self.records:
+            by_endpoint.setdefault(record.endpoint, []).append(record)
+
+        return {
+            "total": _stats(self.records, self.duration),
+            "endpoints": {
+                name: _stats(records, self.duration)
+                for name, records in sorted(by_endpoint.items())
+            },
+        }
+
+    def timeline(self, interval: float = 1.0) -> list[dict]:
+        """요청 시작 시각 기준 구간별 처리량, 오류 수, 지연 시간을 반환합니다."""
+        buckets: dict[int, list[RequestRecord]] = {}
+        for record in self.records:
+            buckets.setdefault(int(record.started // interval), []).append(record)
+
+        timeline = []
+        for index in range(max(buckets, default=-1) + 1):
+            stats = _stats(buckets.get(index, []), interval)
+            timeline.append({
+                "second": round(index * interval, 3),
+                "requests": stats["requests"],
+                "errors": stats["errors"],
+                "throughput": stats["throughput"],
+                "p50_ms": stats["p50_ms"],
+                "p95_ms": stats["p95_ms"],
+            })
+        return timeline
+
+    def errors(self, limit: int = 5) -> dict[str, int]:
+        """자주 발생한 오류 메시지를 반환합니다."""
+        counts: dict[str, int] = {}
+        for record in self.records:
+            if not record.ok:
+                key = f"{record.endpoint}: {record.error or f'HTTP {record.status}'}"
+                counts[key] = counts.get(key, 0) + 1
+        return dict(sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[:limit])
+
+    def to_dict(self, interval: float = 1.0) -> dict:
+        return {
+            "config": self.config,
+            "duration": round(self.duration, 3),
+            **self.summary(),
+            "timeline": self.timeline(interval),
+            "top_errors": self.errors(),
+        }
+
+
+async def run_load_test(
+    client: httpx.AsyncClient,
+    mix: dict[str, float] | str = DEFAULT_MIX,
+    duration: float = 10.0,
+    rps: float | None = None,
+    concurrency: int = 10,
+    companies: tuple[str, ...] = DEFAULT_COMPANIES,
+    seed: int = 0,
+) -> LoadTestResult:
+    """부하 테스트를 실행합니다.
+
+    Args:
+        client: 요청을 보낼 클라이언트 (base_url 설정 필요)
+        mix: 엔드포인트 혼합 비율
+        duration: 요청을 생성할 시간 (초, 진행 중인 요청은 끝까지 기다림)
+        rps: 목표 초당 요청 수 (None이면 concurrency개 워커가 쉬지 않고 요청)
+        concurrency: 동시 요청 수 (rps 모드에서는 최대 동시 요청 수)
+        companies: 요청에 사용할 기업명 (순환)
+        seed: 엔드포인트 선택 난수 시드
+
+    Returns:
+        부하 테스트 결과
+    """
+    if isinstance(mix, str):
+        mix = parse_mix(mix)
+
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    records: list[RequestRecord] = []
+    counter = 0
+    start = time.perf_counter()
+
+    def next_request() -> tuple[str, str, str, dict]:
+        nonlocal counter
+        endpoint = rng.choices(names, weights)[0]
+        method, path, body = ENDPOINTS[endpoint]
+        company = companies[counter % len(companies)]
+        counter += 1
+        return endpoint, method, path, body(company)
+
+    async def send(request: tuple[str, str, str, dict], scheduled: float) -> None:
+        endpoint, method, path, body = request
+        status, error = 0, None
+        try:
+            response = await client.request(method, path, json=body)
+            status = response.status_code
+            if status >= 400:
+                error = f"HTTP {status}"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - scheduled
+        records.append(RequestRecord(endpoint, scheduled - start, elapsed, status, error))
+
+    if rps:
+        # open-loop: 예정 시각마다 요청, 동시 요청은 concurrency로 제한
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = []
+
+        async def scheduled_send(request, scheduled: float) -> None:
+            async with semaphore:
+                await send(request, scheduled)
+
+        interval = 1.0 / rps
+        for i in range(int(duration * rps)):
+            scheduled = start + i * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(scheduled_send(next_request(), scheduled)))
+        await asyncio.gather(*tasks)
+    else:
+        # closed-loop: concurrency개 워커가 응답을 받는 즉시 다음 요청
+        deadline = start + duration
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await send(next_request(), time.perf_counter())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    elapsed = time.perf_counter() - start
+    logger.debug(f"부하 테스트 완료: {len(records)}개 요청, {elapsed:.1f}초")
+    return LoadTestResult(
+        records=records,
+        duration=elapsed,
+        config={
+            "mix": mix,
+            "duration": duration,
+            "rps": rps,
+            "concurrency": concurrency,
+            "seed": seed,
+        },
+    )
@@ -3,15 +3,28 @@
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.datastructures import Default
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from config.settings import settings
-from src.api.routes import analyze_router, graph_router, reports_router, stock_router
+from src.api.responses import CompressionMiddleware, ORJSONResponse
+from src.api.routes import (
+    admin_router,
+    analyze_router,
+    graph_router,
+    jobs_router,
+    metrics_router,
+    reports_router,
+    stock_router,
+)
+from src.api.routes.admin import is_admin
 from src.api.schemas import HealthResponse
 from src.utils.logging import get_logger
+from src.utils.profiling import Profiler, ProfilerBusyError
+from src.utils.tracing import get_tracer, start_span
 
 logger = get_logger("api.main")
 
@@ -24,7 +37,29 @@ TEMPLATES_DIR = Path(__file__).parent / "templates"
 async def lifespan(app: FastAPI):
     """앱 생명주기 관리."""
     logger.info("API 서버 시작")
+
+    # 워커 등록 (공유 캐시 백엔드면 모든 워커의 /health에 보고됨)
+    from src.cache import close_shared_cache, get_worker_registry, shutdown_worker_registry
+    await get_worker_registry(settings).start()
+
+    # 작업 워커 시작 (재시작 전에 대기열에 남은 작업과 lease가 만료된 작업도 처리)
+    from src.api.routes.jobs import job_queue
+    job_queue().start()
     yield
+
+    await shutdown_worker_registry()
+
+    # 작업 워커 정리 (redis 백엔드면 대기 작업은 다른 프로세스가 처리)
+    from src.jobs import shutdown_job_queue
+    await shutdown_job_queue()
+
+    # 남은 span 전송
+    get_tracer().shutdown()
+
+    # 처리하지 못한 수집 대기 문서는 spool (ps ingest로 처리)
+    from src.graph.ingestion import shutdown_ingestion_pipeline
+    await shutdown_ingestion_pipeline(drain=False)
+    await close_shared_cache()
     logger.info("API 서버 종료")
 
 
@@ -35,6 +70,8 @@ def create_app() -> FastAPI:
         description="웹 검색 기반 기업 정보 수집 및 주식 데이터 분석 API",
         version="1.0.0",
         lifespan=lifespan,
+        # response_model이 있는 라우트는 pydantic 직렬화 경로를 유지하고 나머지는 orjson
+        default_response_class=Default(ORJSONResponse),
         docs_url="/docs",
         redoc_url="/redoc",
     )
@@ -48,11 +85,59 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # 요청 추적 (tracing_exporter 설정 시 요청마다 루트 span)
+    @app.middleware("http")
+    async def trace_requests(request: Request, call_next):
+        if not get_tracer().enabled:
+            return await call_next(request)
+
+        with start_span(
+            f"{request.method} {request.url.path}",
+            kind="SERVER",
+            root=True,
+            traceparent=request.headers.get("traceparent"),
+            **{"http.method": request.method, "http.target": request.url.path},
+        ) as span:
+            response = await call_next(request)
+            span.set_attribute("http.status_code", response.status_code)
+            response.headers["traceparent"] = span.traceparent()
+            return response
+
+    # 관리자 전용 요청 프로파일링 (?profile=1 + X-Admin-Token)
+    @app.middleware("http")
+    async def profile_requests(request: Request, call_next):
+        if request.query_params.get("profile") not in ("1", "true"):
+            return await call_next(request)
+        if not is_admin(request):
+            return JSONResponse({"detail": "프로파일링은 관리자 전용입니다"}, status_code=403)
+
+        profiler = Profiler(f"{request.method}-{request.url.path}", settings=settings)
+        try:
+            profiler.start()
+        except ProfilerBusyError as e:
+            return JSONResponse({"detail": str(e)}, status_code=409)
+
+        try:
+            response = await call_next(request)
+        finally:
+            result = profiler.stop()
+
+        response.headers["X-Profile-Id"] = result.id
+        response.headers["X-Profile-Duration"] = f"{result.duration:.3f}"
+        return response
+
+    # 응답 압축 (가장 바깥 미들웨어, 최종 본문을 압축)
+    if settings.compression_min_size > 0:
+        app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_min_size)
+
     # 라우터 등록
     app.include_router(analyze_router)
     app.include_router(stock_router)
     app.include_router(graph_router)
     app.include_router(reports_router)
+    app.include_router(jobs_router)
+    app.include_router(metrics_router)
+    app.include_router(admin_router)
 
     # 정적 파일 (존재하는 경우)
     if STATIC_DIR.exists():
@@ -65,7 +150,12 @@ def create_app() -> FastAPI:
 
     @app.get("/health", response_model=HealthResponse, tags=["시스템"])
     async def health_check() -> HealthResponse:
-        """서비스 상태를 확인합니다."""
+        """서비스 상태와 워커별 준비 상태를 확인합니다.
+
+        준비되지 않았거나 heartbeat가 끊긴 워커가 있으면 status는 degraded입니다.
+        """
+        from src.cache import get_shared_cache, get_worker_registry
+
         services = {
             "openai": bool(settings.openai_api_key),
             "serpapi": bool(settings.serpapi_key),
@@ -74,10 +164,19 @@ def create_app() -> FastAPI:
             "foundry": bool(settings.foundry_token),
         }
 
+        try:
+            workers = await get_worker_registry(settings).workers()
+            healthy = all(worker["ready"] for worker in workers)
+        except Exception as e:
+            logger.warning(f"워커 상태 조회 실패: {e}")
+            workers, healthy = [], False
+
         return HealthResponse(
-            status="ok",
+            status="ok" if healthy else "degraded",
             version="1.0.0",
             services=services,
+            cache_backend=get_shared_cache(settings).backend,
+            workers=workers,
         )
 
     return app
@@ -260,6 +359,23 @@ def get_dashboard_html() -> str:
                 result: null,
                 status: '연결됨',
 
+                async init() {
+                    // 마지막 분석 결과 복원 (브라우저가 ETag로 재검증해 변경 없으면 304)
+                    const analysisId = localStorage.getItem('lastAnalysisId');
+                    if (!analysisId) return;
+                    try {
+                        const response = await fetch(`/analyze/${analysisId}`);
+                        if (response.ok) {
+                            this.result = await response.json();
+                            this.companyName = this.result.company_name;
+                        } else {
+                            localStorage.removeItem('lastAnalysisId');
+                        }
+                    } catch (e) {
+                        // 복원 실패는 무시
+                    }
+                },
+
                 async analyzeCompany() {
                     if (!this.companyName.trim()) return;
 
@@ -284,6 +400,9 @@ def get_dashboard_html() -> str:
                         }
 
                         this.result = await response.json();
+                        if (this.result.analysis_id) {
+                            localStorage.setItem('lastAnalysisId', this.result.analysis_id);
+                        }
                     } catch (e) {
                         this.error = e.message;
                     } finally {
@@ -293,7 +412,9 @@ def get_dashboard_html() -> str:
 
                 async generateReport() {
                     if (!this.result) return;
-                    window.open(`/reports/view/${encodeURIComponent(this.result.company_name)}`, '_blank');
+                    const query = this.result.analysis_id ? `?analysis_id=${this.result.analysis_id}` : '';
+                    const company = encodeURIComponent(this.result.company_name);
+                    window.open(`/reports/view/${company}${query}`, '_blank');
                 },
 
                 async getGraphStats() {
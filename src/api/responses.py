@@ -0,0 +1,199 @@
+"""API 응답 인코딩 (orjson, 압축, 조건부 요청)."""
+
+import gzip
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 압축 대상 미디어 타입 (접두사)
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4  # 응답 경로에서 쓰기 위한 빠른 품질 (최대 11)
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답.
+
+    datetime, dataclass, numpy 값과 문자열이 아닌 dict 키를 그대로 직렬화합니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _brotli():
+    """brotli 모듈을 반환합니다 (설치되어 있지 않으면 None)."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def choose_encoding(accept_encoding: str, brotli_available: bool) -> str | None:
+    """Accept-Encoding에서 사용할 압축 방식을 고릅니다 (br > gzip, q=0은 제외)."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip())
+
+    if brotli_available and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    """minimum_size 이상인 텍스트/JSON 응답을 brotli 또는 gzip으로 압축하는 ASGI 미들웨어.
+
+    brotli는 패키지가 설치되어 있고 클라이언트가 허용할 때만 사용합니다.
+    압축 대상 응답은 본문을 모두 모은 뒤 압축하므로, 압축 대상이 아닌 타입
+    (파일 다운로드, text/event-stream 등)과 이미 인코딩된 응답만 스트리밍됩니다.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        """미들웨어를 초기화합니다.
+
+        Args:
+            app: ASGI 앱
+            minimum_size: 압축할 최소 본문 크기 (바이트)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.brotli = _brotli()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.brotli is not None
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        chunks: list[bytes] = []
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start = message
+                headers = Headers(raw=start["headers"])
+                content_type = headers.get("content-type", "")
+                if (
+                    "content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or content_type.startswith("text/event-stream")
+                ):
+                    passthrough = True
+                    await send(start)
+                return
+
+            # 미들웨어를 거치며 조각난 본문은 모아서 한 번에 압축
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            if len(body) < self.minimum_size:
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            compressed = self.compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return self.brotli.compress(body, quality=BROTLI_QUALITY)
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def cache_validators(
+    analysis_id: str, last_modified: datetime, variant: str = ""
+) -> dict[str, str]:
+    """분석 결과 응답의 ETag/Last-Modified 헤더를 만듭니다.
+
+    analysis_id의 분석 결과는 바뀌지 않으므로 (analysis_id, 표현 형식)만으로
+    ETag를 정합니다. 압축 여부와 무관하게 같은 값이 되도록 약한 ETag를 씁니다.
+
+    Args:
+        analysis_id: 분석 결과 ID
+        last_modified: 분석 생성 시간
+        variant: 같은 분석의 표현 구분 (예: html, markdown)
+    """
+    digest = hashlib.sha256(f"{analysis_id}:{variant}".encode()).hexdigest()[:20]
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.astimezone()
+    return {
+        "ETag": f'W/"{digest}"',
+        "Last-Modified": format_datetime(last_modified.astimezone(UTC), usegmt=True),
+        # 캐시하되 매번 재검증 (새로고침 시 304)
+        "Cache-Control": "private, no-cache",
+    }
+
+
+def is_not_modified(request: Request, validators: dict[str, str]) -> bool:
+    """요청의 If-None-Match/If-Modified-Since가 현재 응답과 일치하는지 확인합니다.
+
+    If-None-Match가 있으면 If-Modified-Since는 무시합니다 (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = validators["ETag"].removeprefix("W/")
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        return parsedate_to_datetime(validators["Last-Modified"]) <= since
+
+    return False
+
+
+def not_modified(validators: dict[str, str]) -> Response:
+    """본문 없는 304 응답을 반환합니다."""
+    return Response(status_code=304, headers=validators)
@@ -1,13 +1,19 @@
 """API 라우트."""
 
+from .admin import router as admin_router
 from .analyze import router as analyze_router
 from .graph import router as graph_router
+from .jobs import router as jobs_router
+from .metrics import router as metrics_router
 from .reports import router as reports_router
 from .stock import router as stock_router
 
 __all__ = [
+    "admin_router",
     "analyze_router",
     "graph_router",
+    "jobs_router",
+    "metrics_router",
     "reports_router",
     "stock_router",
 ]
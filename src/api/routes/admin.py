@@ -0,0 +1,73 @@
+"""관리자 전용 API 라우트 (프로파일 조회)."""
+
+import hmac
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import FileResponse, PlainTextResponse
+
+from config.settings import settings
+
+router = APIRouter(prefix="/admin", tags=["관리자"])
+
+# 프로파일 종류 → (확장자, 미디어 타입)
+PROFILE_FILES = {
+    "summary": (".txt", "text/plain; charset=utf-8"),
+    "collapsed": (".collapsed", "text/plain; charset=utf-8"),
+    "pstats": (".prof", "application/octet-stream"),
+}
+
+
+def is_admin(request: Request) -> bool:
+    """X-Admin-Token 헤더가 admin_token 설정과 일치하는지 확인합니다.
+
+    admin_token이 비어 있으면 관리자 기능은 항상 비활성입니다.
+    """
+    token = request.headers.get("x-admin-token", "")
+    return bool(settings.admin_token) and hmac.compare_digest(
+        token.encode(), settings.admin_token.encode()
+    )
+
+
+def require_admin(request: Request) -> None:
+    """관리자 요청이 아니면 403으로 거부합니다."""
+    if not is_admin(request):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다"
+        )
+
+
+@router.get(
+    "/profiles",
+    dependencies=[Depends(require_admin)],
+    summary="프로파일 목록",
+    description="?profile=1 요청과 --profile 실행으로 저장된 프로파일 ID를 최신순으로 반환합니다.",
+)
+async def list_profiles() -> list[str]:
+    """저장된 프로파일 ID 목록을 반환합니다."""
+    directory = Path(settings.profile_dir)
+    if not directory.exists():
+        return []
+    return sorted((p.stem for p in directory.glob("*.prof")), reverse=True)
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    dependencies=[Depends(require_admin)],
+    summary="프로파일 조회",
+    description="kind=summary(상위 함수), collapsed(flamegraph 입력), pstats(cProfile 파일)",
+)
+async def get_profile(profile_id: str, kind: str = "summary"):
+    """저장된 프로파일 파일을 반환합니다."""
+    if kind not in PROFILE_FILES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 종류: {kind}")
+
+    suffix, media_type = PROFILE_FILES[kind]
+    directory = Path(settings.profile_dir).resolve()
+    path = (directory / f"{profile_id}{suffix}").resolve()
+    if path.parent != directory or not path.exists():
+        raise HTTPException(status_code=404, detail=f"프로파일을 찾을 수 없습니다: {profile_id}")
+
+    if kind == "pstats":
+        return FileResponse(path, media_type=media_type, filename=path.name)
+    return PlainTextResponse(path.read_text(encoding="utf-8"), media_type=media_type)
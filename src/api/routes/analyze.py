@@ -2,9 +2,10 @@
 
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from src.agents import CompanyInfoAgent
+from src.api.responses import cache_validators, is_not_modified, not_modified
 from src.api.schemas import (
     AnalyzeRequest,
     CompanyAnalysis,
@@ -14,12 +15,98 @@ from src.api.schemas import (
     StockData,
     StockIndicators,
 )
+from src.models.schemas import CompanyReport
+from src.reports import get_or_analyze, load_report
 from src.utils.logging import get_logger
 
 logger = get_logger("api.analyze")
 router = APIRouter(prefix="/analyze", tags=["분석"])
 
 
+async def run_analysis(request: AnalyzeRequest) -> CompanyAnalysis:
+    """에이전트로 기업을 분석하고 API 응답 모델로 변환합니다.
+
+    Args:
+        request: 기업 분석 요청
+
+    Returns:
+        기업 분석 결과
+    """
+    # 항상 새로 분석하되, 리포트 엔드포인트가 재사용하도록 저장
+    analysis_id, report, _ = await get_or_analyze(request.company_name, refresh=True)
+    return to_company_analysis(
+        analysis_id, report, request.company_name, include_stock=request.include_stock
+    )
+
+
+def to_company_analysis(
+    analysis_id: str,
+    report: CompanyReport,
+    company_name: str,
+    include_stock: bool = True,
+) -> CompanyAnalysis:
+    """저장된 분석 결과를 API 응답 모델로 변환합니다.
+
+    Args:
+        analysis_id: 분석 결과 ID
+        report: 분석 결과
+        company_name: 요청한 기업명
+        include_stock: 주식 데이터 포함 여부
+
+    Returns:
+        기업 분석 결과
+    """
+    # 결과 변환
+    news_items = [
+        NewsItem(
+            title=n.title,
+            url=n.url,
+            source=n.source,
+            published_date=n.published_date,
+            summary=n.summary,
+        )
+        for n in report.news
+    ]
+
+    # 주식 데이터 변환
+    stock_data = None
+    if include_stock and report.palantir_data:
+        raw_stock = report.palantir_data.get("stock_data")
+        if raw_stock:
+            indicators = None
+            if raw_stock.get("indicators"):
+                ind = raw_stock["indicators"]
+                indicators = StockIndicators(
+                    rsi=ind.get("rsi"),
+                    macd=ind.get("macd"),
+                    bollinger=ind.get("bollinger"),
+                    sma_20=ind.get("sma_20"),
+                    sma_50=ind.get("sma_50"),
+                )
+            stock_data = StockData(
+                ticker=raw_stock.get("ticker", ""),
+                name=raw_stock.get("name", company_name),
+                current_price=raw_stock.get("current_price"),
+                change_percent=raw_stock.get("change_percent"),
+                volume=raw_stock.get("volume"),
+                indicators=indicators,
+            )
+
+    return CompanyAnalysis(
+        analysis_id=analysis_id,
+        company_name=company_name,
+        summary=report.summary,
+        news=news_items,
+        stock_data=stock_data,
+        graph_context=report.palantir_data.get("graph_context")
+        if report.palantir_data
+        else None,
+        palantir_data=report.palantir_data,
+        sources=report.sources,
+        generated_at=report.generated_at,
+    )
+
+
 @router.post(
     "/company",
     response_model=CompanyAnalysis,
@@ -27,66 +114,47 @@ router = APIRouter(prefix="/analyze", tags=["분석"])
     summary="기업 종합 분석",
     description="지정된 기업에 대한 종합 분석을 수행합니다. 웹 검색, 뉴스, 주식 데이터, Graph RAG를 통합합니다.",
 )
-async def analyze_company(request: AnalyzeRequest) -> CompanyAnalysis:
+async def analyze_company(request: AnalyzeRequest, response: Response) -> CompanyAnalysis:
     """기업 종합 분석을 수행합니다."""
     try:
         logger.info(f"기업 분석 요청: {request.company_name}")
-        agent = CompanyInfoAgent()
-        report = await agent.analyze(request.company_name)
-
-        # 결과 변환
-        news_items = [
-            NewsItem(
-                title=n.title,
-                url=n.url,
-                source=n.source,
-                published_date=n.published_date,
-                summary=n.summary,
-            )
-            for n in report.news
-        ]
-
-        # 주식 데이터 변환
-        stock_data = None
-        if request.include_stock and report.palantir_data:
-            raw_stock = report.palantir_data.get("stock_data")
-            if raw_stock:
-                indicators = None
-                if raw_stock.get("indicators"):
-                    ind = raw_stock["indicators"]
-                    indicators = StockIndicators(
-                        rsi=ind.get("rsi"),
-                        macd=ind.get("macd"),
-                        bollinger=ind.get("bollinger"),
-                        sma_20=ind.get("sma_20"),
-                        sma_50=ind.get("sma_50"),
-                    )
-                stock_data = StockData(
-                    ticker=raw_stock.get("ticker", ""),
-                    name=raw_stock.get("name", request.company_name),
-                    current_price=raw_stock.get("current_price"),
-                    change_percent=raw_stock.get("change_percent"),
-                    volume=raw_stock.get("volume"),
-                    indicators=indicators,
-                )
-
-        return CompanyAnalysis(
-            company_name=request.company_name,
-            summary=report.summary,
-            news=news_items,
-            stock_data=stock_data,
-            graph_context=report.palantir_data.get("graph_context")
-            if report.palantir_data
-            else None,
-            palantir_data=report.palantir_data,
-            sources=report.sources,
-            generated_at=report.generated_at,
-        )
+        analysis = await run_analysis(request)
 
     except Exception as e:
         logger.error(f"기업 분석 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    # GET /analyze/{analysis_id} 재검증용 (저장되지 않은 분석은 ID가 없으므로 생략)
+    if analysis.analysis_id is not None:
+        response.headers.update(
+            cache_validators(analysis.analysis_id, analysis.generated_at, "analysis")
+        )
+    return analysis
+
+
+@router.get(
+    "/{analysis_id}",
+    response_model=CompanyAnalysis,
+    responses={304: {"description": "변경 없음"}, 404: {"model": ErrorResponse}},
+    summary="저장된 기업 분석 조회",
+    description=(
+        "analysis_id의 분석 결과를 다시 계산하지 않고 반환합니다. "
+        "ETag/Last-Modified로 조건부 요청하면 304를 반환합니다."
+    ),
+)
+async def get_analysis(analysis_id: str, request: Request, response: Response):
+    """저장된 기업 분석 결과를 조회합니다."""
+    report = await load_report(analysis_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없거나 만료되었습니다")
+
+    validators = cache_validators(analysis_id, report.generated_at, "analysis")
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    response.headers.update(validators)
+    return to_company_analysis(analysis_id, report, report.company.name)
+
 
 @router.post(
     "/news",
@@ -3,7 +3,7 @@
 from fastapi import APIRouter, HTTPException
 
 from src.api.schemas import ErrorResponse, GraphSearchRequest
-from src.graph import HybridRetriever, Neo4jClient
+from src.graph import HybridRetriever, Neo4jClient, get_graph_stats_service
 from src.utils.logging import get_logger
 
 logger = get_logger("api.graph")
@@ -48,41 +48,14 @@ async def search_graph(request: GraphSearchRequest) -> list[dict]:
     response_model=dict,
     responses={500: {"model": ErrorResponse}},
     summary="그래프 통계",
-    description="지식 그래프의 노드 및 관계 통계를 조회합니다.",
+    description="지식 그래프의 노드 및 관계 통계를 카운트 스토어에서 조회합니다 (짧은 TTL 캐시).",
 )
-async def get_graph_stats() -> dict:
+async def get_graph_stats(refresh: bool = False) -> dict:
     """그래프 통계를 조회합니다."""
     try:
         logger.info("그래프 통계 조회")
-        client = Neo4jClient()
-        await client.connect()
-
-        try:
-            # 노드 카운트
-            node_counts = {}
-            for label in ["Company", "Industry", "Event", "Person", "Document"]:
-                result = await client.execute_query(
-                    f"MATCH (n:{label}) RETURN count(n) as count"
-                )
-                records = [r async for r in result]
-                node_counts[label.lower()] = records[0]["count"] if records else 0
-
-            # 관계 카운트
-            rel_result = await client.execute_query(
-                "MATCH ()-[r]->() RETURN type(r) as type, count(r) as count"
-            )
-            rel_counts = {}
-            async for record in rel_result:
-                rel_counts[record["type"]] = record["count"]
-
-            return {
-                "nodes": node_counts,
-                "relationships": rel_counts,
-                "total_nodes": sum(node_counts.values()),
-                "total_relationships": sum(rel_counts.values()),
-            }
-        finally:
-            await client.close()
+        service = get_graph_stats_service()
+        return await service.get_stats(refresh=refresh)
 
     except Exception as e:
         logger.error(f"그래프 통계 조회 실패: {e}")
@@ -0,0 +1,98 @@
+"""비동기 작업 API 라우트."""
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from src.api.routes.analyze import run_analysis
+from src.api.schemas import AnalyzeRequest, ErrorResponse, JobResponse
+from src.jobs import Job, JobLimitExceededError, JobQueue, get_job_queue
+from src.utils.logging import get_logger
+
+logger = get_logger("api.jobs")
+router = APIRouter(prefix="/jobs", tags=["작업"])
+
+
+async def analyze_job(params: dict) -> dict:
+    """기업 분석 작업 핸들러."""
+    analysis = await run_analysis(AnalyzeRequest(**params))
+    return analysis.model_dump(mode="json")
+
+
+def job_queue() -> JobQueue:
+    """작업 핸들러가 등록된 기본 작업 큐를 반환합니다."""
+    queue = get_job_queue()
+    if "analyze" not in queue.handlers:
+        queue.register("analyze", analyze_job)
+    return queue
+
+
+def request_user(request: Request) -> str:
+    """동시 작업 한도를 적용할 요청 사용자를 식별합니다.
+
+    인증 미들웨어가 확인한 사용자가 있으면 그 이름을, 없으면 클라이언트 주소를
+    사용합니다. 클라이언트가 임의로 바꿀 수 있는 헤더(X-User-Id 등)는 한도를
+    우회할 수 있으므로 사용하지 않습니다.
+    """
+    user = request.scope.get("user")
+    if getattr(user, "is_authenticated", False):
+        return f"user:{user.display_name}"
+    return request.client.host if request.client else "anonymous"
+
+
+def to_job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        job_id=job.id,
+        kind=job.kind,
+        status=job.status.value,
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+@router.post(
+    "/analyze",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={429: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    summary="기업 분석 작업 제출",
+    description=(
+        "기업 분석을 백그라운드 작업으로 제출하고 작업 ID를 즉시 반환합니다. "
+        "GET /jobs/{job_id}로 상태와 결과를 조회합니다."
+    ),
+)
+async def submit_analyze_job(
+    request: AnalyzeRequest, http_request: Request, response: Response
+) -> JobResponse:
+    """기업 분석 작업을 제출합니다."""
+    user = request_user(http_request)
+    try:
+        job = await job_queue().submit("analyze", request.model_dump(), user=user)
+    except JobLimitExceededError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+    except Exception as e:
+        logger.error(f"작업 제출 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    logger.info(f"기업 분석 작업 제출: {request.company_name} ({job.id})")
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return to_job_response(job)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    responses={404: {"model": ErrorResponse}},
+    summary="작업 상태 조회",
+    description="작업 상태를 조회합니다. 완료된 작업은 결과(또는 실패 사유)를 포함합니다.",
+)
+async def get_job(job_id: str, response: Response) -> JobResponse:
+    """작업 상태/결과를 조회합니다."""
+    job = await job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없거나 만료되었습니다")
+
+    if not job.status.is_finished:
+        response.headers["Retry-After"] = "2"
+    return to_job_response(job)
@@ -0,0 +1,25 @@
+"""메트릭 API 라우트 (Prometheus 텍스트 형식)."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.utils.metrics import get_registry
+
+router = APIRouter(tags=["시스템"])
+
+# Prometheus 텍스트 노출 형식
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="런타임 메트릭",
+    description=(
+        "노드/백엔드별 지연 시간 히스토그램, 오류 수, 캐시 적중률, 진행 중 작업 수, "
+        "LLM 토큰 사용량을 Prometheus 형식으로 반환합니다."
+    ),
+)
+async def metrics() -> PlainTextResponse:
+    """Prometheus 메트릭을 반환합니다."""
+    return PlainTextResponse(get_registry().render(), media_type=CONTENT_TYPE)
@@ -2,45 +2,81 @@
 
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse
 
-from src.agents import CompanyInfoAgent
+from src.api.responses import cache_validators, is_not_modified, not_modified
 from src.api.schemas import ErrorResponse, ReportRequest, ReportResponse
-from src.reports import ReportGenerator
+from src.models.schemas import CompanyReport
+from src.reports import ReportGenerator, get_or_analyze, load_report
 from src.utils.logging import get_logger
 
 logger = get_logger("api.reports")
 router = APIRouter(prefix="/reports", tags=["리포트"])
 
 
+async def resolve_analysis(
+    company_name: str | None,
+    analysis_id: str | None = None,
+    refresh: bool = False,
+) -> tuple[str, CompanyReport, bool]:
+    """리포트를 렌더링할 분석 결과를 찾습니다.
+
+    analysis_id가 있으면 저장된 결과를, 없으면 기업의 신선한 분석을 재사용하고
+    그마저 없으면 새로 분석합니다.
+
+    Returns:
+        (analysis_id, 분석 결과, 재사용 여부) 튜플
+
+    Raises:
+        HTTPException: analysis_id가 없거나 만료된 경우 (404)
+    """
+    if analysis_id:
+        report = await load_report(analysis_id)
+        if report is None:
+            raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없거나 만료되었습니다")
+        return analysis_id, report, True
+
+    return await get_or_analyze(company_name, refresh=refresh)
+
+
 @router.post(
     "/generate",
     response_model=ReportResponse,
-    responses={500: {"model": ErrorResponse}},
+    responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
     summary="리포트 생성",
-    description="기업 분석 결과를 지정된 형식의 리포트로 생성합니다.",
+    description=(
+        "기업 분석 결과를 지정된 형식의 리포트로 생성합니다. "
+        "analysis_id를 주거나 신선한 분석이 있으면 재분석하지 않습니다."
+    ),
 )
 async def generate_report(request: ReportRequest) -> ReportResponse:
     """리포트를 생성합니다."""
     try:
-        logger.info(f"리포트 생성 요청: {request.company_name} ({request.format})")
+        logger.info(
+            f"리포트 생성 요청: {request.company_name or request.analysis_id} ({request.format})"
+        )
 
-        # 기업 분석 수행
-        agent = CompanyInfoAgent()
-        report_data = await agent.analyze(request.company_name)
+        # 분석 결과 조회 (저장된 결과 우선)
+        analysis_id, report_data, cached = await resolve_analysis(
+            request.company_name, request.analysis_id, request.refresh
+        )
 
         # 리포트 생성
         generator = ReportGenerator()
         content = await generator.generate(report_data, format=request.format)
 
         return ReportResponse(
-            company_name=request.company_name,
+            company_name=report_data.company.name,
             format=request.format,
             content=content,
             generated_at=datetime.now(),
+            analysis_id=analysis_id,
+            cached=cached,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"리포트 생성 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -50,23 +86,37 @@ async def generate_report(request: ReportRequest) -> ReportResponse:
     "/view/{company_name}",
     response_class=HTMLResponse,
     summary="HTML 리포트 뷰",
-    description="기업 분석 HTML 리포트를 웹 페이지로 조회합니다.",
+    description=(
+        "기업 분석 HTML 리포트를 웹 페이지로 조회합니다. "
+        "analysis_id를 주면 해당 분석 결과를 렌더링합니다. "
+        "같은 분석을 조건부 요청(ETag/Last-Modified)하면 렌더링 없이 304를 반환합니다."
+    ),
 )
-async def view_report(company_name: str) -> HTMLResponse:
+async def view_report(
+    request: Request,
+    company_name: str,
+    analysis_id: str | None = None,
+    refresh: bool = False,
+) -> Response:
     """HTML 리포트를 조회합니다."""
     try:
         logger.info(f"HTML 리포트 조회: {company_name}")
 
-        # 기업 분석 수행
-        agent = CompanyInfoAgent()
-        report_data = await agent.analyze(company_name)
+        # 분석 결과 조회 (저장된 결과 우선)
+        analysis_id, report_data, _ = await resolve_analysis(company_name, analysis_id, refresh)
+
+        validators = cache_validators(analysis_id, report_data.generated_at, "html")
+        if is_not_modified(request, validators):
+            return not_modified(validators)
 
         # HTML 리포트 생성
         generator = ReportGenerator()
         html_content = await generator.generate(report_data, format="html")
 
-        return HTMLResponse(content=html_content)
+        return HTMLResponse(content=html_content, headers=validators)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"리포트 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
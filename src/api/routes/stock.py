@@ -23,29 +23,20 @@ async def analyze_stock(request: StockRequest) -> StockData:
         logger.info(f"주식 분석 요청: {request.company_name}")
         client = StockClient()
         analysis = await client.analyze(request.company_name, period=request.period)
+        if analysis is None:
+            raise HTTPException(status_code=404, detail="주식 데이터를 찾을 수 없습니다")
 
-        # 기술적 지표 변환
+        # 기술적 지표 변환 (이름별 지표 목록 → 응답 필드)
         indicators = None
         if analysis.indicators:
-            ind = analysis.indicators
+            by_name = {i.name: i for i in analysis.indicators}
+            rsi, macd, bollinger = (by_name.get(n) for n in ("RSI", "MACD", "Bollinger"))
             indicators = StockIndicators(
-                rsi=ind.rsi,
-                macd={
-                    "macd": ind.macd,
-                    "signal": ind.macd_signal,
-                    "histogram": ind.macd_histogram,
-                }
-                if ind.macd is not None
-                else None,
-                bollinger={
-                    "upper": ind.bollinger_upper,
-                    "middle": ind.bollinger_middle,
-                    "lower": ind.bollinger_lower,
-                }
-                if ind.bollinger_upper is not None
-                else None,
-                sma_20=ind.sma_20,
-                sma_50=ind.sma_50,
+                rsi=rsi.value if rsi else None,
+                macd=macd.values or None if macd else None,
+                bollinger=bollinger.values or None if bollinger else None,
+                sma_20=analysis.moving_averages.get("sma_20"),
+                sma_50=analysis.moving_averages.get("sma_50"),
             )
 
         return StockData(
@@ -53,10 +44,12 @@ async def analyze_stock(request: StockRequest) -> StockData:
             name=analysis.info.name,
             current_price=analysis.current_price,
             change_percent=analysis.change_percent,
-            volume=analysis.volume,
+            volume=analysis.prices[-1].volume if analysis.prices else None,
             indicators=indicators,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"주식 분석 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -74,7 +67,7 @@ async def get_stock_price(company_name: str, period: str = "1mo") -> dict:
     try:
         logger.info(f"주가 조회: {company_name}")
         client = StockClient()
-        history = await client.get_price_history(company_name, period=period)
+        history = await client.get_prices(company_name, period=period)
 
         if not history:
             raise HTTPException(status_code=404, detail="주식 데이터를 찾을 수 없습니다")
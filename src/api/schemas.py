@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class AnalyzeRequest(BaseModel):
@@ -38,8 +38,16 @@ class GraphSearchRequest(BaseModel):
 class ReportRequest(BaseModel):
     """리포트 생성 요청."""
 
-    company_name: str = Field(..., description="기업명")
+    company_name: str | None = Field(default=None, description="기업명")
+    analysis_id: str | None = Field(default=None, description="이전 분석 결과 ID (재분석 없이 렌더링)")
     format: str = Field(default="html", description="출력 형식 (html, markdown, json)")
+    refresh: bool = Field(default=False, description="저장된 분석을 무시하고 다시 분석")
+
+    @model_validator(mode="after")
+    def _require_target(self) -> "ReportRequest":
+        if not self.company_name and not self.analysis_id:
+            raise ValueError("company_name 또는 analysis_id가 필요합니다")
+        return self
 
 
 class NewsItem(BaseModel):
@@ -76,6 +84,7 @@ class StockData(BaseModel):
 class CompanyAnalysis(BaseModel):
     """기업 분석 결과."""
 
+    analysis_id: str | None = Field(default=None, description="리포트 재사용용 분석 결과 ID")
     company_name: str
     summary: str
     news: list[NewsItem] = []
@@ -93,6 +102,33 @@ class ReportResponse(BaseModel):
     format: str
     content: str
     generated_at: datetime
+    analysis_id: str | None = None
+    cached: bool = Field(default=False, description="저장된 분석 결과 재사용 여부")
+
+
+class JobResponse(BaseModel):
+    """비동기 작업 상태 응답."""
+
+    job_id: str
+    kind: str
+    status: str = Field(..., description="queued, running, succeeded, failed")
+    result: dict | None = Field(default=None, description="완료된 작업 결과")
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+class WorkerStatus(BaseModel):
+    """API 워커 상태."""
+
+    id: str = Field(..., description="워커 ID (호스트:PID)")
+    pid: int = Field(..., description="프로세스 ID")
+    ready: bool = Field(..., description="요청 처리 준비 여부 (heartbeat가 끊기면 False)")
+    current: bool = Field(default=False, description="이 요청을 처리한 워커 여부")
+    uptime: float = Field(..., description="실행 시간 (초)")
+    last_seen: float = Field(..., description="마지막 heartbeat 이후 경과 시간 (초)")
+    error: str | None = Field(default=None, description="상태 기록/조회 실패 사유")
 
 
 class HealthResponse(BaseModel):
@@ -101,6 +137,8 @@ class HealthResponse(BaseModel):
     status: str = "ok"
     version: str = "1.0.0"
     services: dict = Field(default_factory=dict)
+    cache_backend: str = Field(default="memory", description="공유 캐시 백엔드")
+    workers: list[WorkerStatus] = Field(default_factory=list, description="워커별 준비 상태")
 
 
 class ErrorResponse(BaseModel):
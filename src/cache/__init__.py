@@ -0,0 +1,18 @@
+"""워커 간 공유 캐시/상태 모듈."""
+
+from .memory import MemoryStore
+from .shared import SharedCache, close_shared_cache, create_cache_store, get_shared_cache
+from .sqlite import SQLiteStore
+from .workers import WorkerRegistry, get_worker_registry, shutdown_worker_registry
+
+__all__ = [
+    "MemoryStore",
+    "SQLiteStore",
+    "SharedCache",
+    "WorkerRegistry",
+    "close_shared_cache",
+    "create_cache_store",
+    "get_shared_cache",
+    "get_worker_registry",
+    "shutdown_worker_registry",
+]
@@ -0,0 +1,82 @@
+"""인메모리 키-값 저장소 (단일 프로세스)."""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+# 만료 항목 정리 주기 (set 호출 수)
+PURGE_EVERY = 256
+
+
+class MemoryStore:
+    """redis.asyncio 명령 일부(get/set/delete/hset/hgetall/hdel)를 흉내 내는 프로세스 내 저장소.
+
+    공유 저장소와 같은 인터페이스를 제공하므로 단일 워커에서는 설정 변경 없이
+    SharedCache/WorkerRegistry를 사용할 수 있습니다.
+
+    문자열 값은 maxsize개까지 LRU로 보관하고, PURGE_EVERY번 쓸 때마다 만료된
+    항목을 정리하므로 한 번 쓰고 다시 읽지 않는 키가 쌓이지 않습니다.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        """저장소를 초기화합니다.
+
+        Args:
+            maxsize: 최대 문자열 값 수 (넘으면 가장 오래 쓰지 않은 항목부터 제거)
+        """
+        self.maxsize = maxsize
+        self._values: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._hashes: dict[str, dict[str, str]] = {}
+        self._writes = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _purge(self) -> None:
+        now = time.time()
+        expired = [
+            key for key, (expires, _) in self._values.items()
+            if expires is not None and expires <= now
+        ]
+        for key in expired:
+            del self._values[key]
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires is not None and expires <= time.time():
+            del self._values[key]
+            return None
+        self._values.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ex: float | None = None) -> None:
+        self._values[key] = (time.time() + ex if ex else None, value)
+        self._values.move_to_end(key)
+
+        self._writes += 1
+        if self._writes % PURGE_EVERY == 0:
+            self._purge()
+        while len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._values.pop(key, None)
+            self._hashes.pop(key, None)
+
+    async def hset(self, name: str, key: str, value: str) -> None:
+        self._hashes.setdefault(name, {})[key] = value
+
+    async def hgetall(self, name: str) -> dict[str, str]:
+        return dict(self._hashes.get(name, {}))
+
+    async def hdel(self, name: str, *keys: str) -> None:
+        fields = self._hashes.get(name, {})
+        for key in keys:
+            fields.pop(key, None)
+
+    async def aclose(self) -> None:
+        pass
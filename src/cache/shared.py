@@ -0,0 +1,172 @@
+"""워커 간 공유 캐시 (검색, LLM 응답, 주가, 분석 결과)."""
+
+import hashlib
+import json
+from typing import Any
+
+from config.settings import Settings
+from src.cache.memory import MemoryStore
+from src.utils.logging import get_logger
+from src.utils.metrics import get_registry
+
+logger = get_logger("cache.shared")
+
+BACKENDS = ("memory", "sqlite", "redis")
+
+
+def create_cache_store(settings: Settings | None = None) -> Any:
+    """설정에 따라 공유 저장소 클라이언트를 생성합니다.
+
+    memory는 프로세스 내 저장소이고, sqlite(cache_path 파일)와 redis(redis_url)는
+    같은 설정을 쓰는 모든 워커가 공유합니다.
+
+    Raises:
+        ValueError: 알 수 없는 백엔드이거나 의존성이 없는 경우
+    """
+    if settings is None:
+        from config.settings import settings as default_settings
+        settings = default_settings
+
+    backend = settings.cache_backend.lower()
+
+    if backend == "memory":
+        return MemoryStore(maxsize=settings.cache_memory_max_entries)
+
+    if backend == "sqlite":
+        from src.cache.sqlite import SQLiteStore
+        return SQLiteStore(settings.cache_path)
+
+    if backend == "redis":
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise ValueError(
+                "redis가 필요합니다. pip install -e '.[redis]'로 설치해주세요."
+            ) from e
+        return redis.from_url(settings.redis_url, decode_responses=True)
+
+    raise ValueError(f"지원하지 않는 캐시 백엔드: {settings.cache_backend} ({'/'.join(BACKENDS)})")
+
+
+class SharedCache:
+    """네임스페이스별 TTL 캐시.
+
+    값은 JSON으로 직렬화해 ``{prefix}:{namespace}:{키 해시}``에 저장합니다.
+    캐시는 최적화일 뿐이므로 저장소 오류는 경고만 남기고 미스로 처리합니다.
+    """
+
+    def __init__(self, store: Any, backend: str = "memory", prefix: str = "ps:cache"):
+        """캐시를 초기화합니다.
+
+        Args:
+            store: 저장소 클라이언트 (get/set(ex)/delete 지원)
+            backend: 백엔드 이름
+            prefix: 키 접두사
+        """
+        self.store = store
+        self.backend = backend
+        self.prefix = prefix
+        self._stats: dict[str, dict[str, int]] = {}
+
+    @property
+    def is_shared(self) -> bool:
+        """다른 워커 프로세스와 공유되는 백엔드인지 여부."""
+        return self.backend != "memory"
+
+    def _key(self, namespace: str, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return f"{self.prefix}:{namespace}:{digest}"
+
+    def _count(self, namespace: str, result: str) -> None:
+        stats = self._stats.setdefault(namespace, {"hits": 0, "misses": 0})
+        stats[result] += 1
+
+    async def get(self, namespace: str, key: str) -> Any | None:
+        """캐시 값을 반환합니다 (없거나 만료되었거나 저장소 오류면 None)."""
+        try:
+            data = await self.store.get(self._key(namespace, key))
+        except Exception as e:
+            logger.warning(f"캐시 조회 실패 ({self.backend}, {namespace}): {e}")
+            data = None
+
+        if data is None:
+            self._count(namespace, "misses")
+            return None
+
+        self._count(namespace, "hits")
+        return json.loads(data)
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: float | None) -> None:
+        """값을 ttl초 동안 저장합니다 (ttl이 0 이하면 저장하지 않음).
+
+        Args:
+            namespace: 캐시 종류 (예: search, llm, price)
+            key: 캐시 키 (저장 시 해시)
+            value: JSON 직렬화 가능한 값
+            ttl: 유효 시간 (초, None이면 만료 없음)
+        """
+        if ttl is not None and ttl <= 0:
+            return
+        try:
+            await self.store.set(
+                self._key(namespace, key),
+                json.dumps(value, ensure_ascii=False),
+                ex=int(max(ttl, 1)) if ttl is not None else None,
+            )
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패 ({self.backend}, {namespace}): {e}")
+
+    async def delete(self, namespace: str, key: str) -> None:
+        """캐시 값을 삭제합니다."""
+        try:
+            await self.store.delete(self._key(namespace, key))
+        except Exception as e:
+            logger.warning(f"캐시 삭제 실패 ({self.backend}, {namespace}): {e}")
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """이 프로세스의 네임스페이스별 적중/미스 수를 반환합니다."""
+        return {namespace: dict(stats) for namespace, stats in self._stats.items()}
+
+    async def close(self) -> None:
+        """저장소 연결을 정리합니다."""
+        close = getattr(self.store, "aclose", None) or getattr(self.store, "close", None)
+        if close is not None:
+            await close()
+
+
+# 기본 공유 캐시 인스턴스
+_default_cache: SharedCache | None = None
+
+
+def get_shared_cache(settings: Settings | None = None) -> SharedCache:
+    """기본 공유 캐시를 반환합니다."""
+    global _default_cache
+
+    if _default_cache is None:
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+        _default_cache = SharedCache(
+            create_cache_store(settings), backend=settings.cache_backend.lower()
+        )
+
+    return _default_cache
+
+
+def _cache_stats() -> dict[str, dict]:
+    """메트릭 수집용 캐시 통계 (기본 인스턴스가 없으면 빈 dict)."""
+    if _default_cache is None:
+        return {}
+    return {f"shared_{namespace}": stats for namespace, stats in _default_cache.stats().items()}
+
+
+get_registry().register_cache_source(_cache_stats)
+
+
+async def close_shared_cache() -> None:
+    """기본 공유 캐시를 정리합니다 (앱 종료 시)."""
+    global _default_cache
+
+    if _default_cache is not None:
+        await _default_cache.close()
+        _default_cache = None
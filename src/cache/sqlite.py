@@ -0,0 +1,214 @@
+"""SQLite 파일 기반 공유 저장소 (같은 호스트의 여러 프로세스 공유)."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# 만료 항목 정리 주기 (set 호출 수)
+PURGE_EVERY = 256
+
+# blpop 대기열 확인 간격 (초): 비어 있는 동안 MAX_POLL_INTERVAL까지 두 배씩 늘림
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value TEXT, expires REAL);
+CREATE TABLE IF NOT EXISTS lists (id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT, value TEXT);
+CREATE INDEX IF NOT EXISTS lists_key ON lists (key, id);
+CREATE TABLE IF NOT EXISTS hashes (name TEXT, field TEXT, value TEXT, PRIMARY KEY (name, field));
+"""
+
+
+class SQLiteStore:
+    """redis.asyncio 명령 일부를 SQLite 파일로 구현한 저장소.
+
+    Redis 없이 ``ps serve --workers N``의 워커들이 캐시, 작업 상태, 워커 상태를
+    공유하기 위한 대체 구현입니다. 문자열(get/set/delete/incr/decr/expire),
+    리스트(rpush/blpop), 해시(hset/hgetall/hdel) 명령만 지원하며, 만료 시각은
+    프로세스 간에 비교할 수 있도록 벽시계 시간으로 저장합니다.
+
+    SQLite 호출은 스레드에서 실행하므로 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(self, path: str | Path):
+        """저장소를 초기화합니다.
+
+        Args:
+            path: SQLite 파일 경로 (워커들이 같은 경로를 사용해야 공유됨)
+        """
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """SQLite 연결을 반환합니다 (처음 사용할 때 생성)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=10.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, func, *args) -> Any:
+        def call():
+            with self._lock:
+                return func(self.conn, *args)
+
+        return await asyncio.to_thread(call)
+
+    @staticmethod
+    def _transaction(conn: sqlite3.Connection, statements) -> Any:
+        # BEGIN IMMEDIATE로 다른 프로세스의 쓰기와 직렬화
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = statements(conn)
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    # 문자열
+
+    async def get(self, key: str) -> str | None:
+        def get(conn):
+            row = conn.execute(
+                "SELECT value FROM kv WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            ).fetchone()
+            return row[0] if row else None
+
+        return await self._run(get)
+
+    async def set(self, key: str, value: Any, ex: float | None = None) -> None:
+        self._writes += 1
+        purge = self._writes % PURGE_EVERY == 0
+
+        def set_(conn):
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (key, value, expires) VALUES (?, ?, ?)",
+                (key, str(value), now + ex if ex else None),
+            )
+            if purge:
+                conn.execute("DELETE FROM kv WHERE expires IS NOT NULL AND expires <= ?", (now,))
+
+        await self._run(set_)
+
+    async def delete(self, *keys: str) -> None:
+        def delete(conn):
+            for key in keys:
+                conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+                conn.execute("DELETE FROM lists WHERE key = ?", (key,))
+                conn.execute("DELETE FROM hashes WHERE name = ?", (key,))
+
+        await self._run(lambda conn: self._transaction(conn, delete))
+
+    async def incr(self, key: str, amount: int = 1) -> int:
+        def incr(conn):
+            now = time.time()
+            row = conn.execute(
+                "SELECT value, expires FROM kv WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, now),
+            ).fetchone()
+            value = (int(row[0]) if row else 0) + amount
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (key, value, expires) VALUES (?, ?, ?)",
+                (key, str(value), row[1] if row else None),
+            )
+            return value
+
+        return await self._run(lambda conn: self._transaction(conn, incr))
+
+    async def decr(self, key: str, amount: int = 1) -> int:
+        return await self.incr(key, -amount)
+
+    async def expire(self, key: str, ttl: float) -> None:
+        await self._run(
+            lambda conn: conn.execute(
+                "UPDATE kv SET expires = ? WHERE key = ?", (time.time() + ttl, key)
+            )
+        )
+
+    # 리스트
+
+    async def rpush(self, key: str, value: Any) -> None:
+        await self._run(
+            lambda conn: conn.execute(
+                "INSERT INTO lists (key, value) VALUES (?, ?)", (key, str(value))
+            )
+        )
+
+    async def blpop(self, keys: list[str], timeout: float = 0) -> tuple[str, str] | None:
+        """keys 중 먼저 들어온 항목을 꺼냅니다 (timeout 초 동안 없으면 None, 0이면 무한 대기)."""
+        placeholders = ",".join("?" * len(keys))
+        select = (
+            f"SELECT id, key, value FROM lists WHERE key IN ({placeholders}) ORDER BY id LIMIT 1"
+        )
+
+        def pop(conn):
+            # 쓰기 잠금 없이 먼저 확인하고, 항목이 있을 때만 BEGIN IMMEDIATE로 꺼냄
+            if conn.execute(select, keys).fetchone() is None:
+                return None
+            return self._transaction(conn, take)
+
+        def take(conn):
+            row = conn.execute(select, keys).fetchone()
+            if row is None:
+                return None
+            conn.execute("DELETE FROM lists WHERE id = ?", (row[0],))
+            return row[1], row[2]
+
+        deadline = time.monotonic() + timeout
+        interval = POLL_INTERVAL
+        while True:
+            item = await self._run(pop)
+            if item is not None:
+                return item
+            if timeout:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                await asyncio.sleep(min(interval, remaining))
+            else:
+                await asyncio.sleep(interval)
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+    # 해시
+
+    async def hset(self, name: str, key: str, value: Any) -> None:
+        await self._run(
+            lambda conn: conn.execute(
+                "INSERT OR REPLACE INTO hashes (name, field, value) VALUES (?, ?, ?)",
+                (name, key, str(value)),
+            )
+        )
+
+    async def hgetall(self, name: str) -> dict[str, str]:
+        rows = await self._run(
+            lambda conn: conn.execute(
+                "SELECT field, value FROM hashes WHERE name = ?", (name,)
+            ).fetchall()
+        )
+        return dict(rows)
+
+    async def hdel(self, name: str, *keys: str) -> None:
+        def hdel(conn):
+            for key in keys:
+                conn.execute("DELETE FROM hashes WHERE name = ? AND field = ?", (name, key))
+
+        await self._run(hdel)
+
+    async def aclose(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
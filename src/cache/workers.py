@@ -0,0 +1,180 @@
+"""API 워커 상태 등록부 (워커별 준비 상태와 heartbeat)."""
+
+import asyncio
+import json
+import os
+import socket
+import time
+from typing import Any
+
+from config.settings import Settings
+from src.utils.logging import get_logger
+
+logger = get_logger("cache.workers")
+
+# heartbeat가 이 배수만큼 끊기면 응답 없음, PRUNE_FACTOR 배수면 등록부에서 제거
+STALE_FACTOR = 3
+PRUNE_FACTOR = 20
+
+
+class WorkerRegistry:
+    """공유 저장소의 해시(``{key}``)에 워커별 상태를 기록합니다.
+
+    각 워커는 시작 시 자신을 등록하고 heartbeat 간격마다 last_seen을 갱신합니다.
+    어느 워커가 /health 요청을 받더라도 같은 저장소를 읽으므로 전체 워커의
+    준비 상태를 보고할 수 있습니다 (memory 백엔드면 자기 자신만 보임).
+
+    저장소 오류로 시작을 막지는 않습니다. 기록에 실패하면 오류를 남기고 이 워커를
+    준비되지 않음(degraded)으로 보고하며, 다음 heartbeat에서 다시 기록합니다.
+    """
+
+    def __init__(self, store: Any, heartbeat: float = 5.0, key: str = "ps:workers"):
+        """등록부를 초기화합니다.
+
+        Args:
+            store: 저장소 클라이언트 (hset/hgetall/hdel 지원)
+            heartbeat: 상태 갱신 간격 (초)
+            key: 워커 상태 해시 키
+        """
+        self.store = store
+        self.heartbeat = heartbeat
+        self.key = key
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.started_at = time.time()
+        self.ready = False
+        self.error: str | None = None
+        self._task: asyncio.Task | None = None
+
+    def _record(self) -> str:
+        return json.dumps({
+            "id": self.worker_id,
+            "pid": os.getpid(),
+            "ready": self.ready,
+            "started_at": self.started_at,
+            "last_seen": time.time(),
+        })
+
+    async def _publish(self) -> bool:
+        """상태를 기록합니다 (실패하면 오류를 남기고 False)."""
+        try:
+            await self.store.hset(self.key, self.worker_id, self._record())
+        except Exception as e:
+            if self.error is None:
+                logger.warning(f"워커 상태 기록 실패: {e}")
+            self.error = str(e) or type(e).__name__
+            return False
+        if self.error is not None:
+            logger.info(f"워커 상태 기록 복구: {self.worker_id}")
+        self.error = None
+        return True
+
+    async def start(self) -> None:
+        """워커를 준비 상태로 등록하고 heartbeat를 시작합니다."""
+        self.ready = True
+        published = await self._publish()
+        if self._task is None:
+            self._task = asyncio.create_task(self._beat(), name="worker-heartbeat")
+        if published:
+            logger.info(f"워커 준비: {self.worker_id}")
+        else:
+            logger.warning(f"워커 시작 (등록 실패, degraded): {self.worker_id}")
+
+    async def _beat(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            await self._publish()
+
+    def _local_status(self) -> dict:
+        """이 워커의 상태를 저장소를 거치지 않고 반환합니다."""
+        return {
+            "id": self.worker_id,
+            "pid": os.getpid(),
+            "ready": self.ready and self.error is None,
+            "current": True,
+            "uptime": round(time.time() - self.started_at, 1),
+            "last_seen": 0.0,
+            "error": self.error,
+        }
+
+    async def stop(self) -> None:
+        """heartbeat를 멈추고 등록부에서 제거합니다."""
+        self.ready = False
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            await self.store.hdel(self.key, self.worker_id)
+        except Exception as e:
+            logger.warning(f"워커 등록 해제 실패: {e}")
+
+    async def workers(self) -> list[dict]:
+        """등록된 워커 상태를 반환합니다.
+
+        heartbeat가 끊긴 워커는 ready=False로 보고하고, 오래 끊긴 워커는
+        등록부에서 제거합니다. 저장소를 읽지 못하거나 이 워커의 기록이 실패하고
+        있으면 이 워커를 오류와 함께 준비되지 않음으로 보고합니다.
+        """
+        try:
+            records = await self.store.hgetall(self.key)
+        except Exception as e:
+            logger.warning(f"워커 상태 조회 실패: {e}")
+            self.error = str(e) or type(e).__name__
+            return [self._local_status()] if self.ready else []
+
+        now = time.time()
+        workers, pruned = [], []
+        for worker_id, data in records.items():
+            worker = json.loads(data)
+            age = now - worker["last_seen"]
+            if age > self.heartbeat * PRUNE_FACTOR:
+                pruned.append(worker_id)
+                continue
+            alive = age <= self.heartbeat * STALE_FACTOR
+            workers.append({
+                "id": worker_id,
+                "pid": worker["pid"],
+                "ready": worker["ready"] and alive,
+                "current": worker_id == self.worker_id,
+                "uptime": round(now - worker["started_at"], 1),
+                "last_seen": round(age, 1),
+            })
+
+        if self.error is not None and self.ready:
+            # 기록이 실패하는 동안 저장소에는 이 워커의 예전 상태만 남아 있음
+            workers = [w for w in workers if w["id"] != self.worker_id]
+            workers.append(self._local_status())
+
+        if pruned:
+            await self.store.hdel(self.key, *pruned)
+        return sorted(workers, key=lambda w: w["id"])
+
+
+# 기본 등록부 인스턴스
+_default_registry: WorkerRegistry | None = None
+
+
+def get_worker_registry(settings: Settings | None = None) -> WorkerRegistry:
+    """기본 워커 등록부를 반환합니다 (기본 공유 캐시의 저장소 사용)."""
+    global _default_registry
+
+    if _default_registry is None:
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+        from src.cache.shared import get_shared_cache
+
+        _default_registry = WorkerRegistry(
+            get_shared_cache(settings).store, heartbeat=settings.worker_heartbeat
+        )
+
+    return _default_registry
+
+
+async def shutdown_worker_registry() -> None:
+    """기본 등록부에서 이 워커를 제거합니다 (앱 종료 시)."""
+    global _default_registry
+
+    if _default_registry is not None:
+        await _default_registry.stop()
+        _default_registry = None
@@ -11,20 +11,28 @@ from .schema import (
 )
 from .repository import GraphRepository
 from .extractor import EntityExtractor
-from .vector_store import VectorStore
-from .hybrid import HybridRetriever
+from .resolver import EntityResolver, get_entity_resolver
+from .vector_store import VectorStore, get_vector_store
+from .hybrid import HybridRetriever, HybridSearchResult
+from .stats import GraphStatsService, get_graph_stats_service
 
 __all__ = [
     "Company",
     "Document",
     "EntityExtractor",
+    "EntityResolver",
     "Event",
     "GraphRepository",
+    "GraphStatsService",
     "HybridRetriever",
+    "HybridSearchResult",
     "Industry",
     "Neo4jClient",
     "Person",
     "Relationship",
     "VectorStore",
+    "get_entity_resolver",
+    "get_graph_stats_service",
     "get_neo4j_client",
+    "get_vector_store",
 ]
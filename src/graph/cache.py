@@ -0,0 +1,191 @@
+"""세대 카운터 기반 검색 결과 캐시."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from config.settings import Settings
+from src.graph.resolver import EntityResolver, get_entity_resolver
+from src.utils.logging import get_logger
+from src.utils.metrics import get_registry
+
+logger = get_logger("graph.cache")
+
+# 기업 미지정 쓰기/조회용 전역 세대 키
+ANY_COMPANY = "*"
+
+
+class GenerationTracker:
+    """기업별 데이터 세대 카운터.
+
+    그래프/벡터 저장소에 기업 관련 데이터가 쓰일 때마다 해당 기업과 전역 세대를
+    올립니다. 기업 조회는 해당 기업 세대에, 기업 미지정 조회는 전역 세대에
+    의존하므로 관련 데이터가 바뀌었을 때만 캐시가 무효화됩니다.
+
+    세대는 해소기의 정규 키로 관리하므로 "Samsung Electronics"나 "005930.KS"로
+    조회한 결과도 "삼성전자" 쓰기에 무효화됩니다.
+
+    카운터는 프로세스 로컬이라 같은 프로세스의 쓰기만 반영합니다. `ps ingest`나
+    다른 API 워커가 쓴 데이터는 RetrievalCache의 TTL(retrieval_cache_ttl)이
+    지나야 보이므로, 여러 프로세스가 같은 저장소에 쓰는 배포에서는 TTL을 짧게 둡니다.
+    """
+
+    def __init__(self, resolver: EntityResolver | None = None):
+        """세대 카운터를 초기화합니다.
+
+        Args:
+            resolver: 기업명 해소기 (기본값: 프로세스 공용 해소기)
+        """
+        self._generations: dict[str, int] = {}
+        self._resolver = resolver
+
+    @property
+    def resolver(self) -> EntityResolver:
+        """기업명 해소기를 반환합니다."""
+        if self._resolver is None:
+            self._resolver = get_entity_resolver()
+        return self._resolver
+
+    def key(self, company_name: str | None) -> str:
+        """기업명의 세대 키 (정규 키, 기업 미지정이면 전역 키)를 반환합니다."""
+        if not company_name:
+            return ANY_COMPANY
+        return self.resolver.canonical_key(company_name)
+
+    def get(self, company_name: str | None = None) -> int:
+        """기업(또는 전역)의 현재 세대를 반환합니다."""
+        return self._generations.get(self.key(company_name), 0)
+
+    def bump(self, *company_names: str | None) -> None:
+        """기업 세대와 전역 세대를 올립니다.
+
+        Args:
+            company_names: 데이터가 바뀐 기업명 (없으면 전역 세대만 올림)
+        """
+        keys = {self.key(name) for name in company_names if name}
+        keys.add(ANY_COMPANY)
+        for key in keys:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+
+class RetrievalCache:
+    """(쿼리, 기업, 결과 수, 융합 설정) 키의 LRU 검색 결과 캐시.
+
+    항목은 저장 시점의 세대와 함께 보관되며, 조회 시 세대가 바뀌었거나
+    TTL이 지났으면 무효로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        generations: GenerationTracker,
+        maxsize: int = 256,
+        ttl: float = 0,
+    ):
+        """캐시를 초기화합니다.
+
+        Args:
+            generations: 세대 카운터
+            maxsize: 최대 항목 수 (0이면 비활성)
+            ttl: 항목 유효 시간 (초, 0이면 무제한)
+        """
+        self.generations = generations
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[int, float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, company_name: str | None) -> Any | None:
+        """유효한 캐시 값을 반환합니다 (없으면 None)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            generation, stored_at, value = entry
+            expired = self.ttl and time.monotonic() - stored_at > self.ttl
+            if generation == self.generations.get(company_name) and not expired:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, company_name: str | None, value: Any, generation: int) -> None:
+        """값을 저장합니다.
+
+        Args:
+            key: 캐시 키
+            company_name: 기업명
+            value: 저장할 값
+            generation: 조회를 시작할 때 읽은 세대 (조회 중 쓰기가 있었으면 저장하지 않음)
+        """
+        if self.maxsize <= 0 or generation != self.generations.get(company_name):
+            return
+
+        self._entries[key] = (generation, time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """캐시 적중률 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        """캐시와 통계를 초기화합니다."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# 기본 인스턴스 (프로세스 내 저장소/검색기 공용)
+_default_generations: GenerationTracker | None = None
+_default_retrieval_cache: RetrievalCache | None = None
+
+
+def get_generation_tracker() -> GenerationTracker:
+    """기본 세대 카운터를 반환합니다."""
+    global _default_generations
+
+    if _default_generations is None:
+        _default_generations = GenerationTracker()
+
+    return _default_generations
+
+
+def get_retrieval_cache(settings: Settings | None = None) -> RetrievalCache:
+    """기본 검색 결과 캐시를 반환합니다."""
+    global _default_retrieval_cache
+
+    if _default_retrieval_cache is None:
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+        _default_retrieval_cache = RetrievalCache(
+            get_generation_tracker(),
+            maxsize=settings.retrieval_cache_size,
+            ttl=settings.retrieval_cache_ttl,
+        )
+
+    return _default_retrieval_cache
+
+
+def _cache_stats() -> dict[str, dict]:
+    """메트릭 수집용 캐시 통계 (기본 인스턴스가 없으면 빈 dict)."""
+    if _default_retrieval_cache is None:
+        return {}
+    return {"retrieval": _default_retrieval_cache.stats()}
+
+
+get_registry().register_cache_source(_cache_stats)
@@ -0,0 +1,90 @@
+"""문서 청크 분할."""
+
+import re
+
+# 문장 경계 (종결 구두점 뒤 공백)
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?。])\s+")
+_PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
+
+
+def split_sentences(text: str) -> list[str]:
+    """문장 단위로 분할합니다."""
+    return [s.strip() for s in _SENTENCE_PATTERN.split(text) if s and s.strip()]
+
+
+def _split_units(text: str, chunk_size: int) -> list[str]:
+    """문단 → 문장 → 고정 길이 순으로 chunk_size 이하 단위로 분할합니다."""
+    units = []
+
+    for paragraph in _PARAGRAPH_PATTERN.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= chunk_size:
+            units.append(paragraph)
+            continue
+
+        for sentence in split_sentences(paragraph):
+            if len(sentence) <= chunk_size:
+                units.append(sentence)
+            else:
+                units.extend(
+                    sentence[i:i + chunk_size] for i in range(0, len(sentence), chunk_size)
+                )
+
+    return units
+
+
+def _overlap_tail(chunk: str, overlap: int) -> str:
+    """청크 끝 overlap 글자를 문장(또는 단어) 경계에서 잘라 반환합니다."""
+    if overlap <= 0 or len(chunk) <= overlap:
+        return ""
+
+    tail = chunk[-overlap:]
+    match = _SENTENCE_PATTERN.search(tail)
+    if match is None:
+        match = re.search(r"\s+", tail)
+    return tail[match.end():] if match else ""
+
+
+def split_text(
+    text: str,
+    chunk_size: int = 2000,
+    overlap: int = 200,
+) -> list[str]:
+    """텍스트를 문단/문장 경계 기준으로 겹치는 청크로 분할합니다.
+
+    각 청크는 chunk_size 글자를 넘지 않으며, 이전 청크의 마지막
+    overlap 글자(문장 경계에서 시작)를 다음 청크 앞에 다시 포함합니다.
+
+    Args:
+        text: 분할할 텍스트
+        chunk_size: 청크 최대 길이 (글자)
+        overlap: 청크 간 겹침 길이 (글자)
+
+    Returns:
+        청크 목록
+    """
+    if not text or not text.strip():
+        return []
+    if len(text) <= chunk_size:
+        return [text.strip()]
+
+    overlap = min(overlap, chunk_size // 2)
+    chunks: list[str] = []
+    current = ""
+
+    for unit in _split_units(text, chunk_size):
+        candidate = f"{current} {unit}" if current else unit
+        if len(candidate) <= chunk_size:
+            current = candidate
+            continue
+
+        chunks.append(current)
+        tail = _overlap_tail(current, overlap)
+        current = f"{tail} {unit}" if tail and len(tail) + len(unit) < chunk_size else unit
+
+    if current:
+        chunks.append(current)
+
+    return chunks
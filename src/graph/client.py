@@ -1,5 +1,6 @@
 """Neo4j 그래프 데이터베이스 클라이언트."""
 
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from functools import cached_property
 from typing import Any
@@ -8,6 +9,7 @@ from neo4j import AsyncGraphDatabase, AsyncDriver
 
 from config.settings import Settings
 from src.utils.logging import get_logger
+from src.utils.metrics import track
 
 logger = get_logger("graph.client")
 
@@ -69,10 +71,14 @@ class Neo4jClient:
             logger.info("Neo4j 연결 종료")
 
     @asynccontextmanager
-    async def session(self):
-        """Neo4j 세션 컨텍스트 매니저."""
+    async def session(self, **config: Any):
+        """Neo4j 세션 컨텍스트 매니저.
+
+        Args:
+            **config: 세션 설정 (fetch_size 등)
+        """
         driver = await self.connect()
-        session = driver.session()
+        session = driver.session(**config)
         try:
             yield session
         finally:
@@ -92,10 +98,57 @@ class Neo4jClient:
         Returns:
             쿼리 결과 목록
         """
-        async with self.session() as session:
-            result = await session.run(query, parameters or {})
-            records = await result.data()
-            return records
+        with track("backend", backend="neo4j", operation="query") as tracked:
+            async with self.session() as session:
+                result = await session.run(query, parameters or {})
+                records = await result.data()
+                tracked.span.set_attributes({
+                    "db.statement": " ".join(query.split())[:500],
+                    "db.record_count": len(records),
+                })
+                return records
+
+    async def iter_query(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        batch_size: int | None = None,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[Any]:
+        """Cypher 쿼리 결과를 커서에서 바로 스트리밍합니다.
+
+        `execute_query`와 달리 전체 결과를 메모리에 적재하지 않으므로
+        대량 내보내기나 전체 그래프 분석에 사용합니다.
+
+        Args:
+            query: Cypher 쿼리
+            parameters: 쿼리 파라미터
+            batch_size: 지정하면 레코드 대신 이 크기의 레코드 배치(list)를 반환
+            fetch_size: 드라이버가 한 번에 가져올 레코드 수 (기본값: 설정값)
+
+        Yields:
+            레코드 딕셔너리 또는 레코드 딕셔너리 배치
+        """
+        fetch_size = fetch_size or self.settings.neo4j_fetch_size
+        count = 0
+
+        # 지연 시간/span은 run()뿐 아니라 레코드를 모두 소비할 때까지 측정
+        with track("backend", backend="neo4j", operation="stream") as tracked:
+            tracked.span.set_attribute("db.statement", " ".join(query.split())[:500])
+            async with self.session(fetch_size=fetch_size) as session:
+                result = await session.run(query, parameters or {})
+                if batch_size:
+                    while True:
+                        records = await result.fetch(batch_size)
+                        if not records:
+                            break
+                        count += len(records)
+                        yield [record.data() for record in records]
+                else:
+                    async for record in result:
+                        count += 1
+                        yield record.data()
+            tracked.span.set_attribute("db.record_count", count)
 
     async def test_connection(self) -> bool:
         """연결을 테스트합니다.
@@ -0,0 +1,159 @@
+"""토큰 예산 기반 LLM 컨텍스트 조립."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.graph.chunking import split_sentences
+from src.graph.dedup import normalize_text
+from src.utils.logging import get_logger
+from src.utils.tokens import count_tokens
+
+logger = get_logger("graph.context")
+
+
+@dataclass
+class Citation:
+    """컨텍스트 구간의 출처."""
+
+    index: int  # 컨텍스트 내 인용 번호 ([n])
+    id: str
+    source: str  # "vector" | "graph" | "hybrid"
+    score: float
+    url: str | None = None
+    date: str | None = None
+    tokens: int = 0
+    trimmed: bool = False
+
+
+@dataclass
+class AssembledContext:
+    """조립된 컨텍스트와 인용 목록."""
+
+    text: str
+    citations: list[Citation] = field(default_factory=list)
+    tokens: int = 0
+    skipped: dict[str, int] = field(default_factory=dict)  # 제외 사유별 건수
+
+    def __bool__(self) -> bool:
+        return bool(self.text)
+
+
+def shingles(text: str, size: int = 5) -> set[str]:
+    """정규화 텍스트의 문자 shingle 집합을 반환합니다."""
+    text = normalize_text(text).replace(" ", "")
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    """두 shingle 집합의 Jaccard 유사도를 반환합니다."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def trim_to_sentences(text: str, max_tokens: int, model: str | None = None) -> str:
+    """max_tokens 안에 들어가는 앞쪽 문장들만 남깁니다.
+
+    Args:
+        text: 구간 텍스트
+        max_tokens: 최대 토큰 수
+        model: 토크나이저 기준 모델
+
+    Returns:
+        문장 경계에서 자른 텍스트 (첫 문장도 넘치면 빈 문자열)
+    """
+    trimmed = ""
+
+    for sentence in split_sentences(text):
+        candidate = f"{trimmed} {sentence}" if trimmed else sentence
+        if count_tokens(candidate, model) > max_tokens:
+            break
+        trimmed = candidate
+
+    return trimmed
+
+
+def assemble_context(
+    results: list[Any],
+    max_tokens: int,
+    max_passage_tokens: int | None = None,
+    dedup_threshold: float = 0.8,
+    model: str | None = None,
+) -> AssembledContext:
+    """검색 결과를 토큰 예산 안에서 인용 번호가 붙은 컨텍스트로 조립합니다.
+
+    순위순으로 구간을 담되, 들어가지 않는 구간은 문장 경계에서 줄여 보고
+    그래도 넘치면 건너뛰고 다음(더 짧은) 구간을 계속 시도합니다.
+    이미 담은 구간과 거의 같은 구간(shingle Jaccard >= dedup_threshold)은 제외합니다.
+
+    Args:
+        results: 점수순 검색 결과 (id, content, source, score, metadata 속성)
+        max_tokens: 컨텍스트 전체 토큰 예산
+        max_passage_tokens: 구간당 최대 토큰 수 (기본값: 예산의 1/3)
+        dedup_threshold: 중복 판정 Jaccard 임계값
+        model: 토크나이저 기준 모델
+
+    Returns:
+        조립된 컨텍스트
+    """
+    if max_passage_tokens is None:
+        max_passage_tokens = max(max_tokens // 3, 1)
+
+    parts: list[str] = []
+    citations: list[Citation] = []
+    selected: list[set[str]] = []
+    skipped = {"duplicate": 0, "budget": 0}
+    used = 0
+    separator = count_tokens("\n\n", model)
+
+    for result in results:
+        content = (result.content or "").strip()
+        if not content:
+            continue
+
+        passage_shingles = shingles(content)
+        if any(jaccard(passage_shingles, s) >= dedup_threshold for s in selected):
+            skipped["duplicate"] += 1
+            continue
+
+        header = f"[{len(citations) + 1}] "
+        overhead = count_tokens(header, model) + (separator if parts else 0)
+        allowed = min(max_passage_tokens, max_tokens - used - overhead)
+        if allowed <= 0:
+            skipped["budget"] += 1
+            continue
+
+        tokens = count_tokens(content, model)
+        trimmed = False
+        if tokens > allowed:
+            content = trim_to_sentences(content, allowed, model)
+            if not content:
+                skipped["budget"] += 1
+                continue
+            tokens = count_tokens(content, model)
+            trimmed = True
+
+        metadata = result.metadata or {}
+        citations.append(
+            Citation(
+                index=len(citations) + 1,
+                id=result.id,
+                source=result.source,
+                score=result.score,
+                url=metadata.get("url"),
+                date=metadata.get("date"),
+                tokens=tokens,
+                trimmed=trimmed,
+            )
+        )
+        parts.append(f"{header}{content}")
+        selected.append(passage_shingles)
+        used += overhead + tokens
+
+    text = "\n\n".join(parts)
+    logger.debug(
+        f"컨텍스트 조립: {used}/{max_tokens} 토큰, {len(citations)}개 인용, 제외 {skipped}"
+    )
+    return AssembledContext(text=text, citations=citations, tokens=used, skipped=skipped)
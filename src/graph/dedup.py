@@ -0,0 +1,178 @@
+"""콘텐츠 지문 기반 수집 중복 제거."""
+
+import hashlib
+import re
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from config.settings import Settings
+from src.utils.logging import get_logger
+
+logger = get_logger("graph.dedup")
+
+# 문서 동일성과 무관한 추적용 쿼리 파라미터
+_TRACKING_PARAMS = {
+    "fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "ref_src", "spm",
+}
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def canonicalize_url(url: str | None) -> str | None:
+    """URL을 정규 형태로 변환합니다.
+
+    스킴/호스트 소문자화, `www.` 및 기본 포트 제거, 프래그먼트와 추적 파라미터
+    (utm_* 등) 제거, 쿼리 파라미터 정렬, 끝 슬래시 제거를 수행합니다.
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        정규화된 URL 또는 None
+    """
+    if not url or not url.strip():
+        return None
+
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "http").lower()
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    if parts.port and not (
+        (scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)
+    ):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def normalize_text(text: str) -> str:
+    """해시용으로 텍스트를 정규화합니다 (NFKC, 소문자화, 공백 통합)."""
+    text = unicodedata.normalize("NFKC", text)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip().lower()
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:32]
+
+
+def event_id(scope: str | None, title: str) -> str:
+    """이벤트의 결정적 ID를 만듭니다.
+
+    같은 문서(scope)에서 추출한 같은 제목의 이벤트는 항상 같은 ID가 되므로
+    재시도나 재수집 시 Event 노드가 MERGE로 합쳐집니다.
+
+    Args:
+        scope: 이벤트 출처 (문서 ID 또는 URL)
+        title: 이벤트 제목
+
+    Returns:
+        이벤트 ID
+    """
+    key = f"{scope or ''}\n{normalize_text(title)}"
+    return f"evt-{_digest(key)}"
+
+
+@dataclass(frozen=True)
+class ContentFingerprint:
+    """문서 콘텐츠 지문."""
+
+    doc_id: str  # 결정적 문서 ID (그래프 노드/임베딩 공용)
+    url_key: str | None  # 정규 URL 해시
+    text_key: str  # 정규화 텍스트 해시
+
+    @property
+    def keys(self) -> list[str]:
+        """중복 판정에 사용하는 키 목록."""
+        return [k for k in (self.url_key, self.text_key) if k]
+
+
+def fingerprint(url: str | None, text: str) -> ContentFingerprint:
+    """정규 URL과 정규화 텍스트 해시로 문서 지문을 생성합니다.
+
+    문서 ID는 URL이 있으면 정규 URL에서, 없으면 텍스트 해시에서 파생되므로
+    같은 기사를 다시 수집해도 같은 ID를 갖습니다.
+
+    Args:
+        url: 문서 URL
+        text: 문서 본문
+
+    Returns:
+        콘텐츠 지문
+    """
+    canonical_url = canonicalize_url(url)
+    url_key = f"u:{_digest(canonical_url)}" if canonical_url else None
+    text_key = f"t:{_digest(normalize_text(text))}"
+
+    doc_id = f"doc-{(url_key or text_key)[2:]}"
+    return ContentFingerprint(doc_id=doc_id, url_key=url_key, text_key=text_key)
+
+
+class IngestionIndex:
+    """이미 수집한 문서 지문의 인메모리 집합 (파일로 영속화).
+
+    조회는 메모리 집합에서만 이루어지고, 새 키는 append-only 파일에 기록되어
+    프로세스 재시작 시 다시 로드됩니다.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """인덱스를 초기화합니다.
+
+        Args:
+            path: 영속화 파일 경로 (None이면 메모리 전용)
+        """
+        self.path = Path(path) if path else None
+        self._seen: set[str] | None = None
+
+    @property
+    def seen(self) -> set[str]:
+        """수집된 키 집합 (최초 접근 시 파일에서 로드)."""
+        if self._seen is None:
+            self._seen = set()
+            if self.path and self.path.exists():
+                with self.path.open(encoding="utf-8") as f:
+                    self._seen.update(line.strip() for line in f if line.strip())
+                logger.debug(f"수집 인덱스 로드: {len(self._seen)}개 키")
+        return self._seen
+
+    def __len__(self) -> int:
+        return len(self.seen)
+
+    def is_seen(self, fp: ContentFingerprint) -> bool:
+        """URL 또는 텍스트 해시 중 하나라도 이미 수집되었는지 확인합니다."""
+        return any(key in self.seen for key in fp.keys)
+
+    def mark_seen(self, fp: ContentFingerprint) -> None:
+        """지문을 수집 완료로 기록합니다."""
+        new_keys = [key for key in fp.keys if key not in self.seen]
+        if not new_keys:
+            return
+
+        self.seen.update(new_keys)
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write("".join(f"{key}\n" for key in new_keys))
+
+
+# 기본 인덱스 인스턴스
+_default_index: IngestionIndex | None = None
+
+
+def get_ingestion_index(settings: Settings | None = None) -> IngestionIndex:
+    """설정 경로에 영속화되는 기본 수집 인덱스를 반환합니다."""
+    global _default_index
+
+    if _default_index is None:
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+        _default_index = IngestionIndex(settings.ingest_index_path)
+
+    return _default_index
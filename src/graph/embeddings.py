@@ -0,0 +1,379 @@
+"""임베딩 함수 및 배치 임베딩 파이프라인."""
+
+import asyncio
+import hashlib
+import json
+import math
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+from chromadb.utils.embedding_functions import register_embedding_function
+
+from config.settings import Settings
+from src.utils.logging import get_logger
+from src.utils.metrics import get_registry
+
+logger = get_logger("graph.embeddings")
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@register_embedding_function
+class HashingEmbeddingFunction(EmbeddingFunction[Documents]):
+    """모델 없이 동작하는 feature hashing 임베딩.
+
+    단어와 문자 bigram을 고정 차원에 해싱한 뒤 L2 정규화합니다.
+    모델 다운로드나 API 호출 없이 오프라인에서 동작하므로
+    테스트/벤치마크나 모델을 쓸 수 없는 환경의 대체 수단으로 사용합니다.
+    """
+
+    def __init__(self, dim: int = 384):
+        """임베딩 함수를 초기화합니다.
+
+        Args:
+            dim: 임베딩 차원
+        """
+        self.dim = dim
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [self._embed(text) for text in input]
+
+    def _embed(self, text: str) -> list[float]:
+        vector = [0.0] * self.dim
+        text = text.lower()
+        features = _TOKEN_PATTERN.findall(text)
+        features += [text[i:i + 2] for i in range(len(text) - 1)]
+
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dim
+            sign = 1.0 if digest[4] & 1 else -1.0
+            vector[bucket] += sign
+
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    @staticmethod
+    def name() -> str:
+        return "palantir_stock_hashing"
+
+    def get_config(self) -> dict[str, Any]:
+        return {"dim": self.dim}
+
+    @staticmethod
+    def build_from_config(config: dict[str, Any]) -> "HashingEmbeddingFunction":
+        return HashingEmbeddingFunction(dim=config.get("dim", 384))
+
+
+def create_embedding_function(settings: Settings | None = None) -> EmbeddingFunction:
+    """설정에 따라 임베딩 함수를 생성합니다.
+
+    - default: Chroma 기본 (ONNX all-MiniLM-L6-v2, 로컬 CPU)
+    - onnx: ONNX all-MiniLM-L6-v2 (CPU 실행 프로바이더 고정)
+    - sentence-transformers: sentence-transformers 로컬 모델 (embeddings extra 필요)
+    - hashing: 모델 없는 feature hashing
+
+    Args:
+        settings: 애플리케이션 설정
+
+    Returns:
+        Chroma 임베딩 함수
+
+    Raises:
+        ValueError: 알 수 없는 백엔드이거나 의존성이 없는 경우
+    """
+    if settings is None:
+        from config.settings import settings as default_settings
+        settings = default_settings
+
+    backend = settings.embedding_backend.lower()
+
+    if backend == "default":
+        from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+        return DefaultEmbeddingFunction()
+
+    if backend == "onnx":
+        from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+        return ONNXMiniLM_L6_V2(preferred_providers=["CPUExecutionProvider"])
+
+    if backend == "sentence-transformers":
+        try:
+            from chromadb.utils.embedding_functions import (
+                SentenceTransformerEmbeddingFunction,
+            )
+            return SentenceTransformerEmbeddingFunction(
+                model_name=settings.embedding_model,
+                device="cpu",
+            )
+        except ImportError as e:
+            raise ValueError(
+                "sentence-transformers가 필요합니다. "
+                "pip install -e '.[embeddings]'로 설치해주세요."
+            ) from e
+
+    if backend == "hashing":
+        return HashingEmbeddingFunction()
+
+    raise ValueError(f"지원하지 않는 임베딩 백엔드: {settings.embedding_backend}")
+
+
+class EmbeddingPipeline:
+    """크기 제한 배치로 나눠 동시에 임베딩하는 파이프라인.
+
+    임베딩 함수는 동기 CPU 작업이므로 전용 스레드 풀에서 실행하고,
+    동시에 처리 중인 배치 수를 concurrency로 제한합니다.
+    """
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction,
+        batch_size: int = 32,
+        max_batch_chars: int = 64_000,
+        concurrency: int = 2,
+    ):
+        """파이프라인을 초기화합니다.
+
+        Args:
+            embedding_function: 임베딩 함수
+            batch_size: 배치당 최대 문서 수
+            max_batch_chars: 배치당 최대 글자 수
+            concurrency: 동시에 임베딩할 배치 수
+        """
+        self.embedding_function = embedding_function
+        self.batch_size = max(batch_size, 1)
+        self.max_batch_chars = max_batch_chars
+        self.concurrency = max(concurrency, 1)
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """임베딩 전용 스레드 풀을 반환합니다."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency,
+                thread_name_prefix="embedding",
+            )
+        return self._executor
+
+    def make_batches(self, texts: list[str]) -> list[list[int]]:
+        """문서 수와 글자 수 제한을 지키는 배치(인덱스 목록)로 나눕니다."""
+        batches: list[list[int]] = []
+        current: list[int] = []
+        current_chars = 0
+
+        for i, text in enumerate(texts):
+            if current and (
+                len(current) >= self.batch_size
+                or current_chars + len(text) > self.max_batch_chars
+            ):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(i)
+            current_chars += len(text)
+
+        if current:
+            batches.append(current)
+        return batches
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """문서를 임베딩합니다.
+
+        Args:
+            texts: 문서 텍스트 목록
+
+        Returns:
+            입력 순서와 같은 임베딩 목록
+        """
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results: list[list[float] | None] = [None] * len(texts)
+
+        async def run_batch(indices: list[int]) -> None:
+            try:
+                batch = [texts[i] for i in indices]
+                vectors = await loop.run_in_executor(
+                    self.executor, self.embedding_function, batch
+                )
+                for i, vector in zip(indices, vectors):
+                    results[i] = [float(v) for v in vector]
+            finally:
+                semaphore.release()
+
+        tasks = []
+        for indices in self.make_batches(texts):
+            # 처리 중인 배치가 concurrency개면 자리가 날 때까지 대기 (backpressure)
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(run_batch(indices)))
+
+        await asyncio.gather(*tasks)
+
+        logger.debug(f"임베딩 완료: {len(texts)}개 문서, {len(tasks)}개 배치")
+        return results
+
+    def close(self) -> None:
+        """스레드 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def embedding_model_key(embedding_function: EmbeddingFunction) -> str:
+    """임베딩 함수를 식별하는 캐시 키를 반환합니다 (이름 + 설정)."""
+    try:
+        name = embedding_function.name()
+    except Exception:
+        name = NotImplemented
+    try:
+        config = embedding_function.get_config()
+    except Exception:
+        config = None
+
+    if name is NotImplemented or not isinstance(name, str):
+        name = type(embedding_function).__name__
+    if not isinstance(config, dict):
+        config = {}
+    return f"{name}:{json.dumps(config, sort_keys=True, default=str)}"
+
+
+class QueryEmbeddingCache:
+    """(모델, 쿼리 텍스트) 키의 LRU 쿼리 임베딩 캐시.
+
+    path를 지정하면 새 항목을 JSONL 파일에 추가 기록하고 시작 시 다시 로드합니다.
+    파일의 레코드 수가 maxsize의 두 배를 넘으면 현재 LRU 항목만 남기도록
+    파일을 다시 씁니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, path: str | Path | None = None):
+        """캐시를 초기화합니다.
+
+        Args:
+            maxsize: 최대 항목 수
+            path: 영속화 파일 경로 (None이면 메모리 전용)
+        """
+        self.maxsize = maxsize
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._file_records = 0  # 영속화 파일의 레코드 수 (중복/축출 항목 포함)
+
+        if self.path and self.path.exists():
+            self._load()
+            if self._file_records > 2 * self.maxsize:
+                self._compact()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, model: str, text: str) -> list[float] | None:
+        """캐시된 임베딩을 반환합니다 (없으면 None)."""
+        key = (model, text)
+        embedding = self._entries.get(key)
+        if embedding is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return embedding
+
+    def put(self, model: str, text: str, embedding: list[float]) -> None:
+        """임베딩을 캐시에 저장합니다."""
+        self._insert((model, text), embedding)
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(self._dump_record((model, text), embedding))
+            self._file_records += 1
+            if self._file_records > 2 * self.maxsize:
+                self._compact()
+
+    def stats(self) -> dict:
+        """캐시 적중률 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        """메모리 캐시와 통계를 초기화합니다."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _insert(self, key: tuple[str, str], embedding: list[float]) -> None:
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _dump_record(key: tuple[str, str], embedding: list[float]) -> str:
+        model, text = key
+        record = {"model": model, "text": text, "embedding": embedding}
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    def _compact(self) -> None:
+        """영속화 파일을 현재 메모리 항목만으로 다시 씁니다 (임시 파일 교체)."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for key, embedding in self._entries.items():
+                f.write(self._dump_record(key, embedding))
+        tmp_path.replace(self.path)
+
+        logger.debug(f"쿼리 임베딩 캐시 파일 정리: {self._file_records} → {len(self._entries)}개")
+        self._file_records = len(self._entries)
+
+    def _load(self) -> None:
+        """영속화 파일에서 항목을 로드합니다."""
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                self._file_records += 1
+                try:
+                    record = json.loads(line)
+                    self._insert((record["model"], record["text"]), record["embedding"])
+                except (ValueError, KeyError):
+                    continue
+        logger.debug(f"쿼리 임베딩 캐시 로드: {len(self._entries)}개")
+
+
+# 기본 쿼리 임베딩 캐시 (프로세스 내 VectorStore 인스턴스 공용)
+_default_query_cache: QueryEmbeddingCache | None = None
+
+
+def get_query_embedding_cache(settings: Settings | None = None) -> QueryEmbeddingCache:
+    """기본 쿼리 임베딩 캐시를 반환합니다."""
+    global _default_query_cache
+
+    if _default_query_cache is None:
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+        _default_query_cache = QueryEmbeddingCache(
+            maxsize=settings.query_embedding_cache_size,
+            path=settings.query_embedding_cache_path or None,
+        )
+
+    return _default_query_cache
+
+
+def _cache_stats() -> dict[str, dict]:
+    """메트릭 수집용 캐시 통계 (기본 인스턴스가 없으면 빈 dict)."""
+    if _default_query_cache is None:
+        return {}
+    return {"query_embedding": _default_query_cache.stats()}
+
+
+get_registry().register_cache_source(_cache_stats)
@@ -0,0 +1,111 @@
+"""하이브리드 검색 오프라인 평가 (recall@k, 지연 시간)."""
+
+import json
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.utils.logging import get_logger
+
+logger = get_logger("graph.evaluation")
+
+
+@dataclass
+class LabeledQuery:
+    """정답 문서가 표시된 평가 쿼리."""
+
+    query: str
+    relevant_ids: list[str]
+    company_name: str | None = None
+
+
+def load_labeled_queries(path: str | Path) -> list[LabeledQuery]:
+    """JSON 파일에서 평가 쿼리를 로드합니다.
+
+    Args:
+        path: [{"query", "relevant_ids", "company_name"?}, ...] 목록 또는
+            해당 목록을 "queries" 키에 담은 JSON 파일
+
+    Returns:
+        평가 쿼리 목록
+    """
+    with Path(path).open(encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("queries", [])
+    return [LabeledQuery(**item) for item in data]
+
+
+def recall_at_k(retrieved_ids: list[str], relevant_ids: list[str], k: int) -> float:
+    """상위 k개 결과에 포함된 정답 문서 비율을 반환합니다."""
+    if not relevant_ids:
+        return 0.0
+    hits = set(retrieved_ids[:k]) & set(relevant_ids)
+    return len(hits) / len(set(relevant_ids))
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """선형 보간 백분위수를 반환합니다."""
+    ordered = sorted(values)
+    index = (len(ordered) - 1) * pct / 100
+    low = int(index)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (index - low)
+
+
+async def evaluate_retriever(
+    retriever,
+    queries: list[LabeledQuery],
+    k: int = 5,
+) -> dict:
+    """검색기를 평가 쿼리로 실행해 recall@k와 지연 시간을 측정합니다.
+
+    Args:
+        retriever: HybridRetriever
+        queries: 평가 쿼리 목록
+        k: recall 계산 기준 상위 결과 수
+
+    Returns:
+        평가 지표 (recall_at_k, latency_ms p50/p95/mean, 쿼리별 결과)
+    """
+    recalls: list[float] = []
+    latencies: list[float] = []
+    per_query: list[dict] = []
+
+    for labeled in queries:
+        started = time.perf_counter()
+        results = await retriever.search(
+            query=labeled.query,
+            company_name=labeled.company_name,
+            n_results=k,
+        )
+        latency = (time.perf_counter() - started) * 1000
+
+        retrieved = [r.id for r in results]
+        recall = recall_at_k(retrieved, labeled.relevant_ids, k)
+        recalls.append(recall)
+        latencies.append(latency)
+        per_query.append({
+            "query": labeled.query,
+            "recall": round(recall, 4),
+            "latency_ms": round(latency, 2),
+            "retrieved": retrieved,
+        })
+
+    if not queries:
+        return {"k": k, "queries": 0, "recall_at_k": 0.0, "latency_ms": {}, "per_query": []}
+
+    report = {
+        "k": k,
+        "queries": len(queries),
+        "recall_at_k": round(statistics.mean(recalls), 4),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50), 2),
+            "p95": round(_percentile(latencies, 95), 2),
+            "mean": round(statistics.mean(latencies), 2),
+        },
+        "per_query": per_query,
+    }
+    logger.info(f"검색 평가: recall@{k}={report['recall_at_k']}, p50={report['latency_ms']['p50']}ms")
+    return report
@@ -1,9 +1,14 @@
 """엔티티 및 관계 추출기."""
 
+import asyncio
+import json
 import re
-import uuid
 from datetime import datetime
 
+from config.settings import Settings
+from src.graph.chunking import split_text
+from src.graph.dedup import IngestionIndex, event_id, fingerprint, get_ingestion_index
+from src.graph.resolver import EntityResolver, get_entity_resolver
 from src.graph.schema import (
     Company,
     Document,
@@ -21,13 +26,31 @@ logger = get_logger("graph.extractor")
 class EntityExtractor:
     """LLM 기반 엔티티/관계 추출기."""
 
-    def __init__(self, llm_client: LLMClient | None = None):
+    def __init__(
+        self,
+        llm_client: LLMClient | None = None,
+        resolver: EntityResolver | None = None,
+        settings: Settings | None = None,
+        index: IngestionIndex | None = None,
+    ):
         """추출기를 초기화합니다.
 
         Args:
             llm_client: LLM 클라이언트
+            resolver: 기업명 해소기 (기본값: KR_TICKER_MAP 기반 공용 해소기)
+            settings: 애플리케이션 설정
+            index: 수집 문서 지문 인덱스 (기본값: 설정 경로의 공용 인덱스)
         """
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+
+        self.settings = settings
         self._llm = llm_client
+        self._resolver = resolver
+        self._index = index
+        # 모든 문서/청크가 공유하는 LLM 동시 호출 제한
+        self._semaphore = asyncio.Semaphore(settings.extraction_concurrency)
 
     @property
     def llm(self) -> LLMClient:
@@ -36,6 +59,20 @@ class EntityExtractor:
             self._llm = LLMClient()
         return self._llm
 
+    @property
+    def resolver(self) -> EntityResolver:
+        """기업명 해소기를 반환합니다."""
+        if self._resolver is None:
+            self._resolver = get_entity_resolver()
+        return self._resolver
+
+    @property
+    def index(self) -> IngestionIndex:
+        """수집 문서 지문 인덱스를 반환합니다."""
+        if self._index is None:
+            self._index = get_ingestion_index(self.settings)
+        return self._index
+
     async def extract_entities(
         self,
         text: str,
@@ -43,6 +80,9 @@ class EntityExtractor:
     ) -> dict:
         """텍스트에서 엔티티를 추출합니다.
 
+        chunk_size 이하의 텍스트는 LLM을 한 번 호출하고, 더 긴 텍스트는
+        extract_document로 청크 추출 후 병합하므로 뒷부분이 잘리지 않습니다.
+
         Args:
             text: 분석할 텍스트
             source_url: 소스 URL
@@ -50,6 +90,64 @@ class EntityExtractor:
         Returns:
             추출된 엔티티 딕셔너리
         """
+        if len(text) > self.settings.extraction_chunk_size:
+            extracted = await self.extract_document(text, source_url)
+            return extracted["entities"]
+
+        entities, _ = await self._extract_chunk(text, source_url)
+        return entities
+
+    async def extract_document(
+        self,
+        text: str,
+        source_url: str | None = None,
+    ) -> dict:
+        """긴 문서를 청크로 나눠 동시에 추출한 뒤 병합합니다.
+
+        Args:
+            text: 분석할 텍스트
+            source_url: 소스 URL
+
+        Returns:
+            {"entities", "relationships", "chunks", "tokens"}
+        """
+        chunks = split_text(
+            text,
+            chunk_size=self.settings.extraction_chunk_size,
+            overlap=self.settings.extraction_chunk_overlap,
+        )
+
+        outputs = await asyncio.gather(
+            *(self._extract_chunk(chunk, source_url) for chunk in chunks)
+        )
+
+        chunk_results = []
+        tokens = 0
+        for entities, used in outputs:
+            tokens += used
+            relationships = await self.extract_relationships(entities)
+            chunk_results.append((entities, relationships))
+
+        entities, relationships = self._merge_chunk_results(chunk_results)
+
+        logger.debug(f"청크 추출 완료: {len(chunks)}개 청크, {tokens} 토큰")
+        return {
+            "entities": entities,
+            "relationships": relationships,
+            "chunks": len(chunks),
+            "tokens": tokens,
+        }
+
+    async def _extract_chunk(
+        self,
+        text: str,
+        source_url: str | None,
+    ) -> tuple[dict, int]:
+        """청크 하나에 대해 LLM 추출을 수행합니다.
+
+        Returns:
+            (엔티티 딕셔너리, 사용 토큰 수)
+        """
         system = """당신은 기업 정보 분석 전문가입니다.
 주어진 텍스트에서 다음 엔티티를 추출해주세요:
 
@@ -62,7 +160,7 @@ JSON 형식으로 응답해주세요."""
 
         prompt = f"""다음 텍스트에서 엔티티를 추출해주세요:
 
-{text[:2000]}
+{text}
 
 JSON 형식:
 {{
@@ -72,17 +170,16 @@ JSON 형식:
     "industries": [{{"name": "...", "sector": "..."}}]
 }}"""
 
+        tokens = 0
         try:
-            response = await self.llm.generate(prompt, system=system)
-
-            # JSON 파싱 시도
-            import json
+            async with self._semaphore:
+                response, tokens = await self.llm.generate_with_usage(prompt, system=system)
 
             # JSON 블록 추출
             json_match = re.search(r"\{[\s\S]*\}", response)
             if json_match:
                 data = json.loads(json_match.group())
-                return self._parse_entities(data, source_url)
+                return self._parse_entities(data, source_url), tokens
 
         except Exception as e:
             logger.warning(f"엔티티 추출 실패: {e}")
@@ -93,7 +190,80 @@ JSON 형식:
             "events": [],
             "industries": [],
             "documents": [],
+        }, tokens
+
+    def _merge_chunk_results(
+        self,
+        chunk_results: list[tuple[dict, list[Relationship]]],
+    ) -> tuple[dict, list[Relationship]]:
+        """청크별 엔티티/관계를 병합하고 중복을 제거합니다."""
+        companies: dict[str, Company] = {}
+        people: dict[str, Person] = {}
+        events: dict[str, Event] = {}
+        industries: dict[str, Industry] = {}
+        event_ids: dict[str, str] = {}  # 중복 이벤트 ID → 유지된 이벤트 ID
+
+        for entities, _ in chunk_results:
+            for company in entities.get("companies", []):
+                kept_company = companies.setdefault(company.name, company)
+                kept_company.ticker = kept_company.ticker or company.ticker
+                kept_company.industry = kept_company.industry or company.industry
+
+            for person in entities.get("people", []):
+                kept_person = people.setdefault(person.name, person)
+                kept_person.role = kept_person.role or person.role
+                kept_person.company = kept_person.company or person.company
+
+            for event in entities.get("events", []):
+                key = re.sub(r"\s+", " ", event.title).strip().lower()
+                kept = events.setdefault(key, event)
+                event_ids[event.id] = kept.id
+
+            for industry in entities.get("industries", []):
+                kept_industry = industries.setdefault(industry.name, industry)
+                kept_industry.sector = kept_industry.sector or industry.sector
+
+        relationships: dict[tuple[str, str, str], Relationship] = {}
+        for _, chunk_relationships in chunk_results:
+            for rel in chunk_relationships:
+                target_id = event_ids.get(rel.target_id, rel.target_id)
+                key = (rel.type.value, rel.source_id, target_id)
+                if key not in relationships:
+                    relationships[key] = rel.model_copy(update={"target_id": target_id})
+
+        merged = {
+            "companies": list(companies.values()),
+            "people": list(people.values()),
+            "events": list(events.values()),
+            "industries": list(industries.values()),
+            "documents": [],
         }
+        return merged, list(relationships.values())
+
+    @staticmethod
+    def _scope_event_ids(
+        entities: dict,
+        relationships: list[Relationship],
+        document_id: str,
+    ) -> list[Relationship]:
+        """이벤트 ID를 문서 지문 기준으로 다시 정하고 관계를 갱신합니다.
+
+        URL이 없는 문서끼리 같은 제목의 이벤트가 하나로 합쳐지지 않도록
+        이벤트 ID 범위를 문서 ID로 한정합니다.
+        """
+        ids = {}
+        for event in entities.get("events", []):
+            ids[event.id] = event.id = event_id(document_id, event.title)
+
+        return [
+            rel.model_copy(update={
+                "source_id": ids.get(rel.source_id, rel.source_id),
+                "target_id": ids.get(rel.target_id, rel.target_id),
+            })
+            if rel.source_id in ids or rel.target_id in ids
+            else rel
+            for rel in relationships
+        ]
 
     def _parse_entities(self, data: dict, source_url: str | None) -> dict:
         """추출된 데이터를 파싱합니다."""
@@ -105,25 +275,39 @@ JSON 형식:
             "documents": [],
         }
 
-        # Companies
+        # Companies (정규 노드 키로 해소 후 중복 제거)
+        companies: dict[str, Company] = {}
         for c in data.get("companies", []):
-            if c.get("name"):
-                result["companies"].append(
-                    Company(
-                        name=c["name"],
-                        ticker=c.get("ticker"),
-                        industry=c.get("industry"),
-                    )
-                )
+            if not c.get("name"):
+                continue
+
+            resolved = self.resolver.resolve(c["name"], ticker=c.get("ticker"))
+            existing = companies.get(resolved.name)
+            if existing:
+                existing.industry = existing.industry or c.get("industry")
+                continue
+
+            companies[resolved.name] = Company(
+                name=resolved.name,
+                ticker=resolved.ticker,
+                industry=c.get("industry"),
+            )
+        result["companies"] = list(companies.values())
 
         # People
         for p in data.get("people", []):
             if p.get("name"):
+                company = p.get("company")
+                if company:
+                    resolved = self.resolver.resolve(company)
+                    if resolved.method != "new":
+                        company = resolved.name
+
                 result["people"].append(
                     Person(
                         name=p["name"],
                         role=p.get("role"),
-                        company=p.get("company"),
+                        company=company,
                     )
                 )
 
@@ -132,7 +316,7 @@ JSON 형식:
             if e.get("title"):
                 result["events"].append(
                     Event(
-                        id=str(uuid.uuid4()),
+                        id=event_id(source_url, e["title"]),
                         type=e.get("type", "news"),
                         title=e["title"],
                         date=self._parse_date(e.get("date")),
@@ -243,33 +427,57 @@ JSON 형식:
         content: str,
         url: str | None = None,
         doc_type: str = "news",
+        mark_seen: bool = True,
     ) -> dict:
         """문서를 처리하여 엔티티와 관계를 추출합니다.
 
+        이미 수집한 문서(같은 정규 URL 또는 같은 본문)는 LLM 호출 없이 건너뜁니다.
+
         Args:
             title: 문서 제목
             content: 문서 내용
             url: 문서 URL
             doc_type: 문서 유형
+            mark_seen: 처리 후 수집 인덱스에 기록할지 여부
+                (False면 호출자가 저장 완료 후 index.mark_seen 호출)
 
         Returns:
-            추출 결과 (entities, relationships, document)
+            추출 결과 (entities, relationships, document, chunks, tokens, skipped, fingerprint)
         """
-        # 문서 노드 생성
+        full_text = f"{title}\n\n{content}" if content else title
+        fp = fingerprint(url, full_text)
+
+        # 문서 노드 생성 (콘텐츠 지문 기반 결정적 ID)
         document = Document(
-            id=str(uuid.uuid4()),
+            id=fp.doc_id,
             type=doc_type,
             title=title,
             url=url,
             content=content[:1000] if content else None,  # 내용 일부만 저장
         )
 
-        # 엔티티 추출
-        full_text = f"{title}\n\n{content}" if content else title
-        entities = await self.extract_entities(full_text, url)
-
-        # 관계 추출
-        relationships = await self.extract_relationships(entities)
+        if self.index.is_seen(fp):
+            logger.debug(f"이미 수집된 문서 건너뜀: {title}")
+            return {
+                "entities": {
+                    "companies": [],
+                    "people": [],
+                    "events": [],
+                    "industries": [],
+                    "documents": [],
+                },
+                "relationships": [],
+                "document": document,
+                "chunks": 0,
+                "tokens": 0,
+                "skipped": True,
+                "fingerprint": fp,
+            }
+
+        # 청크 단위 엔티티/관계 추출
+        extracted = await self.extract_document(full_text, url)
+        entities = extracted["entities"]
+        relationships = extracted["relationships"]
 
         # 문서와 기업 연결
         for company in entities.get("companies", []):
@@ -282,9 +490,17 @@ JSON 형식:
             )
 
         entities["documents"] = [document]
+        relationships = self._scope_event_ids(entities, relationships, document.id)
+
+        if mark_seen:
+            self.index.mark_seen(fp)
 
         return {
             "entities": entities,
             "relationships": relationships,
             "document": document,
+            "chunks": extracted["chunks"],
+            "tokens": extracted["tokens"],
+            "skipped": False,
+            "fingerprint": fp,
         }
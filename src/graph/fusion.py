@@ -0,0 +1,94 @@
+"""하이브리드 검색 결과 융합 전략."""
+
+from collections.abc import Callable, Hashable
+
+# 소스별 순위 목록: {소스명: [(키, 원점수), ...]} (순위순)
+Rankings = dict[str, list[tuple[Hashable, float]]]
+FusionFunction = Callable[..., dict[Hashable, float]]
+
+
+def reciprocal_rank_fusion(
+    rankings: Rankings,
+    weights: dict[str, float] | None = None,
+    k: int = 60,
+) -> dict[Hashable, float]:
+    """Reciprocal Rank Fusion으로 점수를 합산합니다.
+
+    원점수의 척도와 관계없이 순위만 사용하므로 거리 기반 벡터 점수와
+    상수 그래프 점수를 함께 비교할 수 있습니다. 각 소스의 1위 결과가
+    해당 소스 가중치만큼의 점수를 받도록 (k + 1)을 곱해 스케일을 맞춥니다.
+
+    Args:
+        rankings: 소스별 순위 목록
+        weights: 소스별 가중치 (기본값: 1.0)
+        k: 순위 완화 상수
+
+    Returns:
+        키별 융합 점수
+    """
+    weights = weights or {}
+    scores: dict[Hashable, float] = {}
+
+    for source, ranked in rankings.items():
+        weight = weights.get(source, 1.0)
+        for rank, (key, _) in enumerate(ranked, start=1):
+            scores[key] = scores.get(key, 0.0) + weight * (k + 1) / (k + rank)
+
+    return scores
+
+
+def weighted_sum_fusion(
+    rankings: Rankings,
+    weights: dict[str, float] | None = None,
+) -> dict[Hashable, float]:
+    """소스별 min-max 정규화 점수의 가중합으로 점수를 합산합니다.
+
+    모든 점수가 같은 소스(예: 상수 가중치의 그래프 결과)는 1.0으로 정규화됩니다.
+
+    Args:
+        rankings: 소스별 순위 목록
+        weights: 소스별 가중치 (기본값: 1.0)
+
+    Returns:
+        키별 융합 점수
+    """
+    weights = weights or {}
+    scores: dict[Hashable, float] = {}
+
+    for source, ranked in rankings.items():
+        if not ranked:
+            continue
+        weight = weights.get(source, 1.0)
+        raw = [score for _, score in ranked]
+        low, high = min(raw), max(raw)
+        span = high - low
+
+        for key, score in ranked:
+            normalized = (score - low) / span if span else 1.0
+            scores[key] = scores.get(key, 0.0) + weight * normalized
+
+    return scores
+
+
+FUSION_STRATEGIES: dict[str, FusionFunction] = {
+    "rrf": reciprocal_rank_fusion,
+    "weighted": weighted_sum_fusion,
+}
+
+
+def get_fusion(name: str) -> FusionFunction:
+    """이름으로 융합 전략을 반환합니다.
+
+    Args:
+        name: 전략 이름 (rrf/weighted)
+
+    Returns:
+        융합 함수
+
+    Raises:
+        ValueError: 알 수 없는 전략인 경우
+    """
+    try:
+        return FUSION_STRATEGIES[name.lower()]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 융합 전략: {name}") from None
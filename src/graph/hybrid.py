@@ -1,11 +1,23 @@
 """하이브리드 검색기 (Vector + Graph)."""
 
-from dataclasses import dataclass
-
+import asyncio
+import copy
+import math
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass, field, replace
+
+from config.settings import Settings
+from src.graph.cache import RetrievalCache, get_retrieval_cache
 from src.graph.client import Neo4jClient, get_neo4j_client
+from src.graph.context import AssembledContext, assemble_context
+from src.graph.dedup import canonicalize_url
+from src.graph.fusion import Rankings, get_fusion
 from src.graph.repository import GraphRepository
-from src.graph.vector_store import VectorStore
+from src.graph.reranker import Reranker, get_reranker
+from src.graph.vector_store import VectorStore, get_vector_store
 from src.utils.logging import get_logger
+from src.utils.tracing import start_span
 
 logger = get_logger("graph.hybrid")
 
@@ -21,6 +33,19 @@ class HybridResult:
     metadata: dict
 
 
+@dataclass
+class HybridSearchResult:
+    """브랜치별 실행 정보를 포함한 하이브리드 검색 결과."""
+
+    results: list[HybridResult]
+    metadata: dict = field(default_factory=dict)  # timings/partial/errors
+
+    @property
+    def partial(self) -> bool:
+        """실패하거나 시간 초과된 브랜치가 있는지 여부."""
+        return bool(self.metadata.get("errors"))
+
+
 class HybridRetriever:
     """Vector + Graph 하이브리드 검색기."""
 
@@ -29,6 +54,10 @@ class HybridRetriever:
         vector_store: VectorStore | None = None,
         graph_repo: GraphRepository | None = None,
         vector_weight: float = 0.5,
+        settings: Settings | None = None,
+        fusion: str | None = None,
+        reranker: Reranker | None = None,
+        cache: RetrievalCache | None = None,
     ):
         """하이브리드 검색기를 초기화합니다.
 
@@ -36,19 +65,49 @@ class HybridRetriever:
             vector_store: 벡터 저장소
             graph_repo: 그래프 저장소
             vector_weight: 벡터 검색 가중치 (0-1)
+            settings: 애플리케이션 설정
+            fusion: 결과 융합 전략 (기본값: 설정의 retrieval_fusion)
+            reranker: 재순위화기 (기본값: 설정의 rerank_backend, 비어 있으면 사용 안 함)
+            cache: 검색 결과 캐시 (기본값: 프로세스 공용 캐시)
+
+        Raises:
+            ValueError: 알 수 없는 융합 전략인 경우
         """
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+
+        self.settings = settings
         self._vector_store = vector_store
         self._graph_repo = graph_repo
         self.vector_weight = vector_weight
         self.graph_weight = 1 - vector_weight
+        self.fusion = (fusion or settings.retrieval_fusion).lower()
+        self._fuse = get_fusion(self.fusion)
+        self._reranker = reranker
+        self._cache = cache
+
+    @property
+    def cache(self) -> RetrievalCache:
+        """검색 결과 캐시를 반환합니다."""
+        if self._cache is None:
+            self._cache = get_retrieval_cache(self.settings)
+        return self._cache
 
     @property
     def vector_store(self) -> VectorStore:
         """벡터 저장소를 반환합니다."""
         if self._vector_store is None:
-            self._vector_store = VectorStore()
+            self._vector_store = get_vector_store()
         return self._vector_store
 
+    @property
+    def reranker(self) -> Reranker | None:
+        """재순위화기를 반환합니다 (비활성이면 None)."""
+        if self._reranker is None:
+            self._reranker = get_reranker(self.settings)
+        return self._reranker
+
     @property
     def graph_repo(self) -> GraphRepository:
         """그래프 저장소를 반환합니다."""
@@ -72,185 +131,391 @@ class HybridRetriever:
         Returns:
             하이브리드 검색 결과
         """
-        results = []
+        retrieval = await self.retrieve(query, company_name, n_results)
+        return retrieval.results
+
+    async def retrieve(
+        self,
+        query: str,
+        company_name: str | None = None,
+        n_results: int = 10,
+    ) -> HybridSearchResult:
+        """벡터/그래프 브랜치를 동시에 실행해 검색합니다.
+
+        각 브랜치는 개별 타임아웃을 가지며, 실패하거나 시간을 넘긴 브랜치는
+        결과에서 빠지고 나머지 브랜치의 결과만으로 응답합니다.
+        완전한 결과는 기업 세대가 바뀔 때까지 캐시해 재사용합니다.
+
+        Args:
+            query: 검색 쿼리
+            company_name: 기업명 (선택)
+            n_results: 결과 수
 
-        # 1. 벡터 검색
-        try:
+        Returns:
+            검색 결과와 브랜치별 소요 시간(ms)/오류 메타데이터
+        """
+        with start_span(
+            "hybrid.retrieve", query=query, company=company_name, n_results=n_results
+        ) as span:
+            retrieval = await self._retrieve(query, company_name, n_results)
+            span.set_attributes({
+                "cache_hit": bool(retrieval.metadata.get("cached")),
+                "result_count": len(retrieval.results),
+                "partial": retrieval.partial,
+            })
+            return retrieval
+
+    async def _retrieve(
+        self,
+        query: str,
+        company_name: str | None,
+        n_results: int,
+    ) -> HybridSearchResult:
+        # 저장된 노드/메타데이터와 같은 정규 이름으로 한 번만 해소
+        if company_name:
+            company_name = self.cache.generations.resolver.resolve(company_name).name
+
+        # 같은 기업의 다른 표기(영문명, 티커)도 같은 캐시 항목을 사용
+        company_key = self.cache.generations.key(company_name)
+        cache_key = (query, company_key, n_results, self._cache_config())
+        generation = self.cache.generations.get(company_name)
+        cached = self.cache.get(cache_key, company_name)
+        if cached is not None:
+            logger.debug(f"검색 캐시 적중: {query} ({company_name})")
+            # 호출자가 결과를 수정해도 캐시 항목이 바뀌지 않도록 복사본을 반환
+            retrieval = copy.deepcopy(cached)
+            retrieval.metadata["cached"] = True
+            return retrieval
+
+        vector_timeout = self.settings.retrieval_vector_timeout
+        graph_timeout = self.settings.retrieval_graph_timeout
+        depth = self._fetch_depth(n_results)
+
+        branches: dict[str, tuple[Awaitable[list[HybridResult]], float]] = {
+            "vector": (self._search_vector(query, company_name, depth), vector_timeout),
+        }
+        if self.graph_repo.is_available:
             if company_name:
-                vector_results = await self.vector_store.search_by_company(
-                    query=query,
-                    company_name=company_name,
-                    n_results=n_results,
+                branches["graph_documents"] = (
+                    self._search_graph_documents(company_name, depth),
+                    graph_timeout,
+                )
+                branches["graph_events"] = (
+                    self._search_graph_events(company_name, max(depth // 2, 1)),
+                    graph_timeout,
                 )
             else:
-                vector_results = await self.vector_store.search(
-                    query=query,
-                    n_results=n_results,
+                branches["graph_text"] = (
+                    self._search_graph_text(query, depth),
+                    graph_timeout,
                 )
 
-            for vr in vector_results:
-                # 거리를 점수로 변환 (거리가 작을수록 높은 점수)
-                score = 1 / (1 + vr.get("distance", 0))
-                results.append(
-                    HybridResult(
-                        id=vr["id"],
-                        content=vr.get("content", ""),
-                        source="vector",
-                        score=score * self.vector_weight,
-                        metadata=vr.get("metadata", {}),
-                    )
-                )
-        except Exception as e:
-            logger.warning(f"벡터 검색 실패: {e}")
+        outcomes = await asyncio.gather(
+            *(self._run_branch(name, coro, timeout) for name, (coro, timeout) in branches.items())
+        )
 
-        # 2. 그래프 검색
-        try:
-            if self.graph_repo.is_available:
-                graph_results = await self._search_graph(query, company_name, n_results)
-                results.extend(graph_results)
-        except Exception as e:
-            logger.warning(f"그래프 검색 실패: {e}")
+        branch_results: dict[str, list[HybridResult]] = {}
+        timings: dict[str, float] = {}
+        errors: dict[str, str] = {}
+        for name, results, elapsed, error in outcomes:
+            timings[name] = elapsed
+            if error:
+                errors[name] = error
+            branch_results[name] = results
+
+        # 결과 융합 및 정렬
+        merged = self._merge_results(branch_results)
+        merged.sort(key=lambda x: x.score, reverse=True)
 
-        # 3. 결과 병합 및 정렬
-        merged = self._merge_results(results)
+        metadata = {
+            "timings": timings,
+            "errors": errors,
+            "partial": bool(errors),
+            "fusion": self.fusion,
+            "fetch_depth": depth,
+        }
+
+        # 재순위화 (선택, 실패/예산 초과 시 융합 순서 유지)
+        if self.reranker is not None and merged:
+            started = time.perf_counter()
+            try:
+                merged, metadata["rerank"] = await self.reranker.rerank(query, merged)
+            except Exception as e:
+                logger.warning(f"재순위화 실패, 융합 순서 사용: {e}")
+                metadata["rerank"] = {"reranked": False, "reason": str(e)}
+            timings["rerank"] = round((time.perf_counter() - started) * 1000, 2)
+
+        logger.debug(f"하이브리드 검색 브랜치 소요 시간(ms): {timings}")
+        retrieval = HybridSearchResult(results=merged[:n_results], metadata=metadata)
+
+        # 부분 결과는 캐시하지 않음
+        if not retrieval.partial:
+            self.cache.put(cache_key, company_name, copy.deepcopy(retrieval), generation)
+        return retrieval
+
+    def _cache_config(self) -> tuple:
+        """결과에 영향을 주는 융합/재순위화 설정 (캐시 키 구성요소)."""
+        return (
+            self.fusion,
+            self.settings.retrieval_rrf_k,
+            self.settings.retrieval_fetch_factor,
+            self.vector_weight,
+            self.settings.rerank_backend if self.reranker is not None else None,
+        )
 
-        # 점수 기준 정렬
-        merged.sort(key=lambda x: x.score, reverse=True)
+    def _fetch_depth(self, n_results: int) -> int:
+        """소스별 조회 깊이를 반환합니다.
 
-        return merged[:n_results]
+        융합 후에도 n_results를 채울 수 있도록 소스마다 조금 더 조회합니다.
+        """
+        return max(n_results, math.ceil(n_results * self.settings.retrieval_fetch_factor))
 
-    async def _search_graph(
+    async def _run_branch(
+        self,
+        name: str,
+        coro: Awaitable[list[HybridResult]],
+        timeout: float,
+    ) -> tuple[str, list[HybridResult], float, str | None]:
+        """검색 브랜치를 타임아웃과 함께 실행합니다 (실패 시 빈 결과)."""
+        started = time.perf_counter()
+        with start_span(f"retrieve.{name}") as span:
+            try:
+                results = await asyncio.wait_for(coro, timeout=timeout)
+                error = None
+            except TimeoutError:
+                logger.warning(f"{name} 검색 시간 초과 ({timeout}s)")
+                results, error = [], "timeout"
+            except Exception as e:
+                logger.warning(f"{name} 검색 실패: {e}")
+                results, error = [], str(e) or type(e).__name__
+            span.set_attributes({"result_count": len(results), "error": error})
+
+        elapsed = round((time.perf_counter() - started) * 1000, 2)
+        return name, results, elapsed, error
+
+    async def _search_vector(
         self,
         query: str,
         company_name: str | None,
         n_results: int,
     ) -> list[HybridResult]:
-        """그래프에서 검색합니다."""
-        results = []
-
+        """벡터 저장소에서 검색합니다."""
         if company_name:
-            # 기업 관련 문서 조회
-            documents = await self.graph_repo.get_company_documents(
+            vector_results = await self.vector_store.search_by_company(
+                query=query,
                 company_name=company_name,
-                limit=n_results,
+                n_results=n_results,
+            )
+        else:
+            vector_results = await self.vector_store.search(
+                query=query,
+                n_results=n_results,
             )
 
-            for doc in documents:
-                results.append(
-                    HybridResult(
-                        id=doc.id or "",
-                        content=doc.title,
-                        source="graph",
-                        score=self.graph_weight,
-                        metadata={
-                            "type": doc.type,
-                            "url": doc.url,
-                            "date": doc.date.isoformat() if doc.date else None,
-                        },
-                    )
+        results = []
+        for vr in vector_results:
+            # 거리를 점수로 변환 (거리가 작을수록 높은 점수)
+            score = 1 / (1 + vr.get("distance", 0))
+            results.append(
+                HybridResult(
+                    id=vr["id"],
+                    content=vr.get("content", ""),
+                    source="vector",
+                    score=score * self.vector_weight,
+                    metadata=vr.get("metadata", {}),
                 )
+            )
+        return results
 
-            # 관련 이벤트 조회
-            events = await self.graph_repo.get_company_events(
-                company_name=company_name,
-                limit=n_results // 2,
+    async def _search_graph_documents(
+        self,
+        company_name: str,
+        limit: int,
+    ) -> list[HybridResult]:
+        """그래프에서 기업 관련 문서를 조회합니다."""
+        documents = await self.graph_repo.get_company_documents(
+            company_name=company_name,
+            limit=limit,
+        )
+
+        return [
+            HybridResult(
+                id=doc.id or "",
+                content=doc.title,
+                source="graph",
+                score=self.graph_weight,
+                metadata={
+                    "type": doc.type,
+                    "url": doc.url,
+                    "date": doc.date.isoformat() if doc.date else None,
+                },
             )
+            for doc in documents
+        ]
 
-            for event in events:
-                results.append(
-                    HybridResult(
-                        id=event.id,
-                        content=event.title,
-                        source="graph",
-                        score=self.graph_weight * 0.8,  # 이벤트는 약간 낮은 가중치
-                        metadata={
-                            "type": event.type,
-                            "impact": event.impact,
-                            "date": event.date.isoformat() if event.date else None,
-                        },
-                    )
-                )
+    async def _search_graph_events(
+        self,
+        company_name: str,
+        limit: int,
+    ) -> list[HybridResult]:
+        """그래프에서 기업 관련 이벤트를 조회합니다."""
+        events = await self.graph_repo.get_company_events(
+            company_name=company_name,
+            limit=limit,
+        )
 
-        else:
-            # 텍스트 검색
-            graph_results = await self.graph_repo.search_by_text(
-                text=query,
-                limit=n_results,
+        return [
+            HybridResult(
+                id=event.id,
+                content=event.title,
+                source="graph",
+                score=self.graph_weight * 0.8,  # 이벤트는 약간 낮은 가중치
+                metadata={
+                    "type": event.type,
+                    "impact": event.impact,
+                    "date": event.date.isoformat() if event.date else None,
+                },
             )
+            for event in events
+        ]
 
-            for gr in graph_results:
-                node = gr["node"]
-                results.append(
-                    HybridResult(
-                        id=node.get("name", node.get("id", "")),
-                        content=node.get("description", node.get("name", "")),
-                        source="graph",
-                        score=self.graph_weight,
-                        metadata={
-                            "labels": gr["labels"],
-                            **node,
-                        },
-                    )
-                )
+    async def _search_graph_text(
+        self,
+        query: str,
+        limit: int,
+    ) -> list[HybridResult]:
+        """그래프에서 텍스트로 노드를 검색합니다."""
+        graph_results = await self.graph_repo.search_by_text(
+            text=query,
+            limit=limit,
+        )
 
+        results = []
+        for gr in graph_results:
+            node = gr["node"]
+            results.append(
+                HybridResult(
+                    id=node.get("name", node.get("id", "")),
+                    content=node.get("description", node.get("name", "")),
+                    source="graph",
+                    score=self.graph_weight,
+                    metadata={
+                        "labels": gr["labels"],
+                        **node,
+                    },
+                )
+            )
         return results
 
+    def _source_weights(self) -> dict[str, float]:
+        """브랜치별 융합 가중치를 반환합니다."""
+        return {
+            "vector": self.vector_weight,
+            "graph_documents": self.graph_weight,
+            "graph_events": self.graph_weight * 0.8,  # 이벤트는 약간 낮은 가중치
+            "graph_text": self.graph_weight,
+        }
+
+    @staticmethod
+    def _identity_keys(result: HybridResult) -> list[str]:
+        """소스와 무관한 문서 식별 키 목록 (ID, 정규 URL)."""
+        keys = [result.id] if result.id else []
+        url = canonicalize_url(result.metadata.get("url"))
+        if url:
+            keys.append(f"url:{url}")
+        return keys or [f"content:{result.content}"]
+
     def _merge_results(
         self,
-        results: list[HybridResult],
+        branch_results: dict[str, list[HybridResult]],
     ) -> list[HybridResult]:
-        """결과를 병합합니다 (중복 제거 및 점수 합산)."""
-        merged: dict[str, HybridResult] = {}
+        """브랜치별 결과를 문서 단위로 병합하고 융합 점수를 매깁니다.
 
-        for result in results:
-            key = result.id
-
-            if key in merged:
-                # 점수 합산
-                merged[key].score += result.score
-                # 소스 표시 업데이트
-                if merged[key].source != result.source:
-                    merged[key].source = "hybrid"
-            else:
-                merged[key] = result
+        ID나 정규 URL 중 하나라도 같으면 같은 문서로 보고 하나로 합칩니다.
+        """
+        merged: dict[str, HybridResult] = {}
+        aliases: dict[str, str] = {}  # 식별 키 → 병합 그룹 키
+        rankings: Rankings = {}
+
+        for source, results in branch_results.items():
+            ranked = []
+            for result in results:
+                keys = self._identity_keys(result)
+                group = next((aliases[k] for k in keys if k in aliases), None)
+
+                if group is None:
+                    group = keys[0]
+                    merged[group] = replace(result, metadata=dict(result.metadata))
+                else:
+                    existing = merged[group]
+                    # 소스 표시 업데이트
+                    if existing.source != result.source:
+                        existing.source = "hybrid"
+                    for key, value in result.metadata.items():
+                        existing.metadata.setdefault(key, value)
+
+                for key in keys:
+                    aliases.setdefault(key, group)
+                if all(group != g for g, _ in ranked):
+                    ranked.append((group, result.score))
+
+            rankings[source] = ranked
+
+        options = {"k": self.settings.retrieval_rrf_k} if self.fusion == "rrf" else {}
+        scores = self._fuse(rankings, weights=self._source_weights(), **options)
+        for group, score in scores.items():
+            merged[group].score = score
 
         return list(merged.values())
 
-    async def get_context_for_query(
+    async def build_context(
         self,
         query: str,
         company_name: str | None = None,
-        max_context_length: int = 4000,
-    ) -> str:
-        """쿼리에 대한 컨텍스트를 생성합니다.
+        max_tokens: int | None = None,
+        n_results: int | None = None,
+    ) -> AssembledContext:
+        """쿼리에 대한 토큰 예산 컨텍스트와 인용 목록을 생성합니다.
 
         Args:
             query: 검색 쿼리
             company_name: 기업명
-            max_context_length: 최대 컨텍스트 길이
+            max_tokens: 토큰 예산 (기본값: 설정의 context_max_tokens)
+            n_results: 후보 검색 결과 수 (기본값: 설정의 context_n_results)
 
         Returns:
-            LLM에 전달할 컨텍스트 문자열
+            조립된 컨텍스트
         """
         results = await self.search(
             query=query,
             company_name=company_name,
-            n_results=10,
+            n_results=n_results or self.settings.context_n_results,
         )
 
-        context_parts = []
-        current_length = 0
-
-        for result in results:
-            content = f"[{result.source}] {result.content}"
-
-            if current_length + len(content) > max_context_length:
-                break
+        return assemble_context(
+            results,
+            max_tokens=max_tokens or self.settings.context_max_tokens,
+            dedup_threshold=self.settings.context_dedup_threshold,
+            model=self.settings.openai_model,
+        )
 
-            context_parts.append(content)
-            current_length += len(content)
+    async def get_context_for_query(
+        self,
+        query: str,
+        company_name: str | None = None,
+        max_tokens: int | None = None,
+        n_results: int | None = None,
+    ) -> str:
+        """쿼리에 대한 컨텍스트를 생성합니다.
 
-        context = "\n\n".join(context_parts)
+        Args:
+            query: 검색 쿼리
+            company_name: 기업명
+            max_tokens: 토큰 예산 (기본값: 설정의 context_max_tokens)
+            n_results: 후보 검색 결과 수 (기본값: 설정의 context_n_results)
 
-        logger.debug(f"컨텍스트 생성: {len(context)}자, {len(context_parts)}개 소스")
-        return context
+        Returns:
+            LLM에 전달할 컨텍스트 문자열
+        """
+        context = await self.build_context(query, company_name, max_tokens, n_results)
+        return context.text
@@ -0,0 +1,508 @@
+"""백그라운드 문서 수집 파이프라인 (추출 → 그래프 저장 → 임베딩)."""
+
+import asyncio
+import json
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+
+from config.settings import Settings
+from src.graph.dedup import IngestionIndex, fingerprint, get_ingestion_index
+from src.utils.logging import get_logger
+from src.utils.metrics import PREFIX, Collected, get_registry
+
+logger = get_logger("graph.ingestion")
+
+
+@dataclass
+class IngestionItem:
+    """수집 대기 문서."""
+
+    title: str
+    content: str = ""
+    url: str | None = None
+    doc_type: str = "news"
+    company: str | None = None  # 수집을 유발한 분석 대상 기업
+    attempts: int = 0
+    error: str | None = None
+    # 재시도 시 완료된 단계를 다시 하지 않도록 보관하는 처리 상태 (spool 시 제외)
+    extraction: dict | None = field(default=None, repr=False, compare=False)
+    graph_saved: bool = field(default=False, repr=False, compare=False)
+
+    @property
+    def doc_id(self) -> str:
+        """추출기와 같은 방식으로 계산한 문서 ID (배치 내 중복 제거용)."""
+        text = f"{self.title}\n\n{self.content}" if self.content else self.title
+        return fingerprint(self.url, text).doc_id
+
+    def to_dict(self) -> dict:
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in ("extraction", "graph_saved")
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IngestionItem":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+def items_from_agent_state(state: dict) -> list[IngestionItem]:
+    """에이전트 상태의 search_results/news_items를 수집 항목으로 변환합니다.
+
+    Args:
+        state: 에이전트 실행 결과 상태
+
+    Returns:
+        수집 항목 목록
+    """
+    company = state.get("company_name") or None
+    items = [
+        IngestionItem(
+            title=r.title,
+            content=r.snippet,
+            url=r.url,
+            doc_type="web",
+            company=company,
+        )
+        for r in state.get("search_results") or []
+    ]
+    items.extend(
+        IngestionItem(
+            title=n.title,
+            content=n.summary or "",
+            url=n.url,
+            doc_type="news",
+            company=company,
+        )
+        for n in state.get("news_items") or []
+    )
+    return items
+
+
+def _append_jsonl(path: Path, items: list[IngestionItem]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        for item in items:
+            f.write(json.dumps(item.to_dict(), ensure_ascii=False) + "\n")
+
+
+def _take_jsonl(path: Path) -> list[IngestionItem]:
+    """JSONL 파일의 항목을 읽고 파일을 비웁니다."""
+    if not path.exists():
+        return []
+
+    items = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                items.append(IngestionItem.from_dict(json.loads(line)))
+            except (ValueError, TypeError):
+                continue
+    path.write_text("", encoding="utf-8")
+    return items
+
+
+class IngestionPipeline:
+    """인프로세스 큐와 제한된 워커로 문서를 수집하는 파이프라인.
+
+    워커는 큐에서 최대 ingest_batch_size개 문서를 꺼내 EntityExtractor로 처리한 뒤
+    그래프 쓰기와 임베딩을 배치 단위로 수행합니다. 실패한 문서는 지수 백오프로
+    재시도하되 이미 끝난 추출/그래프 저장은 다시 하지 않고, 재시도 한도를
+    넘으면 dead-letter 파일에 기록합니다.
+    큐가 가득 차면 요청 경로를 막지 않도록 spool 파일로 넘기며,
+    `ps ingest`로 spool/dead-letter를 다시 처리할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        extractor=None,
+        repository=None,
+        vector_store=None,
+        settings: Settings | None = None,
+        index: IngestionIndex | None = None,
+    ):
+        """파이프라인을 초기화합니다.
+
+        Args:
+            extractor: EntityExtractor (기본값: 수집 인덱스를 공유하는 새 인스턴스)
+            repository: GraphRepository
+            vector_store: VectorStore (기본값: 공용 벡터 저장소)
+            settings: 애플리케이션 설정
+            index: 수집 인덱스
+        """
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+
+        self.settings = settings
+        self._extractor = extractor
+        self._repository = repository
+        self._vector_store = vector_store
+        self._index = index
+        self.spool_path = Path(settings.ingest_spool_path)
+        self.dead_letter_path = Path(settings.ingest_dead_letter_path)
+
+        self._queue: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+        self._inflight: dict[int, list[IngestionItem]] = {}
+        self._resolver_seeded = False
+        self.stats = {
+            "queued": 0,
+            "processed": 0,
+            "skipped": 0,
+            "retried": 0,
+            "dead_lettered": 0,
+            "spooled": 0,
+        }
+
+    @property
+    def index(self) -> IngestionIndex:
+        """수집 인덱스를 반환합니다."""
+        if self._index is None:
+            self._index = get_ingestion_index(self.settings)
+        return self._index
+
+    @property
+    def extractor(self):
+        """엔티티 추출기를 반환합니다."""
+        if self._extractor is None:
+            from src.graph.extractor import EntityExtractor
+            self._extractor = EntityExtractor(settings=self.settings, index=self.index)
+        return self._extractor
+
+    @property
+    def repository(self):
+        """그래프 저장소를 반환합니다."""
+        if self._repository is None:
+            from src.graph.repository import GraphRepository
+            self._repository = GraphRepository()
+        return self._repository
+
+    @property
+    def vector_store(self):
+        """벡터 저장소를 반환합니다."""
+        if self._vector_store is None:
+            from src.graph.vector_store import get_vector_store
+            self._vector_store = get_vector_store(self.settings)
+        return self._vector_store
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        """수집 큐를 반환합니다."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.settings.ingest_queue_size)
+        return self._queue
+
+    @property
+    def is_running(self) -> bool:
+        """워커 실행 여부."""
+        return any(not worker.done() for worker in self._workers)
+
+    def start(self, workers: int | None = None) -> None:
+        """현재 이벤트 루프에서 워커를 시작합니다."""
+        if self.is_running:
+            return
+
+        count = workers or self.settings.ingest_workers
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"ingest-worker-{i}")
+            for i in range(count)
+        ]
+        logger.debug(f"수집 워커 {count}개 시작")
+
+    def offer(self, items: list[IngestionItem]) -> int:
+        """문서를 대기 없이 큐에 넣습니다 (요청 경로용).
+
+        큐가 가득 차면 넘치는 문서는 spool 파일에 기록합니다.
+
+        Args:
+            items: 수집 항목 목록
+
+        Returns:
+            큐에 넣은 문서 수
+        """
+        self.start()
+
+        accepted = 0
+        overflow = []
+        for item in items:
+            try:
+                self.queue.put_nowait(item)
+                accepted += 1
+            except asyncio.QueueFull:
+                overflow.append(item)
+
+        if overflow:
+            self.spool(overflow)
+        self.stats["queued"] += accepted
+        return accepted
+
+    async def put(self, item: IngestionItem) -> None:
+        """큐에 자리가 날 때까지 기다렸다가 문서를 넣습니다 (backpressure)."""
+        self.start()
+        await self.queue.put(item)
+        self.stats["queued"] += 1
+
+    def spool(self, items: list[IngestionItem]) -> None:
+        """처리하지 못한 문서를 spool 파일에 기록합니다."""
+        _append_jsonl(self.spool_path, items)
+        self.stats["spooled"] += len(items)
+        logger.info(f"수집 대기 문서 {len(items)}개 spool: {self.spool_path}")
+
+    def take_spooled(self, dead_letters: bool = False) -> list[IngestionItem]:
+        """spool(및 선택적으로 dead-letter) 파일의 문서를 꺼냅니다.
+
+        Args:
+            dead_letters: dead-letter 문서도 재시도 횟수를 초기화해 포함할지 여부
+
+        Returns:
+            수집 항목 목록
+        """
+        items = _take_jsonl(self.spool_path)
+        if dead_letters:
+            for item in _take_jsonl(self.dead_letter_path):
+                item.attempts = 0
+                item.error = None
+                items.append(item)
+        return items
+
+    async def shutdown(self, drain: bool = True) -> None:
+        """워커를 종료합니다.
+
+        Args:
+            drain: True면 큐가 빌 때까지 처리 후 종료,
+                False면 대기/처리 중 문서를 spool에 기록하고 즉시 종료
+        """
+        if drain and self.is_running:
+            await self.queue.join()
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        pending = [item for batch in self._inflight.values() for item in batch]
+        self._inflight.clear()
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+            self._queue.task_done()
+
+        if pending:
+            self.spool(pending)
+
+    async def _worker(self, worker_id: int) -> None:
+        """큐에서 배치를 꺼내 처리합니다."""
+        batch_size = max(self.settings.ingest_batch_size, 1)
+
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            self._inflight[worker_id] = batch
+            try:
+                await self._handle(batch)
+            except asyncio.CancelledError:
+                # 처리 중 배치는 shutdown에서 spool
+                raise
+            except Exception as e:
+                logger.error(f"수집 배치 처리 오류: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            self._inflight.pop(worker_id, None)
+
+    async def _handle(self, batch: list[IngestionItem]) -> None:
+        """배치를 처리하고 실패 문서는 백오프 후 재시도합니다."""
+        pending = batch
+
+        while pending:
+            failed = await self._process_batch(pending)
+            pending = []
+
+            for item, error in failed:
+                item.attempts += 1
+                item.error = f"{type(error).__name__}: {error}"
+                if item.attempts > self.settings.ingest_max_retries:
+                    self._dead_letter(item)
+                else:
+                    pending.append(item)
+                    self.stats["retried"] += 1
+
+            if pending:
+                attempts = max(item.attempts for item in pending)
+                await asyncio.sleep(self.settings.ingest_retry_backoff * 2 ** (attempts - 1))
+
+    async def _seed_resolver(self) -> None:
+        """첫 배치 전에 기존 Company 노드로 추출기의 해소기를 채웁니다 (한 번만 시도)."""
+        if self._resolver_seeded:
+            return
+
+        self._resolver_seeded = True
+        await self.repository.seed_resolver(self.extractor.resolver)
+
+    async def _process_batch(
+        self,
+        batch: list[IngestionItem],
+    ) -> list[tuple[IngestionItem, BaseException]]:
+        """추출 → 그래프 일괄 저장 → 일괄 임베딩을 수행합니다.
+
+        추출 결과와 그래프 저장 여부는 문서에 보관하므로, 재시도 배치는
+        실패한 단계부터 다시 수행합니다 (LLM 추출을 반복하지 않음).
+        같은 문서(같은 문서 ID)가 배치에 여러 번 있으면 한 번만 처리합니다.
+
+        Returns:
+            실패한 (문서, 예외) 목록
+        """
+        await self._seed_resolver()
+
+        unique: dict[str, IngestionItem] = {}
+        for item in batch:
+            unique.setdefault(item.doc_id, item)
+        self.stats["skipped"] += len(batch) - len(unique)
+        batch = list(unique.values())
+
+        pending = [item for item in batch if item.extraction is None]
+        results = await asyncio.gather(
+            *(
+                self.extractor.process_document(
+                    title=item.title,
+                    content=item.content,
+                    url=item.url,
+                    doc_type=item.doc_type,
+                    mark_seen=False,
+                )
+                for item in pending
+            ),
+            return_exceptions=True,
+        )
+
+        failed: list[tuple[IngestionItem, BaseException]] = []
+        for item, result in zip(pending, results, strict=True):
+            # return_exceptions=True는 CancelledError(BaseException)도 결과로 돌려줌
+            if isinstance(result, BaseException):
+                failed.append((item, result))
+            elif result["skipped"]:
+                self.stats["skipped"] += 1
+            else:
+                item.extraction = result
+
+        extracted = [item for item in batch if item.extraction is not None]
+        if not extracted:
+            return failed
+
+        try:
+            unsaved = [item for item in extracted if not item.graph_saved]
+            await self._write_graph([item.extraction for item in unsaved])
+            for item in unsaved:
+                item.graph_saved = True
+            await self._write_vectors(extracted)
+        except Exception as e:
+            logger.warning(f"수집 배치 저장 실패 ({len(extracted)}개): {e}")
+            return failed + [(item, e) for item in extracted]
+
+        # 저장이 끝난 문서만 수집 완료로 기록
+        for item in extracted:
+            self.index.mark_seen(item.extraction["fingerprint"])
+            item.extraction = None
+        self.stats["processed"] += len(extracted)
+        logger.info(f"문서 {len(extracted)}개 수집 완료")
+        return failed
+
+    async def _write_graph(self, results: list[dict]) -> None:
+        """배치의 엔티티/관계를 한 번에 저장합니다.
+
+        Raises:
+            RuntimeError: 그래프 저장소를 사용할 수 없는 경우 (수집 완료로 기록하지 않음)
+        """
+        if not results:
+            return
+        if not self.repository.is_available:
+            raise RuntimeError("그래프 저장소를 사용할 수 없습니다")
+
+        entities: dict[str, list] = {}
+        relationships = []
+        for result in results:
+            for key, nodes in result["entities"].items():
+                entities.setdefault(key, []).extend(nodes)
+            relationships.extend(result["relationships"])
+
+        await self.repository.save_extraction(entities, relationships)
+
+    async def _write_vectors(self, extracted: list[IngestionItem]) -> None:
+        """배치의 문서를 한 번에 임베딩합니다."""
+        documents = []
+        for item in extracted:
+            company = None
+            if item.company:
+                company = self.extractor.resolver.resolve(item.company).name
+
+            metadata = {
+                "title": item.title,
+                "type": item.doc_type,
+                "url": item.url,
+                "company": company,
+            }
+            documents.append({
+                "id": item.extraction["document"].id,
+                "content": f"{item.title}\n\n{item.content}" if item.content else item.title,
+                "metadata": {k: v for k, v in metadata.items() if v},
+            })
+
+        await self.vector_store.add_documents(documents)
+
+    def _dead_letter(self, item: IngestionItem) -> None:
+        """재시도 한도를 넘은 문서를 dead-letter 파일에 기록합니다."""
+        _append_jsonl(self.dead_letter_path, [item])
+        self.stats["dead_lettered"] += 1
+        logger.warning(f"수집 실패 (dead-letter): {item.title} - {item.error}")
+
+
+# 기본 파이프라인 인스턴스
+_default_pipeline: IngestionPipeline | None = None
+
+
+def get_ingestion_pipeline(settings: Settings | None = None) -> IngestionPipeline:
+    """기본 수집 파이프라인을 반환합니다."""
+    global _default_pipeline
+
+    if _default_pipeline is None:
+        _default_pipeline = IngestionPipeline(settings=settings)
+
+    return _default_pipeline
+
+
+def _metrics() -> list[Collected]:
+    """기본 파이프라인의 처리 수와 대기 문서 수 메트릭을 수집합니다."""
+    pipeline = _default_pipeline
+    if pipeline is None:
+        return []
+    return [
+        (
+            f"{PREFIX}_ingest_documents_total",
+            "counter",
+            "백그라운드 수집 문서 수",
+            [({"result": name}, value) for name, value in pipeline.stats.items()],
+        ),
+        (
+            f"{PREFIX}_ingest_queue_depth",
+            "gauge",
+            "수집 대기 문서 수",
+            [({}, pipeline.queue.qsize())],
+        ),
+    ]
+
+
+get_registry().register_collector(_metrics)
+
+
+async def shutdown_ingestion_pipeline(drain: bool = False) -> None:
+    """기본 파이프라인이 있으면 종료합니다 (남은 문서는 spool)."""
+    global _default_pipeline
+
+    if _default_pipeline is not None:
+        await _default_pipeline.shutdown(drain=drain)
+        _default_pipeline = None
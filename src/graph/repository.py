@@ -1,10 +1,13 @@
 """그래프 저장소 - 노드/관계 CRUD 작업."""
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 import uuid
 
+from src.graph.cache import GenerationTracker, get_generation_tracker
 from src.graph.client import Neo4jClient, get_neo4j_client
+from src.graph.resolver import EntityResolver, get_entity_resolver
 from src.graph.schema import (
     Company,
     Document,
@@ -19,27 +22,92 @@ from src.utils.logging import get_logger
 
 logger = get_logger("graph.repository")
 
+# 관계 타입별 (시작 라벨, 시작 키, 끝 라벨, 끝 키)
+RELATIONSHIP_ENDPOINTS: dict[RelationType, tuple[str, str, str, str]] = {
+    RelationType.BELONGS_TO: ("Company", "name", "Industry", "name"),
+    RelationType.COMPETES_WITH: ("Company", "name", "Company", "name"),
+    RelationType.AFFECTED_BY: ("Company", "name", "Event", "id"),
+    RelationType.LED_BY: ("Company", "name", "Person", "name"),
+    RelationType.MENTIONED_IN: ("Company", "name", "Document", "id"),
+    RelationType.WORKS_AT: ("Person", "name", "Company", "name"),
+}
+
+# 엔티티 목록 키별 (라벨, 병합 키)
+_ENTITY_NODES: dict[str, tuple[str, str]] = {
+    "companies": ("Company", "name"),
+    "industries": ("Industry", "name"),
+    "people": ("Person", "name"),
+    "events": ("Event", "id"),
+    "documents": ("Document", "id"),
+}
+
 
 class GraphRepository:
     """그래프 데이터 저장소."""
 
-    def __init__(self, client: Neo4jClient | None = None):
+    def __init__(
+        self,
+        client: Neo4jClient | None = None,
+        generations: GenerationTracker | None = None,
+        resolver: EntityResolver | None = None,
+    ):
         """저장소를 초기화합니다.
 
         Args:
             client: Neo4j 클라이언트
+            generations: 검색 캐시 세대 카운터 (쓰기 시 관련 기업 세대를 올림)
+            resolver: 기업명 해소기 (기본값: 프로세스 공용 해소기)
         """
         self._client = client or get_neo4j_client()
+        self._generations = generations or get_generation_tracker()
+        self._resolver = resolver
 
     @property
     def is_available(self) -> bool:
         """저장소 사용 가능 여부."""
         return self._client.is_available
 
+    @property
+    def resolver(self) -> EntityResolver:
+        """기업명 해소기를 반환합니다."""
+        if self._resolver is None:
+            self._resolver = get_entity_resolver()
+        return self._resolver
+
+    def _company_key(self, company_name: str) -> str:
+        """조회할 기업명을 Company 노드 키(정규 이름)로 해소합니다."""
+        return self.resolver.resolve(company_name).name
+
+    async def seed_resolver(self, resolver: EntityResolver | None = None) -> int:
+        """그래프의 기존 Company 노드로 해소기를 한 번 채웁니다.
+
+        이미 채운 해소기이거나 저장소를 사용할 수 없으면 아무것도 하지 않습니다.
+        실패해도 티커 매핑 기반 해소는 계속 동작하므로 경고만 남깁니다.
+
+        Args:
+            resolver: 채울 해소기 (기본값: 저장소의 해소기)
+
+        Returns:
+            읽은 Company 노드 수
+        """
+        resolver = resolver or self.resolver
+        if resolver.graph_seeded or not self.is_available:
+            return 0
+
+        try:
+            return await resolver.seed_from_graph(self)
+        except Exception as e:
+            logger.warning(f"그래프 기반 해소기 초기화 실패: {e}")
+            return 0
+
     # ==================== Company ====================
 
     async def create_company(self, company: Company) -> Company:
         """기업 노드를 생성합니다."""
+        resolved = self.resolver.resolve(company.name, ticker=company.ticker)
+        company = company.model_copy(
+            update={"name": resolved.name, "ticker": company.ticker or resolved.ticker}
+        )
         props = company.to_cypher_properties()
 
         query = """
@@ -52,6 +120,7 @@ class GraphRepository:
             query,
             {"name": company.name, "props": props},
         )
+        self._generations.bump(company.name)
 
         logger.debug(f"기업 생성: {company.name}")
         return company
@@ -63,7 +132,7 @@ class GraphRepository:
         RETURN c
         """
 
-        result = await self._client.execute_query(query, {"name": name})
+        result = await self._client.execute_query(query, {"name": self._company_key(name)})
 
         if result:
             data = result[0]["c"]
@@ -101,7 +170,9 @@ class GraphRepository:
         RETURN DISTINCT competitor
         """
 
-        result = await self._client.execute_query(query, {"name": company_name})
+        result = await self._client.execute_query(
+            query, {"name": self._company_key(company_name)}
+        )
         return [Company(**r["competitor"]) for r in result]
 
     # ==================== Industry ====================
@@ -120,6 +191,7 @@ class GraphRepository:
             query,
             {"name": industry.name, "props": props},
         )
+        self._generations.bump()
 
         logger.debug(f"산업 생성: {industry.name}")
         return industry
@@ -146,6 +218,7 @@ class GraphRepository:
             query,
             {"id": event.id, "props": props},
         )
+        self._generations.bump()
 
         logger.debug(f"이벤트 생성: {event.title}")
         return event
@@ -165,7 +238,7 @@ class GraphRepository:
 
         result = await self._client.execute_query(
             query,
-            {"name": company_name, "limit": limit},
+            {"name": self._company_key(company_name), "limit": limit},
         )
         return [Event(**r["e"]) for r in result]
 
@@ -185,6 +258,7 @@ class GraphRepository:
             query,
             {"name": person.name, "props": props},
         )
+        self._generations.bump(person.company)
 
         logger.debug(f"인물 생성: {person.name}")
         return person
@@ -196,7 +270,9 @@ class GraphRepository:
         RETURN p
         """
 
-        result = await self._client.execute_query(query, {"name": company_name})
+        result = await self._client.execute_query(
+            query, {"name": self._company_key(company_name)}
+        )
         return [Person(**r["p"]) for r in result]
 
     # ==================== Document ====================
@@ -220,6 +296,7 @@ class GraphRepository:
             query,
             {"id": document.id, "props": props},
         )
+        self._generations.bump()
 
         logger.debug(f"문서 생성: {document.title}")
         return document
@@ -231,6 +308,7 @@ class GraphRepository:
         limit: int = 10,
     ) -> list[Document]:
         """기업 관련 문서를 조회합니다."""
+        company_name = self._company_key(company_name)
         if doc_type:
             query = """
             MATCH (c:Company {name: $name})-[:MENTIONED_IN]->(d:Document {type: $type})
@@ -271,6 +349,7 @@ class GraphRepository:
                 "props": rel.to_cypher_properties(),
             },
         )
+        self._generations.bump(rel.source_id, rel.target_id)
 
         logger.debug(f"관계 생성: {rel.source_id} -[{rel.type.value}]-> {rel.target_id}")
 
@@ -315,6 +394,7 @@ class GraphRepository:
             query,
             {"company_name": company_name, "event_id": event_id},
         )
+        self._generations.bump(company_name)
 
     async def link_company_to_document(
         self,
@@ -331,6 +411,81 @@ class GraphRepository:
             query,
             {"company_name": company_name, "document_id": document_id},
         )
+        self._generations.bump(company_name)
+
+    # ==================== Batch ====================
+
+    async def save_extraction(
+        self,
+        entities: dict[str, list],
+        relationships: list[Relationship],
+    ) -> dict[str, int]:
+        """추출 결과를 노드 라벨/관계 타입별 UNWIND 쿼리로 일괄 저장합니다.
+
+        Args:
+            entities: 엔티티 목록 (companies/industries/people/events/documents)
+            relationships: 관계 목록
+
+        Returns:
+            라벨/관계 타입별 저장 건수
+        """
+        counts: dict[str, int] = {}
+        companies: set[str | None] = set()
+
+        for key, (label, merge_key) in _ENTITY_NODES.items():
+            rows = []
+            for node in entities.get(key, []):
+                if merge_key == "id" and not node.id:
+                    node.id = str(uuid.uuid4())
+                props = node.to_cypher_properties()
+                if "date" in props and isinstance(props["date"], datetime):
+                    props["date"] = props["date"].isoformat()
+                rows.append({"key": getattr(node, merge_key), "props": props})
+                if key == "companies":
+                    companies.add(node.name)
+                elif key == "people":
+                    companies.add(node.company)
+
+            if not rows:
+                continue
+
+            query = f"""
+            UNWIND $rows AS row
+            MERGE (n:{label} {{{merge_key}: row.key}})
+            SET n += row.props
+            """
+            await self._client.execute_query(query, {"rows": rows})
+            counts[label] = len(rows)
+
+        grouped: dict[RelationType, list[dict]] = {}
+        for rel in relationships:
+            grouped.setdefault(rel.type, []).append({
+                "source": rel.source_id,
+                "target": rel.target_id,
+                "props": rel.to_cypher_properties(),
+            })
+            companies.update((rel.source_id, rel.target_id))
+
+        for rel_type, rows in grouped.items():
+            source_label, source_key, target_label, target_key = RELATIONSHIP_ENDPOINTS.get(
+                rel_type, ("", "name", "", "name")
+            )
+            source = f"a:{source_label}" if source_label else "a"
+            target = f"b:{target_label}" if target_label else "b"
+
+            query = f"""
+            UNWIND $rows AS row
+            MATCH ({source} {{{source_key}: row.source}})
+            MATCH ({target} {{{target_key}: row.target}})
+            MERGE (a)-[r:{rel_type.value}]->(b)
+            SET r += row.props
+            """
+            await self._client.execute_query(query, {"rows": rows})
+            counts[rel_type.value] = len(rows)
+
+        self._generations.bump(*companies)
+        logger.debug(f"추출 결과 일괄 저장: {counts}")
+        return counts
 
     # ==================== Graph Queries ====================
 
@@ -348,7 +503,7 @@ class GraphRepository:
 
         result = await self._client.execute_query(
             query,
-            {"name": company_name, "depth": depth},
+            {"name": self._company_key(company_name), "depth": depth},
         )
 
         # 노드와 관계 추출
@@ -394,3 +549,25 @@ class GraphRepository:
         )
 
         return [{"node": r["n"], "labels": r["labels"]} for r in result]
+
+    async def export_nodes(
+        self,
+        node_type: NodeType,
+        batch_size: int = 500,
+    ) -> AsyncIterator[list[dict]]:
+        """노드를 배치 단위로 스트리밍하여 내보냅니다.
+
+        Args:
+            node_type: 내보낼 노드 타입
+            batch_size: 배치당 노드 수
+
+        Yields:
+            노드 프로퍼티 딕셔너리 배치
+        """
+        query = f"""
+        MATCH (n:{node_type.value})
+        RETURN n
+        """
+
+        async for batch in self._client.iter_query(query, batch_size=batch_size):
+            yield [r["n"] for r in batch]
@@ -0,0 +1,219 @@
+"""융합 후보 재순위화 (로컬 CPU cross-encoder)."""
+
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from config.settings import Settings
+from src.utils.logging import get_logger
+
+logger = get_logger("graph.reranker")
+
+# (쿼리, 문서) 쌍 목록 → 관련도 점수 목록
+PairScorer = Callable[[list[tuple[str, str]]], list[float]]
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def lexical_scorer(pairs: list[tuple[str, str]]) -> list[float]:
+    """쿼리 토큰이 문서에 포함된 비율로 점수를 매깁니다.
+
+    모델 없이 동작하는 대체 scorer로, 테스트/벤치마크에서 사용합니다.
+    """
+    scores = []
+    for query, text in pairs:
+        tokens = set(_TOKEN_PATTERN.findall(query.lower()))
+        text = text.lower()
+        scores.append(sum(1 for t in tokens if t in text) / len(tokens) if tokens else 0.0)
+    return scores
+
+
+def create_pair_scorer(settings: Settings | None = None) -> PairScorer:
+    """설정에 따라 (쿼리, 문서) 쌍 scorer를 생성합니다.
+
+    - cross-encoder: sentence-transformers CrossEncoder (embeddings extra 필요)
+    - lexical: 모델 없는 토큰 일치율
+
+    Args:
+        settings: 애플리케이션 설정
+
+    Returns:
+        쌍 scorer
+
+    Raises:
+        ValueError: 알 수 없는 백엔드이거나 의존성이 없는 경우
+    """
+    if settings is None:
+        from config.settings import settings as default_settings
+        settings = default_settings
+
+    backend = settings.rerank_backend.lower()
+
+    if backend == "cross-encoder":
+        try:
+            from sentence_transformers import CrossEncoder
+        except ImportError as e:
+            raise ValueError(
+                "sentence-transformers가 필요합니다. "
+                "pip install -e '.[embeddings]'로 설치해주세요."
+            ) from e
+
+        model = CrossEncoder(settings.rerank_model, device="cpu")
+        return lambda pairs: [float(s) for s in model.predict(pairs, show_progress_bar=False)]
+
+    if backend == "lexical":
+        return lexical_scorer
+
+    raise ValueError(f"지원하지 않는 재순위화 백엔드: {settings.rerank_backend}")
+
+
+class Reranker:
+    """융합 결과 상위 후보를 쿼리와 함께 채점해 재정렬합니다.
+
+    후보 쌍을 배치로 나눠 전용 스레드에서 채점하고, (쿼리, 문서 내용 해시) 점수를
+    LRU로 캐시합니다 (ID가 빈 그래프 결과끼리도 충돌하지 않음). 지연 예산을 넘기면
+    융합 순서를 그대로 반환하며, 늦게 끝난 배치의 점수는 다음 요청을 위해 캐시에
+    저장합니다.
+    """
+
+    def __init__(
+        self,
+        scorer: PairScorer,
+        top_n: int = 20,
+        batch_size: int = 16,
+        budget_ms: float = 300,
+        cache_size: int = 4096,
+    ):
+        """재순위화기를 초기화합니다.
+
+        Args:
+            scorer: (쿼리, 문서) 쌍 scorer
+            top_n: 재순위화할 상위 후보 수
+            batch_size: 채점 배치 크기
+            budget_ms: 지연 예산 (ms)
+            cache_size: 점수 캐시 최대 항목 수
+        """
+        self.scorer = scorer
+        self.top_n = top_n
+        self.batch_size = max(batch_size, 1)
+        self.budget_ms = budget_ms
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """채점 전용 스레드 풀을 반환합니다."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rerank")
+        return self._executor
+
+    def _cache_get(self, key: tuple[str, str]) -> float | None:
+        score = self._cache.get(key)
+        if score is not None:
+            self._cache.move_to_end(key)
+        return score
+
+    def _cache_put(self, key: tuple[str, str], score: float) -> None:
+        self._cache[key] = score
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def rerank(self, query: str, results: list[Any]) -> tuple[list[Any], dict]:
+        """상위 후보를 재순위화합니다.
+
+        Args:
+            query: 검색 쿼리
+            results: 융합 점수순 결과 (id, content, score, metadata 속성)
+
+        Returns:
+            (재정렬된 결과, 실행 정보) 튜플. 예산 초과 시 입력 순서 그대로 반환
+        """
+        candidates = results[:self.top_n]
+        scores: dict[tuple[str, str], float] = {}
+        pending = []
+
+        for result in candidates:
+            key = self._pair_key(query, result)
+            cached = self._cache_get(key)
+            if cached is None:
+                pending.append(result)
+            else:
+                scores[key] = cached
+
+        info = {"candidates": len(candidates), "cached": len(scores), "reranked": False}
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        loop = asyncio.get_running_loop()
+
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            keys = [self._pair_key(query, r) for r in batch]
+            future = loop.run_in_executor(
+                self.executor, self.scorer, [(query, r.content) for r in batch]
+            )
+
+            done, _ = await asyncio.wait({future}, timeout=max(deadline - time.perf_counter(), 0))
+            if not done:
+                # 늦게 끝난 점수도 캐시해 다음 요청에서 사용
+                future.add_done_callback(lambda f, keys=keys: self._store(keys, f))
+                logger.debug(f"재순위화 예산 초과 ({self.budget_ms}ms), 융합 순서 사용")
+                info["reason"] = "budget"
+                return results, info
+
+            for key, score in zip(keys, future.result()):
+                self._cache_put(key, score)
+                scores[key] = score
+
+        for result in candidates:
+            result.metadata["fusion_score"] = result.score
+            result.score = scores[self._pair_key(query, result)]
+
+        reranked = sorted(candidates, key=lambda r: r.score, reverse=True)
+        info["reranked"] = True
+        return reranked + results[self.top_n:], info
+
+    @staticmethod
+    def _pair_key(query: str, result: Any) -> tuple[str, str]:
+        """(쿼리, 문서 내용 해시) 캐시 키를 반환합니다."""
+        digest = hashlib.blake2b(result.content.encode("utf-8"), digest_size=16).hexdigest()
+        return query, digest
+
+    def _store(self, keys: list[tuple[str, str]], future: asyncio.Future) -> None:
+        """완료된 배치 점수를 캐시에 저장합니다."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        for key, score in zip(keys, future.result()):
+            self._cache_put(key, score)
+
+
+# 기본 재순위화기 인스턴스
+_default_reranker: Reranker | None = None
+
+
+def get_reranker(settings: Settings | None = None) -> Reranker | None:
+    """설정의 재순위화기를 반환합니다 (rerank_backend가 비어 있으면 None)."""
+    global _default_reranker
+
+    if settings is None:
+        from config.settings import settings as default_settings
+        settings = default_settings
+
+    if not settings.rerank_backend:
+        return None
+
+    if _default_reranker is None:
+        _default_reranker = Reranker(
+            create_pair_scorer(settings),
+            top_n=settings.rerank_top_n,
+            batch_size=settings.rerank_batch_size,
+            budget_ms=settings.rerank_budget_ms,
+            cache_size=settings.rerank_cache_size,
+        )
+
+    return _default_reranker
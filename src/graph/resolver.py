@@ -0,0 +1,367 @@
+"""기업명 정규화 및 엔티티 해소 (alias 인덱스)."""
+
+import re
+import unicodedata
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from src.graph.schema import NodeType
+from src.utils.logging import get_logger
+
+logger = get_logger("graph.resolver")
+
+# 법인 형태 접미사/접두사 (정규화 시 제거)
+_CORP_SUFFIX_PATTERN = re.compile(
+    r"\(주\)|㈜|주식회사|\(유\)|유한회사"
+    r"|\bco\b\.?,?\s*ltd\b\.?|\bcorporation\b|\bcorp\b\.?|\binc\b\.?|\bltd\b\.?"
+    r"|\blimited\b|\bplc\b",
+    re.IGNORECASE,
+)
+_NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+# 티커 형식 (005930, 005930.KS, AAPL, BRK.B)
+_KR_TICKER_PATTERN = re.compile(r"^(\d{6})(?:\.(?:KS|KQ))?$", re.IGNORECASE)
+_US_TICKER_PATTERN = re.compile(r"^[A-Z]{1,5}(?:\.[A-Z]{1,2})?$")
+
+# KR_TICKER_MAP 기업의 영문명 alias
+DEFAULT_ALIASES: dict[str, list[str]] = {
+    "삼성전자": ["Samsung Electronics"],
+    "SK하이닉스": ["SK Hynix"],
+    "LG에너지솔루션": ["LG Energy Solution"],
+    "삼성바이오로직스": ["Samsung Biologics"],
+    "현대차": ["Hyundai Motor", "Hyundai Motor Company"],
+    "기아": ["Kia", "Kia Motors"],
+    "셀트리온": ["Celltrion"],
+    "POSCO홀딩스": ["POSCO Holdings"],
+    "KB금융": ["KB Financial Group"],
+    "신한지주": ["Shinhan Financial Group"],
+    "NAVER": ["Naver Corp"],
+    "카카오": ["Kakao"],
+    "LG화학": ["LG Chem"],
+    "삼성SDI": ["Samsung SDI"],
+    "현대모비스": ["Hyundai Mobis"],
+    "삼성물산": ["Samsung C&T"],
+    "SK이노베이션": ["SK Innovation"],
+    "LG전자": ["LG Electronics"],
+}
+
+
+@lru_cache(maxsize=65536)
+def normalize_name(name: str) -> str:
+    """기업명을 비교용 키로 정규화합니다.
+
+    유니코드 정규화(NFKC), 소문자화, 법인 형태 제거, 공백/구두점 제거를 수행합니다.
+
+    Args:
+        name: 기업명
+
+    Returns:
+        정규화된 키 (빈 문자열일 수 있음)
+    """
+    text = unicodedata.normalize("NFKC", name).strip()
+    text = _CORP_SUFFIX_PATTERN.sub(" ", text)
+    return _NON_WORD_PATTERN.sub("", text).lower()
+
+
+def canonical_name(name: str) -> str:
+    """alias 인덱스에 없는 기업의 정규 이름을 만듭니다.
+
+    법인 형태와 중복 공백만 제거하고 대소문자는 유지하므로, 같은 표기는
+    프로세스나 처리 순서와 관계없이 항상 같은 노드 키가 됩니다.
+
+    Args:
+        name: 기업명
+
+    Returns:
+        정규 이름
+    """
+    text = unicodedata.normalize("NFKC", name)
+    text = " ".join(_CORP_SUFFIX_PATTERN.sub(" ", text).split()).strip(" ,.-")
+    return text or " ".join(name.split())
+
+
+def normalize_ticker(ticker: str) -> str | None:
+    """티커 형식이면 비교용 키로 정규화합니다.
+
+    한국 티커는 거래소 접미사 유무와 관계없이 6자리 코드로 통일합니다.
+
+    Args:
+        ticker: 티커 후보 문자열
+
+    Returns:
+        정규화된 티커 또는 None (티커 형식이 아닌 경우)
+    """
+    text = ticker.strip()
+    kr_match = _KR_TICKER_PATTERN.match(text)
+    if kr_match:
+        return kr_match.group(1)
+    if _US_TICKER_PATTERN.match(text):
+        return text.upper()
+    return None
+
+
+def _ngrams(key: str, n: int = 2) -> set[str]:
+    """문자 n-gram 집합을 반환합니다."""
+    if len(key) < n:
+        return {key} if key else set()
+    return {key[i:i + n] for i in range(len(key) - n + 1)}
+
+
+@dataclass
+class Resolution:
+    """엔티티 해소 결과."""
+
+    name: str  # 정규 노드 키 (Company.name)
+    ticker: str | None
+    method: str  # "exact" | "ticker" | "fuzzy" | "new"
+    score: float = 1.0
+
+
+class EntityResolver:
+    """기업명 → 정규 노드 키 매핑을 위한 인메모리 alias 인덱스.
+
+    정규화 문자열 해시 조회, 티커 조회, 문자 n-gram 유사도 순서로
+    후보를 매칭합니다. 인덱스는 add_entity/seed_*로 등록한 엔티티만 담고,
+    매칭되지 않은 이름은 등록하지 않고 canonical_name()으로 키를 정하므로
+    워커마다 같은 결과가 나옵니다. 티커/유사도 매칭 결과는 크기가 제한된
+    LRU에 기억합니다.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        similarity_margin: float = 0.05,
+        ngram_size: int = 2,
+        max_learned: int = 10000,
+    ):
+        """해소기를 초기화합니다.
+
+        Args:
+            similarity_threshold: n-gram 유사도(Dice) 매칭 임계값
+            similarity_margin: 두 번째로 가까운 다른 엔티티와의 최소 유사도 차이
+            ngram_size: n-gram 크기
+            max_learned: 기억할 해소 결과 최대 수
+        """
+        self.similarity_threshold = similarity_threshold
+        self.similarity_margin = similarity_margin
+        self.ngram_size = ngram_size
+        self.max_learned = max_learned
+
+        self._aliases: dict[str, str] = {}  # 정규화 키 → 정규 이름
+        self._tickers: dict[str, str] = {}  # 정규화 티커 → 정규 이름
+        self._canonical_tickers: dict[str, str] = {}  # 정규 이름 → 티커
+        self._gram_index: dict[str, set[str]] = {}  # n-gram → 정규화 키
+        self._gram_counts: dict[str, int] = {}  # 정규화 키 → n-gram 수
+        self._learned: OrderedDict[tuple[str, str | None], Resolution] = OrderedDict()
+        self.graph_seeded = False  # seed_from_graph 완료 여부
+
+    def __len__(self) -> int:
+        return len(self._aliases)
+
+    def add_entity(
+        self,
+        name: str,
+        ticker: str | None = None,
+        aliases: list[str] | None = None,
+    ) -> str:
+        """정규 엔티티와 alias를 등록합니다.
+
+        이미 같은 티커나 이름으로 등록된 엔티티가 있으면 그 엔티티의 alias로 추가합니다.
+
+        Args:
+            name: 정규 이름
+            ticker: 주식 티커
+            aliases: 추가 alias 목록
+
+        Returns:
+            등록된 정규 이름
+        """
+        canonical = self._match_exact(name) or self._match_ticker(ticker) or name
+
+        # 인덱스가 바뀌면 기억한 해소 결과(특히 "new")가 달라질 수 있음
+        self._learned.clear()
+        self._add_alias(name, canonical)
+        for alias in aliases or []:
+            self._add_alias(alias, canonical)
+        if ticker:
+            self._add_ticker(ticker, canonical)
+
+        return canonical
+
+    def resolve(self, name: str, ticker: str | None = None) -> Resolution:
+        """기업명을 정규 노드 키로 해소합니다.
+
+        인덱스에 없는 기업은 등록하지 않고 canonical_name(name)을 키로 사용합니다.
+
+        Args:
+            name: 기업명 (티커 문자열도 허용)
+            ticker: 함께 추출된 티커 (선택)
+
+        Returns:
+            해소 결과
+        """
+        canonical = self._match_exact(name)
+        if canonical is not None:
+            ticker = self._canonical_tickers.get(canonical, ticker)
+            return Resolution(name=canonical, ticker=ticker, method="exact")
+
+        memo_key = (normalize_name(name), normalize_ticker(ticker) if ticker else None)
+        resolution = self._learned.get(memo_key)
+        if resolution is not None:
+            self._learned.move_to_end(memo_key)
+            return resolution
+
+        canonical = self._match_ticker(ticker) or self._match_ticker(name)
+        method = "ticker"
+        score = 1.0
+
+        if canonical is None:
+            canonical, score = self._match_fuzzy(name)
+            method = "fuzzy"
+
+        if canonical is None:
+            canonical = canonical_name(name)
+            method = "new"
+            score = 0.0
+
+        resolution = Resolution(
+            name=canonical,
+            ticker=self._canonical_tickers.get(canonical, ticker),
+            method=method,
+            score=score,
+        )
+        self._learned[memo_key] = resolution
+        if len(self._learned) > self.max_learned:
+            self._learned.popitem(last=False)
+        return resolution
+
+    def canonical_key(self, name: str) -> str:
+        """기업명을 캐시/필터용 비교 키로 변환합니다 (정규 이름의 정규화 키).
+
+        Args:
+            name: 기업명 또는 티커
+
+        Returns:
+            같은 기업의 모든 표기에 대해 같은 키
+        """
+        canonical = self.resolve(name).name
+        return normalize_name(canonical) or canonical
+
+    def seed_from_ticker_map(self, ticker_map: dict[str, str] | None = None) -> None:
+        """KR_TICKER_MAP 및 기본 영문 alias로 인덱스를 채웁니다.
+
+        Args:
+            ticker_map: 기업명 → 티커 매핑 (기본값: KR_TICKER_MAP)
+        """
+        if ticker_map is None:
+            from src.stock.client import KR_TICKER_MAP
+            ticker_map = KR_TICKER_MAP
+
+        for name, ticker in ticker_map.items():
+            self.add_entity(name, ticker=ticker, aliases=DEFAULT_ALIASES.get(name))
+
+        logger.debug(f"티커 매핑으로 alias 인덱스 초기화: {len(self)}개")
+
+    async def seed_from_graph(self, repository, batch_size: int = 500) -> int:
+        """그래프의 기존 Company 노드로 인덱스를 채웁니다.
+
+        Args:
+            repository: GraphRepository
+            batch_size: 스트리밍 배치 크기
+
+        Returns:
+            읽은 노드 수
+        """
+        count = 0
+        async for batch in repository.export_nodes(NodeType.COMPANY, batch_size=batch_size):
+            for node in batch:
+                if node.get("name"):
+                    self.add_entity(node["name"], ticker=node.get("ticker"))
+                    count += 1
+
+        self.graph_seeded = True
+        logger.info(f"그래프 Company 노드로 alias 인덱스 갱신: {count}개")
+        return count
+
+    def _add_alias(self, alias: str, canonical: str) -> None:
+        """정규화 키를 등록합니다."""
+        key = normalize_name(alias)
+        if not key or key in self._aliases:
+            return
+
+        self._aliases[key] = canonical
+        grams = _ngrams(key, self.ngram_size)
+        self._gram_counts[key] = len(grams)
+        for gram in grams:
+            self._gram_index.setdefault(gram, set()).add(key)
+
+    def _add_ticker(self, ticker: str, canonical: str) -> None:
+        """티커를 등록합니다."""
+        key = normalize_ticker(ticker)
+        if key and key not in self._tickers:
+            self._tickers[key] = canonical
+            self._canonical_tickers.setdefault(canonical, ticker)
+
+    def _match_exact(self, name: str) -> str | None:
+        """정규화 키 해시 조회."""
+        key = normalize_name(name)
+        return self._aliases.get(key) if key else None
+
+    def _match_ticker(self, ticker: str | None) -> str | None:
+        """티커 조회."""
+        if not ticker:
+            return None
+        key = normalize_ticker(ticker)
+        return self._tickers.get(key) if key else None
+
+    def _match_fuzzy(self, name: str) -> tuple[str | None, float]:
+        """n-gram Dice 유사도로 가장 가까운 alias를 찾습니다.
+
+        "Samsung SDS"와 "Samsung SDI"처럼 한두 글자만 다른 별개 기업이 합쳐지지
+        않도록, 임계값을 넘고 두 번째로 가까운 다른 엔티티보다 similarity_margin
+        이상 가까운 경우에만 매칭합니다.
+        """
+        key = normalize_name(name)
+        grams = _ngrams(key, self.ngram_size)
+        if len(grams) < 2:
+            return None, 0.0
+
+        overlap: Counter[str] = Counter()
+        for gram in grams:
+            for candidate in self._gram_index.get(gram, ()):
+                overlap[candidate] += 1
+
+        # 정규 이름별 최고 유사도 (같은 엔티티의 alias끼리는 경쟁하지 않음)
+        scores: dict[str, float] = {}
+        for candidate, shared in overlap.items():
+            score = 2 * shared / (len(grams) + self._gram_counts[candidate])
+            canonical = self._aliases[candidate]
+            scores[canonical] = max(score, scores.get(canonical, 0.0))
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        if not ranked:
+            return None, 0.0
+
+        best, best_score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if best_score >= self.similarity_threshold and (
+            best_score - runner_up >= self.similarity_margin
+        ):
+            return best, best_score
+        return None, best_score
+
+
+# 기본 해소기 인스턴스
+_default_resolver: EntityResolver | None = None
+
+
+def get_entity_resolver() -> EntityResolver:
+    """KR_TICKER_MAP으로 초기화된 기본 해소기를 반환합니다."""
+    global _default_resolver
+
+    if _default_resolver is None:
+        _default_resolver = EntityResolver()
+        _default_resolver.seed_from_ticker_map()
+
+    return _default_resolver
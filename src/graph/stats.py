@@ -0,0 +1,185 @@
+"""그래프 통계 서비스 (카운트 스토어 기반 + TTL 캐시)."""
+
+import asyncio
+import time
+
+from neo4j.exceptions import ClientError
+
+from config.settings import Settings
+from src.graph.client import Neo4jClient, get_neo4j_client
+from src.graph.schema import NodeType, RelationType
+from src.utils.logging import get_logger
+
+logger = get_logger("graph.stats")
+
+# APOC 메타 통계 (카운트 스토어에서 한 번에 조회)
+APOC_STATS_QUERY = """
+CALL apoc.meta.stats() YIELD labels, relTypesCount
+RETURN labels, relTypesCount
+"""
+
+
+def _build_count_store_query() -> str:
+    """레이블/관계 타입별 카운트 스토어 조회 쿼리를 생성합니다.
+
+    `MATCH (n:Label) RETURN count(n)` 및
+    `MATCH ()-[r:TYPE]->() RETURN count(r)` 형태는 플래너가 스캔 없이
+    카운트 스토어에서 바로 읽으므로, 서브쿼리로 묶어 한 번에 실행합니다.
+    """
+    parts = []
+    returns = []
+
+    for node_type in NodeType:
+        alias = f"n_{node_type.value}"
+        parts.append(f"CALL {{ MATCH (n:{node_type.value}) RETURN count(n) AS {alias} }}")
+        returns.append(f"{node_type.value}: {alias}")
+
+    rel_returns = []
+    for rel_type in RelationType:
+        alias = f"r_{rel_type.value}"
+        parts.append(f"CALL {{ MATCH ()-[r:{rel_type.value}]->() RETURN count(r) AS {alias} }}")
+        rel_returns.append(f"{rel_type.value}: {alias}")
+
+    return (
+        "\n".join(parts)
+        + "\nRETURN {" + ", ".join(returns) + "} AS labels, "
+        + "{" + ", ".join(rel_returns) + "} AS relTypesCount"
+    )
+
+
+COUNT_STORE_QUERY = _build_count_store_query()
+
+
+def _is_missing_procedure(error: Exception) -> bool:
+    """APOC 프로시저가 설치되지 않아 발생한 오류인지 확인합니다."""
+    if not isinstance(error, ClientError):
+        return False
+    return "ProcedureNotFound" in (error.code or "") or "no procedure" in str(error).lower()
+
+
+class GraphStatsService:
+    """노드/관계 카운트를 단일 쿼리로 조회하고 짧은 TTL 동안 캐시합니다."""
+
+    def __init__(
+        self,
+        client: Neo4jClient | None = None,
+        ttl: float | None = None,
+    ):
+        """통계 서비스를 초기화합니다.
+
+        Args:
+            client: Neo4j 클라이언트
+            ttl: 캐시 유지 시간 (초, 기본값: 설정값)
+        """
+        self._client = client or get_neo4j_client()
+        self.ttl = ttl if ttl is not None else self._client.settings.graph_stats_ttl
+        self._cached: dict | None = None
+        self._cached_at: float = 0.0
+        self._use_apoc: bool = True
+        self._lock = asyncio.Lock()
+
+    @property
+    def settings(self) -> Settings:
+        """클라이언트 설정을 반환합니다."""
+        return self._client.settings
+
+    @property
+    def is_available(self) -> bool:
+        """통계 조회 가능 여부."""
+        return self._client.is_available
+
+    async def get_stats(self, refresh: bool = False) -> dict:
+        """그래프 통계를 반환합니다.
+
+        Args:
+            refresh: True면 캐시를 무시하고 다시 조회
+
+        Returns:
+            노드/관계 카운트 딕셔너리
+        """
+        if not refresh and self._is_fresh():
+            return self._cached
+
+        async with self._lock:
+            # 대기 중 다른 요청이 갱신했을 수 있음
+            if not refresh and self._is_fresh():
+                return self._cached
+
+            labels, rel_counts = await self._fetch_counts()
+
+            node_counts = {
+                node_type.value.lower(): int(labels.get(node_type.value, 0))
+                for node_type in NodeType
+            }
+            rel_counts = {k: int(v) for k, v in rel_counts.items() if v}
+
+            self._cached = {
+                "nodes": node_counts,
+                "relationships": rel_counts,
+                "total_nodes": sum(node_counts.values()),
+                "total_relationships": sum(rel_counts.values()),
+            }
+            self._cached_at = time.monotonic()
+
+            logger.debug(
+                f"그래프 통계 갱신: 노드 {self._cached['total_nodes']}개, "
+                f"관계 {self._cached['total_relationships']}개"
+            )
+            return self._cached
+
+    def invalidate(self) -> None:
+        """캐시를 무효화합니다."""
+        self._cached = None
+        self._cached_at = 0.0
+
+    def _is_fresh(self) -> bool:
+        """캐시가 유효한지 확인합니다."""
+        return (
+            self._cached is not None
+            and time.monotonic() - self._cached_at < self.ttl
+        )
+
+    async def _fetch_counts(self) -> tuple[dict, dict]:
+        """카운트 스토어에서 레이블/관계 카운트를 조회합니다."""
+        if self._use_apoc:
+            try:
+                result = await self._client.execute_query(APOC_STATS_QUERY)
+                if result:
+                    return result[0]["labels"], result[0]["relTypesCount"]
+            except ClientError as e:
+                # 연결 오류 등 일시적인 실패는 그대로 전파하고, APOC가 없을 때만 전환
+                if not _is_missing_procedure(e):
+                    raise
+                logger.debug(f"APOC 통계 사용 불가, 카운트 스토어 쿼리로 대체: {e}")
+                self._use_apoc = False
+
+        result = await self._client.execute_query(COUNT_STORE_QUERY)
+        if not result:
+            return {}, {}
+        return result[0]["labels"], result[0]["relTypesCount"]
+
+
+# 기본 서비스 인스턴스
+_default_service: GraphStatsService | None = None
+
+
+def get_graph_stats_service(settings: Settings | None = None) -> GraphStatsService:
+    """기본 그래프 통계 서비스를 반환합니다.
+
+    프로세스 공용 인스턴스이므로 settings는 처음 생성할 때만 사용합니다.
+    다른 설정이 필요하면 GraphStatsService를 직접 생성하세요.
+
+    Args:
+        settings: 애플리케이션 설정 (첫 호출에서만 적용)
+
+    Returns:
+        GraphStatsService 인스턴스
+    """
+    global _default_service
+
+    if _default_service is None:
+        _default_service = GraphStatsService(get_neo4j_client(settings))
+    elif settings is not None and settings is not _default_service.settings:
+        logger.debug("기본 그래프 통계 서비스가 이미 생성되어 settings를 무시합니다")
+
+    return _default_service
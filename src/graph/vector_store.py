@@ -1,27 +1,172 @@
 """ChromaDB 벡터 저장소."""
 
-import uuid
+import asyncio
+import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 import chromadb
 from chromadb.config import Settings as ChromaSettings
 
 from config.settings import Settings
+from src.graph.cache import GenerationTracker, get_generation_tracker
+from src.graph.chunking import split_text
+from src.graph.dedup import fingerprint
+from src.graph.embeddings import (
+    EmbeddingPipeline,
+    QueryEmbeddingCache,
+    create_embedding_function,
+    embedding_model_key,
+    get_query_embedding_cache,
+)
+from src.graph.resolver import EntityResolver, get_entity_resolver
 from src.utils.logging import get_logger
+from src.utils.metrics import track
+from src.utils.tracing import current_span
 
 logger = get_logger("graph.vector_store")
 
+# 청크 메타데이터 필드 (부모 문서 메타데이터와 구분)
+_CHUNK_FIELDS = ("parent_id", "chunk_index", "chunk_count")
+
+# 문서 수 집계 시 한 번에 읽을 청크 수
+_STATS_PAGE_SIZE = 1000
+
+
+class _QueryBatcher:
+    """짧은 시간 창 안에 들어온 검색을 하나의 collection.query로 묶습니다.
+
+    같은 where 필터를 가진 검색끼리 모아 한 번에 조회한 뒤,
+    각 호출자에게 자신의 결과만 돌려줍니다. 실행 중이거나 대기 중인 다른
+    검색이 없으면 시간 창을 기다리지 않고 바로 실행하므로, 경합이 없는
+    단일 검색에는 지연이 추가되지 않습니다.
+    """
+
+    def __init__(
+        self,
+        run: Callable[..., Any],
+        query: Callable[..., dict],
+        window: float,
+        max_batch: int,
+    ):
+        """배처를 초기화합니다.
+
+        Args:
+            run: 동기 함수를 실행기에서 실행하는 코루틴 함수
+            query: 동기 collection.query 호출 함수
+            window: 배치 수집 시간 창 (초)
+            max_batch: 배치당 최대 쿼리 수 (도달 시 즉시 실행)
+        """
+        self._run = run
+        self._query = query
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[str, list[tuple[list[float], int, asyncio.Future]]] = {}
+        self._wheres: dict[str, dict | None] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._inflight = 0
+        self.batches = 0
+        self.queries = 0
+
+    async def submit(
+        self,
+        embedding: list[float],
+        n_results: int,
+        where: dict | None,
+    ) -> dict:
+        """검색을 배치에 추가하고 결과를 기다립니다."""
+        key = json.dumps(where, sort_keys=True, default=str)
+        future = asyncio.get_running_loop().create_future()
+
+        idle = not self._pending and not self._inflight
+        group = self._pending.setdefault(key, [])
+        group.append((embedding, n_results, future))
+        self._wheres[key] = where
+
+        if len(group) >= self.max_batch:
+            self._spawn(self._flush(key))
+        elif len(group) == 1:
+            # 다른 검색이 없으면 같은 루프 반복에 들어온 검색만 모아 바로 실행
+            self._spawn(self._flush_later(key, group, 0 if idle else self.window))
+
+        return await future
+
+    def _spawn(self, coro) -> None:
+        """배치 태스크를 참조를 유지한 채 실행합니다 (GC 방지, 실패 로깅)."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"검색 배치 실행 실패: {task.exception()!r}")
+
+    async def _flush_later(self, key: str, group: list, delay: float) -> None:
+        await asyncio.sleep(delay)
+        # 이미 max_batch로 실행된 그룹이면 무시
+        if self._pending.get(key) is group:
+            await self._flush(key)
+
+    async def _flush(self, key: str) -> None:
+        group = self._pending.pop(key, None)
+        where = self._wheres.pop(key, None)
+        if not group:
+            return
+
+        self.batches += 1
+        self.queries += len(group)
+
+        self._inflight += 1
+        try:
+            results = await self._run(
+                self._query,
+                operation="query_batch",
+                query_embeddings=[embedding for embedding, _, _ in group],
+                n_results=max(n for _, n, _ in group),
+                where=where,
+            )
+        except Exception as e:
+            for _, _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._inflight -= 1
+
+        for i, (_, n_results, future) in enumerate(group):
+            if future.done():
+                continue
+            future.set_result({
+                field: (results.get(field) or [[]] * len(group))[i][:n_results]
+                for field in ("ids", "documents", "metadatas", "distances")
+            })
+
 
 class VectorStore:
     """ChromaDB 기반 벡터 저장소."""
 
     COLLECTION_NAME = "palantir_stock"
 
-    def __init__(self, settings: Settings | None = None):
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        embedding_function=None,
+        query_cache: QueryEmbeddingCache | None = None,
+        generations: GenerationTracker | None = None,
+        resolver: EntityResolver | None = None,
+    ):
         """벡터 저장소를 초기화합니다.
 
         Args:
             settings: 애플리케이션 설정
+            embedding_function: Chroma 임베딩 함수 (기본값: 설정의 embedding_backend)
+            query_cache: 쿼리 임베딩 캐시 (기본값: 프로세스 공용 캐시)
+            generations: 검색 캐시 세대 카운터 (추가/삭제 시 관련 기업 세대를 올림)
+            resolver: 기업명 해소기 (기업 필터 검색 시 정규 이름으로 변환)
         """
         if settings is None:
             from config.settings import settings as default_settings
@@ -30,6 +175,23 @@ class VectorStore:
         self.settings = settings
         self._client: chromadb.Client | None = None
         self._collection = None
+        self._known_ids: set[str] = set()  # 이미 임베딩된 ID (중복 임베딩 방지)
+        self._document_count: int | None = None  # get_stats용 문서 수 (쓰기 시 갱신)
+        self._embedding_function = embedding_function
+        self._embedder: EmbeddingPipeline | None = None
+        self._query_cache = query_cache
+        self._model_key: str | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._batcher: _QueryBatcher | None = None
+        self._generations = generations or get_generation_tracker()
+        self._resolver = resolver
+
+    @property
+    def resolver(self) -> EntityResolver:
+        """기업명 해소기를 반환합니다."""
+        if self._resolver is None:
+            self._resolver = get_entity_resolver()
+        return self._resolver
 
     @property
     def client(self) -> chromadb.Client:
@@ -48,6 +210,97 @@ class VectorStore:
 
         return self._client
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """ChromaDB 호출 전용 스레드 풀을 반환합니다."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.settings.chroma_executor_workers,
+                thread_name_prefix="chroma",
+            )
+        return self._executor
+
+    async def _run(
+        self, func: Callable[..., Any], *args: Any, operation: str = "call", **kwargs: Any
+    ) -> Any:
+        """동기 ChromaDB 호출을 이벤트 루프 밖에서 실행합니다.
+
+        Args:
+            func: ChromaDB 호출 함수
+            operation: 메트릭 라벨용 작업 이름
+        """
+        loop = asyncio.get_running_loop()
+        with track("backend", backend="chroma", operation=operation):
+            return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    @property
+    def batcher(self) -> _QueryBatcher:
+        """검색 마이크로 배처를 반환합니다."""
+        if self._batcher is None:
+            self._batcher = _QueryBatcher(
+                run=self._run,
+                query=lambda **kwargs: self.collection.query(**kwargs),
+                window=self.settings.vector_search_batch_window_ms / 1000,
+                max_batch=self.settings.vector_search_max_batch,
+            )
+        return self._batcher
+
+    @property
+    def embedding_function(self):
+        """임베딩 함수를 반환합니다."""
+        if self._embedding_function is None:
+            self._embedding_function = create_embedding_function(self.settings)
+        return self._embedding_function
+
+    @property
+    def embedder(self) -> EmbeddingPipeline:
+        """배치 임베딩 파이프라인을 반환합니다."""
+        if self._embedder is None:
+            self._embedder = EmbeddingPipeline(
+                self.embedding_function,
+                batch_size=self.settings.embedding_batch_size,
+                max_batch_chars=self.settings.embedding_max_batch_chars,
+                concurrency=self.settings.embedding_concurrency,
+            )
+        return self._embedder
+
+    @property
+    def query_cache(self) -> QueryEmbeddingCache:
+        """쿼리 임베딩 캐시를 반환합니다."""
+        if self._query_cache is None:
+            self._query_cache = get_query_embedding_cache(self.settings)
+        return self._query_cache
+
+    @property
+    def model_key(self) -> str:
+        """쿼리 캐시용 임베딩 모델 키를 반환합니다."""
+        if self._model_key is None:
+            self._model_key = embedding_model_key(self.embedding_function)
+        return self._model_key
+
+    async def embed_query(self, query: str) -> list[float]:
+        """쿼리를 임베딩합니다 (캐시 우선).
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            쿼리 임베딩
+        """
+        embedding = self.query_cache.get(self.model_key, query)
+        current_span().set_attribute("embedding.cache_hit", embedding is not None)
+        if embedding is not None:
+            return embedding
+
+        function = self.embedding_function
+        embed = getattr(function, "embed_query", function)
+        loop = asyncio.get_running_loop()
+        vectors = await loop.run_in_executor(self.embedder.executor, embed, [query])
+
+        embedding = [float(v) for v in vectors[0]]
+        self.query_cache.put(self.model_key, query, embedding)
+        return embedding
+
     @property
     def collection(self):
         """기본 컬렉션을 반환합니다."""
@@ -55,6 +308,7 @@ class VectorStore:
             self._collection = self.client.get_or_create_collection(
                 name=self.COLLECTION_NAME,
                 metadata={"description": "Palantir Stock 문서 임베딩"},
+                embedding_function=self.embedding_function,
             )
             logger.debug(f"컬렉션 로드: {self.COLLECTION_NAME}")
 
@@ -68,6 +322,10 @@ class VectorStore:
     ) -> str:
         """문서를 벡터 저장소에 추가합니다.
 
+        ID가 없으면 콘텐츠 지문으로 결정적 ID를 만들고,
+        이미 저장된 ID는 임베딩하지 않고 건너뜁니다.
+        청크 모드에서는 문서를 청크로 나눠 각각 임베딩합니다.
+
         Args:
             document_id: 문서 ID
             content: 문서 내용
@@ -76,16 +334,10 @@ class VectorStore:
         Returns:
             임베딩 ID
         """
-        embedding_id = document_id or str(uuid.uuid4())
-
-        self.collection.add(
-            ids=[embedding_id],
-            documents=[content],
-            metadatas=[metadata or {}],
+        ids = await self.add_documents(
+            [{"id": document_id, "content": content, "metadata": metadata or {}}]
         )
-
-        logger.debug(f"문서 임베딩 추가: {embedding_id}")
-        return embedding_id
+        return ids[0]
 
     async def add_documents(
         self,
@@ -97,24 +349,104 @@ class VectorStore:
             documents: 문서 목록 [{"id": ..., "content": ..., "metadata": ...}]
 
         Returns:
-            임베딩 ID 목록
+            임베딩 ID 목록 (건너뛴 문서 포함, 입력 순서)
         """
         if not documents:
             return []
 
-        ids = [d.get("id", str(uuid.uuid4())) for d in documents]
-        contents = [d["content"] for d in documents]
-        metadatas = [d.get("metadata", {}) for d in documents]
-
-        self.collection.add(
-            ids=ids,
-            documents=contents,
-            metadatas=metadatas,
+        ids = [
+            d.get("id") or fingerprint((d.get("metadata") or {}).get("url"), d["content"]).doc_id
+            for d in documents
+        ]
+
+        # 배치 내 중복 및 이미 임베딩된 문서 제외
+        pending: dict[str, dict] = {}
+        for doc_id, doc in zip(ids, documents):
+            if doc_id not in self._known_ids and doc_id not in pending:
+                pending[doc_id] = doc
+
+        if pending:
+            # 청크 문서는 첫 청크 ID로 저장 여부를 확인
+            lookup = list(pending) + [self._chunk_id(doc_id, 0) for doc_id in pending]
+            found = await self._run(
+                lambda: self.collection.get(ids=lookup, include=[]), operation="get"
+            )
+            existing = {doc_id.removesuffix("#0") for doc_id in found["ids"]}
+            self._known_ids.update(existing)
+            for doc_id in existing:
+                pending.pop(doc_id, None)
+
+        if not pending:
+            logger.debug(f"신규 문서 없음, 임베딩 건너뜀 ({len(documents)}개)")
+            return ids
+
+        entries = [
+            entry
+            for doc_id, doc in pending.items()
+            for entry in self._make_entries(doc_id, doc["content"], doc.get("metadata") or {})
+        ]
+        contents = [content for _, content, _ in entries]
+        embeddings = await self.embedder.embed(contents)
+
+        await self._run(
+            lambda: self.collection.upsert(
+                ids=[entry_id for entry_id, _, _ in entries],
+                embeddings=embeddings,
+                documents=contents,
+                # Chroma는 빈 메타데이터 dict를 거부하므로 None으로 전달
+                metadatas=[metadata or None for _, _, metadata in entries],
+            ),
+            operation="upsert",
+        )
+        self._known_ids.update(pending)
+        if self._document_count is not None:
+            self._document_count += len(pending)
+        self._generations.bump(
+            *{(d.get("metadata") or {}).get("company") for d in pending.values()}
         )
 
-        logger.info(f"문서 {len(documents)}개 임베딩 추가")
+        logger.info(
+            f"문서 {len(pending)}개 임베딩 추가 ({len(entries)}개 청크, "
+            f"{len(documents) - len(pending)}개 중복 제외)"
+        )
         return ids
 
+    @staticmethod
+    def _chunk_id(parent_id: str, index: int) -> str:
+        """청크 ID를 반환합니다."""
+        return f"{parent_id}#{index}"
+
+    def _make_entries(
+        self,
+        doc_id: str,
+        content: str,
+        metadata: dict,
+    ) -> list[tuple[str, str, dict]]:
+        """문서를 (ID, 텍스트, 메타데이터) 임베딩 항목으로 변환합니다.
+
+        청크가 하나뿐인 문서는 문서 ID를 그대로 사용하고,
+        여러 청크로 나뉜 문서는 `<문서 ID>#<순번>` ID와 부모 ID 메타데이터를 갖습니다.
+        """
+        if not self.settings.vector_chunking:
+            return [(doc_id, content, metadata)]
+
+        chunks = split_text(
+            content,
+            chunk_size=self.settings.vector_chunk_size,
+            overlap=self.settings.vector_chunk_overlap,
+        )
+        if len(chunks) <= 1:
+            return [(doc_id, content, {**metadata, "parent_id": doc_id})]
+
+        return [
+            (
+                self._chunk_id(doc_id, i),
+                chunk,
+                {**metadata, "parent_id": doc_id, "chunk_index": i, "chunk_count": len(chunks)},
+            )
+            for i, chunk in enumerate(chunks)
+        ]
+
     async def search(
         self,
         query: str,
@@ -123,36 +455,91 @@ class VectorStore:
     ) -> list[dict]:
         """쿼리로 유사 문서를 검색합니다.
 
+        청크 모드에서는 상위 청크를 조회한 뒤 부모 문서 단위로 묶고,
+        가장 잘 맞는 청크(span)를 문서 순서대로 이어 content로 반환합니다.
+
         Args:
             query: 검색 쿼리
-            n_results: 결과 수
+            n_results: 결과 수 (부모 문서 기준)
             where: 필터 조건
 
         Returns:
             검색 결과 목록
         """
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            where=where,
-        )
+        query_embedding = await self.embed_query(query)
+
+        fetch = n_results
+        if self.settings.vector_chunking:
+            fetch = n_results * max(self.settings.vector_chunk_fetch_factor, 1)
+
+        if self.batcher.window > 0:
+            results = await self.batcher.submit(query_embedding, fetch, where)
+        else:
+            raw = await self._run(
+                lambda: self.collection.query(
+                    query_embeddings=[query_embedding],
+                    n_results=fetch,
+                    where=where,
+                ),
+                operation="query",
+            )
+            results = {field: (raw.get(field) or [[]])[0] for field in raw}
 
         # 결과 포맷팅
-        documents = []
-        ids = results.get("ids", [[]])[0]
-        docs = results.get("documents", [[]])[0]
-        metadatas = results.get("metadatas", [[]])[0]
-        distances = results.get("distances", [[]])[0]
+        hits = []
+        ids = results.get("ids") or []
+        docs = results.get("documents") or []
+        metadatas = results.get("metadatas") or []
+        distances = results.get("distances") or []
 
         for i, doc_id in enumerate(ids):
-            documents.append({
+            hits.append({
                 "id": doc_id,
                 "content": docs[i] if i < len(docs) else "",
-                "metadata": metadatas[i] if i < len(metadatas) else {},
+                "metadata": (metadatas[i] if i < len(metadatas) else None) or {},
                 "distance": distances[i] if i < len(distances) else 0,
             })
 
-        logger.debug(f"벡터 검색 결과: {len(documents)}개")
+        documents = self._collapse_chunks(hits)[:n_results]
+        current_span().set_attributes({
+            "vector.chunks": len(hits),
+            "vector.results": len(documents),
+        })
+
+        logger.debug(f"벡터 검색 결과: {len(documents)}개 ({len(hits)}개 청크)")
+        return documents
+
+    def _collapse_chunks(self, hits: list[dict]) -> list[dict]:
+        """거리순 청크 결과를 부모 문서 단위로 묶습니다."""
+        parents: dict[str, dict] = {}
+
+        for hit in hits:
+            metadata = hit["metadata"]
+            parent_id = metadata.get("parent_id") or hit["id"]
+            span = {
+                "chunk_index": metadata.get("chunk_index", 0),
+                "text": hit["content"],
+                "distance": hit["distance"],
+            }
+
+            parent = parents.get(parent_id)
+            if parent is None:
+                parents[parent_id] = {
+                    "id": parent_id,
+                    "metadata": {k: v for k, v in metadata.items() if k not in _CHUNK_FIELDS},
+                    "distance": hit["distance"],
+                    "spans": [span],
+                }
+            elif len(parent["spans"]) < self.settings.vector_max_spans:
+                parent["spans"].append(span)
+
+        documents = []
+        for parent in parents.values():
+            # 거리순으로 고른 span을 원문 순서로 정렬
+            parent["spans"].sort(key=lambda span: span["chunk_index"])
+            parent["content"] = "\n...\n".join(span["text"] for span in parent["spans"])
+            documents.append(parent)
+
         return documents
 
     async def search_by_company(
@@ -163,9 +550,12 @@ class VectorStore:
     ) -> list[dict]:
         """기업 필터로 문서를 검색합니다.
 
+        문서의 company 메타데이터는 정규 이름으로 저장되므로, 영문명이나 티커로
+        조회해도 같은 문서를 찾도록 기업명을 먼저 해소합니다.
+
         Args:
             query: 검색 쿼리
-            company_name: 기업명
+            company_name: 기업명 (alias/티커 허용)
             n_results: 결과 수
 
         Returns:
@@ -174,7 +564,7 @@ class VectorStore:
         return await self.search(
             query=query,
             n_results=n_results,
-            where={"company": company_name},
+            where={"company": self.resolver.resolve(company_name).name},
         )
 
     async def delete_document(self, document_id: str) -> None:
@@ -183,13 +573,82 @@ class VectorStore:
         Args:
             document_id: 문서 ID
         """
-        self.collection.delete(ids=[document_id])
+        found = await self._run(
+            lambda: self.collection.get(ids=[document_id], include=["metadatas"]),
+            operation="get",
+        )
+        chunks = await self._run(
+            lambda: self.collection.get(where={"parent_id": document_id}, include=["metadatas"]),
+            operation="get",
+        )
+        companies = {
+            (metadata or {}).get("company")
+            for metadata in found["metadatas"] + chunks["metadatas"]
+        }
+
+        await self._run(lambda: self.collection.delete(ids=[document_id]), operation="delete")
+        await self._run(
+            lambda: self.collection.delete(where={"parent_id": document_id}), operation="delete"
+        )
+        self._generations.bump(*companies)
+        self._known_ids.discard(document_id)
+        self._document_count = None
         logger.debug(f"문서 임베딩 삭제: {document_id}")
 
+    def _count_documents(self) -> int:
+        """서로 다른 parent_id 수로 문서 수를 셉니다 (동기 호출)."""
+        parents: set[str] = set()
+        offset = 0
+        while True:
+            page = self.collection.get(
+                include=["metadatas"], limit=_STATS_PAGE_SIZE, offset=offset
+            )
+            ids = page.get("ids") or []
+            for chunk_id, metadata in zip(ids, page.get("metadatas") or [], strict=False):
+                parents.add((metadata or {}).get("parent_id") or chunk_id)
+            if len(ids) < _STATS_PAGE_SIZE:
+                return len(parents)
+            offset += len(ids)
+
     async def get_stats(self) -> dict:
-        """저장소 통계를 반환합니다."""
-        count = self.collection.count()
+        """저장소 통계를 반환합니다.
+
+        document_count는 원본 문서 수, chunk_count는 임베딩된 청크 수입니다.
+        문서 수는 처음 한 번만 전체를 세고 이후에는 이 인스턴스의 쓰기로 갱신합니다.
+        """
+        chunks = await self._run(lambda: self.collection.count(), operation="count")
+        if self._document_count is None:
+            self._document_count = await self._run(
+                self._count_documents, operation="count_documents"
+            )
+        documents = self._document_count
         return {
             "collection": self.COLLECTION_NAME,
-            "document_count": count,
+            "document_count": documents,
+            "chunk_count": chunks,
+            "query_cache": self.query_cache.stats(),
         }
+
+
+# 기본 벡터 저장소 인스턴스
+_default_store: VectorStore | None = None
+
+
+def get_vector_store(settings: Settings | None = None) -> VectorStore:
+    """기본 벡터 저장소를 반환합니다.
+
+    요청마다 새 인스턴스를 만들면 실행기와 검색 배처가 공유되지 않으므로
+    API/에이전트 경로는 이 인스턴스를 사용합니다.
+
+    Args:
+        settings: 애플리케이션 설정
+
+    Returns:
+        VectorStore 인스턴스
+    """
+    global _default_store
+
+    if _default_store is None:
+        _default_store = VectorStore(settings)
+
+    return _default_store
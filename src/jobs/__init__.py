@@ -0,0 +1,22 @@
+"""비동기 작업 큐 모듈."""
+
+from .base import Job, JobBackend, JobError, JobLimitExceededError, JobStatus
+from .memory import InMemoryJobBackend
+from .queue import JobQueue, create_job_backend, get_job_queue, shutdown_job_queue
+from .redis_backend import RedisJobBackend
+from .sqlite_backend import SQLiteJobBackend
+
+__all__ = [
+    "InMemoryJobBackend",
+    "Job",
+    "JobBackend",
+    "JobError",
+    "JobLimitExceededError",
+    "JobQueue",
+    "JobStatus",
+    "RedisJobBackend",
+    "SQLiteJobBackend",
+    "create_job_backend",
+    "get_job_queue",
+    "shutdown_job_queue",
+]
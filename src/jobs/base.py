@@ -0,0 +1,134 @@
+"""비동기 작업 모델과 백엔드 추상 인터페이스."""
+
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class JobStatus(StrEnum):
+    """작업 상태."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+class Job(BaseModel):
+    """비동기 작업."""
+
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex, description="작업 ID")
+    kind: str = Field(..., description="작업 종류 (예: analyze)")
+    params: dict = Field(default_factory=dict, description="작업 파라미터")
+    user: str = Field(default="anonymous", description="요청 사용자")
+    status: JobStatus = Field(default=JobStatus.QUEUED, description="작업 상태")
+    result: Any | None = Field(default=None, description="작업 결과 (JSON 직렬화 가능)")
+    error: str | None = Field(default=None, description="실패 사유")
+    created_at: datetime = Field(default_factory=datetime.now, description="생성 시간")
+    started_at: datetime | None = Field(default=None, description="실행 시작 시간")
+    finished_at: datetime | None = Field(default=None, description="완료 시간")
+
+
+class JobBackend(ABC):
+    """작업 상태 저장소 + 대기열 추상 기본 클래스.
+
+    여러 프로세스가 같은 백엔드를 공유하면 어느 워커든 대기열의 작업을 가져가고,
+    어느 프로세스에서든 상태를 조회할 수 있습니다.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """백엔드 이름을 반환합니다."""
+        pass
+
+    @abstractmethod
+    async def save(self, job: Job, ttl: int) -> None:
+        """작업 상태를 저장합니다.
+
+        Args:
+            job: 작업
+            ttl: 보관 시간 (초)
+        """
+        pass
+
+    @abstractmethod
+    async def load(self, job_id: str) -> Job | None:
+        """작업 상태를 조회합니다 (없거나 만료되면 None)."""
+        pass
+
+    @abstractmethod
+    async def push(self, job_id: str) -> None:
+        """작업을 대기열에 넣습니다."""
+        pass
+
+    @abstractmethod
+    async def pop(self, timeout: float) -> str | None:
+        """대기열에서 작업 ID를 꺼냅니다 (timeout 동안 없으면 None)."""
+        pass
+
+    @abstractmethod
+    async def lease(self, job_id: str, ttl: float) -> None:
+        """실행 중인 작업의 lease를 기록하거나 갱신합니다.
+
+        Args:
+            job_id: 작업 ID
+            ttl: lease 유효 시간 (초)
+        """
+        pass
+
+    @abstractmethod
+    async def unlease(self, job_id: str) -> None:
+        """작업의 lease를 지웁니다 (실행 완료 시)."""
+        pass
+
+    @abstractmethod
+    async def expired_leases(self) -> list[str]:
+        """lease가 만료된 작업 ID를 기록에서 지우고 반환합니다."""
+        pass
+
+    @abstractmethod
+    async def acquire(self, user: str, slot: str, limit: int, ttl: int) -> bool:
+        """사용자의 동시 작업 슬롯을 확보합니다.
+
+        슬롯은 작업별로 만료 시각과 함께 기록되므로, 워커가 비정상 종료해 반환되지
+        않은 슬롯도 ttl이 지나면 한도 계산에서 빠집니다.
+
+        Args:
+            user: 사용자
+            slot: 슬롯 ID (작업 ID)
+            limit: 최대 동시 작업 수 (0이면 무제한)
+            ttl: 슬롯 보관 시간 (초)
+
+        Returns:
+            확보 여부
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, user: str, slot: str) -> None:
+        """사용자의 동시 작업 슬롯을 반환합니다."""
+        pass
+
+    async def close(self) -> None:
+        """연결을 정리합니다."""
+
+
+class JobError(Exception):
+    """작업 큐 오류."""
+
+    pass
+
+
+class JobLimitExceededError(JobError):
+    """사용자 동시 작업 한도 초과."""
+
+    pass
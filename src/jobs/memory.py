@@ -0,0 +1,84 @@
+"""인메모리 작업 백엔드 (단일 프로세스)."""
+
+import asyncio
+import time
+
+from src.jobs.base import Job, JobBackend
+
+
+class InMemoryJobBackend(JobBackend):
+    """프로세스 내 dict/asyncio.Queue 기반 작업 백엔드."""
+
+    def __init__(self):
+        self._jobs: dict[str, tuple[float, str]] = {}
+        self._queue: asyncio.Queue[str] | None = None
+        # 사용자 → {슬롯 ID: 만료 시각}
+        self._slots: dict[str, dict[str, float]] = {}
+        # 실행 중 작업 ID → lease 만료 시각
+        self._leases: dict[str, float] = {}
+
+    @property
+    def name(self) -> str:
+        return "memory"
+
+    @property
+    def queue(self) -> asyncio.Queue[str]:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        for job_id in [k for k, (expires, _) in self._jobs.items() if expires <= now]:
+            del self._jobs[job_id]
+
+    async def save(self, job: Job, ttl: int) -> None:
+        self._purge()
+        self._jobs[job.id] = (time.monotonic() + ttl, job.model_dump_json())
+
+    async def load(self, job_id: str) -> Job | None:
+        entry = self._jobs.get(job_id)
+        if entry is None or entry[0] <= time.monotonic():
+            self._jobs.pop(job_id, None)
+            return None
+        return Job.model_validate_json(entry[1])
+
+    async def push(self, job_id: str) -> None:
+        self.queue.put_nowait(job_id)
+
+    async def pop(self, timeout: float) -> str | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def lease(self, job_id: str, ttl: float) -> None:
+        self._leases[job_id] = time.monotonic() + ttl
+
+    async def unlease(self, job_id: str) -> None:
+        self._leases.pop(job_id, None)
+
+    async def expired_leases(self) -> list[str]:
+        now = time.monotonic()
+        expired = [job_id for job_id, expires in self._leases.items() if expires <= now]
+        for job_id in expired:
+            del self._leases[job_id]
+        return expired
+
+    async def acquire(self, user: str, slot: str, limit: int, ttl: int) -> bool:
+        now = time.monotonic()
+        slots = {k: expires for k, expires in self._slots.get(user, {}).items() if expires > now}
+        if limit > 0 and len(slots) >= limit:
+            self._slots[user] = slots
+            return False
+        slots[slot] = now + ttl
+        self._slots[user] = slots
+        return True
+
+    async def release(self, user: str, slot: str) -> None:
+        slots = self._slots.get(user)
+        if slots is None:
+            return
+        slots.pop(slot, None)
+        if not slots:
+            del self._slots[user]
@@ -0,0 +1,299 @@
+"""비동기 작업 큐 (제출 → 워커 풀 실행 → TTL 결과 조회)."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+from config.settings import Settings
+from src.jobs.base import Job, JobBackend, JobError, JobLimitExceededError, JobStatus
+from src.jobs.memory import InMemoryJobBackend
+from src.utils.logging import get_logger
+from src.utils.metrics import PREFIX, Collected, get_registry, track
+from src.utils.tracing import start_span
+
+logger = get_logger("jobs.queue")
+
+# 작업 파라미터 → JSON 직렬화 가능한 결과
+JobHandler = Callable[[dict], Awaitable[Any]]
+
+# 워커가 대기열을 확인하는 주기 (초, 종료 신호 확인용)
+POLL_INTERVAL = 1.0
+
+
+def create_job_backend(settings: Settings | None = None) -> JobBackend:
+    """설정에 따라 작업 백엔드를 생성합니다.
+
+    Raises:
+        ValueError: 알 수 없는 백엔드이거나 의존성이 없는 경우
+    """
+    if settings is None:
+        from config.settings import settings as default_settings
+        settings = default_settings
+
+    backend = settings.job_backend.lower()
+
+    if backend == "memory":
+        return InMemoryJobBackend()
+
+    if backend == "redis":
+        from src.jobs.redis_backend import RedisJobBackend
+        return RedisJobBackend.from_url(settings.redis_url)
+
+    if backend == "sqlite":
+        from src.jobs.sqlite_backend import SQLiteJobBackend
+        return SQLiteJobBackend.from_path(settings.cache_path)
+
+    raise ValueError(f"지원하지 않는 작업 백엔드: {settings.job_backend}")
+
+
+class JobQueue:
+    """장시간 작업을 요청 경로 밖에서 실행하는 작업 큐.
+
+    제출된 작업은 백엔드 대기열에 들어가고, 프로세스별 워커 풀이 꺼내 실행합니다.
+    상태와 결과는 job_result_ttl 동안 보관되며, 사용자별 동시 작업 수는
+    job_max_per_user로 제한합니다.
+
+    실행 중인 작업은 job_lease 주기로 lease를 갱신합니다. 워커 프로세스가 죽어
+    lease가 만료된 RUNNING 작업은 다른 워커가 다시 대기열에 넣습니다.
+    """
+
+    def __init__(
+        self,
+        backend: JobBackend | None = None,
+        settings: Settings | None = None,
+        handlers: dict[str, JobHandler] | None = None,
+    ):
+        """작업 큐를 초기화합니다.
+
+        Args:
+            backend: 작업 백엔드 (None이면 설정에 따라 생성)
+            settings: 애플리케이션 설정
+            handlers: 작업 종류별 핸들러
+        """
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+
+        self.settings = settings
+        self._backend = backend
+        self.handlers: dict[str, JobHandler] = dict(handlers or {})
+        self._workers: list[asyncio.Task] = []
+        self._stopping = False
+        self._next_reap = 0.0
+        self.stats = {
+            "submitted": 0,
+            "rejected": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "requeued": 0,
+        }
+
+    @property
+    def backend(self) -> JobBackend:
+        """작업 백엔드를 반환합니다."""
+        if self._backend is None:
+            self._backend = create_job_backend(self.settings)
+        return self._backend
+
+    @property
+    def is_running(self) -> bool:
+        return any(not w.done() for w in self._workers)
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """작업 종류 핸들러를 등록합니다."""
+        self.handlers[kind] = handler
+
+    def start(self, workers: int | None = None) -> None:
+        """워커 풀을 시작합니다 (이미 실행 중이면 무시)."""
+        if self.is_running:
+            return
+        count = workers or self.settings.job_workers
+        self._stopping = False
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(count)
+        ]
+        logger.info(f"작업 워커 시작: {count}개 ({self.backend.name})")
+
+    async def submit(self, kind: str, params: dict, user: str = "anonymous") -> Job:
+        """작업을 제출합니다 (실행을 기다리지 않음).
+
+        Args:
+            kind: 작업 종류
+            params: 작업 파라미터
+            user: 요청 사용자
+
+        Returns:
+            대기 상태의 작업
+
+        Raises:
+            JobError: 알 수 없는 작업 종류인 경우
+            JobLimitExceededError: 사용자 동시 작업 한도를 넘은 경우
+        """
+        if kind not in self.handlers:
+            raise JobError(f"지원하지 않는 작업 종류: {kind}")
+
+        job = Job(kind=kind, params=params, user=user)
+        limit = self.settings.job_max_per_user
+        if not await self.backend.acquire(user, job.id, limit, self._slot_ttl):
+            self.stats["rejected"] += 1
+            raise JobLimitExceededError(f"동시 작업 한도({limit})를 초과했습니다: {user}")
+
+        try:
+            await self.backend.save(job, self.settings.job_result_ttl)
+            await self.backend.push(job.id)
+        except Exception:
+            await self.backend.release(user, job.id)
+            raise
+
+        self.stats["submitted"] += 1
+        self.start()
+        logger.debug(f"작업 제출: {job.id} ({kind}, {user})")
+        return job
+
+    async def get(self, job_id: str) -> Job | None:
+        """작업 상태/결과를 조회합니다 (없거나 만료되면 None)."""
+        return await self.backend.load(job_id)
+
+    @property
+    def _slot_ttl(self) -> int:
+        # 대기 + 실행 시간 동안 슬롯 유지, 이후에는 자동 해제
+        return self.settings.job_timeout * 2 + 60
+
+    async def requeue_stale(self) -> int:
+        """lease가 만료된 RUNNING 작업을 다시 대기열에 넣습니다.
+
+        Returns:
+            다시 넣은 작업 수
+        """
+        requeued = 0
+        for job_id in await self.backend.expired_leases():
+            job = await self.backend.load(job_id)
+            if job is None or job.status != JobStatus.RUNNING:
+                continue
+
+            job.status = JobStatus.QUEUED
+            job.started_at = None
+            await self.backend.save(job, self.settings.job_result_ttl)
+            await self.backend.push(job.id)
+            requeued += 1
+            logger.warning(f"lease 만료 작업 재시도: {job.id} ({job.kind})")
+
+        self.stats["requeued"] += requeued
+        return requeued
+
+    async def _worker(self) -> None:
+        # 취소가 대기열 수신과 겹쳐 무시되더라도 종료 플래그로 루프를 끝냄
+        while not self._stopping:
+            if time.monotonic() >= self._next_reap:
+                self._next_reap = time.monotonic() + self.settings.job_lease
+                try:
+                    await self.requeue_stale()
+                except Exception as e:
+                    logger.warning(f"만료 작업 확인 실패: {e}")
+
+            job_id = await self.backend.pop(POLL_INTERVAL)
+            if job_id is None:
+                continue
+
+            job = await self.backend.load(job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                continue
+
+            await self._run(job)
+
+    async def _run(self, job: Job) -> None:
+        """작업을 실행하고 결과를 저장합니다."""
+        with start_span(f"job {job.kind}", root=True, job_id=job.id, user=job.user):
+            await self._execute(job)
+
+    async def _execute(self, job: Job) -> None:
+        ttl = self.settings.job_result_ttl
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.now()
+        await self.backend.lease(job.id, self.settings.job_lease)
+        await self.backend.save(job, ttl)
+        renewer = asyncio.create_task(self._renew_lease(job.id))
+
+        try:
+            handler = self.handlers[job.kind]
+            with track("job", kind=job.kind):
+                job.result = await asyncio.wait_for(
+                    handler(job.params), self.settings.job_timeout
+                )
+            job.status = JobStatus.SUCCEEDED
+            self.stats["succeeded"] += 1
+        except TimeoutError:
+            job.status = JobStatus.FAILED
+            job.error = f"작업 시간 초과 ({self.settings.job_timeout}초)"
+            self.stats["failed"] += 1
+        except Exception as e:
+            logger.error(f"작업 실패: {job.id} ({job.kind}): {e}")
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            self.stats["failed"] += 1
+        finally:
+            renewer.cancel()
+            job.finished_at = datetime.now()
+            await self.backend.save(job, ttl)
+            await self.backend.unlease(job.id)
+            await self.backend.release(job.user, job.id)
+
+    async def _renew_lease(self, job_id: str) -> None:
+        """작업이 끝날 때까지 lease를 주기적으로 갱신합니다."""
+        interval = self.settings.job_lease / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.backend.lease(job_id, self.settings.job_lease)
+            except Exception as e:
+                logger.warning(f"작업 lease 갱신 실패: {job_id}: {e}")
+
+    async def shutdown(self) -> None:
+        """워커를 중지하고 백엔드 연결을 정리합니다."""
+        self._stopping = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._backend is not None:
+            await self._backend.close()
+
+
+# 기본 작업 큐 인스턴스
+_default_job_queue: JobQueue | None = None
+
+
+def get_job_queue(settings: Settings | None = None) -> JobQueue:
+    """기본 작업 큐를 반환합니다."""
+    global _default_job_queue
+
+    if _default_job_queue is None:
+        _default_job_queue = JobQueue(settings=settings)
+
+    return _default_job_queue
+
+
+def _metrics() -> list[Collected]:
+    """기본 작업 큐의 처리 수 메트릭을 수집합니다."""
+    if _default_job_queue is None:
+        return []
+    return [(
+        f"{PREFIX}_jobs_total",
+        "counter",
+        "작업 큐 처리 수",
+        [({"result": name}, value) for name, value in _default_job_queue.stats.items()],
+    )]
+
+
+get_registry().register_collector(_metrics)
+
+
+async def shutdown_job_queue() -> None:
+    """기본 작업 큐를 정리합니다 (앱 종료 시)."""
+    global _default_job_queue
+
+    if _default_job_queue is not None:
+        await _default_job_queue.shutdown()
+        _default_job_queue = None
@@ -0,0 +1,117 @@
+"""Redis 작업 백엔드 (여러 프로세스/호스트 공유)."""
+
+import time
+from typing import Any
+
+from src.jobs.base import Job, JobBackend
+
+
+class RedisJobBackend(JobBackend):
+    """Redis 키/리스트 기반 작업 백엔드.
+
+    - 작업 상태: ``{prefix}:job:{id}`` 문자열 (SET EX로 TTL 적용)
+    - 대기열: ``{prefix}:queue`` 리스트 (RPUSH/BLPOP)
+    - 사용자 슬롯: ``{prefix}:slots:{user}`` 해시 (작업 ID → 만료 시각)
+    - 실행 lease: ``{prefix}:leases`` 해시 (작업 ID → 만료 시각)
+
+    슬롯은 먼저 기록한 뒤 살아 있는 슬롯 수를 다시 세어 한도를 넘으면 되돌립니다.
+    동시에 제출된 요청이 함께 거부될 수는 있어도 한도를 넘겨 받지는 않으며,
+    거부된 시도는 기존 슬롯의 만료 시각을 바꾸지 않습니다.
+
+    redis.asyncio 클라이언트 인터페이스(set/get/rpush/blpop/hset/hgetall/hdel/expire/delete)만
+    사용하므로 테스트에서는 같은 메서드를 가진 가짜 클라이언트로 대체할 수 있습니다.
+    """
+
+    def __init__(self, client: Any, prefix: str = "ps:jobs"):
+        """백엔드를 초기화합니다.
+
+        Args:
+            client: redis.asyncio 클라이언트 (decode_responses=True)
+            prefix: 키 접두사
+        """
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "ps:jobs") -> "RedisJobBackend":
+        """Redis URL로 백엔드를 생성합니다.
+
+        Raises:
+            ValueError: redis 패키지가 없는 경우
+        """
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise ValueError(
+                "redis가 필요합니다. pip install -e '.[redis]'로 설치해주세요."
+            ) from e
+
+        return cls(redis.from_url(url, decode_responses=True), prefix=prefix)
+
+    @property
+    def name(self) -> str:
+        return "redis"
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self.prefix, *parts))
+
+    async def save(self, job: Job, ttl: int) -> None:
+        await self.client.set(self._key("job", job.id), job.model_dump_json(), ex=ttl)
+
+    async def load(self, job_id: str) -> Job | None:
+        data = await self.client.get(self._key("job", job_id))
+        return Job.model_validate_json(data) if data else None
+
+    async def push(self, job_id: str) -> None:
+        await self.client.rpush(self._key("queue"), job_id)
+
+    async def pop(self, timeout: float) -> str | None:
+        # BLPOP timeout은 초 단위 (0은 무한 대기)
+        item = await self.client.blpop([self._key("queue")], timeout=max(timeout, 0.01))
+        return item[1] if item else None
+
+    async def lease(self, job_id: str, ttl: float) -> None:
+        await self.client.hset(self._key("leases"), job_id, time.time() + ttl)
+
+    async def unlease(self, job_id: str) -> None:
+        await self.client.hdel(self._key("leases"), job_id)
+
+    async def expired_leases(self) -> list[str]:
+        key = self._key("leases")
+        now = time.time()
+        leases = await self.client.hgetall(key)
+        expired = [job_id for job_id, expires in leases.items() if float(expires) <= now]
+        if expired:
+            await self.client.hdel(key, *expired)
+        return expired
+
+    async def _live_slots(self, key: str, now: float) -> set[str]:
+        """만료된 슬롯을 지우고 살아 있는 슬롯 ID를 반환합니다."""
+        slots = await self.client.hgetall(key)
+        expired = [slot for slot, expires in slots.items() if float(expires) <= now]
+        if expired:
+            await self.client.hdel(key, *expired)
+        return set(slots) - set(expired)
+
+    async def acquire(self, user: str, slot: str, limit: int, ttl: int) -> bool:
+        key = self._key("slots", user)
+        now = time.time()
+        if limit > 0 and len(await self._live_slots(key, now)) >= limit:
+            return False
+
+        await self.client.hset(key, slot, now + ttl)
+        if limit > 0 and len(await self._live_slots(key, now) | {slot}) > limit:
+            await self.client.hdel(key, slot)
+            return False
+
+        # 해시 자체는 가장 늦게 만료되는 슬롯과 함께 사라지도록 (확보한 경우에만 갱신)
+        await self.client.expire(key, ttl)
+        return True
+
+    async def release(self, user: str, slot: str) -> None:
+        await self.client.hdel(self._key("slots", user), slot)
+
+    async def close(self) -> None:
+        close = getattr(self.client, "aclose", None) or getattr(self.client, "close", None)
+        if close is not None:
+            await close()
@@ -0,0 +1,21 @@
+"""SQLite 작업 백엔드 (같은 호스트의 여러 프로세스 공유)."""
+
+from src.cache.sqlite import SQLiteStore
+from src.jobs.redis_backend import RedisJobBackend
+
+
+class SQLiteJobBackend(RedisJobBackend):
+    """SQLiteStore 위에서 Redis 백엔드와 같은 키/리스트 구조를 사용하는 작업 백엔드.
+
+    Redis 없이 ``ps serve --workers N``의 워커들이 대기열과 작업 상태를
+    공유하기 위한 대체 구현입니다.
+    """
+
+    @classmethod
+    def from_path(cls, path: str, prefix: str = "ps:jobs") -> "SQLiteJobBackend":
+        """SQLite 파일 경로로 백엔드를 생성합니다."""
+        return cls(SQLiteStore(path), prefix=prefix)
+
+    @property
+    def name(self) -> str:
+        return "sqlite"
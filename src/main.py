@@ -1,6 +1,8 @@
 """Palantir Stock CLI 엔트리포인트."""
 
 import asyncio
+import os
+from contextlib import contextmanager
 from typing import Optional
 
 import typer
@@ -38,11 +40,30 @@ def validate_config() -> bool:
     return True
 
 
+@contextmanager
+def _profiling(enabled: bool, name: str):
+    """--profile이면 블록 실행을 프로파일링합니다.
+
+    프로파일러(비활성이면 None)를 반환하므로, 명령 출력 뒤에
+    _display_profile로 요약을 표시합니다.
+    """
+    if not enabled:
+        yield None
+        return
+
+    from src.utils.profiling import Profiler
+
+    with Profiler(name, settings=settings) as profiler:
+        yield profiler
+
+
 @app.command()
 def analyze(
     company: str = typer.Argument(..., help="분석할 기업명"),
     output: str = typer.Option("text", "--output", "-o", help="출력 형식 (text/json)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="상세 출력"),
+    trace: bool = typer.Option(False, "--trace", help="단계별 실행 시간 waterfall 출력"),
+    profile: bool = typer.Option(False, "--profile", help="실행 프로파일 저장 (pstats/flamegraph)"),
 ):
     """기업 정보를 수집하고 분석합니다."""
     if verbose:
@@ -54,24 +75,43 @@ def analyze(
         raise typer.Exit(1)
 
     from src.agents import CompanyInfoAgent
+    from src.utils.tracing import InMemorySpanExporter, get_tracer, start_span
+
+    exporter = InMemorySpanExporter()
+    if trace:
+        get_tracer(settings).add_exporter(exporter)
 
     async def run():
+        from src.graph.ingestion import shutdown_ingestion_pipeline
+
         agent = CompanyInfoAgent(settings)
-        return await agent.analyze(company)
+        try:
+            with start_span("ps analyze", root=True, company=company):
+                return await agent.analyze(company)
+        finally:
+            # CLI 프로세스는 곧 종료되므로 수집 대기 문서는 spool (ps ingest로 처리)
+            await shutdown_ingestion_pipeline(drain=False)
+            get_tracer().shutdown()
 
     with console.status(f"[bold blue]{company} 정보 수집 중...[/bold blue]"):
-        report = asyncio.run(run())
+        with _profiling(profile, f"analyze-{company}") as profiler:
+            report = asyncio.run(run())
 
     if output == "json":
         console.print_json(report.model_dump_json(indent=2))
     else:
         _display_report(report)
 
+    if trace:
+        _display_trace(exporter.get_finished_spans())
+    _display_profile(profiler)
+
 
 @app.command()
 def news(
     query: str = typer.Argument(..., help="뉴스 검색어"),
     limit: int = typer.Option(5, "--limit", "-n", help="결과 수"),
+    profile: bool = typer.Option(False, "--profile", help="실행 프로파일 저장 (pstats/flamegraph)"),
 ):
     """최신 뉴스를 검색합니다."""
     setup_logging("WARNING")
@@ -86,10 +126,12 @@ def news(
         return await agent.quick_news(query)
 
     with console.status(f"[bold blue]'{query}' 뉴스 검색 중...[/bold blue]"):
-        results = asyncio.run(run())
+        with _profiling(profile, f"news-{query}") as profiler:
+            results = asyncio.run(run())
 
     if not results:
         console.print("[yellow]검색 결과가 없습니다.[/yellow]")
+        _display_profile(profiler)
         return
 
     table = Table(title=f"'{query}' 관련 뉴스")
@@ -105,6 +147,7 @@ def news(
         )
 
     console.print(table)
+    _display_profile(profiler)
 
 
 @app.command()
@@ -192,6 +235,7 @@ def datasets():
 def stock_analyze(
     ticker: str = typer.Argument(..., help="티커 또는 기업명 (예: 삼성전자, AAPL)"),
     period: str = typer.Option("3mo", "--period", "-p", help="분석 기간"),
+    profile: bool = typer.Option(False, "--profile", help="실행 프로파일 저장 (pstats/flamegraph)"),
 ):
     """주식 정보를 조회하고 분석합니다."""
     setup_logging("WARNING")
@@ -204,13 +248,15 @@ def stock_analyze(
 
     with console.status(f"[bold blue]{ticker} 주식 분석 중...[/bold blue]"):
         try:
-            analysis = asyncio.run(run())
+            with _profiling(profile, f"stock-{ticker}") as profiler:
+                analysis = asyncio.run(run())
         except Exception as e:
             console.print(f"[red]주식 분석 실패: {e}[/red]")
             raise typer.Exit(1)
 
     if not analysis:
         console.print(f"[yellow]'{ticker}' 주식 정보를 찾을 수 없습니다.[/yellow]")
+        _display_profile(profiler)
         return
 
     # 기본 정보
@@ -253,12 +299,14 @@ def stock_analyze(
     if analysis.info.sector:
         console.print()
         console.print(f"[dim]섹터: {analysis.info.sector} | 산업: {analysis.info.industry}[/dim]")
+    _display_profile(profiler)
 
 
 @app.command("stock-price")
 def stock_price(
     ticker: str = typer.Argument(..., help="티커 또는 기업명"),
     period: str = typer.Option("1mo", "--period", "-p", help="조회 기간"),
+    profile: bool = typer.Option(False, "--profile", help="실행 프로파일 저장 (pstats/flamegraph)"),
 ):
     """주가 히스토리를 조회합니다."""
     setup_logging("WARNING")
@@ -271,13 +319,15 @@ def stock_price(
 
     with console.status(f"[bold blue]{ticker} 주가 조회 중...[/bold blue]"):
         try:
-            prices = asyncio.run(run())
+            with _profiling(profile, f"stock-price-{ticker}") as profiler:
+                prices = asyncio.run(run())
         except Exception as e:
             console.print(f"[red]주가 조회 실패: {e}[/red]")
             raise typer.Exit(1)
 
     if not prices:
         console.print(f"[yellow]'{ticker}' 주가 데이터를 찾을 수 없습니다.[/yellow]")
+        _display_profile(profiler)
         return
 
     table = Table(title=f"{ticker} 주가 ({period})")
@@ -301,6 +351,7 @@ def stock_price(
 
     console.print(table)
     console.print(f"[dim]총 {len(prices)}일 데이터[/dim]")
+    _display_profile(profiler)
 
 
 @app.command("graph-init")
@@ -345,21 +396,23 @@ def graph_stats():
     table.add_column("통계")
 
     # Neo4j 상태
-    from src.graph import get_neo4j_client
-    client = get_neo4j_client(settings)
+    from src.graph import get_graph_stats_service
+    service = get_graph_stats_service(settings)
+    graph_stats = None
 
-    if client.is_available:
+    if service.is_available:
         try:
             async def check_neo4j():
-                return await client.test_connection()
-            connected = asyncio.run(check_neo4j())
+                return await service.get_stats()
+            graph_stats = asyncio.run(check_neo4j())
             table.add_row(
                 "Neo4j",
-                "[green]연결됨[/green]" if connected else "[red]연결 실패[/red]",
-                settings.neo4j_uri,
+                "[green]연결됨[/green]",
+                f"노드 {graph_stats['total_nodes']:,}개, "
+                f"관계 {graph_stats['total_relationships']:,}개",
             )
         except Exception:
-            table.add_row("Neo4j", "[red]오류[/red]", "-")
+            table.add_row("Neo4j", "[red]연결 실패[/red]", settings.neo4j_uri)
     else:
         table.add_row("Neo4j", "[yellow]미설정[/yellow]", "-")
 
@@ -374,19 +427,88 @@ def graph_stats():
         table.add_row(
             "ChromaDB",
             "[green]사용 가능[/green]",
-            f"{stats['document_count']}개 문서",
+            f"{stats['document_count']}개 문서 ({stats['chunk_count']}개 청크)",
         )
     except Exception as e:
         table.add_row("ChromaDB", "[yellow]초기화 필요[/yellow]", str(e)[:30])
 
     console.print(table)
 
+    # 노드/관계 상세
+    if graph_stats:
+        detail = Table(title="그래프 노드/관계 수")
+        detail.add_column("구분", style="cyan")
+        detail.add_column("이름")
+        detail.add_column("개수", justify="right", style="green")
+
+        for label, count in graph_stats["nodes"].items():
+            detail.add_row("노드", label, f"{count:,}")
+        for rel_type, count in graph_stats["relationships"].items():
+            detail.add_row("관계", rel_type, f"{count:,}")
+
+        console.print()
+        console.print(detail)
+
+
+@app.command("graph-export")
+def graph_export(
+    output: str = typer.Argument(..., help="내보낼 JSONL 파일 경로"),
+    node_type: str | None = typer.Option(
+        None, "--type", "-t", help="노드 타입 (예: Company, 기본값: 전체)"
+    ),
+    batch_size: int = typer.Option(500, "--batch-size", help="배치당 노드 수"),
+):
+    """Graph DB 노드를 JSONL로 내보냅니다 (커서 스트리밍)."""
+    setup_logging("WARNING")
+
+    import json
+    from pathlib import Path
+
+    from src.graph import GraphRepository, get_neo4j_client
+    from src.graph.schema import NodeType
+
+    client = get_neo4j_client(settings)
+    if not client.is_available:
+        console.print("[yellow]Neo4j 설정이 필요합니다.[/yellow]")
+        raise typer.Exit(1)
+
+    try:
+        node_types = [NodeType(node_type)] if node_type else list(NodeType)
+    except ValueError:
+        console.print(f"[red]알 수 없는 노드 타입: {node_type}[/red]")
+        raise typer.Exit(1)
+
+    repository = GraphRepository(client)
+
+    async def run() -> dict[str, int]:
+        counts: dict[str, int] = {}
+        with Path(output).open("w", encoding="utf-8") as f:
+            for nt in node_types:
+                counts[nt.value] = 0
+                async for batch in repository.export_nodes(nt, batch_size=batch_size):
+                    for node in batch:
+                        record = {"label": nt.value, **node}
+                        f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                    counts[nt.value] += len(batch)
+        return counts
+
+    with console.status("[bold blue]그래프 내보내는 중...[/bold blue]"):
+        try:
+            counts = asyncio.run(run())
+        except Exception as e:
+            console.print(f"[red]그래프 내보내기 실패: {e}[/red]")
+            raise typer.Exit(1)
+
+    summary = ", ".join(f"{label} {count:,}개" for label, count in counts.items())
+    console.print(f"[green]✓ 내보내기 완료: {output}[/green] ({summary})")
+
 
 @app.command("graph-search")
 def graph_search(
     query: str = typer.Argument(..., help="검색 쿼리"),
     company: str = typer.Option(None, "--company", "-c", help="기업명 필터"),
     limit: int = typer.Option(10, "--limit", "-n", help="결과 수"),
+    profile: bool = typer.Option(False, "--profile", help="실행 프로파일 저장 (pstats/flamegraph)"),
 ):
     """하이브리드 검색 (Vector + Graph)을 수행합니다."""
     setup_logging("WARNING")
@@ -403,13 +525,15 @@ def graph_search(
 
     with console.status("[bold blue]하이브리드 검색 중...[/bold blue]"):
         try:
-            results = asyncio.run(run())
+            with _profiling(profile, f"graph-search-{query}") as profiler:
+                results = asyncio.run(run())
         except Exception as e:
             console.print(f"[red]검색 실패: {e}[/red]")
             raise typer.Exit(1)
 
     if not results:
         console.print("[yellow]검색 결과가 없습니다.[/yellow]")
+        _display_profile(profiler)
         return
 
     table = Table(title=f"'{query}' 검색 결과")
@@ -425,6 +549,58 @@ def graph_search(
         )
 
     console.print(table)
+    _display_profile(profiler)
+
+
+@app.command("ingest")
+def ingest(
+    replay_dead_letters: bool = typer.Option(
+        False, "--replay-dead-letters", help="dead-letter 문서도 다시 처리"
+    ),
+    workers: int = typer.Option(None, "--workers", "-w", help="수집 워커 수"),
+):
+    """spool된 수집 대기 문서를 처리합니다 (Graph + Vector 저장)."""
+    setup_logging("INFO")
+
+    from src.graph.ingestion import IngestionPipeline
+
+    pipeline = IngestionPipeline(settings=settings)
+    items = pipeline.take_spooled(dead_letters=replay_dead_letters)
+
+    if not items:
+        console.print("[yellow]처리할 수집 대기 문서가 없습니다.[/yellow]")
+        return
+
+    async def run():
+        pipeline.start(workers)
+        try:
+            for item in items:
+                await pipeline.put(item)
+            await pipeline.shutdown(drain=True)
+        except BaseException:
+            await pipeline.shutdown(drain=False)
+            raise
+
+    with console.status(f"[bold blue]문서 {len(items)}개 수집 중...[/bold blue]"):
+        asyncio.run(run())
+
+    table = Table(title="수집 결과")
+    table.add_column("항목", style="cyan")
+    table.add_column("건수", style="green", justify="right")
+
+    labels = {
+        "processed": "저장",
+        "skipped": "중복 건너뜀",
+        "retried": "재시도",
+        "dead_lettered": "실패 (dead-letter)",
+        "spooled": "spool",
+    }
+    for key, label in labels.items():
+        table.add_row(label, str(pipeline.stats[key]))
+
+    console.print(table)
+    if pipeline.stats["dead_lettered"]:
+        console.print(f"[yellow]실패 문서: {pipeline.dead_letter_path}[/yellow]")
 
 
 @app.command()
@@ -432,12 +608,36 @@ def serve(
     host: str = typer.Option("0.0.0.0", "--host", "-h", help="서버 호스트"),
     port: int = typer.Option(8000, "--port", "-p", help="서버 포트"),
     reload: bool = typer.Option(False, "--reload", "-r", help="자동 리로드"),
+    workers: int = typer.Option(1, "--workers", "-w", help="워커 프로세스 수"),
 ):
-    """API 서버를 시작합니다."""
+    """API 서버를 시작합니다.
+
+    --workers가 2 이상이면 uvicorn이 소켓을 연 뒤 워커 프로세스를 띄우고
+    (pre-fork), 캐시/작업 백엔드가 memory면 워커 간 공유를 위해 sqlite로 바꿉니다.
+    """
     setup_logging("INFO")
     import uvicorn
 
+    if workers > 1:
+        if reload:
+            console.print("[red]--reload와 --workers는 함께 사용할 수 없습니다.[/red]")
+            raise typer.Exit(1)
+
+        # 워커 프로세스는 환경 변수로 설정을 새로 읽음
+        for name in ("cache_backend", "job_backend"):
+            if getattr(settings, name).lower() == "memory":
+                os.environ[name.upper()] = "sqlite"
+                setattr(settings, name, "sqlite")
+                console.print(
+                    f"[yellow]{name}=memory는 워커 간 공유되지 않아 sqlite "
+                    f"({settings.cache_path})를 사용합니다.[/yellow]"
+                )
+
     console.print(f"[bold blue]Palantir Stock API 서버 시작[/bold blue]")
+    if workers > 1:
+        console.print(
+            f"  • 워커: {workers}개 (캐시 {settings.cache_backend}, 작업 {settings.job_backend})"
+        )
     console.print(f"  • 대시보드: http://{host}:{port}")
     console.print(f"  • API 문서: http://{host}:{port}/docs")
     console.print(f"  • ReDoc: http://{host}:{port}/redoc")
@@ -448,15 +648,69 @@ def serve(
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
         log_level="info",
     )
 
 
+@app.command()
+def loadtest(
+    url: str = typer.Option(..., "--url", "-u", help="대상 서버 (예: http://localhost:8000)"),
+    duration: float = typer.Option(10.0, "--duration", "-d", help="요청 생성 시간 (초)"),
+    rps: float | None = typer.Option(
+        None, "--rps", help="목표 초당 요청 수 (없으면 동시성 고정)"
+    ),
+    concurrency: int = typer.Option(10, "--concurrency", "-c", help="동시 요청 수"),
+    mix: str = typer.Option(
+        "analyze=1,stock=2,graph=3,report=4", "--mix", "-m", help="엔드포인트 비율"
+    ),
+    interval: float = typer.Option(1.0, "--interval", help="처리량 집계 구간 (초)"),
+    save: str | None = typer.Option(None, "--save", "-s", help="결과 JSON 저장 경로"),
+):
+    """실행 중인 API 서버 부하 테스트 (p50/p95/p99, 오류율, 구간별 처리량).
+
+    외부 서비스 없는 인프로세스 측정은 저장소에서 `python -m benchmarks.loadtest`를
+    사용합니다.
+    """
+    setup_logging("WARNING")
+
+    from src.api.loadtest import parse_mix, run_load_test
+
+    try:
+        weights = parse_mix(mix)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    async def run():
+        import httpx
+
+        async with httpx.AsyncClient(base_url=url, timeout=60.0) as client:
+            return await run_load_test(
+                client, mix=weights, duration=duration, rps=rps, concurrency=concurrency
+            )
+
+    load = f"{rps:g} rps" if rps else f"동시성 {concurrency}"
+    with console.status(f"[bold blue]부하 테스트 중: {url}, {load}, {duration:g}초...[/bold blue]"):
+        result = asyncio.run(run())
+
+    _display_loadtest(result, interval)
+
+    if save:
+        import json
+        from pathlib import Path
+        Path(save).write_text(
+            json.dumps(result.to_dict(interval), ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        console.print(f"[green]✓ 결과 저장: {save}[/green]")
+
+
 @app.command("report")
 def generate_report(
     company: str = typer.Argument(..., help="기업명"),
     output: str = typer.Option("html", "--output", "-o", help="출력 형식 (html/markdown/json)"),
     save: Optional[str] = typer.Option(None, "--save", "-s", help="저장 경로"),
+    profile: bool = typer.Option(False, "--profile", help="실행 프로파일 저장 (pstats/flamegraph)"),
 ):
     """기업 분석 리포트를 생성합니다."""
     setup_logging("WARNING")
@@ -474,7 +728,8 @@ def generate_report(
         return await generator.generate(report, format=output)
 
     with console.status(f"[bold blue]{company} 리포트 생성 중...[/bold blue]"):
-        content = asyncio.run(run())
+        with _profiling(profile, f"report-{company}") as profiler:
+            content = asyncio.run(run())
 
     if save:
         from pathlib import Path
@@ -487,6 +742,7 @@ def generate_report(
             console.print("[dim]--save 옵션으로 파일 저장 가능[/dim]")
         else:
             console.print(content)
+    _display_profile(profiler)
 
 
 @app.command()
@@ -613,5 +869,129 @@ def _display_report(report):
     console.print(f"[dim]생성: {report.generated_at.strftime('%Y-%m-%d %H:%M:%S')}[/dim]")
 
 
+def _display_loadtest(result, interval: float = 1.0):
+    """부하 테스트 결과를 표시합니다."""
+    summary = result.summary()
+
+    table = Table(title=f"부하 테스트 결과 ({result.duration:.1f}초)")
+    table.add_column("엔드포인트", style="cyan")
+    for column in ("요청", "오류율", "처리량(req/s)", "p50(ms)", "p95(ms)", "p99(ms)"):
+        table.add_column(column, justify="right")
+
+    rows = [*summary["endpoints"].items(), ("[bold]전체[/bold]", summary["total"])]
+    for name, stats in rows:
+        error_style = "red" if stats["error_rate"] else "green"
+        table.add_row(
+            name,
+            f"{stats['requests']:,}",
+            f"[{error_style}]{stats['error_rate']:.1%}[/{error_style}]",
+            f"{stats['throughput']:.1f}",
+            f"{stats['p50_ms']:.1f}",
+            f"{stats['p95_ms']:.1f}",
+            f"{stats['p99_ms']:.1f}",
+        )
+    console.print()
+    console.print(table)
+
+    timeline = Table(title="구간별 처리량")
+    timeline.add_column("시각(s)", justify="right")
+    for column in ("요청", "오류", "req/s", "p50(ms)", "p95(ms)"):
+        timeline.add_column(column, justify="right")
+    for point in result.timeline(interval):
+        timeline.add_row(
+            f"{point['second']:g}",
+            str(point["requests"]),
+            str(point["errors"]),
+            f"{point['throughput']:.1f}",
+            f"{point['p50_ms']:.1f}",
+            f"{point['p95_ms']:.1f}",
+        )
+    console.print(timeline)
+
+    for message, count in result.errors().items():
+        console.print(f"[red]  • {message} ({count}회)[/red]")
+
+
+def _display_profile(profiler, top: int = 15):
+    """프로파일 결과 파일과 누적 시간 상위 함수를 표시합니다 (프로파일하지 않았으면 무시)."""
+    if profiler is None or profiler.result is None:
+        return
+
+    from src.utils.profiling import top_functions
+
+    result = profiler.result
+
+    table = Table(title=f"프로파일 ({result.duration:.2f}초, 샘플 {result.samples}개)")
+    table.add_column("함수", style="cyan", max_width=60)
+    table.add_column("호출", justify="right")
+    table.add_column("자체(s)", justify="right")
+    table.add_column("누적(s)", justify="right", style="green")
+
+    for func, calls, tottime, cumtime in top_functions(result.stats_path, top):
+        table.add_row(func, f"{calls:,}", f"{tottime:.3f}", f"{cumtime:.3f}")
+
+    console.print()
+    console.print(table)
+    console.print(f"[dim]pstats: {result.stats_path}[/dim]")
+    console.print(f"[dim]flamegraph: {result.collapsed_path} (flamegraph.pl / speedscope)[/dim]")
+    console.print(f"[dim]요약: {result.summary_path}[/dim]")
+
+
+def _display_trace(spans, width: int = 40):
+    """span 목록을 waterfall 표로 표시합니다."""
+    if not spans:
+        console.print("[yellow]기록된 span이 없습니다.[/yellow]")
+        return
+
+    by_id = {s.span_id: s for s in spans}
+    start = min(s.start_ns for s in spans)
+    total = max(max(s.end_ns for s in spans) - start, 1)
+
+    def depth(span) -> int:
+        level = 0
+        while span.parent_id in by_id:
+            span = by_id[span.parent_id]
+            level += 1
+        return level
+
+    # 부모 아래에 자식이 오도록 깊이 우선 정렬
+    children: dict[str | None, list] = {}
+    for span in spans:
+        parent = span.parent_id if span.parent_id in by_id else None
+        children.setdefault(parent, []).append(span)
+
+    ordered = []
+    stack = sorted(children.get(None, []), key=lambda s: s.start_ns, reverse=True)
+    while stack:
+        span = stack.pop()
+        ordered.append(span)
+        stack.extend(sorted(children.get(span.span_id, []), key=lambda s: s.start_ns, reverse=True))
+
+    table = Table(title=f"실행 추적 ({total / 1e6:.0f}ms)")
+    table.add_column("Span", style="cyan", no_wrap=True)
+    table.add_column("ms", justify="right")
+    table.add_column("Waterfall", no_wrap=True)
+    table.add_column("속성", style="dim", max_width=50)
+
+    hidden = {"backend", "operation", "node", "company"}
+    for span in ordered:
+        offset = int((span.start_ns - start) / total * width)
+        length = max(int((span.end_ns - span.start_ns) / total * width), 1)
+        color = "red" if span.status == "ERROR" else "green"
+        bar = " " * offset + f"[{color}]" + "█" * min(length, width - offset) + f"[/{color}]"
+        attributes = ", ".join(
+            f"{k}={v}" for k, v in span.attributes.items() if k not in hidden
+        )
+        table.add_row(
+            "  " * depth(span) + span.name,
+            f"{span.duration_ms:.1f}",
+            bar,
+            attributes,
+        )
+
+    console.print()
+    console.print(table)
+
+
 if __name__ == "__main__":
     app()
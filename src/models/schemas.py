@@ -66,6 +66,7 @@ class AgentState(TypedDict, total=False):
     news_items: list[NewsItem]
     palantir_data: dict
     graph_context: str | None
+    graph_citations: list[dict]
     stock_data: dict | None
     summary: str
     error: str | None
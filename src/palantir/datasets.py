@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from src.palantir.client import FoundryClientWrapper, get_foundry_client
 from src.utils.logging import get_logger
+from src.utils.metrics import instrumented
 
 logger = get_logger("palantir.datasets")
 
@@ -34,6 +35,7 @@ class DatasetManager:
         """데이터셋 접근이 가능한지 확인합니다."""
         return self._client.is_available
 
+    @instrumented("backend", backend="foundry", operation="list_datasets")
     async def list_datasets(self, folder_rid: str | None = None) -> list[DatasetInfo]:
         """데이터셋 목록을 조회합니다.
 
@@ -64,6 +66,7 @@ class DatasetManager:
             logger.error(f"데이터셋 목록 조회 실패: {e}")
             return []
 
+    @instrumented("backend", backend="foundry", operation="get_dataset")
     async def get_dataset(self, dataset_rid: str) -> DatasetInfo | None:
         """데이터셋 정보를 조회합니다.
 
@@ -86,6 +89,7 @@ class DatasetManager:
             logger.error(f"데이터셋 조회 실패: {e}")
             return None
 
+    @instrumented("backend", backend="foundry", operation="read_dataset")
     async def read_dataset(
         self,
         dataset_rid: str,
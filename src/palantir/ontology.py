@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from src.palantir.client import FoundryClientWrapper, get_foundry_client
 from src.utils.logging import get_logger
+from src.utils.metrics import instrumented
 
 logger = get_logger("palantir.ontology")
 
@@ -43,6 +44,7 @@ class OntologyExplorer:
         """온톨로지 접근이 가능한지 확인합니다."""
         return self._client.is_available
 
+    @instrumented("backend", backend="foundry", operation="list_object_types")
     async def list_object_types(self) -> list[ObjectType]:
         """온톨로지 객체 타입 목록을 조회합니다.
 
@@ -75,6 +77,7 @@ class OntologyExplorer:
             logger.error(f"객체 타입 조회 실패: {e}")
             return []
 
+    @instrumented("backend", backend="foundry", operation="search_objects")
     async def search_objects(
         self,
         object_type: str,
@@ -109,6 +112,7 @@ class OntologyExplorer:
             logger.error(f"객체 검색 실패: {e}")
             return []
 
+    @instrumented("backend", backend="foundry", operation="get_object")
     async def get_object(
         self,
         object_type: str,
@@ -1,10 +1,15 @@
 """리포트 모듈."""
 
 from .generator import ReportGenerator
+from .store import ReportStore, get_or_analyze, get_report_store, load_report
 from .templates import HTMLTemplate, MarkdownTemplate
 
 __all__ = [
     "ReportGenerator",
+    "ReportStore",
     "HTMLTemplate",
     "MarkdownTemplate",
+    "get_or_analyze",
+    "get_report_store",
+    "load_report",
 ]
@@ -0,0 +1,218 @@
+"""기업 분석 결과 저장소 (리포트 형식 간 재사용)."""
+
+import time
+import uuid
+from collections import OrderedDict
+
+from config.settings import Settings
+from src.cache import SharedCache, get_shared_cache
+from src.graph.resolver import normalize_name
+from src.models.schemas import CompanyReport
+from src.utils.logging import get_logger
+from src.utils.metrics import get_registry
+
+logger = get_logger("reports.store")
+
+
+class ReportStore:
+    """analysis_id와 기업별 최신 분석으로 CompanyReport를 보관하는 LRU 저장소.
+
+    같은 분석을 HTML/Markdown/JSON 등 여러 형식으로 렌더링할 때 에이전트를
+    다시 실행하지 않도록, 분석 결과를 ID로 보관하고 기업별 최신 결과를
+    신선도 기간 안에서 재사용합니다.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 86400):
+        """저장소를 초기화합니다.
+
+        Args:
+            maxsize: 최대 보관 분석 수
+            ttl: 분석 보관 시간 (초, 0이면 무제한)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._reports: OrderedDict[str, tuple[float, CompanyReport]] = OrderedDict()
+        self._latest: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._reports)
+
+    @staticmethod
+    def _company_key(company_name: str) -> str:
+        return normalize_name(company_name) or company_name
+
+    def put(self, report: CompanyReport) -> str:
+        """분석 결과를 저장하고 analysis_id를 반환합니다."""
+        analysis_id = uuid.uuid4().hex
+        self._reports[analysis_id] = (time.monotonic(), report)
+        self._latest[self._company_key(report.company.name)] = analysis_id
+
+        while len(self._reports) > self.maxsize:
+            evicted, (_, old) = self._reports.popitem(last=False)
+            key = self._company_key(old.company.name)
+            if self._latest.get(key) == evicted:
+                del self._latest[key]
+
+        return analysis_id
+
+    def get(self, analysis_id: str) -> CompanyReport | None:
+        """analysis_id의 분석 결과를 반환합니다 (없거나 만료되면 None)."""
+        entry = self._reports.get(analysis_id)
+        if entry is None:
+            return None
+
+        stored_at, report = entry
+        if self.ttl and time.monotonic() - stored_at > self.ttl:
+            self._remove(analysis_id)
+            return None
+
+        self._reports.move_to_end(analysis_id)
+        return report
+
+    def latest(self, company_name: str, max_age: float) -> tuple[str, CompanyReport] | None:
+        """기업의 최신 분석이 max_age초 이내면 (analysis_id, 분석 결과)를 반환합니다."""
+        analysis_id = self._latest.get(self._company_key(company_name))
+        report = None
+        if analysis_id is not None:
+            stored_at, _ = self._reports[analysis_id]
+            if time.monotonic() - stored_at <= max_age:
+                report = self.get(analysis_id)
+
+        if report is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return analysis_id, report
+
+    def _remove(self, analysis_id: str) -> None:
+        _, report = self._reports.pop(analysis_id)
+        key = self._company_key(report.company.name)
+        if self._latest.get(key) == analysis_id:
+            del self._latest[key]
+
+    def stats(self) -> dict:
+        """기업별 최신 분석 재사용 통계를 반환합니다."""
+        return {"size": len(self._reports), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """저장된 분석과 통계를 초기화합니다."""
+        self._reports.clear()
+        self._latest.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# 기본 저장소 인스턴스
+_default_report_store: ReportStore | None = None
+
+
+def get_report_store(settings: Settings | None = None) -> ReportStore:
+    """기본 분석 결과 저장소를 반환합니다."""
+    global _default_report_store
+
+    if _default_report_store is None:
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+        _default_report_store = ReportStore(
+            maxsize=settings.report_store_size,
+            ttl=settings.report_store_ttl,
+        )
+
+    return _default_report_store
+
+
+def _cache_stats() -> dict[str, dict]:
+    """메트릭 수집용 캐시 통계 (기본 인스턴스가 없으면 빈 dict)."""
+    if _default_report_store is None:
+        return {}
+    return {"report": _default_report_store.stats()}
+
+
+get_registry().register_cache_source(_cache_stats)
+
+
+async def load_report(analysis_id: str, settings: Settings | None = None) -> CompanyReport | None:
+    """analysis_id의 분석 결과를 이 프로세스 저장소에서, 없으면 공유 캐시에서 찾습니다.
+
+    공유 캐시 백엔드(sqlite/redis)를 사용하면 다른 워커가 만든 analysis_id도 조회됩니다.
+    """
+    report = get_report_store(settings).get(analysis_id)
+    if report is not None:
+        return report
+
+    cache = get_shared_cache(settings)
+    if not cache.is_shared:
+        return None
+    data = await cache.get("report", analysis_id)
+    return CompanyReport.model_validate(data) if data is not None else None
+
+
+async def _shared_latest(
+    cache: SharedCache, company_name: str, settings: Settings
+) -> tuple[str, CompanyReport] | None:
+    """다른 워커가 공유 캐시에 남긴 기업의 최신 분석을 찾습니다."""
+    analysis_id = await cache.get("report_latest", ReportStore._company_key(company_name))
+    if analysis_id is None:
+        return None
+    report = await load_report(analysis_id, settings)
+    return (analysis_id, report) if report is not None else None
+
+
+async def _publish(
+    cache: SharedCache, analysis_id: str, report: CompanyReport, settings: Settings
+) -> None:
+    """분석 결과와 기업별 최신 analysis_id를 공유 캐시에 기록합니다."""
+    await cache.set(
+        "report", analysis_id, report.model_dump(mode="json"), settings.report_store_ttl or None
+    )
+    await cache.set(
+        "report_latest",
+        ReportStore._company_key(report.company.name),
+        analysis_id,
+        settings.report_freshness,
+    )
+
+
+async def get_or_analyze(
+    company_name: str,
+    refresh: bool = False,
+    settings: Settings | None = None,
+) -> tuple[str, CompanyReport, bool]:
+    """신선한 분석 결과가 있으면 재사용하고, 없으면 에이전트로 분석해 저장합니다.
+
+    공유 캐시 백엔드를 사용하면 다른 워커의 분석 결과도 재사용하고, 새 분석은
+    모든 워커가 analysis_id로 조회할 수 있도록 공유 캐시에도 기록합니다.
+
+    Args:
+        company_name: 기업명
+        refresh: True면 저장된 결과를 무시하고 다시 분석
+        settings: 애플리케이션 설정
+
+    Returns:
+        (analysis_id, 분석 결과, 재사용 여부) 튜플
+    """
+    if settings is None:
+        from config.settings import settings as default_settings
+        settings = default_settings
+
+    store = get_report_store(settings)
+    cache = get_shared_cache(settings)
+    if not refresh:
+        cached = store.latest(company_name, settings.report_freshness)
+        if cached is None and cache.is_shared and settings.report_freshness > 0:
+            cached = await _shared_latest(cache, company_name, settings)
+        if cached is not None:
+            logger.debug(f"저장된 분석 재사용: {company_name} ({cached[0]})")
+            return cached[0], cached[1], True
+
+    from src.agents import CompanyInfoAgent
+
+    report = await CompanyInfoAgent(settings).analyze(company_name)
+    analysis_id = store.put(report)
+    if cache.is_shared:
+        await _publish(cache, analysis_id, report, settings)
+    return analysis_id, report, False
@@ -1,14 +1,17 @@
 """웹 검색 모듈."""
 
 from .base import BaseSearchProvider, SearchProviderError
+from .cached import CachedSearchProvider, with_cache
 from .factory import SearchProviderFactory
 from .serpapi import SerpAPIProvider
 from .tavily import TavilyProvider
 
 __all__ = [
     "BaseSearchProvider",
+    "CachedSearchProvider",
     "SearchProviderError",
     "SearchProviderFactory",
     "SerpAPIProvider",
     "TavilyProvider",
+    "with_cache",
 ]
@@ -0,0 +1,90 @@
+"""공유 캐시를 거치는 검색 프로바이더 래퍼."""
+
+from config.settings import Settings
+from src.cache import SharedCache, get_shared_cache
+from src.models.schemas import SearchResponse
+from src.search.base import BaseSearchProvider
+from src.utils.tracing import current_span
+
+
+class CachedSearchProvider(BaseSearchProvider):
+    """검색 결과를 search_cache_ttl 동안 공유 캐시에 보관하는 래퍼.
+
+    캐시 키는 (프로바이더, 검색 종류, 결과 수, 옵션, 쿼리)이며, 공유 백엔드를
+    사용하면 다른 워커가 같은 쿼리를 검색한 결과도 재사용합니다.
+    결과가 없는 응답은 일시적인 실패일 수 있으므로 캐시하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        provider: BaseSearchProvider,
+        cache: SharedCache | None = None,
+        ttl: float | None = None,
+        settings: Settings | None = None,
+    ):
+        """래퍼를 초기화합니다.
+
+        Args:
+            provider: 실제 검색 프로바이더
+            cache: 공유 캐시 (None이면 기본 공유 캐시)
+            ttl: 캐시 유효 시간 (초, None이면 search_cache_ttl 설정)
+            settings: 애플리케이션 설정
+        """
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+
+        self.provider = provider
+        self.cache = cache or get_shared_cache(settings)
+        self.ttl = settings.search_cache_ttl if ttl is None else ttl
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def is_available(self) -> bool:
+        return self.provider.is_available
+
+    async def _cached(
+        self, kind: str, query: str, max_results: int | None, kwargs: dict
+    ) -> SearchResponse:
+        options = ",".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
+        key = f"{self.name}|{kind}|{max_results}|{options}|{query}"
+
+        cached = await self.cache.get("search", key)
+        current_span().set_attribute("search.cache_hit", cached is not None)
+        if cached is not None:
+            return SearchResponse.model_validate(cached)
+
+        if kind == "news":
+            response = await self.provider.news_search(query, max_results=max_results, **kwargs)
+        else:
+            response = await self.provider.search(query, max_results=max_results, **kwargs)
+
+        if response.results:
+            await self.cache.set("search", key, response.model_dump(mode="json"), self.ttl)
+        return response
+
+    async def search(
+        self, query: str, max_results: int | None = None, **kwargs
+    ) -> SearchResponse:
+        return await self._cached("web", query, max_results, kwargs)
+
+    async def news_search(
+        self, query: str, max_results: int | None = None, **kwargs
+    ) -> SearchResponse:
+        return await self._cached("news", query, max_results, kwargs)
+
+
+def with_cache(
+    provider: BaseSearchProvider, settings: Settings | None = None
+) -> BaseSearchProvider:
+    """search_cache_ttl이 설정되어 있으면 프로바이더를 캐시 래퍼로 감쌉니다."""
+    if settings is None:
+        from config.settings import settings as default_settings
+        settings = default_settings
+
+    if settings.search_cache_ttl <= 0:
+        return provider
+    return CachedSearchProvider(provider, settings=settings)
@@ -9,6 +9,7 @@ from serpapi import GoogleSearch
 from src.models.schemas import SearchResponse, SearchResult
 from src.search.base import BaseSearchProvider, SearchProviderError
 from src.utils.logging import get_logger
+from src.utils.metrics import track
 
 logger = get_logger("search.serpapi")
 
@@ -50,10 +51,13 @@ class SerpAPIProvider(BaseSearchProvider):
         try:
             # SerpAPI는 동기 라이브러리이므로 스레드 풀에서 실행
             loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: self._execute_search(query, max_results, **kwargs),
-            )
+            operation = "news_search" if kwargs.get("tbm") == "nws" else "search"
+            with track("backend", backend="serpapi", operation=operation) as tracked:
+                result = await loop.run_in_executor(
+                    None,
+                    lambda: self._execute_search(query, max_results, **kwargs),
+                )
+                tracked.span.set_attributes({"query": query, "result_count": len(result.results)})
             return result
 
         except Exception as e:
@@ -8,6 +8,7 @@ from tavily import TavilyClient
 from src.models.schemas import SearchResponse, SearchResult
 from src.search.base import BaseSearchProvider, SearchProviderError
 from src.utils.logging import get_logger
+from src.utils.metrics import track
 
 logger = get_logger("search.tavily")
 
@@ -55,12 +56,17 @@ class TavilyProvider(BaseSearchProvider):
         start_time = time.time()
 
         try:
-            response = self.client.search(
-                query=query,
-                max_results=max_results,
-                search_depth=kwargs.get("search_depth", "basic"),
-                include_answer=kwargs.get("include_answer", False),
-            )
+            with track("backend", backend="tavily", operation="search") as tracked:
+                response = self.client.search(
+                    query=query,
+                    max_results=max_results,
+                    search_depth=kwargs.get("search_depth", "basic"),
+                    include_answer=kwargs.get("include_answer", False),
+                )
+                tracked.span.set_attributes({
+                    "query": query,
+                    "result_count": len(response.get("results", [])),
+                })
 
             results = self._parse_results(response)
             search_time = time.time() - start_time
@@ -93,12 +99,17 @@ class TavilyProvider(BaseSearchProvider):
         start_time = time.time()
 
         try:
-            response = self.client.search(
-                query=query,
-                max_results=max_results,
-                topic="news",
-                search_depth=kwargs.get("search_depth", "basic"),
-            )
+            with track("backend", backend="tavily", operation="news_search") as tracked:
+                response = self.client.search(
+                    query=query,
+                    max_results=max_results,
+                    topic="news",
+                    search_depth=kwargs.get("search_depth", "basic"),
+                )
+                tracked.span.set_attributes({
+                    "query": query,
+                    "result_count": len(response.get("results", [])),
+                })
 
             results = self._parse_results(response)
             search_time = time.time() - start_time
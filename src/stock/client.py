@@ -6,9 +6,11 @@ import yfinance as yf
 import pandas as pd
 
 from config.settings import Settings
+from src.cache import SharedCache, get_shared_cache
 from src.stock.models import StockInfo, StockPrice, StockAnalysis, TechnicalIndicator
 from src.stock.indicators import TechnicalIndicators
 from src.utils.logging import get_logger
+from src.utils.metrics import track
 
 logger = get_logger("stock.client")
 
@@ -52,6 +54,23 @@ class StockClient:
 
         self.settings = settings
         self._indicators = TechnicalIndicators()
+        self._cache: SharedCache | None = None
+
+    @property
+    def cache(self) -> SharedCache | None:
+        """주식 정보/주가 캐시를 반환합니다 (price_cache_ttl이 0이면 None)."""
+        if self.settings.price_cache_ttl <= 0:
+            return None
+        if self._cache is None:
+            self._cache = get_shared_cache(self.settings)
+        return self._cache
+
+    async def _cache_get(self, key: str):
+        return await self.cache.get("price", key) if self.cache is not None else None
+
+    async def _cache_set(self, key: str, value) -> None:
+        if self.cache is not None:
+            await self.cache.set("price", key, value, self.settings.price_cache_ttl)
 
     def resolve_ticker(self, query: str) -> str:
         """기업명 또는 티커를 표준 티커로 변환합니다.
@@ -83,16 +102,20 @@ class StockClient:
             주식 기본 정보 또는 None
         """
         resolved = self.resolve_ticker(ticker)
+        cached = await self._cache_get(f"info|{resolved}")
+        if cached is not None:
+            return StockInfo.model_validate(cached)
 
         try:
-            stock = yf.Ticker(resolved)
-            info = stock.info
+            with track("backend", backend="yfinance", operation="info"):
+                stock = yf.Ticker(resolved)
+                info = stock.info
 
             if not info or "symbol" not in info:
                 logger.warning(f"주식 정보를 찾을 수 없음: {resolved}")
                 return None
 
-            return StockInfo(
+            stock_info = StockInfo(
                 ticker=info.get("symbol", resolved),
                 name=info.get("longName", info.get("shortName", "")),
                 sector=info.get("sector"),
@@ -104,6 +127,8 @@ class StockClient:
                 website=info.get("website"),
                 description=info.get("longBusinessSummary"),
             )
+            await self._cache_set(f"info|{resolved}", stock_info.model_dump(mode="json"))
+            return stock_info
 
         except Exception as e:
             logger.error(f"주식 정보 조회 실패: {e}")
@@ -126,10 +151,15 @@ class StockClient:
             주가 히스토리 목록
         """
         resolved = self.resolve_ticker(ticker)
+        key = f"history|{resolved}|{period}|{interval}"
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return [StockPrice.model_validate(p) for p in cached]
 
         try:
-            stock = yf.Ticker(resolved)
-            hist = stock.history(period=period, interval=interval)
+            with track("backend", backend="yfinance", operation="history"):
+                stock = yf.Ticker(resolved)
+                hist = stock.history(period=period, interval=interval)
 
             if hist.empty:
                 logger.warning(f"주가 데이터 없음: {resolved}")
@@ -150,6 +180,7 @@ class StockClient:
                 )
 
             logger.debug(f"주가 데이터 조회: {len(prices)}개")
+            await self._cache_set(key, [p.model_dump(mode="json") for p in prices])
             return prices
 
         except Exception as e:
@@ -168,17 +199,18 @@ class StockClient:
         resolved = self.resolve_ticker(ticker)
 
         try:
-            stock = yf.Ticker(resolved)
-            info = stock.info
+            with track("backend", backend="yfinance", operation="current_price"):
+                stock = yf.Ticker(resolved)
+                info = stock.info
 
-            # 현재가 조회 (여러 필드 시도)
-            price = info.get("currentPrice") or info.get("regularMarketPrice")
+                # 현재가 조회 (여러 필드 시도)
+                price = info.get("currentPrice") or info.get("regularMarketPrice")
 
-            if price is None:
-                # 최근 종가로 대체
-                hist = stock.history(period="1d")
-                if not hist.empty:
-                    price = hist["Close"].iloc[-1]
+                if price is None:
+                    # 최근 종가로 대체
+                    hist = stock.history(period="1d")
+                    if not hist.empty:
+                        price = hist["Close"].iloc[-1]
 
             return price
 
@@ -244,6 +276,7 @@ class StockClient:
                     value=round(macd_result["macd"], 2),
                     signal=signal,
                     description=f"MACD {macd_result['macd']:.2f}, Signal {macd_result['signal']:.2f}",
+                    values={k: round(v, 2) for k, v in macd_result.items()},
                 )
             )
 
@@ -266,9 +299,17 @@ class StockClient:
                     value=round(bb["middle"], 2),
                     signal=signal,
                     description=desc,
+                    values={k: round(bb[k], 2) for k in ("upper", "middle", "lower")},
                 )
             )
 
+        # 이동평균
+        moving_averages = {}
+        for period in (20, 50):
+            sma = self._indicators.sma(df["close"], period=period)
+            if sma is not None:
+                moving_averages[f"sma_{period}"] = round(sma, 2)
+
         # 종합 추천
         buy_signals = sum(1 for i in indicators if i.signal == "buy")
         sell_signals = sum(1 for i in indicators if i.signal == "sell")
@@ -286,6 +327,7 @@ class StockClient:
             change_percent=round(change_percent, 2),
             prices=prices[-30:],  # 최근 30일
             indicators=indicators,
+            moving_averages=moving_averages,
             recommendation=recommendation,
         )
 
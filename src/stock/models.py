@@ -38,6 +38,9 @@ class TechnicalIndicator(BaseModel):
     value: float = Field(..., description="현재 값")
     signal: str = Field(..., description="신호 (buy/sell/neutral)")
     description: str | None = Field(default=None, description="설명")
+    values: dict[str, float] = Field(
+        default_factory=dict, description="세부 값 (MACD signal/histogram, 밴드 상/하단 등)"
+    )
 
 
 class StockAnalysis(BaseModel):
@@ -50,5 +53,8 @@ class StockAnalysis(BaseModel):
     indicators: list[TechnicalIndicator] = Field(
         default_factory=list, description="기술적 지표"
     )
+    moving_averages: dict[str, float] = Field(
+        default_factory=dict, description="이동평균 (sma_20, sma_50)"
+    )
     recommendation: str | None = Field(default=None, description="추천 의견")
     analyzed_at: datetime = Field(default_factory=datetime.now, description="분석 시간")
@@ -4,6 +4,10 @@ from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from config.settings import Settings
+from src.utils.metrics import record_llm_tokens, track
+
+# 응답 생성 온도 (캐시 키에 포함)
+TEMPERATURE = 0.3
 
 
 class LLMClient:
@@ -29,7 +33,7 @@ class LLMClient:
             self._model = ChatOpenAI(
                 model=self.settings.openai_model,
                 api_key=self.settings.openai_api_key,
-                temperature=0.3,
+                temperature=TEMPERATURE,
             )
         return self._model
 
@@ -47,13 +51,54 @@ class LLMClient:
         Returns:
             생성된 응답 텍스트
         """
+        text, _ = await self.generate_with_usage(prompt, system=system)
+        return text
+
+    async def generate_with_usage(
+        self,
+        prompt: str,
+        system: str | None = None,
+    ) -> tuple[str, int]:
+        """응답과 함께 사용한 토큰 수를 반환합니다.
+
+        Args:
+            prompt: 사용자 프롬프트
+            system: 시스템 프롬프트 (선택)
+
+        동일한 (모델, 시스템 프롬프트, 프롬프트)의 응답은 llm_cache_ttl 동안
+        공유 캐시에서 재사용하며, 이때 사용한 토큰 수는 0입니다.
+
+        Returns:
+            (생성된 응답 텍스트, 총 토큰 수)
+        """
+        from src.cache import get_shared_cache
+
+        cache = get_shared_cache(self.settings) if self.settings.llm_cache_ttl > 0 else None
+        key = f"{self.settings.openai_model}|{TEMPERATURE}|{system or ''}|{prompt}"
+        if cache is not None:
+            cached = await cache.get("llm", key)
+            if cached is not None:
+                return cached["text"], 0
+
         messages = []
         if system:
             messages.append(SystemMessage(content=system))
         messages.append(HumanMessage(content=prompt))
 
-        response = await self.model.ainvoke(messages)
-        return str(response.content)
+        with track("backend", backend="openai", operation="chat") as tracked:
+            response = await self.model.ainvoke(messages)
+            usage = getattr(response, "usage_metadata", None) or {}
+            tracked.span.set_attributes({
+                "llm.model": self.settings.openai_model,
+                "llm.input_tokens": usage.get("input_tokens"),
+                "llm.output_tokens": usage.get("output_tokens"),
+            })
+        record_llm_tokens(self.settings.openai_model, usage)
+
+        text = str(response.content)
+        if cache is not None:
+            await cache.set("llm", key, {"text": text}, self.settings.llm_cache_ttl)
+        return text, int(usage.get("total_tokens", 0))
 
     async def summarize(
         self,
@@ -89,6 +134,7 @@ class LLMClient:
         search_results: list[dict],
         news_items: list[dict],
         palantir_data: dict | None = None,
+        graph_context: str | None = None,
     ) -> str:
         """기업 정보를 종합 분석합니다.
 
@@ -97,6 +143,7 @@ class LLMClient:
             search_results: 검색 결과 목록
             news_items: 뉴스 항목 목록
             palantir_data: Palantir에서 가져온 데이터
+            graph_context: Graph RAG 컨텍스트 (인용 번호 [n] 포함)
 
         Returns:
             종합 분석 리포트
@@ -125,6 +172,9 @@ class LLMClient:
         if palantir_data:
             context_parts.append(f"## Palantir 데이터\n{palantir_data}")
 
+        if graph_context:
+            context_parts.append(f"## 관련 문서 (인용 번호 [n])\n{graph_context}")
+
         context = "\n\n".join(context_parts)
 
         prompt = f"""# {company_name} 기업 분석
@@ -0,0 +1,371 @@
+"""Prometheus 텍스트 형식 런타임 메트릭.
+
+외부 의존성 없이 Counter/Gauge/Histogram과 계측용 컨텍스트 매니저/데코레이터를
+제공합니다. 값 갱신은 이벤트 루프 스레드에서 일어난다고 가정하므로 잠금을
+사용하지 않습니다.
+
+캐시/큐 같은 싱글톤은 자신을 소유한 모듈에서 수집 함수를 등록하므로,
+/metrics 라우트는 레지스트리만 렌더링합니다.
+
+사용 예:
+    @instrumented("node")
+    async def search_node(state): ...
+
+    with track("backend", backend="tavily", operation="search"):
+        response = client.search(...)
+"""
+
+import asyncio
+import functools
+import math
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from src.utils.tracing import start_span
+
+# 기본 지연 시간 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PREFIX = "ps"
+
+# 수집 시점에 계산하는 메트릭: (이름, 타입, 설명, [(라벨, 값)])
+Collected = tuple[str, str, str, list[tuple[dict[str, str], float]]]
+
+# 수집 시점의 캐시 통계: 캐시 이름 → {"hits", "misses", "size"}
+CacheStats = dict[str, dict]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+class _Metric:
+    """라벨 값 튜플별로 값을 보관하는 메트릭 기본 클래스."""
+
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], Any] = {}
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} 라벨 불일치: {sorted(labels)} != {list(self.labelnames)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _labels(self, key: tuple[str, ...]) -> dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def get(self, **labels: Any) -> float:
+        """라벨의 현재 값을 반환합니다 (없으면 0)."""
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        return [(self.name, self._labels(k), v) for k, v in self._values.items()]
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class Counter(_Metric):
+    """단조 증가 카운터."""
+
+    type = "counter"
+
+    def inc(self, value: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + value
+
+
+class Gauge(_Metric):
+    """증감 가능한 게이지."""
+
+    type = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, value: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + value
+
+    def dec(self, value: float = 1, **labels: Any) -> None:
+        self.inc(-value, **labels)
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            # [버킷별 개수..., 합계, 개수]
+            state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[i] += 1
+                break
+        state[-2] += value
+        state[-1] += 1
+
+    def get(self, **labels: Any) -> float:
+        """라벨의 관측 횟수를 반환합니다."""
+        state = self._values.get(self._key(labels))
+        return state[-1] if state else 0
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        samples = []
+        for key, state in self._values.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                bucket_labels = {**labels, "le": _format_value(bound)}
+                samples.append((f"{self.name}_bucket", bucket_labels, cumulative))
+            samples.append((f"{self.name}_bucket", {**labels, "le": "+Inf"}, state[-1]))
+            samples.append((f"{self.name}_sum", labels, state[-2]))
+            samples.append((f"{self.name}_count", labels, state[-1]))
+        return samples
+
+
+class MetricsRegistry:
+    """메트릭과 수집 함수 레지스트리."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Iterable[Collected]]] = []
+        self._cache_sources: list[Callable[[], CacheStats]] = []
+
+    def _get_or_create(self, cls: type, name: str, help: str, labelnames: Iterable[str], **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, help, labelnames, **kwargs)
+        elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"메트릭 정의 충돌: {name}")
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+    def register_collector(self, collector: Callable[[], Iterable[Collected]]) -> None:
+        """수집 시점에 값을 계산하는 함수를 등록합니다 (캐시 통계 등)."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def register_cache_source(self, source: Callable[[], CacheStats]) -> None:
+        """캐시 통계를 반환하는 함수를 등록합니다.
+
+        모든 캐시는 ``cache`` 라벨로 구분되는 같은 메트릭으로 합쳐서 출력합니다.
+        아직 생성되지 않은 캐시는 결과에서 빼면 됩니다.
+        """
+        if source not in self._cache_sources:
+            self._cache_sources.append(source)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식(0.0.4)으로 렌더링합니다."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        caches: CacheStats = {}
+        for source in self._cache_sources:
+            caches.update(source())
+        collected = [cache_metrics(caches), *(collector() for collector in self._collectors)]
+
+        for name, metric_type, help, samples in (item for items in collected for item in items):
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """모든 메트릭 값을 초기화합니다 (정의와 수집 함수는 유지)."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+# 프로세스 기본 레지스트리
+registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """기본 메트릭 레지스트리를 반환합니다."""
+    return registry
+
+
+class TrackedCall:
+    """호출 지연 시간, 오류, 진행 중 수를 기록하는 컨텍스트 매니저 (track 참고).
+
+    ``{prefix}_{family}_duration_seconds`` 히스토그램,
+    ``{prefix}_{family}_errors_total`` 카운터(라벨 + error 타입),
+    ``{prefix}_{family}_in_flight`` 게이지를 갱신합니다. 같은 family는 항상
+    같은 라벨 이름을 사용해야 합니다.
+
+    진행 중인 trace가 있으면 라벨 값을 이름으로 하는 하위 span도 만듭니다
+    (``span`` 속성으로 결과 수 등 속성을 추가할 수 있음).
+    """
+
+    __slots__ = ("family", "labels", "span", "_start", "_metrics", "_span_cm")
+
+    def __init__(self, family: str, **labels: Any):
+        self.family = family
+        self.labels = labels
+        self._metrics = _family_metrics(family, tuple(labels))
+        name = ".".join(str(v) for v in labels.values()) or family
+        self._span_cm = start_span(name, kind="CLIENT" if family == "backend" else "INTERNAL")
+
+    def __enter__(self) -> "TrackedCall":
+        self.span = self._span_cm.__enter__()
+        self.span.set_attributes(self.labels)
+        self._metrics[2].inc(**self.labels)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration, errors, in_flight = self._metrics
+        duration.observe(time.perf_counter() - self._start, **self.labels)
+        if exc_type is not None and not issubclass(exc_type, asyncio.CancelledError):
+            errors.inc(**self.labels, error=exc_type.__name__)
+        in_flight.dec(**self.labels)
+        self._span_cm.__exit__(exc_type, exc, tb)
+
+    async def __aenter__(self) -> "TrackedCall":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.__exit__(exc_type, exc, tb)
+
+
+def track(family: str, **labels: Any) -> TrackedCall:
+    """호출을 family 메트릭과 하위 span으로 계측하는 컨텍스트 매니저를 반환합니다.
+
+    Args:
+        family: 메트릭 묶음 이름 (예: node, backend)
+        **labels: 라벨 (같은 family는 항상 같은 라벨 이름 사용)
+    """
+    return TrackedCall(family, **labels)
+
+
+@functools.cache
+def _family_metrics(family: str, labelnames: tuple[str, ...]) -> tuple[Histogram, Counter, Gauge]:
+    return (
+        registry.histogram(
+            f"{PREFIX}_{family}_duration_seconds", f"{family} 호출 지연 시간 (초)", labelnames
+        ),
+        registry.counter(
+            f"{PREFIX}_{family}_errors_total", f"{family} 호출 오류 수", (*labelnames, "error")
+        ),
+        registry.gauge(f"{PREFIX}_{family}_in_flight", f"진행 중인 {family} 호출 수", labelnames),
+    )
+
+
+def instrumented(family: str, **labels: Any) -> Callable:
+    """함수 호출을 track으로 계측하는 데코레이터.
+
+    라벨을 지정하지 않으면 ``{family}=함수 이름`` 라벨을 사용합니다.
+
+    Args:
+        family: 메트릭 묶음 이름 (예: node, backend)
+        **labels: 고정 라벨
+    """
+
+    def decorator(func: Callable) -> Callable:
+        fixed = labels or {family: func.__name__}
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with track(family, **fixed):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with track(family, **fixed):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_llm_tokens(model: str, usage: dict | None) -> None:
+    """LLM 응답의 usage_metadata를 토큰 카운터에 기록합니다."""
+    if not usage:
+        return
+    tokens = registry.counter(f"{PREFIX}_llm_tokens_total", "LLM 토큰 사용량", ("model", "type"))
+    tokens.inc(int(usage.get("input_tokens", 0)), model=model, type="input")
+    tokens.inc(int(usage.get("output_tokens", 0)), model=model, type="output")
+
+
+def cache_metrics(caches: dict[str, dict]) -> list[Collected]:
+    """캐시 stats() 결과들을 요청 수/적중률 메트릭으로 변환합니다.
+
+    Args:
+        caches: 캐시 이름 → {"hits", "misses", "size"} 통계
+    """
+    requests, ratios, sizes = [], [], []
+    for name, stats in caches.items():
+        hits, misses = stats.get("hits", 0), stats.get("misses", 0)
+        requests.append(({"cache": name, "result": "hit"}, hits))
+        requests.append(({"cache": name, "result": "miss"}, misses))
+        ratios.append(({"cache": name}, hits / (hits + misses) if hits + misses else 0.0))
+        if "size" in stats:
+            sizes.append(({"cache": name}, stats["size"]))
+
+    return [
+        (f"{PREFIX}_cache_requests_total", "counter", "캐시 조회 수", requests),
+        (f"{PREFIX}_cache_hit_ratio", "gauge", "캐시 적중률", ratios),
+        (f"{PREFIX}_cache_entries", "gauge", "캐시 항목 수", sizes),
+    ]
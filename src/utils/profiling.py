@@ -0,0 +1,237 @@
+"""실행 프로파일링 (cProfile + 스택 샘플링).
+
+한 번의 실행(CLI 명령, API 요청)을 프로파일링해 다음 세 파일을 남깁니다.
+
+- ``*.prof``: cProfile pstats 파일 (``python -m pstats``, snakeviz 등으로 분석)
+- ``*.collapsed``: 샘플링한 collapsed stack (flamegraph.pl, speedscope 입력)
+- ``*.txt``: 누적 시간 기준 상위 N개 함수 요약
+
+cProfile은 스레드별 훅이므로 시작한 스레드(이벤트 루프 스레드)만 측정하며,
+같은 프로세스에서 동시에 하나의 프로파일만 실행할 수 있습니다.
+
+사용 예:
+    with Profiler("stock-AAPL") as profiler:
+        asyncio.run(run())
+    print(profiler.result.summary)
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import CodeType
+
+from config.settings import Settings
+from src.utils.logging import get_logger
+
+logger = get_logger("utils.profiling")
+
+# 동시에 하나의 프로파일만 허용
+_active_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """다른 프로파일이 이미 실행 중입니다."""
+
+    pass
+
+
+@dataclass
+class ProfileResult:
+    """프로파일 결과."""
+
+    name: str
+    duration: float  # 초
+    samples: int  # 스택 샘플 수
+    stats_path: Path
+    collapsed_path: Path
+    summary_path: Path
+    summary: str
+
+    @property
+    def id(self) -> str:
+        """파일 이름 공통 부분 (확장자 제외)."""
+        return self.stats_path.stem
+
+
+def _frame_label(code: CodeType) -> str:
+    """collapsed stack용 프레임 이름 (함수 (파일:줄))."""
+    filename = code.co_filename
+    marker = "site-packages" + os.sep
+    if marker in filename:
+        filename = filename.split(marker, 1)[1]
+    else:
+        try:
+            filename = os.path.relpath(filename)
+        except ValueError:
+            pass
+        if filename.startswith(".."):
+            filename = os.path.basename(filename)
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+class _StackSampler(threading.Thread):
+    """대상 스레드의 호출 스택을 주기적으로 샘플링합니다."""
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class Profiler:
+    """cProfile과 스택 샘플러를 함께 실행하는 프로파일러.
+
+    Attributes:
+        result: stop() 이후의 프로파일 결과
+    """
+
+    def __init__(
+        self,
+        name: str,
+        output_dir: str | Path | None = None,
+        top: int | None = None,
+        interval: float | None = None,
+        settings: Settings | None = None,
+    ):
+        """프로파일러를 초기화합니다.
+
+        Args:
+            name: 프로파일 이름 (파일 이름에 사용)
+            output_dir: 결과 저장 디렉토리 (None이면 profile_dir 설정)
+            top: 요약할 상위 함수 수 (None이면 profile_top 설정)
+            interval: 스택 샘플링 간격 (초, None이면 profile_interval 설정)
+            settings: 애플리케이션 설정
+        """
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+
+        self.name = re.sub(r"[^\w.-]+", "_", name).strip("_") or "profile"
+        self.output_dir = Path(output_dir or settings.profile_dir)
+        self.top = top or settings.profile_top
+        self.interval = interval or settings.profile_interval
+        self.result: ProfileResult | None = None
+        self._profile: cProfile.Profile | None = None
+        self._sampler: _StackSampler | None = None
+        self._started = 0.0
+
+    def start(self) -> None:
+        """프로파일링을 시작합니다.
+
+        Raises:
+            ProfilerBusyError: 다른 프로파일이 실행 중인 경우
+        """
+        if not _active_lock.acquire(blocking=False):
+            raise ProfilerBusyError("다른 프로파일이 실행 중입니다")
+
+        self._sampler = _StackSampler(threading.get_ident(), self.interval)
+        self._profile = cProfile.Profile()
+        self._started = time.perf_counter()
+        self._sampler.start()
+        self._profile.enable()
+
+    def stop(self) -> ProfileResult:
+        """프로파일링을 멈추고 결과 파일을 저장합니다.
+
+        Raises:
+            RuntimeError: start()하지 않은 경우
+        """
+        profile, sampler = self._profile, self._sampler
+        if profile is None or sampler is None:
+            raise RuntimeError("프로파일링이 시작되지 않았습니다")
+
+        try:
+            profile.disable()
+            sampler.stop()
+        finally:
+            _active_lock.release()
+
+        duration = time.perf_counter() - self._started
+        self.result = self._write(duration, profile, sampler.stacks)
+        logger.info(f"프로파일 저장: {self.result.stats_path} ({duration:.2f}초)")
+        return self.result
+
+    def _write(
+        self,
+        duration: float,
+        profile: cProfile.Profile,
+        stacks: Counter[str],
+    ) -> ProfileResult:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        base = self.output_dir / f"{datetime.now():%Y%m%d-%H%M%S}-{self.name}"
+        stats_path = base.with_name(base.name + ".prof")
+        collapsed_path = base.with_name(base.name + ".collapsed")
+        summary_path = base.with_name(base.name + ".txt")
+
+        profile.dump_stats(stats_path)
+
+        collapsed_path.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in stacks.most_common()),
+            encoding="utf-8",
+        )
+
+        stream = io.StringIO()
+        stream.write(f"{self.name}: {duration:.3f}초, 샘플 {sum(stacks.values())}개\n")
+        stats = pstats.Stats(profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        summary = stream.getvalue()
+        summary_path.write_text(summary, encoding="utf-8")
+
+        return ProfileResult(
+            name=self.name,
+            duration=duration,
+            samples=sum(stacks.values()),
+            stats_path=stats_path,
+            collapsed_path=collapsed_path,
+            summary_path=summary_path,
+            summary=summary,
+        )
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self.stop()
+
+
+def top_functions(stats_path: str | Path, top: int = 10) -> list[tuple[str, int, float, float]]:
+    """pstats 파일에서 누적 시간 상위 함수를 반환합니다.
+
+    Returns:
+        (함수, 호출 수, 자체 시간, 누적 시간) 목록
+    """
+    stats = pstats.Stats(str(stats_path))
+    rows = []
+    raw = stats.stats  # type: ignore[attr-defined]  # typeshed에 없는 pstats 내부 속성
+    for (filename, line, func), (_, calls, tottime, cumtime, _) in raw.items():
+        label = func if filename == "~" else f"{func} ({os.path.basename(filename)}:{line})"
+        rows.append((label, calls, tottime, cumtime))
+    rows.sort(key=lambda r: r[3], reverse=True)
+    return rows[:top]
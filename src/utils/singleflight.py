@@ -0,0 +1,102 @@
+"""동일 키 동시 호출 병합 (single-flight) 및 짧은 결과 memoization."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from src.utils.logging import get_logger
+from src.utils.tracing import current_span
+
+logger = get_logger("utils.singleflight")
+
+
+class SingleFlight:
+    """같은 키의 동시 호출을 하나의 실행으로 합칩니다.
+
+    첫 호출이 작업을 태스크로 시작하고, 완료 전 같은 키로 들어온 호출은 그
+    태스크를 함께 기다립니다. 성공한 결과는 memo_ttl 동안 재사용하며,
+    실패는 기다리던 모든 호출에 전파하되 저장하지 않습니다. memo는 저장 순서를
+    유지하므로 새 결과를 저장할 때 만료된 항목을 앞에서부터 정리하며,
+    memo_maxsize를 넘으면 가장 오래된 항목부터 버립니다.
+
+    호출자 하나가 취소되어도 공유 실행은 계속되므로 나머지 호출자는 결과를 받습니다.
+    """
+
+    def __init__(self, memo_ttl: float = 0, memo_maxsize: int = 1024):
+        """병합기를 초기화합니다.
+
+        Args:
+            memo_ttl: 완료된 결과 재사용 시간 (초, 0이면 동시 호출만 병합)
+            memo_maxsize: memo 최대 항목 수
+        """
+        self.memo_ttl = memo_ttl
+        self.memo_maxsize = memo_maxsize
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._memo: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.stats = {"calls": 0, "executions": 0, "coalesced": 0, "memo_hits": 0}
+
+    @property
+    def inflight(self) -> int:
+        """실행 중인 키 수를 반환합니다."""
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """키의 실행 결과를 반환합니다 (진행 중이거나 memo된 결과가 있으면 재사용).
+
+        Args:
+            key: 병합 키
+            func: 실제 작업을 수행하는 코루틴 함수
+
+        Returns:
+            작업 결과
+        """
+        self.stats["calls"] += 1
+
+        memo = self._memo.get(key)
+        if memo is not None:
+            if time.monotonic() - memo[0] <= self.memo_ttl:
+                self.stats["memo_hits"] += 1
+                current_span().set_attribute("singleflight", "memoized")
+                return memo[1]
+            del self._memo[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            current_span().set_attribute("singleflight", "coalesced")
+            logger.debug(f"진행 중인 실행에 합류: {key}")
+        else:
+            self.stats["executions"] += 1
+            task = asyncio.create_task(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._complete(key, t))
+
+        return await asyncio.shield(task)
+
+    def _complete(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if self.memo_ttl > 0 and not task.cancelled() and task.exception() is None:
+            self._remember(key, task.result())
+
+    def _remember(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        self._memo[key] = (now, value)
+        self._memo.move_to_end(key)
+        while self._memo:
+            stored_at, _ = next(iter(self._memo.values()))
+            if now - stored_at <= self.memo_ttl and len(self._memo) <= self.memo_maxsize:
+                break
+            self._memo.popitem(last=False)
+
+    def forget(self, key: Hashable) -> None:
+        """키의 memo된 결과를 삭제합니다."""
+        self._memo.pop(key, None)
+
+    def clear(self) -> None:
+        """memo와 통계를 초기화합니다 (진행 중인 실행은 유지)."""
+        self._memo.clear()
+        for name in self.stats:
+            self.stats[name] = 0
@@ -0,0 +1,57 @@
+"""토큰 수 계산."""
+
+import math
+from functools import lru_cache
+
+from src.utils.logging import get_logger
+
+logger = get_logger("utils.tokens")
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """모델의 tiktoken 인코딩을 반환합니다 (사용할 수 없으면 None)."""
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # tiktoken 미설치 또는 인코딩 파일을 내려받을 수 없는 환경
+        logger.debug(f"tiktoken 사용 불가, 근사 토큰 수 사용: {e}")
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """tiktoken 없이 토큰 수를 근사합니다.
+
+    ASCII는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 1토큰으로 계산해
+    실제보다 약간 크게 잡습니다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """텍스트의 토큰 수를 반환합니다.
+
+    Args:
+        text: 텍스트
+        model: 토크나이저 기준 모델 (기본값: 설정의 openai_model)
+
+    Returns:
+        토큰 수
+    """
+    if not text:
+        return 0
+
+    if model is None:
+        from config.settings import settings
+        model = settings.openai_model
+
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text))
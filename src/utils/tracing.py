@@ -0,0 +1,393 @@
+"""OpenTelemetry 호환 요청 추적 (span).
+
+trace/span ID, 부모 관계, 속성, 상태를 OpenTelemetry 데이터 모델대로 기록하고
+OTLP/HTTP JSON으로 내보낼 수 있습니다. SDK 의존성 없이 contextvars로 현재
+span을 전파합니다.
+
+루트 span은 API 요청, CLI 실행, 작업 큐 작업에서 ``root=True``로 시작하며,
+그 밖의 span(노드, 백엔드 호출)은 진행 중인 trace가 있을 때만 만들어집니다.
+추적이 꺼져 있으면 모든 호출이 공유 no-op span을 반환합니다.
+"""
+
+import json
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from config.settings import Settings
+from src.utils.logging import get_logger
+
+logger = get_logger("utils.tracing")
+
+# OTLP span kind
+SPAN_KINDS = {"INTERNAL": 1, "SERVER": 2, "CLIENT": 3}
+
+_current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """추적 span."""
+
+    name: str
+    trace_id: str  # 32자리 hex
+    span_id: str  # 16자리 hex
+    parent_id: str | None = None
+    kind: str = "INTERNAL"
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "UNSET"  # UNSET/OK/ERROR
+    status_message: str = ""
+    # 이 프로세스에서 시작한 trace의 첫 span (원격 부모가 있어도 True)
+    is_local_root: bool = False
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    @property
+    def is_recording(self) -> bool:
+        return True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status = "ERROR"
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def traceparent(self) -> str:
+        """W3C traceparent 헤더 값을 반환합니다."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_otlp(self) -> dict:
+        """OTLP JSON span 표현을 반환합니다."""
+        data = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": SPAN_KINDS.get(self.kind, 1),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": {"UNSET": 0, "OK": 1, "ERROR": 2}[self.status]},
+        }
+        if self.parent_id:
+            data["parentSpanId"] = self.parent_id
+        if self.status_message:
+            data["status"]["message"] = self.status_message
+        return data
+
+
+class _NoopSpan:
+    """추적하지 않을 때 사용하는 span."""
+
+    is_recording = False
+    attributes: dict = {}
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str] | None:
+    """W3C traceparent 헤더에서 (trace_id, parent span_id)를 추출합니다."""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+    except ValueError:
+        return None
+    return parts[1], parts[2]
+
+
+class SpanExporter(ABC):
+    """완료된 span 내보내기 추상 기본 클래스."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """완료된 span을 내보냅니다 (요청 경로에서 호출되므로 블로킹 금지)."""
+        pass
+
+    def shutdown(self) -> None:
+        """남은 span을 내보내고 정리합니다."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """완료된 span을 메모리에 보관합니다 (테스트, CLI waterfall용)."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def get_finished_spans(self, trace_id: str | None = None) -> list[Span]:
+        """완료된 span을 시작 순서로 반환합니다."""
+        spans = [s for s in self.spans if trace_id is None or s.trace_id == trace_id]
+        return sorted(spans, key=lambda s: s.start_ns)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """완료된 span을 OTLP JSON 한 줄로 stderr에 출력합니다."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stderr
+
+    def export(self, span: Span) -> None:
+        self.stream.write(json.dumps(span.to_otlp(), ensure_ascii=False) + "\n")
+
+
+class OTLPSpanExporter(SpanExporter):
+    """OTLP/HTTP JSON으로 collector에 span을 보냅니다.
+
+    로컬 루트 span(요청/CLI/작업 단위)이 끝나거나 버퍼가 max_batch에 도달하면
+    전용 스레드에서 전송합니다. traceparent를 이어받은 루트 span은 원격 부모가
+    있으므로 parent_id가 아니라 is_local_root로 판단합니다.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318/v1/traces",
+        service_name: str = "palantir-stock",
+        max_batch: int = 512,
+        timeout: float = 5.0,
+    ):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self._buffer: list[Span] = []
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="otlp")
+
+    def export(self, span: Span) -> None:
+        self._buffer.append(span)
+        if span.is_local_root or len(self._buffer) >= self.max_batch:
+            self._flush()
+
+    def payload(self, spans: list[Span]) -> dict:
+        """OTLP ExportTraceServiceRequest JSON을 만듭니다."""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": self.service_name},
+                    "spans": [s.to_otlp() for s in spans],
+                }],
+            }]
+        }
+
+    def _flush(self) -> None:
+        spans, self._buffer = self._buffer, []
+        if spans:
+            self._executor.submit(self._send, self.payload(spans))
+
+    def _send(self, payload: dict) -> None:
+        import httpx
+
+        try:
+            httpx.post(self.endpoint, json=payload, timeout=self.timeout).raise_for_status()
+        except Exception as e:
+            logger.debug(f"OTLP span 전송 실패: {e}")
+
+    def shutdown(self) -> None:
+        self._flush()
+        self._executor.shutdown(wait=True)
+
+
+class Tracer:
+    """span 생성과 내보내기를 관리합니다."""
+
+    def __init__(self, exporters: list[SpanExporter] | None = None):
+        self.exporters: list[SpanExporter] = list(exporters or [])
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        self.exporters.append(exporter)
+
+    def remove_exporter(self, exporter: SpanExporter) -> None:
+        if exporter in self.exporters:
+            self.exporters.remove(exporter)
+
+    def _end(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                logger.debug(f"span 내보내기 실패: {e}")
+
+    def shutdown(self) -> None:
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+class SpanScope:
+    """span을 시작하고 현재 span으로 설정하는 컨텍스트 매니저 (start_span 참고)."""
+
+    __slots__ = ("name", "kind", "root", "traceparent", "attributes", "span", "_token")
+
+    def __init__(
+        self,
+        name: str,
+        kind: str = "INTERNAL",
+        root: bool = False,
+        traceparent: str | None = None,
+        **attributes: Any,
+    ):
+        self.name = name
+        self.kind = kind
+        self.root = root
+        self.traceparent = traceparent
+        self.attributes = attributes
+        self.span: Span | _NoopSpan = NOOP_SPAN
+        self._token = None
+
+    def __enter__(self) -> "Span | _NoopSpan":
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return NOOP_SPAN
+
+        parent = _current_span.get()
+        if parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        elif self.root:
+            remote = parse_traceparent(self.traceparent)
+            trace_id, parent_id = remote if remote else (os.urandom(16).hex(), None)
+        else:
+            return NOOP_SPAN
+
+        self.span = Span(
+            name=self.name,
+            trace_id=trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent_id,
+            kind=self.kind,
+            start_ns=time.time_ns(),
+            is_local_root=parent is None,
+        )
+        self.span.set_attributes(self.attributes)
+        self._token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._token is None:
+            return
+        _current_span.reset(self._token)
+        self._token = None
+        if exc is not None:
+            self.span.record_exception(exc)
+        elif self.span.status == "UNSET":
+            self.span.status = "OK"
+        get_tracer()._end(self.span)
+
+    async def __aenter__(self) -> "Span | _NoopSpan":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.__exit__(exc_type, exc, tb)
+
+
+def start_span(
+    name: str,
+    kind: str = "INTERNAL",
+    root: bool = False,
+    traceparent: str | None = None,
+    **attributes: Any,
+) -> SpanScope:
+    """span을 시작하고 현재 span으로 설정하는 컨텍스트 매니저를 반환합니다.
+
+    진행 중인 trace가 없으면 root=True일 때만 새 trace를 시작하고, 아니면
+    no-op span을 반환합니다.
+
+    Args:
+        name: span 이름
+        kind: INTERNAL/SERVER/CLIENT
+        root: 진행 중인 trace가 없을 때 새 trace 시작 여부
+        traceparent: 이어받을 W3C traceparent 헤더 (root일 때)
+        **attributes: span 속성
+    """
+    return SpanScope(name, kind, root, traceparent, **attributes)
+
+
+def current_span() -> "Span | _NoopSpan":
+    """현재 span을 반환합니다 (없으면 no-op span)."""
+    return _current_span.get() or NOOP_SPAN
+
+
+def create_exporters(settings: Settings) -> list[SpanExporter]:
+    """설정에 따라 span exporter를 생성합니다.
+
+    Raises:
+        ValueError: 알 수 없는 exporter인 경우
+    """
+    exporters: list[SpanExporter] = []
+    for name in filter(None, (n.strip().lower() for n in settings.tracing_exporter.split(","))):
+        if name == "console":
+            exporters.append(ConsoleSpanExporter())
+        elif name == "otlp":
+            exporters.append(
+                OTLPSpanExporter(settings.otlp_endpoint, settings.tracing_service_name)
+            )
+        elif name == "memory":
+            exporters.append(InMemorySpanExporter())
+        else:
+            raise ValueError(f"지원하지 않는 tracing exporter: {name}")
+    return exporters
+
+
+# 기본 tracer 인스턴스
+_default_tracer: Tracer | None = None
+
+
+def get_tracer(settings: Settings | None = None) -> Tracer:
+    """기본 tracer를 반환합니다 (tracing_exporter 설정으로 exporter 구성)."""
+    global _default_tracer
+
+    if _default_tracer is None:
+        if settings is None:
+            from config.settings import settings as default_settings
+            settings = default_settings
+        _default_tracer = Tracer(create_exporters(settings))
+
+    return _default_tracer
@@ -0,0 +1,111 @@
+"""기업 분석 요청 병합 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from config.settings import Settings
+from src.agents import orchestrator
+from src.agents.orchestrator import CompanyInfoAgent
+from src.utils.singleflight import SingleFlight
+
+
+@pytest.fixture
+def flight(monkeypatch):
+    """테스트마다 새 병합기를 사용합니다."""
+    flight = SingleFlight(memo_ttl=60)
+    monkeypatch.setattr(orchestrator, "_analysis_flight", flight)
+    return flight
+
+
+def _agent(graph) -> CompanyInfoAgent:
+    agent = CompanyInfoAgent(Settings(ingest_enabled=False))
+    agent._graph = graph
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_concurrent_analyses_share_one_pipeline(flight):
+    """같은 기업(alias, 티커 포함)의 동시 분석은 파이프라인을 한 번만 실행합니다."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def ainvoke(state):
+        started.set()
+        await release.wait()
+        return {"summary": f"{state['company_name']} 요약"}
+
+    graph = AsyncMock()
+    graph.ainvoke = AsyncMock(side_effect=ainvoke)
+
+    names = ["삼성전자", "삼성전자(주)", "Samsung Electronics", "005930.KS"]
+    tasks = [asyncio.create_task(_agent(graph).analyze(n)) for n in names]
+    await started.wait()
+    release.set()
+    reports = await asyncio.gather(*tasks)
+
+    assert graph.ainvoke.await_count == 1
+    assert all(r == reports[0] for r in reports)
+    assert len({id(r) for r in reports}) == len(reports)  # 호출자별 사본
+    assert flight.stats["coalesced"] == 3
+
+    # 완료 직후 요청은 memo된 결과 사용 (사본을 바꿔도 memo에는 영향 없음)
+    reports[0].summary = "변경됨"
+    assert (await _agent(graph).analyze("삼성전자")).summary == reports[1].summary
+    assert flight.stats["memo_hits"] == 1
+    assert graph.ainvoke.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_propagate_and_are_not_memoized(flight):
+    """실패는 기다리던 모든 호출에 전파되고, 다음 호출은 다시 실행합니다."""
+    graph = AsyncMock()
+    graph.ainvoke = AsyncMock(side_effect=[RuntimeError("검색 실패"), {"summary": "요약"}])
+
+    results = await asyncio.gather(
+        _agent(graph).analyze("LG전자"), _agent(graph).analyze("LG전자"), return_exceptions=True
+    )
+    report = await _agent(graph).analyze("LG전자")
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert report.summary == "요약"
+    assert flight.stats["executions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_run():
+    """먼저 호출한 쪽이 취소되어도 공유 실행은 다른 호출자에게 결과를 줍니다."""
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return 42
+
+    first = asyncio.create_task(flight.do("k", work))
+    second = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == 42
+    assert flight.inflight == 0
+
+
+@pytest.mark.asyncio
+async def test_memo_prunes_expired_and_oldest_entries():
+    """memo는 새 결과를 저장할 때 만료된 항목과 한도를 넘은 오래된 항목을 버립니다."""
+    flight = SingleFlight(memo_ttl=0.2, memo_maxsize=2)
+
+    async def work():
+        return "결과"
+
+    await flight.do("a", work)
+    await asyncio.sleep(0.3)
+    await flight.do("b", work)
+    assert list(flight._memo) == ["b"]
+
+    await flight.do("c", work)
+    await flight.do("d", work)
+    assert list(flight._memo) == ["c", "d"]
@@ -4,7 +4,15 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from src.agents.nodes import search_node, news_node, summarize_node, error_handler_node
+from src.agents.nodes import (
+    error_handler_node,
+    graph_rag_node,
+    news_node,
+    search_node,
+    summarize_node,
+)
+from src.graph.context import assemble_context
+from src.graph.hybrid import HybridResult
 from src.models.schemas import AgentState
 
 
@@ -79,3 +87,41 @@ class TestErrorHandlerNode:
         assert "삼성전자" in result["summary"]
         assert "오류" in result["summary"]
         assert "검색 API 오류" in result["summary"]
+
+
+class TestGraphRagNode:
+    """graph_rag_node 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_graph_rag_node_sets_context_and_citations(self, initial_state):
+        """조립된 컨텍스트와 인용을 상태에 담습니다."""
+        context = assemble_context([
+            HybridResult(
+                id="doc-1",
+                content="삼성전자 HBM 공급 확대.",
+                source="vector",
+                score=0.9,
+                metadata={"url": "https://example.com/1"},
+            ),
+        ], max_tokens=200)
+        retriever = AsyncMock()
+        retriever.build_context.return_value = context
+
+        with patch("src.graph.HybridRetriever", return_value=retriever):
+            result = await graph_rag_node(initial_state)
+
+        retriever.build_context.assert_awaited_once_with(query="삼성전자", company_name="삼성전자")
+        assert result["graph_context"] == context.text
+        assert result["graph_citations"] == [
+            {
+                "index": 1,
+                "id": "doc-1",
+                "source": "vector",
+                "score": 0.9,
+                "url": "https://example.com/1",
+                "date": None,
+                "tokens": context.citations[0].tokens,
+                "trimmed": False,
+            }
+        ]
+
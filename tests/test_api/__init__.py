@@ -0,0 +1 @@
+"""API 테스트."""
@@ -0,0 +1,90 @@
+"""API 부하 테스트 생성기 테스트."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from src.api.loadtest import LoadTestResult, RequestRecord, parse_mix, run_load_test
+
+
+def make_app() -> FastAPI:
+    """엔드포인트별 고정 지연을 가진 테스트 앱 (stock은 항상 실패)."""
+    app = FastAPI()
+
+    @app.post("/analyze/company")
+    async def analyze(body: dict):
+        await asyncio.sleep(0.01)
+        return {"company_name": body["company_name"]}
+
+    @app.post("/stock/analyze")
+    async def stock(body: dict):
+        raise HTTPException(status_code=500, detail="실패")
+
+    @app.post("/graph/search")
+    async def graph(body: dict):
+        return []
+
+    @app.post("/reports/generate")
+    async def report(body: dict):
+        return {"content": "# report"}
+
+    return app
+
+
+def test_parse_mix():
+    """비율 문자열을 파싱하고 잘못된 입력은 거부합니다."""
+    assert parse_mix("analyze=1, report=4,graph") == {"analyze": 1.0, "report": 4.0, "graph": 1.0}
+    assert parse_mix("analyze=0,stock=2") == {"stock": 2.0}
+
+    for spec in ("unknown=1", "analyze=abc", "analyze=0", "analyze=-1"):
+        with pytest.raises(ValueError):
+            parse_mix(spec)
+
+
+def test_summary_percentiles_and_timeline():
+    """분위수, 오류율, 구간별 처리량을 집계합니다."""
+    records = [
+        RequestRecord("graph", started=i / 100, latency=(i + 1) / 1000, status=200)
+        for i in range(100)
+    ]
+    records.append(RequestRecord("stock", started=1.5, latency=0.2, status=500, error="HTTP 500"))
+    result = LoadTestResult(records=records, duration=2.0)
+
+    summary = result.summary()
+    assert summary["endpoints"]["graph"]["p50_ms"] == 51.0
+    assert summary["endpoints"]["graph"]["p99_ms"] == 100.0
+    assert summary["total"]["errors"] == 1
+    assert summary["total"]["throughput"] == 50.5
+
+    timeline = result.timeline(1.0)
+    assert [p["requests"] for p in timeline] == [100, 1]
+    assert timeline[1]["errors"] == 1
+    assert result.errors() == {"stock: HTTP 500": 1}
+
+
+@pytest.mark.asyncio
+async def test_closed_loop_against_app():
+    """고정 동시성으로 혼합 비율에 따라 요청하고 실패를 기록합니다."""
+    transport = ASGITransport(app=make_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        result = await run_load_test(client, "analyze=1,stock=1", duration=0.3, concurrency=4)
+
+    summary = result.summary()
+    assert set(summary["endpoints"]) == {"analyze", "stock"}
+    assert summary["endpoints"]["stock"]["error_rate"] == 1.0
+    assert summary["endpoints"]["analyze"]["error_rate"] == 0.0
+    assert summary["endpoints"]["analyze"]["p50_ms"] >= 10
+
+
+@pytest.mark.asyncio
+async def test_open_loop_sends_target_rate():
+    """목표 RPS 모드는 duration * rps개 요청을 보냅니다."""
+    transport = ASGITransport(app=make_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        result = await run_load_test(client, "graph=1,report=1", duration=0.5, rps=40)
+
+    assert len(result.records) == 20
+    assert result.summary()["total"]["error_rate"] == 0.0
+    assert result.config["rps"] == 40
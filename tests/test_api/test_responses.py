@@ -0,0 +1,124 @@
+"""API 응답 인코딩/압축/조건부 요청 테스트."""
+
+import gzip
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import create_app
+from src.api.responses import CompressionMiddleware, ORJSONResponse, choose_encoding
+from src.models.schemas import CompanyInfo, CompanyReport
+from src.reports.store import ReportStore
+
+
+def test_orjson_response_types():
+    """numpy 값과 문자열이 아닌 키를 직렬화합니다."""
+    body = ORJSONResponse({1: np.float64(0.5), "when": datetime(2026, 1, 2)}).body
+    assert body == b'{"1":0.5,"when":"2026-01-02T00:00:00"}'
+
+
+def test_choose_encoding():
+    assert choose_encoding("gzip, deflate, br", brotli_available=True) == "br"
+    assert choose_encoding("gzip, deflate, br", brotli_available=False) == "gzip"
+    assert choose_encoding("br;q=0, gzip;q=0.5", brotli_available=True) == "gzip"
+    assert choose_encoding("identity", brotli_available=True) is None
+
+
+@pytest.mark.asyncio
+async def test_compression_threshold_and_type():
+    """임계값 이상의 텍스트 응답만 압축합니다."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/big")
+    async def big():
+        return PlainTextResponse("가" * 200)
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("가")
+
+    @app.get("/binary")
+    async def binary():
+        return PlainTextResponse("x" * 500, media_type="application/octet-stream")
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        big = await client.get("/big", headers={"Accept-Encoding": "gzip"})
+        async with client.stream("GET", "/big", headers={"Accept-Encoding": "gzip"}) as raw:
+            compressed = b"".join([chunk async for chunk in raw.aiter_raw()])
+        plain = await client.get("/big", headers={"Accept-Encoding": "identity"})
+        small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+        binary = await client.get("/binary", headers={"Accept-Encoding": "gzip"})
+
+    assert big.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in big.headers["vary"].lower()
+    assert int(big.headers["content-length"]) < 600
+    assert big.text == "가" * 200  # httpx가 압축 해제
+    assert gzip.decompress(compressed).decode() == "가" * 200
+    assert "content-encoding" not in plain.headers
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in binary.headers
+
+
+@pytest.fixture
+def stored_analysis():
+    """분석 결과 하나를 저장한 기본 저장소."""
+    store = ReportStore()
+    report = CompanyReport(
+        company=CompanyInfo(name="삼성전자"),
+        summary="분석 요약 " * 300,
+        generated_at=datetime(2026, 1, 2, 9, 0, 0),
+    )
+    analysis_id = store.put(report)
+    with patch("src.reports.store._default_report_store", store):
+        yield analysis_id
+
+
+@pytest.mark.asyncio
+async def test_analysis_conditional_get(stored_analysis):
+    """저장된 분석은 ETag/Last-Modified로 재검증하면 본문 없이 304를 반환합니다."""
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get(f"/analyze/{stored_analysis}", headers={"Accept-Encoding": "gzip"})
+        etag, last_modified = first.headers["etag"], first.headers["last-modified"]
+
+        by_etag = await client.get(
+            f"/analyze/{stored_analysis}", headers={"If-None-Match": etag.removeprefix("W/")}
+        )
+        by_date = await client.get(
+            f"/analyze/{stored_analysis}", headers={"If-Modified-Since": last_modified}
+        )
+        changed = await client.get(
+            f"/analyze/{stored_analysis}", headers={"If-None-Match": 'W/"other"'}
+        )
+        missing = await client.get("/analyze/unknown")
+
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.json()["company_name"] == "삼성전자"
+    assert by_etag.status_code == 304 and by_etag.content == b""
+    assert by_etag.headers["etag"] == etag
+    assert by_date.status_code == 304
+    assert changed.status_code == 200
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_report_view_not_modified_skips_rendering(stored_analysis):
+    """HTML 리포트 재검증이 일치하면 리포트를 다시 렌더링하지 않습니다."""
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        url = f"/reports/view/삼성전자?analysis_id={stored_analysis}"
+        first = await client.get(url)
+        with patch("src.api.routes.reports.ReportGenerator") as generator:
+            again = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200 and "삼성전자" in first.text
+    assert again.status_code == 304
+    generator.assert_not_called()
@@ -0,0 +1,54 @@
+"""주식 API 라우트 테스트."""
+
+import math
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import create_app
+from src.stock import StockClient
+from src.stock.models import StockInfo, StockPrice
+
+
+def _prices(days: int = 80) -> list[StockPrice]:
+    start = datetime(2026, 1, 1)
+    prices = []
+    for i in range(days):
+        close = 70000 + 3000 * math.sin(i / 5) + 50 * i
+        prices.append(StockPrice(
+            date=start + timedelta(days=i),
+            open=close - 100,
+            high=close + 300,
+            low=close - 300,
+            close=close,
+            volume=1_000_000 + i,
+        ))
+    return prices
+
+
+@pytest.mark.asyncio
+async def test_analyze_stock_response_fields():
+    """기술적 지표 응답은 MACD/볼린저 밴드 세부 값과 이동평균을 포함합니다."""
+    info = StockInfo(ticker="005930.KS", name="삼성전자")
+    with (
+        patch.object(StockClient, "get_info", AsyncMock(return_value=info)),
+        patch.object(StockClient, "get_prices", AsyncMock(return_value=_prices())),
+    ):
+        transport = ASGITransport(app=create_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/stock/analyze", json={"company_name": "삼성전자"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ticker"] == "005930.KS"
+    assert data["volume"] == 1_000_079
+
+    indicators = data["indicators"]
+    assert 0 <= indicators["rsi"] <= 100
+    assert set(indicators["macd"]) == {"macd", "signal", "histogram"}
+    bollinger = indicators["bollinger"]
+    assert bollinger["lower"] < bollinger["middle"] < bollinger["upper"]
+    assert indicators["sma_20"] == pytest.approx(bollinger["middle"], abs=0.01)
+    assert indicators["sma_50"] is not None
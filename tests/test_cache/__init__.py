@@ -0,0 +1 @@
+"""공유 캐시 테스트."""
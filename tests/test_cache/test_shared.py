@@ -0,0 +1,177 @@
+"""공유 캐시/저장소/워커 등록부 테스트."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.cache import MemoryStore, SharedCache, SQLiteStore, WorkerRegistry
+from src.search import CachedSearchProvider
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "shared.sqlite3"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_commands(db_path):
+    """문자열/리스트/해시 명령과 만료를 지원합니다."""
+    store = SQLiteStore(db_path)
+
+    await store.set("a", "1")
+    await store.set("short", "x", ex=0.05)
+    assert await store.get("a") == "1"
+    assert await store.incr("a") == 2
+    assert await store.decr("counter") == -1
+
+    await asyncio.sleep(0.1)
+    assert await store.get("short") is None
+
+    await store.rpush("queue", "job-1")
+    await store.rpush("queue", "job-2")
+    assert await store.blpop(["queue"], timeout=0.1) == ("queue", "job-1")
+    assert await store.blpop(["queue"], timeout=0.1) == ("queue", "job-2")
+    assert await store.blpop(["queue"], timeout=0.1) is None
+
+    await store.hset("h", "f1", "v1")
+    await store.hset("h", "f2", "v2")
+    await store.hdel("h", "f1")
+    assert await store.hgetall("h") == {"f2": "v2"}
+
+    await store.delete("a", "h")
+    assert await store.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_blpop_waits_without_write_lock(db_path):
+    """빈 대기열을 기다리는 동안 쓰기 잠금을 잡지 않고, 항목이 들어오면 꺼냅니다."""
+    store = SQLiteStore(db_path)
+    other = SQLiteStore(db_path)
+    statements = []
+    store.conn.set_trace_callback(statements.append)
+
+    waiter = asyncio.create_task(store.blpop(["queue"], timeout=2))
+    await asyncio.sleep(0.3)
+    assert not any(s.startswith("BEGIN") for s in statements)
+
+    await other.rpush("queue", "job-1")
+    assert await waiter == ("queue", "job-1")
+    assert statements.count("BEGIN IMMEDIATE") == 1
+    assert await store.hgetall("h") == {}
+    await store.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_are_shared_across_workers(db_path):
+    """같은 SQLite 파일을 쓰는 캐시끼리는 다른 인스턴스가 저장한 값도 적중합니다."""
+    worker_a = SharedCache(SQLiteStore(db_path), backend="sqlite")
+    worker_b = SharedCache(SQLiteStore(db_path), backend="sqlite")
+
+    assert await worker_a.get("search", "삼성전자 뉴스") is None
+    await worker_a.set("search", "삼성전자 뉴스", {"results": [1, 2]}, ttl=60)
+    await worker_a.set("search", "disabled", {"x": 1}, ttl=0)
+
+    assert await worker_b.get("search", "삼성전자 뉴스") == {"results": [1, 2]}
+    assert await worker_b.get("search", "disabled") is None
+    assert worker_a.stats() == {"search": {"hits": 0, "misses": 1}}
+    assert worker_b.stats() == {"search": {"hits": 1, "misses": 1}}
+    assert worker_b.is_shared and not SharedCache(MemoryStore()).is_shared
+
+
+@pytest.mark.asyncio
+async def test_memory_store_is_bounded(monkeypatch):
+    """memory 저장소는 maxsize를 넘으면 LRU로 제거하고, 만료 항목을 주기적으로 정리합니다."""
+    from src.cache import memory
+
+    store = MemoryStore(maxsize=2)
+    await store.set("a", "1")
+    await store.set("b", "2")
+    assert await store.get("a") == "1"  # b가 가장 오래 쓰지 않은 항목
+    await store.set("c", "3")
+    assert await store.get("b") is None
+    assert len(store) == 2
+
+    monkeypatch.setattr(memory, "PURGE_EVERY", 2)
+    store = MemoryStore()
+    await store.set("expired", "x", ex=0.01)
+    await asyncio.sleep(0.02)
+    await store.set("fresh", "y")
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_store_errors_are_misses():
+    """저장소 오류는 예외 대신 미스로 처리합니다."""
+    store = MagicMock()
+    store.get = AsyncMock(side_effect=ConnectionError("down"))
+    store.set = AsyncMock(side_effect=ConnectionError("down"))
+    cache = SharedCache(store, backend="redis")
+
+    await cache.set("llm", "prompt", {"text": "응답"}, ttl=60)
+    assert await cache.get("llm", "prompt") is None
+
+
+@pytest.mark.asyncio
+async def test_cached_search_provider(mock_search_results):
+    """같은 쿼리는 프로바이더를 다시 호출하지 않습니다."""
+    provider = MagicMock()
+    provider.name = "tavily"
+    provider.search = AsyncMock(return_value=mock_search_results)
+    provider.news_search = AsyncMock(return_value=mock_search_results)
+    cached = CachedSearchProvider(provider, cache=SharedCache(MemoryStore()), ttl=60)
+
+    first = await cached.search("삼성전자")
+    second = await cached.search("삼성전자")
+    await cached.news_search("삼성전자")
+
+    assert second == first
+    assert provider.search.await_count == 1
+    assert provider.news_search.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_registry_reports_each_worker(db_path):
+    """워커별 준비 상태를 보고하고, heartbeat가 끊긴 워커는 준비되지 않음으로 표시합니다."""
+    store = SQLiteStore(db_path)
+    registry = WorkerRegistry(store, heartbeat=60)
+    await registry.start()
+
+    # 다른 워커: 정상, heartbeat 끊김, 오래전에 죽음
+    now = time.time()
+    for worker_id, age in (("host:2", 1), ("host:3", 200), ("host:4", 5000)):
+        await store.hset("ps:workers", worker_id, json.dumps({
+            "id": worker_id, "pid": 0, "ready": True, "started_at": now - age, "last_seen": now - age,
+        }))
+
+    workers = {w["id"]: w for w in await registry.workers()}
+    assert workers[registry.worker_id]["ready"] and workers[registry.worker_id]["current"]
+    assert workers["host:2"]["ready"]
+    assert not workers["host:3"]["ready"]
+    assert "host:4" not in workers
+
+    await registry.stop()
+    assert registry.worker_id not in {w["id"] for w in await registry.workers()}
+
+
+@pytest.mark.asyncio
+async def test_worker_registry_degrades_when_store_is_down():
+    """저장소 오류에도 워커는 시작하고 degraded로 보고하며, 복구되면 다시 준비됩니다."""
+    store = MemoryStore()
+    store.hset = AsyncMock(side_effect=ConnectionError("redis down"))
+    store.hgetall = AsyncMock(side_effect=ConnectionError("redis down"))
+    registry = WorkerRegistry(store, heartbeat=60)
+
+    await registry.start()
+    (worker,) = await registry.workers()
+    assert not worker["ready"] and worker["error"] == "redis down"
+
+    healthy = MemoryStore()
+    store.hset, store.hgetall = healthy.hset, healthy.hgetall
+    assert await registry._publish()
+    (worker,) = await registry.workers()
+    assert worker["ready"] and worker.get("error") is None
+
+    await registry.stop()
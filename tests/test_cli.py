@@ -59,3 +59,31 @@ def test_datasets_without_palantir_config(monkeypatch):
 
     assert result.exit_code == 1
     assert "Palantir" in result.stdout
+
+
+def test_graph_export_streams_nodes_to_jsonl(monkeypatch, tmp_path):
+    """graph-export는 export_nodes 배치를 JSONL로 씁니다."""
+    import json
+    from unittest.mock import MagicMock
+
+    import src.graph
+    from src.graph import GraphRepository
+
+    client = MagicMock()
+    client.is_available = True
+    monkeypatch.setattr(src.graph, "get_neo4j_client", lambda settings: client)
+
+    async def export_nodes(self, node_type, batch_size=500):
+        yield [{"name": "삼성전자"}, {"name": "SK하이닉스"}]
+
+    monkeypatch.setattr(GraphRepository, "export_nodes", export_nodes)
+    output = tmp_path / "companies.jsonl"
+
+    result = runner.invoke(app, ["graph-export", str(output), "--type", "Company"])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert lines == [
+        {"label": "Company", "name": "삼성전자"},
+        {"label": "Company", "name": "SK하이닉스"},
+    ]
@@ -0,0 +1 @@
+"""그래프 모듈 테스트."""
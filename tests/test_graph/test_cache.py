@@ -0,0 +1,53 @@
+"""검색 캐시 세대 카운터 테스트."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.graph import GraphRepository
+from src.graph.cache import GenerationTracker, RetrievalCache
+from src.graph.schema import Company
+
+
+@pytest.mark.asyncio
+async def test_repository_writes_bump_generations():
+    """그래프 쓰기는 관련 기업과 전역 세대를 올립니다."""
+    client = MagicMock()
+    client.execute_query = AsyncMock(return_value=[])
+    generations = GenerationTracker()
+    repo = GraphRepository(client, generations=generations)
+
+    await repo.create_company(Company(name="삼성전자"))
+    await repo.link_company_to_document("삼성전자", "doc-1")
+    await repo.link_companies_as_competitors("삼성전자", "SK하이닉스")
+
+    assert generations.get("삼성전자") == 3
+    assert generations.get("SK하이닉스") == 1
+    assert generations.get("카카오") == 0
+    assert generations.get() == 3
+
+
+def test_generations_shared_across_aliases():
+    """같은 기업의 다른 표기는 같은 세대를 공유합니다."""
+    generations = GenerationTracker()
+
+    generations.bump("삼성전자")
+
+    assert generations.get("Samsung Electronics") == 1
+    assert generations.get("005930.KS") == 1
+    assert generations.get("삼성전자(주)") == 1
+    assert generations.get("삼성SDI") == 0
+
+
+def test_cache_entry_invalidated_by_generation():
+    """저장 이후 세대가 바뀐 항목은 반환하지 않습니다."""
+    cache = RetrievalCache(GenerationTracker(), maxsize=2)
+    cache.put("k", "삼성전자", "value", generation=0)
+
+    assert cache.get("k", "삼성전자") == "value"
+    cache.generations.bump("삼성전자")
+    assert cache.get("k", "삼성전자") is None
+
+    # 조회 도중 쓰기가 있었으면 저장하지 않음
+    cache.put("k", "삼성전자", "stale", generation=0)
+    assert len(cache) == 0
@@ -0,0 +1,30 @@
+"""split_text 테스트."""
+
+from src.graph.chunking import split_text
+
+
+def test_short_text_is_single_chunk():
+    """chunk_size 이하 텍스트는 그대로 반환합니다."""
+    assert split_text("짧은 문서입니다.", chunk_size=100) == ["짧은 문서입니다."]
+    assert split_text("   ") == []
+
+
+def test_chunks_respect_size_and_overlap():
+    """청크는 chunk_size를 넘지 않고 이전 청크와 겹칩니다."""
+    text = "\n\n".join(f"문단 {i}의 첫 문장입니다. 문단 {i}의 둘째 문장입니다." for i in range(40))
+
+    chunks = split_text(text, chunk_size=200, overlap=50)
+
+    assert len(chunks) > 1
+    assert all(len(c) <= 200 for c in chunks)
+    for prev, nxt in zip(chunks, chunks[1:]):
+        head = nxt.split(". ")[0]
+        assert head in prev
+
+
+def test_long_sentence_is_hard_split():
+    """경계가 없는 긴 문장은 고정 길이로 자릅니다."""
+    chunks = split_text("가" * 450, chunk_size=200, overlap=20)
+
+    assert "".join(chunks) == "가" * 450
+    assert all(len(c) <= 200 for c in chunks)
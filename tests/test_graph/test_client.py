@@ -0,0 +1,118 @@
+"""Neo4jClient 테스트."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from config.settings import Settings
+from src.graph import Neo4jClient
+
+
+class FakeRecord:
+    """테스트용 Neo4j 레코드."""
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def data(self) -> dict:
+        return self._data
+
+
+class FakeResult:
+    """커서처럼 동작하는 테스트용 결과 객체."""
+
+    def __init__(self, rows: list[dict]):
+        self._records = [FakeRecord(r) for r in rows]
+        self._pos = 0
+
+    async def fetch(self, n: int) -> list[FakeRecord]:
+        batch = self._records[self._pos:self._pos + n]
+        self._pos += len(batch)
+        return batch
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> FakeRecord:
+        if self._pos >= len(self._records):
+            raise StopAsyncIteration
+        record = self._records[self._pos]
+        self._pos += 1
+        return record
+
+
+class FakeSession:
+    """테스트용 세션."""
+
+    def __init__(self, rows: list[dict]):
+        self._rows = rows
+
+    async def run(self, query, parameters):
+        return FakeResult(self._rows)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def client():
+    """가짜 드라이버가 연결된 클라이언트를 반환합니다."""
+    settings = Settings(
+        neo4j_uri="bolt://localhost:7687",
+        neo4j_user="neo4j",
+        neo4j_password="test",
+        neo4j_fetch_size=50,
+    )
+    client = Neo4jClient(settings)
+    driver = MagicMock()
+    driver.session.side_effect = lambda **config: FakeSession(
+        [{"id": i} for i in range(5)]
+    )
+    client._driver = driver
+    return client
+
+
+class TestIterQuery:
+    """iter_query 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_yields_records(self, client):
+        """레코드를 하나씩 반환합니다."""
+        records = [r async for r in client.iter_query("MATCH (n) RETURN n.id AS id")]
+
+        assert records == [{"id": i} for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_yields_batches(self, client):
+        """batch_size를 지정하면 배치 단위로 반환합니다."""
+        batches = [
+            b async for b in client.iter_query("MATCH (n) RETURN n.id AS id", batch_size=2)
+        ]
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert batches[-1] == [{"id": 4}]
+
+    @pytest.mark.asyncio
+    async def test_uses_configured_fetch_size(self, client):
+        """설정된 fetch_size로 세션을 엽니다."""
+        _ = [r async for r in client.iter_query("RETURN 1")]
+        client._driver.session.assert_called_with(fetch_size=50)
+
+        _ = [r async for r in client.iter_query("RETURN 1", fetch_size=10)]
+        client._driver.session.assert_called_with(fetch_size=10)
+
+    @pytest.mark.asyncio
+    async def test_span_covers_consumption(self, client, monkeypatch):
+        """stream span은 레코드를 모두 소비한 뒤에 닫힙니다."""
+        import src.utils.tracing as tracing
+
+        exporter = tracing.InMemorySpanExporter()
+        monkeypatch.setattr(tracing, "_default_tracer", tracing.Tracer([exporter]))
+
+        with tracing.start_span("export", root=True):
+            async for _ in client.iter_query("MATCH (n) RETURN n.id AS id"):
+                assert [s.name for s in exporter.spans] == []
+
+        _root, stream = exporter.get_finished_spans()
+        assert stream.name == "neo4j.stream"
+        assert stream.attributes["db.record_count"] == 5
@@ -0,0 +1,60 @@
+"""컨텍스트 조립 테스트."""
+
+from src.graph.context import assemble_context, trim_to_sentences
+from src.graph.hybrid import HybridResult
+from src.utils.tokens import count_tokens
+
+
+def _result(id: str, content: str, score: float = 1.0, url: str | None = None) -> HybridResult:
+    return HybridResult(
+        id=id,
+        content=content,
+        source="vector",
+        score=score,
+        metadata={"url": url} if url else {},
+    )
+
+
+def test_skips_oversized_and_keeps_smaller():
+    """들어가지 않는 구간은 건너뛰고 뒤의 짧은 구간을 계속 담습니다."""
+    long_text = "가" * 500
+    results = [
+        _result("doc-1", "삼성전자 HBM 공급 확대."),
+        _result("doc-2", long_text),
+        _result("doc-3", "SK하이닉스 실적 발표."),
+    ]
+
+    context = assemble_context(results, max_tokens=60, max_passage_tokens=60)
+
+    assert [c.id for c in context.citations] == ["doc-1", "doc-3"]
+    assert context.skipped["budget"] == 1
+    assert context.tokens <= 60
+    assert context.text.startswith("[1] 삼성전자")
+    assert "[2] SK하이닉스" in context.text
+
+
+def test_near_duplicates_are_removed():
+    """거의 같은 구간은 한 번만 포함합니다."""
+    results = [
+        _result("doc-1", "삼성전자가 HBM3E 12단 제품의 엔비디아 공급을 확대한다.", url="https://a.com/1"),
+        _result("doc-2", "삼성전자가 HBM3E 12단 제품의 엔비디아 공급을 확대한다!"),
+        _result("doc-3", "현대차 전기차 판매 증가."),
+    ]
+
+    context = assemble_context(results, max_tokens=500)
+
+    assert [c.id for c in context.citations] == ["doc-1", "doc-3"]
+    assert context.citations[0].url == "https://a.com/1"
+    assert context.skipped["duplicate"] == 1
+
+
+def test_long_passage_trimmed_to_sentences():
+    """구간 한도를 넘는 구간은 문장 경계에서 자릅니다."""
+    text = "첫 번째 문장입니다. 두 번째 문장입니다. 세 번째 문장입니다."
+    limit = count_tokens("첫 번째 문장입니다. 두 번째 문장입니다.")
+
+    assert trim_to_sentences(text, limit) == "첫 번째 문장입니다. 두 번째 문장입니다."
+
+    context = assemble_context([_result("doc-1", text)], max_tokens=200, max_passage_tokens=limit)
+    assert context.citations[0].trimmed
+    assert context.text == "[1] 첫 번째 문장입니다. 두 번째 문장입니다."
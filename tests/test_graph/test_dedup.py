@@ -0,0 +1,76 @@
+"""콘텐츠 지문 중복 제거 테스트."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.graph import VectorStore
+from src.graph.dedup import IngestionIndex, canonicalize_url, fingerprint
+from src.graph.embeddings import HashingEmbeddingFunction
+
+
+def test_canonicalize_url():
+    """추적 파라미터, www, 프래그먼트, 끝 슬래시를 제거합니다."""
+    assert canonicalize_url("HTTPS://www.Example.com/news/1/?utm_source=x&b=2&a=1#top") == (
+        "https://example.com/news/1?a=1&b=2"
+    )
+    assert canonicalize_url("") is None
+
+
+def test_fingerprint_is_stable():
+    """같은 기사는 표기가 달라도 같은 문서 ID를 갖습니다."""
+    a = fingerprint("https://example.com/a?utm_medium=rss", "삼성전자  실적\n발표")
+    b = fingerprint("https://www.example.com/a/", "삼성전자 실적 발표")
+
+    assert a.doc_id == b.doc_id
+    assert a.text_key == b.text_key
+
+
+def test_index_persists(tmp_path):
+    """수집 키가 파일에 기록되어 재시작 후에도 유지됩니다."""
+    path = tmp_path / "index.txt"
+    fp = fingerprint(None, "본문")
+
+    index = IngestionIndex(path)
+    assert not index.is_seen(fp)
+    index.mark_seen(fp)
+    index.mark_seen(fp)
+
+    reloaded = IngestionIndex(path)
+    assert reloaded.is_seen(fp)
+    assert path.read_text().count("\n") == 1
+
+
+def test_index_matches_same_text_on_other_url():
+    """URL이 달라도 본문이 같으면 이미 수집된 것으로 봅니다."""
+    index = IngestionIndex()
+    index.mark_seen(fingerprint("https://a.com/1", "같은 본문"))
+
+    assert index.is_seen(fingerprint("https://mirror.com/1", "같은 본문"))
+
+
+@pytest.mark.asyncio
+async def test_vector_store_skips_existing_ids():
+    """이미 임베딩된 문서는 다시 임베딩하지 않습니다."""
+    store = VectorStore(embedding_function=HashingEmbeddingFunction())
+    collection = MagicMock()
+    collection.get.return_value = {"ids": ["doc-existing"]}
+    store._collection = collection
+
+    ids = await store.add_documents(
+        [
+            {"id": "doc-existing", "content": "기존"},
+            {"content": "신규 문서", "metadata": {"url": "https://a.com/n"}},
+            {"content": "신규 문서", "metadata": {"url": "https://a.com/n"}},
+        ]
+    )
+
+    assert ids[0] == "doc-existing"
+    assert ids[1] == ids[2] == fingerprint("https://a.com/n", "신규 문서").doc_id
+    upserted = collection.upsert.call_args.kwargs["ids"]
+    assert upserted == [ids[1]]
+
+    collection.reset_mock()
+    await store.add_document(ids[1], "신규 문서")
+    collection.upsert.assert_not_called()
+    collection.get.assert_not_called()
@@ -0,0 +1,134 @@
+"""EntityExtractor 청크 추출 테스트."""
+
+import asyncio
+import json
+
+import pytest
+
+from config.settings import Settings
+from src.graph import EntityExtractor, EntityResolver
+from src.graph.dedup import IngestionIndex
+from src.graph.schema import RelationType
+
+
+class FakeLLM:
+    """청크마다 같은 엔티티를 돌려주는 테스트용 LLM."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_with_usage(self, prompt: str, system: str | None = None):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+        data = {
+            "companies": [{"name": "Samsung Electronics", "industry": "반도체"}],
+            "people": [{"name": "이재용", "role": "회장", "company": "삼성전자"}],
+            "events": [{"type": "earnings", "title": "3분기 실적 발표", "date": "2024-10-31"}],
+            "industries": [{"name": "반도체", "sector": "IT"}],
+        }
+        return json.dumps(data, ensure_ascii=False), 100
+
+
+@pytest.fixture
+def extractor():
+    """작은 청크 크기로 설정된 추출기를 반환합니다."""
+    resolver = EntityResolver()
+    resolver.seed_from_ticker_map()
+    settings = Settings(
+        extraction_chunk_size=300,
+        extraction_chunk_overlap=50,
+        extraction_concurrency=2,
+    )
+    return EntityExtractor(
+        llm_client=FakeLLM(),
+        resolver=resolver,
+        settings=settings,
+        index=IngestionIndex(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_document_covers_whole_text(extractor):
+    """긴 문서 전체를 청크로 나눠 추출하고 결과를 병합합니다."""
+    content = "\n\n".join(f"삼성전자 관련 {i}번째 문단입니다. 실적이 발표되었습니다." for i in range(60))
+
+    result = await extractor.process_document("삼성전자 실적", content, url="https://a.com/1")
+
+    assert result["chunks"] > 1
+    assert result["chunks"] == extractor.llm.calls
+    assert result["tokens"] == 100 * result["chunks"]
+
+    entities = result["entities"]
+    assert [c.name for c in entities["companies"]] == ["삼성전자"]
+    assert len(entities["people"]) == 1
+    assert len(entities["events"]) == 1
+
+    keys = [(r.type, r.source_id, r.target_id) for r in result["relationships"]]
+    assert len(keys) == len(set(keys))
+    affected = [r for r in result["relationships"] if r.type == RelationType.AFFECTED_BY]
+    assert [r.target_id for r in affected] == [entities["events"][0].id]
+    assert any(r.type == RelationType.MENTIONED_IN for r in result["relationships"])
+
+
+@pytest.mark.asyncio
+async def test_extract_entities_chunks_long_text(extractor):
+    """chunk_size를 넘는 텍스트도 잘라내지 않고 청크별로 추출해 병합합니다."""
+    short = await extractor.extract_entities("삼성전자 실적 발표")
+    assert extractor.llm.calls == 1
+
+    text = "\n\n".join(f"{i}번째 문단입니다. " * 5 for i in range(20))
+    entities = await extractor.extract_entities(text)
+
+    assert extractor.llm.calls > 2
+    assert [c.name for c in entities["companies"]] == [c.name for c in short["companies"]]
+    assert len(entities["events"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped(extractor):
+    """동시 LLM 호출 수가 설정값을 넘지 않습니다."""
+    content = "\n\n".join(f"{i}번째 문단입니다. " * 5 for i in range(40))
+
+    await asyncio.gather(
+        extractor.process_document("문서 A", content),
+        extractor.process_document("문서 B", content),
+    )
+
+    assert extractor.llm.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_seen_document_skips_llm(extractor):
+    """이미 수집한 문서는 LLM 호출 없이 건너뜁니다."""
+    first = await extractor.process_document("삼성전자 실적", "본문", url="https://a.com/1?utm_source=x")
+    calls = extractor.llm.calls
+
+    again = await extractor.process_document("삼성전자 실적", "본문", url="https://www.a.com/1")
+
+    assert first["skipped"] is False
+    assert again["skipped"] is True
+    assert again["document"].id == first["document"].id
+    assert extractor.llm.calls == calls
+
+
+@pytest.mark.asyncio
+async def test_event_ids_are_deterministic(extractor):
+    """같은 문서를 다시 추출해도 이벤트 ID가 같아 MERGE가 멱등입니다."""
+    url = "https://a.com/1"
+    first = await extractor.process_document("삼성전자 실적", "본문", url=url, mark_seen=False)
+    again = await extractor.process_document("삼성전자 실적", "본문", url=url, mark_seen=False)
+    other = await extractor.process_document("삼성전자 공시", "본문", mark_seen=False)
+
+    event_id = first["entities"]["events"][0].id
+    assert again["entities"]["events"][0].id == event_id
+    assert other["entities"]["events"][0].id != event_id
+    affected = [r for r in again["relationships"] if r.type == RelationType.AFFECTED_BY]
+    assert [r.target_id for r in affected] == [event_id]
+
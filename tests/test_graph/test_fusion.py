@@ -0,0 +1,45 @@
+"""융합 전략 및 평가 지표 테스트."""
+
+import pytest
+
+from src.graph.evaluation import recall_at_k
+from src.graph.fusion import get_fusion, reciprocal_rank_fusion, weighted_sum_fusion
+
+
+def test_rrf_rewards_agreement_across_sources():
+    """여러 소스에서 상위에 오른 문서가 가장 높은 점수를 받습니다."""
+    rankings = {
+        "vector": [("a", 0.9), ("b", 0.8), ("c", 0.1)],
+        "graph": [("b", 0.5), ("c", 0.5)],
+    }
+
+    scores = reciprocal_rank_fusion(rankings, k=60)
+
+    assert max(scores, key=scores.get) == "b"
+    assert scores["a"] == pytest.approx(1.0)
+
+
+def test_weighted_sum_normalizes_each_source():
+    """소스별 min-max 정규화 후 가중합을 계산합니다."""
+    rankings = {
+        "vector": [("a", 0.9), ("b", 0.5), ("c", 0.1)],
+        "graph": [("c", 0.5)],
+    }
+
+    scores = weighted_sum_fusion(rankings, weights={"vector": 0.5, "graph": 0.5})
+
+    assert scores == pytest.approx({"a": 0.5, "b": 0.25, "c": 0.5})
+
+
+def test_unknown_fusion():
+    """알 수 없는 전략은 ValueError를 발생시킵니다."""
+    assert get_fusion("RRF") is reciprocal_rank_fusion
+    with pytest.raises(ValueError):
+        get_fusion("borda")
+
+
+def test_recall_at_k():
+    """상위 k개 안의 정답 비율을 계산합니다."""
+    assert recall_at_k(["a", "b", "c"], ["a", "c"], k=2) == 0.5
+    assert recall_at_k(["a", "b", "c"], ["a", "c"], k=3) == 1.0
+    assert recall_at_k(["a"], [], k=1) == 0.0
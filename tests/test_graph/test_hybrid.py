@@ -0,0 +1,182 @@
+"""HybridRetriever 테스트."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from config.settings import Settings
+from src.graph import HybridRetriever
+from src.graph.cache import GenerationTracker, RetrievalCache
+from src.graph.reranker import Reranker, lexical_scorer
+from src.graph.schema import Document, Event
+
+
+def _delayed(value, delay: float):
+    """delay초 뒤 value를 반환하는 AsyncMock을 만듭니다."""
+
+    async def side_effect(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return value
+
+    return AsyncMock(side_effect=side_effect)
+
+
+@pytest.fixture(autouse=True)
+def retrieval_cache(monkeypatch):
+    """테스트마다 새 검색 캐시를 사용합니다."""
+    cache = RetrievalCache(GenerationTracker())
+    monkeypatch.setattr("src.graph.hybrid.get_retrieval_cache", lambda settings=None: cache)
+    return cache
+
+
+@pytest.fixture
+def vector_store():
+    """테스트용 벡터 저장소를 반환합니다."""
+    store = MagicMock()
+    store.search_by_company = _delayed(
+        [{"id": "doc-v", "content": "벡터 문서", "metadata": {}, "distance": 0.2}], 0.1
+    )
+    return store
+
+
+@pytest.fixture
+def graph_repo():
+    """테스트용 그래프 저장소를 반환합니다."""
+    repo = MagicMock()
+    repo.is_available = True
+    repo.get_company_documents = _delayed([Document(id="doc-g", type="news", title="그래프 문서")], 0.1)
+    repo.get_company_events = _delayed(
+        [Event(id="evt-1", title="실적 발표", type="earnings", date=datetime(2026, 1, 1))], 0.1
+    )
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_branches_run_concurrently(vector_store, graph_repo):
+    """벡터/문서/이벤트 브랜치를 동시에 실행하고 소요 시간을 기록합니다."""
+    retriever = HybridRetriever(vector_store, graph_repo, settings=Settings())
+
+    started = asyncio.get_running_loop().time()
+    retrieval = await retriever.retrieve("실적", company_name="삼성전자")
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert elapsed < 0.25
+    assert {r.id for r in retrieval.results} == {"doc-v", "doc-g", "evt-1"}
+    assert set(retrieval.metadata["timings"]) == {"vector", "graph_documents", "graph_events"}
+    assert not retrieval.partial
+
+
+@pytest.mark.asyncio
+async def test_slow_and_failed_branches_degrade(vector_store, graph_repo):
+    """시간 초과/실패 브랜치는 빼고 부분 결과를 반환합니다."""
+    graph_repo.get_company_documents = _delayed([], 5)
+    graph_repo.get_company_events = AsyncMock(side_effect=RuntimeError("neo4j down"))
+    settings = Settings(retrieval_graph_timeout=0.2)
+    retriever = HybridRetriever(vector_store, graph_repo, settings=settings)
+
+    retrieval = await retriever.retrieve("실적", company_name="삼성전자")
+
+    assert [r.id for r in retrieval.results] == ["doc-v"]
+    assert retrieval.partial
+    assert retrieval.metadata["errors"] == {
+        "graph_documents": "timeout",
+        "graph_events": "neo4j down",
+    }
+    assert retrieval.metadata["timings"]["graph_documents"] < 1000
+
+
+@pytest.mark.asyncio
+async def test_dedup_on_document_identity(vector_store, graph_repo):
+    """ID가 달라도 정규 URL이 같으면 하나의 hybrid 결과로 병합합니다."""
+    vector_store.search_by_company = AsyncMock(return_value=[
+        {
+            "id": "doc-abc",
+            "content": "본문 구간",
+            "metadata": {"url": "https://www.example.com/news/1?utm_source=x"},
+            "distance": 0.3,
+        },
+        {"id": "doc-other", "content": "다른 문서", "metadata": {}, "distance": 0.1},
+    ])
+    graph_repo.get_company_documents = AsyncMock(return_value=[
+        Document(id="legacy-1", type="news", title="제목", url="https://example.com/news/1"),
+    ])
+    graph_repo.get_company_events = AsyncMock(return_value=[])
+    retriever = HybridRetriever(vector_store, graph_repo, settings=Settings(), fusion="rrf")
+
+    results = await retriever.search("실적", company_name="삼성전자", n_results=4)
+
+    assert [r.id for r in results] == ["doc-abc", "doc-other"]
+    assert results[0].source == "hybrid"
+    assert results[0].content == "본문 구간"
+    vector_store.search_by_company.assert_awaited_once_with(
+        query="실적", company_name="삼성전자", n_results=6
+    )
+
+
+@pytest.mark.asyncio
+async def test_rerank_stage(vector_store, graph_repo):
+    """재순위화 백엔드를 켜면 후보를 쿼리 관련도순으로 재정렬합니다."""
+    reranker = Reranker(lexical_scorer)
+    retriever = HybridRetriever(vector_store, graph_repo, settings=Settings(), reranker=reranker)
+
+    retrieval = await retriever.retrieve("실적 발표", company_name="삼성전자")
+
+    assert retrieval.results[0].id == "evt-1"
+    assert retrieval.metadata["rerank"]["reranked"]
+    assert "rerank" in retrieval.metadata["timings"]
+
+
+@pytest.mark.asyncio
+async def test_retrieval_cached_until_company_generation_changes(
+    vector_store, graph_repo, retrieval_cache
+):
+    """같은 기업 데이터가 바뀌기 전까지 캐시된 검색 결과를 재사용합니다."""
+    retriever = HybridRetriever(vector_store, graph_repo, settings=Settings())
+
+    first = await retriever.retrieve("실적", company_name="삼성전자")
+    second = await retriever.retrieve("실적", company_name="삼성전자")
+    retrieval_cache.generations.bump("SK하이닉스")
+    third = await retriever.retrieve("실적", company_name="삼성전자")
+    retrieval_cache.generations.bump("삼성전자")
+    fourth = await retriever.retrieve("실적", company_name="삼성전자")
+
+    assert vector_store.search_by_company.await_count == 2
+    assert "cached" not in first.metadata
+    assert second.metadata["cached"] and third.metadata["cached"]
+    assert "cached" not in fourth.metadata
+    assert [r.id for r in second.results] == [r.id for r in first.results]
+
+
+@pytest.mark.asyncio
+async def test_cached_alias_invalidated_by_canonical_write(
+    vector_store, graph_repo, retrieval_cache
+):
+    """영문명으로 캐시된 결과도 정규 이름 쓰기에 무효화되고, 복사본으로 반환됩니다."""
+    retriever = HybridRetriever(vector_store, graph_repo, settings=Settings())
+
+    first = await retriever.retrieve("실적", company_name="Samsung Electronics")
+    first.results[0].metadata["mutated"] = True
+    first.results.clear()
+    second = await retriever.retrieve("실적", company_name="005930.KS")
+    retrieval_cache.generations.bump("삼성전자")
+    third = await retriever.retrieve("실적", company_name="Samsung Electronics")
+
+    assert second.metadata["cached"]
+    assert second.results and "mutated" not in second.results[0].metadata
+    assert "cached" not in third.metadata
+    assert vector_store.search_by_company.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_partial_results_not_cached(vector_store, graph_repo, retrieval_cache):
+    """브랜치가 실패한 부분 결과는 캐시하지 않습니다."""
+    graph_repo.get_company_events = AsyncMock(side_effect=RuntimeError("neo4j down"))
+    retriever = HybridRetriever(vector_store, graph_repo, settings=Settings())
+
+    await retriever.retrieve("실적", company_name="삼성전자")
+    await retriever.retrieve("실적", company_name="삼성전자")
+
+    assert vector_store.search_by_company.await_count == 2
+    assert len(retrieval_cache) == 0
@@ -0,0 +1,305 @@
+"""IngestionPipeline 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from config.settings import Settings
+from src.graph import GraphRepository
+from src.graph.cache import GenerationTracker
+from src.graph.dedup import IngestionIndex, fingerprint
+from src.graph.ingestion import IngestionItem, IngestionPipeline, items_from_agent_state
+from src.graph.resolver import EntityResolver
+from src.graph.schema import Company, Document, Relationship, RelationType
+from src.models.schemas import NewsItem, SearchResult
+
+
+class FakeExtractor:
+    """process_document 결과를 흉내 내는 추출기."""
+
+    def __init__(self):
+        self.resolver = EntityResolver()
+        self.resolver.seed_from_ticker_map()
+        self.calls = 0
+
+    async def process_document(self, title, content, url=None, doc_type="news", mark_seen=True):
+        self.calls += 1
+        fp = fingerprint(url, f"{title}\n\n{content}")
+        document = Document(id=fp.doc_id, type=doc_type, title=title, url=url)
+        company = Company(name="삼성전자")
+        return {
+            "entities": {"companies": [company], "documents": [document]},
+            "relationships": [
+                Relationship(type=RelationType.MENTIONED_IN, source_id="삼성전자", target_id=document.id)
+            ],
+            "document": document,
+            "skipped": False,
+            "fingerprint": fp,
+        }
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """임시 spool/dead-letter 경로를 쓰는 설정을 반환합니다."""
+    return Settings(
+        ingest_workers=1,
+        ingest_batch_size=8,
+        ingest_max_retries=2,
+        ingest_retry_backoff=0,
+        ingest_spool_path=str(tmp_path / "spool.jsonl"),
+        ingest_dead_letter_path=str(tmp_path / "dead.jsonl"),
+    )
+
+
+@pytest.fixture
+def pipeline(settings):
+    """가짜 저장소를 사용하는 파이프라인을 반환합니다."""
+    repository = MagicMock()
+    repository.is_available = True
+    repository.seed_resolver = AsyncMock(return_value=0)
+    repository.save_extraction = AsyncMock(return_value={})
+    vector_store = MagicMock()
+    vector_store.add_documents = AsyncMock(return_value=[])
+    return IngestionPipeline(
+        extractor=FakeExtractor(),
+        repository=repository,
+        vector_store=vector_store,
+        settings=settings,
+        index=IngestionIndex(),
+    )
+
+
+def _items(n: int) -> list[IngestionItem]:
+    return [
+        IngestionItem(title=f"기사 {i}", content="삼성전자 실적", url=f"https://a.com/{i}", company="삼성전자")
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batches_graph_writes_and_embeddings(pipeline):
+    """큐의 문서를 한 번의 그래프 저장과 한 번의 임베딩으로 처리합니다."""
+    assert pipeline.offer(_items(5)) == 5
+    await pipeline.shutdown(drain=True)
+
+    pipeline.repository.save_extraction.assert_awaited_once()
+    entities, relationships = pipeline.repository.save_extraction.await_args.args
+    assert len(entities["documents"]) == 5
+    assert len(relationships) == 5
+
+    documents = pipeline.vector_store.add_documents.await_args.args[0]
+    assert len(documents) == 5
+    assert documents[0]["metadata"]["company"] == "삼성전자"
+    assert pipeline.stats["processed"] == 5
+    assert len(pipeline.index) == 10  # 문서당 URL/본문 키
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_retry_then_dead_letter(pipeline):
+    """저장이 계속 실패하면 재시도 후 dead-letter에 기록하고, 재처리할 수 있습니다."""
+    pipeline.vector_store.add_documents = AsyncMock(side_effect=RuntimeError("chroma down"))
+
+    pipeline.offer(_items(2))
+    await pipeline.shutdown(drain=True)
+
+    assert pipeline.vector_store.add_documents.await_count == 3
+    # 추출과 그래프 저장은 한 번만 수행하고 실패한 임베딩만 재시도
+    assert pipeline.extractor.calls == 2
+    pipeline.repository.save_extraction.assert_awaited_once()
+    assert pipeline.stats["retried"] == 4
+    assert pipeline.stats["dead_lettered"] == 2
+    assert len(pipeline.index) == 0
+
+    replay = pipeline.take_spooled(dead_letters=True)
+    assert [item.attempts for item in replay] == [0, 0]
+    assert pipeline.take_spooled(dead_letters=True) == []
+
+
+@pytest.mark.asyncio
+async def test_retry_resumes_from_failed_step(pipeline):
+    """그래프 저장 후 임베딩이 실패하면 임베딩만 다시 시도합니다."""
+    pipeline.vector_store.add_documents = AsyncMock(side_effect=[RuntimeError("chroma down"), []])
+
+    pipeline.offer(_items(3))
+    await pipeline.shutdown(drain=True)
+
+    assert pipeline.extractor.calls == 3
+    pipeline.repository.save_extraction.assert_awaited_once()
+    assert pipeline.vector_store.add_documents.await_count == 2
+    assert pipeline.stats["processed"] == 3
+    assert pipeline.stats["retried"] == 3
+
+
+@pytest.mark.asyncio
+async def test_unavailable_graph_is_not_marked_seen(pipeline):
+    """그래프에 쓰지 못한 문서는 수집 완료로 기록하지 않고 dead-letter로 남깁니다."""
+    pipeline.repository.is_available = False
+
+    pipeline.offer(_items(2))
+    await pipeline.shutdown(drain=True)
+
+    pipeline.vector_store.add_documents.assert_not_awaited()
+    assert pipeline.stats["processed"] == 0
+    assert pipeline.stats["dead_lettered"] == 2
+    assert len(pipeline.index) == 0
+
+
+@pytest.mark.asyncio
+async def test_duplicate_documents_in_batch_are_processed_once(pipeline):
+    """같은 문서가 한 배치에 여러 번 있으면 한 번만 추출/저장합니다."""
+    pipeline.offer(_items(2) + _items(2))
+    await pipeline.shutdown(drain=True)
+
+    assert pipeline.extractor.calls == 2
+    assert pipeline.stats["skipped"] == 2
+    assert len(pipeline.vector_store.add_documents.await_args.args[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_extraction_is_reported_as_failure(pipeline):
+    """gather가 돌려준 CancelledError도 실패로 처리해 재시도합니다."""
+    pipeline.extractor.process_document = AsyncMock(side_effect=asyncio.CancelledError())
+
+    failed = await pipeline._process_batch(_items(1))
+
+    assert [type(error) for _, error in failed] == [asyncio.CancelledError]
+    pipeline.repository.save_extraction.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_ingested_alias_is_retrievable_by_other_alias(settings, tmp_path):
+    """영문명으로 수집한 문서를 티커나 한글명으로 검색할 수 있습니다."""
+    from src.graph import VectorStore
+
+    store = VectorStore(
+        settings.model_copy(update={
+            "chroma_persist_dir": str(tmp_path / "chroma"),
+            "embedding_backend": "hashing",
+        }),
+        generations=GenerationTracker(),
+    )
+    repository = MagicMock()
+    repository.is_available = True
+    repository.seed_resolver = AsyncMock(return_value=0)
+    repository.save_extraction = AsyncMock(return_value={})
+    pipeline = IngestionPipeline(
+        extractor=FakeExtractor(),
+        repository=repository,
+        vector_store=store,
+        settings=settings,
+        index=IngestionIndex(),
+    )
+
+    pipeline.offer([
+        IngestionItem(title="HBM 공급 확대", url="https://a.com/hbm", company="Samsung Electronics")
+    ])
+    await pipeline.shutdown(drain=True)
+
+    for alias in ("005930.KS", "삼성전자", "Samsung Electronics"):
+        results = await store.search_by_company("HBM", alias, n_results=3)
+        assert [r["metadata"]["company"] for r in results] == ["삼성전자"]
+
+
+@pytest.mark.asyncio
+async def test_repository_lookups_resolve_aliases():
+    """그래프 조회는 기업명을 Company 노드 키(정규 이름)로 해소합니다."""
+    client = MagicMock()
+    client.execute_query = AsyncMock(return_value=[])
+    repo = GraphRepository(client, generations=GenerationTracker())
+
+    await repo.get_company_events("Samsung Electronics")
+    await repo.get_company_documents("005930.KS")
+
+    names = [call.args[1]["name"] for call in client.execute_query.await_args_list]
+    assert names == ["삼성전자", "삼성전자"]
+
+
+@pytest.mark.asyncio
+async def test_create_company_merges_on_canonical_name():
+    """create_company도 alias/티커를 Company 노드 키로 해소해 MERGE합니다."""
+    client = MagicMock()
+    client.execute_query = AsyncMock(return_value=[])
+    repo = GraphRepository(client, generations=GenerationTracker())
+
+    company = await repo.create_company(Company(name="Samsung Electronics Co., Ltd."))
+
+    params = client.execute_query.await_args.args[1]
+    assert params["name"] == company.name == "삼성전자"
+    assert params["props"]["ticker"] == "005930.KS"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_seeds_resolver_from_graph(pipeline):
+    """첫 배치 전에 기존 Company 노드로 해소기를 한 번 채웁니다."""
+    client = MagicMock()
+    client.is_available = True
+
+    async def iter_query(query, batch_size=None):
+        yield [{"n": {"name": "한미반도체", "ticker": "042700"}}]
+
+    client.iter_query = iter_query
+    resolver = pipeline.extractor.resolver
+    pipeline._repository = GraphRepository(
+        client, generations=GenerationTracker(), resolver=resolver
+    )
+    pipeline._repository.save_extraction = AsyncMock(return_value={})
+
+    pipeline.offer(_items(2))
+    await pipeline.shutdown(drain=True)
+
+    assert resolver.graph_seeded
+    assert resolver.resolve("Hanmi", ticker="042700.KS").name == "한미반도체"
+    assert await pipeline.repository.seed_resolver() == 0
+
+
+@pytest.mark.asyncio
+async def test_overflow_is_spooled(pipeline, settings):
+    """큐가 가득 차면 요청 경로를 막지 않고 spool 파일로 넘깁니다."""
+    pipeline.settings = settings.model_copy(update={"ingest_queue_size": 2})
+
+    assert pipeline.offer(_items(5)) == 2
+    await pipeline.shutdown(drain=False)
+
+    spooled = pipeline.take_spooled()
+    assert len(spooled) == 5
+    assert pipeline.stats["processed"] == 0
+
+
+def test_items_from_agent_state():
+    """검색 결과와 뉴스를 수집 항목으로 변환합니다."""
+    state = {
+        "company_name": "삼성전자",
+        "search_results": [SearchResult(title="검색", url="https://a.com/1", snippet="요약", source="tavily")],
+        "news_items": [NewsItem(title="뉴스", url="https://a.com/2", source="연합")],
+    }
+
+    items = items_from_agent_state(state)
+
+    assert [(i.title, i.doc_type, i.company) for i in items] == [
+        ("검색", "web", "삼성전자"),
+        ("뉴스", "news", "삼성전자"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_save_extraction_uses_one_query_per_label_and_type():
+    """라벨/관계 타입별 UNWIND 쿼리로 일괄 저장합니다."""
+    client = MagicMock()
+    client.execute_query = AsyncMock(return_value=[])
+    repo = GraphRepository(client, generations=GenerationTracker())
+    documents = [Document(id=f"doc-{i}", type="news", title=f"기사 {i}") for i in range(3)]
+    relationships = [
+        Relationship(type=RelationType.MENTIONED_IN, source_id="삼성전자", target_id=d.id)
+        for d in documents
+    ]
+
+    counts = await repo.save_extraction(
+        {"companies": [Company(name="삼성전자")], "documents": documents},
+        relationships,
+    )
+
+    assert counts == {"Company": 1, "Document": 3, "MENTIONED_IN": 3}
+    assert client.execute_query.await_count == 3
+    rel_query = client.execute_query.await_args_list[-1].args[0]
+    assert "MATCH (b:Document {id: row.target})" in rel_query
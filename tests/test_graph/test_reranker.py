@@ -0,0 +1,82 @@
+"""Reranker 테스트."""
+
+import time
+
+import pytest
+
+from src.graph.hybrid import HybridResult
+from src.graph.reranker import Reranker, lexical_scorer
+
+
+def _results() -> list[HybridResult]:
+    return [
+        HybridResult(id="doc-1", content="카카오 실적", source="vector", score=0.9, metadata={}),
+        HybridResult(id="doc-2", content="삼성전자 HBM 공급", source="graph", score=0.5, metadata={}),
+        HybridResult(id="doc-3", content="기타 뉴스", source="vector", score=0.1, metadata={}),
+    ]
+
+
+class CountingScorer:
+    """호출된 쌍을 기록하는 scorer."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls: list[list[tuple[str, str]]] = []
+
+    def __call__(self, pairs):
+        self.calls.append(pairs)
+        time.sleep(self.delay)
+        return lexical_scorer(pairs)
+
+
+@pytest.mark.asyncio
+async def test_rerank_orders_by_pair_score():
+    """후보를 쌍 점수순으로 재정렬하고 융합 점수를 메타데이터에 남깁니다."""
+    scorer = CountingScorer()
+    reranker = Reranker(scorer, top_n=2, batch_size=1)
+
+    results, info = await reranker.rerank("삼성전자 HBM", _results())
+
+    assert [r.id for r in results] == ["doc-2", "doc-1", "doc-3"]
+    assert results[0].metadata["fusion_score"] == 0.5
+    assert info == {"candidates": 2, "cached": 0, "reranked": True}
+    assert len(scorer.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_rerank_scores_are_cached():
+    """같은 (쿼리, 문서) 쌍은 다시 채점하지 않습니다."""
+    scorer = CountingScorer()
+    reranker = Reranker(scorer, top_n=3, batch_size=8)
+
+    await reranker.rerank("삼성전자 HBM", _results())
+    _, info = await reranker.rerank("삼성전자 HBM", _results())
+
+    assert len(scorer.calls) == 1
+    assert info["cached"] == 3
+
+
+@pytest.mark.asyncio
+async def test_results_without_id_do_not_share_scores():
+    """ID가 빈 결과(그래프 컨텍스트)끼리 캐시 점수를 공유하지 않습니다."""
+    reranker = Reranker(CountingScorer(), top_n=2)
+    results = [
+        HybridResult(id="", content="카카오 실적", source="graph", score=0.9, metadata={}),
+        HybridResult(id="", content="삼성전자 HBM 공급", source="graph", score=0.5, metadata={}),
+    ]
+
+    reranked, _ = await reranker.rerank("삼성전자 HBM", results)
+
+    assert [r.content for r in reranked] == ["삼성전자 HBM 공급", "카카오 실적"]
+    assert reranked[0].score > reranked[1].score
+
+
+@pytest.mark.asyncio
+async def test_budget_exceeded_keeps_fused_order():
+    """지연 예산을 넘기면 융합 순서를 그대로 반환합니다."""
+    reranker = Reranker(CountingScorer(delay=0.2), top_n=3, budget_ms=20)
+
+    results, info = await reranker.rerank("삼성전자 HBM", _results())
+
+    assert [r.id for r in results] == ["doc-1", "doc-2", "doc-3"]
+    assert info["reason"] == "budget"
@@ -0,0 +1,134 @@
+"""EntityResolver 테스트."""
+
+import pytest
+
+from src.graph import EntityExtractor, EntityResolver
+from src.graph.resolver import normalize_name, normalize_ticker
+
+
+@pytest.fixture
+def resolver():
+    """KR_TICKER_MAP으로 초기화된 해소기를 반환합니다."""
+    resolver = EntityResolver()
+    resolver.seed_from_ticker_map()
+    return resolver
+
+
+def test_normalize_name_strips_corporate_forms():
+    """법인 형태와 구두점을 제거합니다."""
+    assert normalize_name("삼성전자(주)") == normalize_name("삼성전자")
+    assert normalize_name("㈜ 카카오") == "카카오"
+    assert normalize_name("Samsung Electronics Co., Ltd.") == "samsungelectronics"
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Incheon Airport", "incheonairport"),
+        ("Corpus Christi Energy", "corpuschristienergy"),
+        ("Income Fund", "incomefund"),
+        ("Ltdata Systems", "ltdatasystems"),
+        ("Apple Inc.", "apple"),
+    ],
+)
+def test_normalize_name_keeps_words_starting_with_suffix(name, expected):
+    """법인 형태로 시작하는 일반 단어는 자르지 않습니다."""
+    assert normalize_name(name) == expected
+
+
+def test_normalize_ticker():
+    """한국 티커는 6자리 코드로 통일합니다."""
+    assert normalize_ticker("005930.KS") == "005930"
+    assert normalize_ticker("005930") == "005930"
+    assert normalize_ticker("AAPL") == "AAPL"
+    assert normalize_ticker("삼성전자") is None
+
+
+class TestEntityResolver:
+    """EntityResolver 테스트."""
+
+    @pytest.mark.parametrize(
+        "mention",
+        ["삼성전자", "Samsung Electronics", "삼성전자(주)", "005930.KS", "005930"],
+    )
+    def test_variants_resolve_to_same_key(self, resolver, mention):
+        """표기 변형이 같은 정규 키로 해소됩니다."""
+        resolved = resolver.resolve(mention)
+
+        assert resolved.name == "삼성전자"
+        assert resolved.ticker == "005930.KS"
+
+    def test_ticker_argument(self, resolver):
+        """함께 추출된 티커로 해소합니다."""
+        resolved = resolver.resolve("Samsung Elec.", ticker="005930.KS")
+
+        assert resolved.name == "삼성전자"
+        assert resolved.method == "ticker"
+
+    def test_fuzzy_match(self, resolver):
+        """n-gram 유사도로 오탈자를 해소합니다."""
+        resolved = resolver.resolve("Samsung Electronic")
+
+        assert resolved.name == "삼성전자"
+        assert resolved.method == "fuzzy"
+
+    @pytest.mark.parametrize(
+        "mention", ["삼성전기", "Samsung SDS", "Samsung", "Samsung Group"]
+    )
+    def test_similar_but_distinct_companies(self, resolver, mention):
+        """비슷하지만 다른 기업은 합치지 않습니다."""
+        resolved = resolver.resolve(mention)
+
+        assert resolved.method == "new"
+        assert resolved.name == mention
+        assert resolver.resolve("LG전자").name == "LG전자"
+
+    def test_new_entity_is_not_registered(self, resolver):
+        """처음 보는 기업은 등록하지 않고 표기에서 정해진 키를 사용합니다."""
+        size = len(resolver)
+
+        first = resolver.resolve("Palantir Technologies Inc.")
+        second = resolver.resolve("Palantir Technologies, Inc.")
+        fresh = EntityResolver()
+        fresh.seed_from_ticker_map()
+
+        assert first.method == "new"
+        assert first.name == second.name == "Palantir Technologies"
+        assert fresh.resolve("Palantir Technologies, Inc.").name == first.name
+        assert len(resolver) == size
+
+    def test_learned_resolutions_are_bounded(self):
+        """기억하는 해소 결과 수가 max_learned를 넘지 않습니다."""
+        resolver = EntityResolver(max_learned=3)
+        resolver.seed_from_ticker_map()
+        size = len(resolver)
+
+        for i in range(20):
+            resolver.resolve(f"Unknown Company {i}")
+        resolved = resolver.resolve("Samsung Electronic")
+
+        assert resolved.name == "삼성전자"
+        assert resolver.resolve("Samsung Electronic") == resolved
+        assert len(resolver._learned) == 3
+        assert len(resolver) == size
+
+
+def test_extractor_merges_duplicate_companies(resolver):
+    """추출기가 중복 기업을 하나의 노드 키로 합칩니다."""
+    extractor = EntityExtractor(llm_client=object(), resolver=resolver)
+
+    entities = extractor._parse_entities(
+        {
+            "companies": [
+                {"name": "Samsung Electronics", "industry": "반도체"},
+                {"name": "삼성전자(주)"},
+                {"name": "005930.KS"},
+            ],
+            "people": [{"name": "이재용", "role": "회장", "company": "Samsung Electronics"}],
+        },
+        source_url=None,
+    )
+
+    assert [c.name for c in entities["companies"]] == ["삼성전자"]
+    assert entities["companies"][0].industry == "반도체"
+    assert entities["people"][0].company == "삼성전자"
@@ -0,0 +1,93 @@
+"""GraphStatsService 테스트."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from neo4j.exceptions import ClientError, ServiceUnavailable
+
+from config.settings import Settings
+from src.graph import GraphStatsService
+from src.graph.stats import APOC_STATS_QUERY, COUNT_STORE_QUERY
+
+
+@pytest.fixture
+def mock_client():
+    """테스트용 Neo4j 클라이언트를 반환합니다."""
+    client = MagicMock()
+    client.is_available = True
+    client.settings = Settings(graph_stats_ttl=30)
+    client.execute_query = AsyncMock(
+        return_value=[
+            {
+                "labels": {"Company": 3, "Document": 7, "Other": 100},
+                "relTypesCount": {"MENTIONED_IN": 9, "BELONGS_TO": 0},
+            }
+        ]
+    )
+    return client
+
+
+class TestGraphStatsService:
+    """GraphStatsService 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_single_round_trip(self, mock_client):
+        """한 번의 쿼리로 노드/관계 카운트를 반환합니다."""
+        service = GraphStatsService(mock_client)
+
+        stats = await service.get_stats()
+
+        mock_client.execute_query.assert_awaited_once_with(APOC_STATS_QUERY)
+        assert stats["nodes"]["company"] == 3
+        assert stats["nodes"]["person"] == 0
+        assert stats["relationships"] == {"MENTIONED_IN": 9}
+        assert stats["total_nodes"] == 10
+        assert stats["total_relationships"] == 9
+
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self, mock_client):
+        """TTL 내에서는 캐시된 결과를 반환합니다."""
+        service = GraphStatsService(mock_client)
+
+        await service.get_stats()
+        await service.get_stats()
+        assert mock_client.execute_query.await_count == 1
+
+        await service.get_stats(refresh=True)
+        assert mock_client.execute_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_apoc(self, mock_client):
+        """APOC가 없으면 카운트 스토어 쿼리로 대체합니다."""
+        rows = mock_client.execute_query.return_value
+        missing = ClientError("There is no procedure with the name `apoc.meta.stats` registered")
+        mock_client.execute_query = AsyncMock(side_effect=[missing, rows, rows])
+        service = GraphStatsService(mock_client, ttl=0)
+
+        stats = await service.get_stats()
+        await service.get_stats()
+
+        queries = [c.args[0] for c in mock_client.execute_query.await_args_list]
+        assert queries == [APOC_STATS_QUERY, COUNT_STORE_QUERY, COUNT_STORE_QUERY]
+        assert stats["total_nodes"] == 10
+
+    @pytest.mark.asyncio
+    async def test_transient_error_keeps_apoc(self, mock_client):
+        """연결 오류는 전파하고 다음 조회에서 다시 APOC를 사용합니다."""
+        rows = mock_client.execute_query.return_value
+        mock_client.execute_query = AsyncMock(side_effect=[ServiceUnavailable("down"), rows])
+        service = GraphStatsService(mock_client, ttl=0)
+
+        with pytest.raises(ServiceUnavailable):
+            await service.get_stats()
+        await service.get_stats()
+
+        queries = [c.args[0] for c in mock_client.execute_query.await_args_list]
+        assert queries == [APOC_STATS_QUERY, APOC_STATS_QUERY]
+
+
+def test_count_store_query_avoids_full_scan():
+    """관계 카운트는 타입별로 조회하여 전체 스캔을 피합니다."""
+    assert "MATCH ()-[r]->()" not in COUNT_STORE_QUERY
+    assert "MATCH ()-[r:MENTIONED_IN]->()" in COUNT_STORE_QUERY
+    assert "MATCH (n:Company)" in COUNT_STORE_QUERY
@@ -0,0 +1,233 @@
+"""VectorStore 테스트 (로컬 ChromaDB + hashing 임베딩)."""
+
+import asyncio
+
+import pytest
+
+from config.settings import Settings
+from src.graph import VectorStore
+from src.graph.cache import GenerationTracker
+from src.graph.embeddings import (
+    EmbeddingPipeline,
+    HashingEmbeddingFunction,
+    QueryEmbeddingCache,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 디렉터리에 저장하는 벡터 저장소를 반환합니다."""
+    settings = Settings(
+        chroma_persist_dir=str(tmp_path / "chroma"),
+        embedding_backend="hashing",
+        embedding_batch_size=4,
+    )
+    return VectorStore(settings)
+
+
+@pytest.mark.asyncio
+async def test_add_and_search(store):
+    """배치 임베딩으로 추가한 문서를 검색합니다."""
+    docs = [
+        {"id": f"doc-{i}", "content": f"{i}번 문서 일반 뉴스", "metadata": {"company": "카카오"}}
+        for i in range(10)
+    ]
+    docs.append(
+        {"id": "doc-hbm", "content": "삼성전자 HBM 반도체 공급 확대", "metadata": {"company": "삼성전자"}}
+    )
+
+    ids = await store.add_documents(docs)
+    results = await store.search("삼성전자 HBM 반도체", n_results=3)
+
+    assert len(ids) == 11
+    assert (await store.get_stats())["document_count"] == 11
+    assert results[0]["id"] == "doc-hbm"
+
+    # 문서 수는 다시 세지 않고 쓰기로 갱신 (삭제 후에는 다시 셈)
+    await store.add_documents([{"id": "doc-new", "content": "새 문서"}, docs[0]])
+    assert (await store.get_stats())["document_count"] == 12
+    await store.delete_document("doc-new")
+    assert (await store.get_stats())["document_count"] == 11
+
+
+def test_batches_respect_count_and_size():
+    """배치는 문서 수와 글자 수 제한을 모두 지킵니다."""
+    pipeline = EmbeddingPipeline(HashingEmbeddingFunction(), batch_size=3, max_batch_chars=10)
+
+    batches = pipeline.make_batches(["aaaa", "bbbb", "cccc", "d", "e", "f", "g", "h"])
+
+    assert batches == [[0, 1], [2, 3, 4], [5, 6, 7]]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_preserves_order():
+    """동시 배치 처리 후에도 입력 순서를 유지합니다."""
+    function = HashingEmbeddingFunction(dim=16)
+    pipeline = EmbeddingPipeline(function, batch_size=2, concurrency=3)
+    texts = [f"문서 {i}" for i in range(9)]
+
+    embeddings = await pipeline.embed(texts)
+
+    assert embeddings == [[float(v) for v in e] for e in function(texts)]
+
+
+@pytest.mark.asyncio
+async def test_query_embedding_cache(tmp_path):
+    """반복 검색은 캐시된 쿼리 임베딩을 사용합니다."""
+    settings = Settings(chroma_persist_dir=str(tmp_path / "chroma"), embedding_backend="hashing")
+    cache_path = tmp_path / "query_cache.jsonl"
+    store = VectorStore(settings, query_cache=QueryEmbeddingCache(maxsize=8, path=cache_path))
+    await store.add_documents([{"id": "doc-1", "content": "삼성전자 실적"}])
+
+    for _ in range(5):
+        await store.search("삼성전자", n_results=1)
+
+    stats = (await store.get_stats())["query_cache"]
+    assert stats["misses"] == 1
+    assert stats["hits"] == 4
+    assert stats["hit_rate"] == 0.8
+
+    reloaded = QueryEmbeddingCache(maxsize=8, path=cache_path)
+    assert reloaded.get(store.model_key, "삼성전자") == await store.embed_query("삼성전자")
+
+
+def test_query_cache_evicts_lru():
+    """최대 크기를 넘으면 가장 오래 사용하지 않은 항목을 제거합니다."""
+    cache = QueryEmbeddingCache(maxsize=2)
+    cache.put("m", "a", [1.0])
+    cache.put("m", "b", [2.0])
+    cache.get("m", "a")
+    cache.put("m", "c", [3.0])
+
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") == [1.0]
+    assert cache.get("other-model", "a") is None
+
+
+def test_query_cache_file_is_compacted(tmp_path):
+    """영속화 파일은 maxsize의 두 배를 넘으면 현재 항목만 남기도록 다시 씁니다."""
+    cache_path = tmp_path / "query_cache.jsonl"
+    cache = QueryEmbeddingCache(maxsize=2, path=cache_path)
+    for i in range(10):
+        cache.put("m", f"q{i}", [float(i)])
+
+    assert len(cache_path.read_text(encoding="utf-8").splitlines()) <= 4
+
+    reloaded = QueryEmbeddingCache(maxsize=2, path=cache_path)
+    assert reloaded.get("m", "q9") == [9.0]
+    assert reloaded.get("m", "q8") == [8.0]
+    assert reloaded.get("m", "q0") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_are_batched(store):
+    """동시 검색은 collection.query 호출로 묶이고 결과는 호출자별로 나뉩니다."""
+    await store.add_documents([
+        {"id": "doc-hbm", "content": "삼성전자 HBM 반도체 공급", "metadata": {"company": "삼성전자"}},
+        {"id": "doc-ev", "content": "현대차 전기차 판매 증가", "metadata": {"company": "현대차"}},
+        {"id": "doc-bank", "content": "KB금융 배당 확대 발표", "metadata": {"company": "KB금융"}},
+    ])
+
+    calls = []
+    query = store.collection.query
+
+    def spy(**kwargs):
+        calls.append(kwargs)
+        return query(**kwargs)
+
+    store.collection.query = spy
+
+    results = await asyncio.gather(
+        store.search("삼성전자 HBM 반도체", n_results=1),
+        store.search("현대차 전기차", n_results=2),
+        store.search("KB금융 배당", n_results=1),
+    )
+
+    # 첫 검색은 바로 실행되고, 그동안 들어온 검색은 한 배치로 묶임
+    assert len(calls) < 3
+    assert sum(len(call["query_embeddings"]) for call in calls) == 3
+    assert [len(r) for r in results] == [1, 2, 1]
+    assert [r[0]["id"] for r in results] == ["doc-hbm", "doc-ev", "doc-bank"]
+
+
+@pytest.mark.asyncio
+async def test_uncontended_search_skips_batch_window(tmp_path):
+    """다른 검색이 없으면 배치 시간 창을 기다리지 않습니다."""
+    settings = Settings(
+        chroma_persist_dir=str(tmp_path / "chroma"),
+        embedding_backend="hashing",
+        vector_search_batch_window_ms=60_000,
+    )
+    store = VectorStore(settings)
+    await store.add_documents([{"id": "doc-1", "content": "삼성전자 실적", "metadata": {}}])
+
+    results = await asyncio.wait_for(store.search("삼성전자", n_results=1), timeout=10)
+
+    assert results[0]["id"] == "doc-1"
+
+
+@pytest.mark.asyncio
+async def test_batches_split_by_filter(store):
+    """where 필터가 다른 검색은 별도 배치로 실행됩니다."""
+    await store.add_documents([
+        {"id": "doc-1", "content": "삼성전자 실적", "metadata": {"company": "삼성전자"}},
+        {"id": "doc-2", "content": "카카오 실적", "metadata": {"company": "카카오"}},
+    ])
+
+    results = await asyncio.gather(
+        store.search_by_company("실적", "삼성전자", n_results=5),
+        store.search_by_company("실적", "카카오", n_results=5),
+    )
+
+    assert [[d["id"] for d in r] for r in results] == [["doc-1"], ["doc-2"]]
+    assert store.batcher.batches == 2
+
+
+@pytest.mark.asyncio
+async def test_chunked_document_collapses_to_parent(tmp_path):
+    """긴 문서는 청크로 저장되고 검색 결과는 부모 문서의 일치 구간으로 묶입니다."""
+    settings = Settings(
+        chroma_persist_dir=str(tmp_path / "chroma"),
+        embedding_backend="hashing",
+        vector_chunk_size=80,
+        vector_chunk_overlap=0,
+        vector_max_spans=1,
+    )
+    store = VectorStore(settings)
+    filler = " ".join(f"일반 시장 동향 문장 {i}." for i in range(20))
+    content = f"{filler}\n\n삼성전자 HBM 반도체 공급 확대.\n\n{filler}"
+
+    await store.add_documents([{"id": "doc-long", "content": content, "metadata": {"company": "삼성전자"}}])
+    results = await store.search("삼성전자 HBM 반도체", n_results=3)
+
+    stats = await store.get_stats()
+    assert stats["document_count"] == 1
+    assert stats["chunk_count"] > 1
+    assert [r["id"] for r in results] == ["doc-long"]
+    assert "HBM" in results[0]["content"]
+    assert len(results[0]["content"]) <= 80
+    assert results[0]["metadata"] == {"company": "삼성전자"}
+
+    # 재추가는 건너뛰고, 삭제는 모든 청크를 제거
+    await store.add_documents([{"id": "doc-long", "content": content}])
+    await store.delete_document("doc-long")
+    assert (await store.get_stats())["chunk_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_writes_bump_company_generation(tmp_path):
+    """문서 추가/삭제는 관련 기업의 검색 캐시 세대를 올립니다."""
+    generations = GenerationTracker()
+    settings = Settings(chroma_persist_dir=str(tmp_path / "chroma"), embedding_backend="hashing")
+    store = VectorStore(settings, generations=generations)
+
+    await store.add_documents([{"id": "doc-1", "content": "삼성전자 실적", "metadata": {"company": "삼성전자"}}])
+    assert generations.get("삼성전자") == 1
+    assert generations.get("(주)삼성전자") == 1
+    assert generations.get("카카오") == 0
+
+    await store.add_documents([{"id": "doc-1", "content": "삼성전자 실적"}])
+    assert generations.get("삼성전자") == 1
+
+    await store.delete_document("doc-1")
+    assert generations.get("삼성전자") == 2
@@ -0,0 +1 @@
+"""작업 큐 모듈 테스트."""
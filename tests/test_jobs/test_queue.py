@@ -0,0 +1,284 @@
+"""JobQueue 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from config.settings import Settings
+from src.jobs import (
+    InMemoryJobBackend,
+    Job,
+    JobError,
+    JobLimitExceededError,
+    JobQueue,
+    JobStatus,
+    RedisJobBackend,
+    SQLiteJobBackend,
+)
+
+
+class FakeRedis:
+    """RedisJobBackend가 사용하는 명령만 구현한 가짜 redis.asyncio 클라이언트."""
+
+    def __init__(self):
+        self.values: dict[str, str | int] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.ttls[key] = ex
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+
+    async def blpop(self, keys, timeout=0):
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            for key in keys:
+                if self.lists.get(key):
+                    return key, self.lists[key].pop(0)
+            if asyncio.get_running_loop().time() >= deadline:
+                return None
+            await asyncio.sleep(0.005)
+
+    async def hset(self, name, key, value):
+        self.hashes.setdefault(name, {})[key] = str(value)
+
+    async def hgetall(self, name):
+        return dict(self.hashes.get(name, {}))
+
+    async def hdel(self, name, *keys):
+        fields = self.hashes.get(name, {})
+        for key in keys:
+            fields.pop(key, None)
+        if not fields:
+            self.hashes.pop(name, None)
+
+    async def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+
+@pytest.fixture(params=["memory", "redis", "sqlite"])
+def backend(request, tmp_path):
+    """인메모리/가짜 Redis/SQLite 백엔드를 반환합니다."""
+    if request.param == "memory":
+        return InMemoryJobBackend()
+    if request.param == "sqlite":
+        return SQLiteJobBackend.from_path(str(tmp_path / "jobs.sqlite3"))
+    return RedisJobBackend(FakeRedis())
+
+
+@pytest.fixture
+def settings():
+    return Settings(job_workers=2, job_timeout=1, job_result_ttl=60, job_max_per_user=2)
+
+
+async def _wait_finished(queue: JobQueue, job_id: str):
+    for _ in range(200):
+        job = await queue.get(job_id)
+        if job.status.is_finished:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("작업이 끝나지 않았습니다")
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_immediately_and_stores_result(backend, settings):
+    """제출은 즉시 반환되고, 워커가 실행한 결과를 조회할 수 있습니다."""
+    release = asyncio.Event()
+
+    async def handler(params):
+        await release.wait()
+        return {"company": params["company_name"]}
+
+    queue = JobQueue(backend, settings, handlers={"analyze": handler})
+    job = await queue.submit("analyze", {"company_name": "삼성전자"}, user="u1")
+
+    assert job.status == JobStatus.QUEUED
+    assert (await queue.get(job.id)).status in (JobStatus.QUEUED, JobStatus.RUNNING)
+
+    release.set()
+    finished = await _wait_finished(queue, job.id)
+    await queue.shutdown()
+
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.result == {"company": "삼성전자"}
+    assert finished.started_at and finished.finished_at
+
+
+@pytest.mark.asyncio
+async def test_per_user_limit_releases_on_completion(backend, settings):
+    """사용자별 동시 작업 한도를 넘으면 거부하고, 완료되면 다시 받습니다."""
+    release = asyncio.Event()
+
+    async def handler(params):
+        await release.wait()
+        return {}
+
+    queue = JobQueue(backend, settings, handlers={"analyze": handler})
+    jobs = [await queue.submit("analyze", {}, user="u1") for _ in range(2)]
+
+    with pytest.raises(JobLimitExceededError):
+        await queue.submit("analyze", {}, user="u1")
+    await queue.submit("analyze", {}, user="u2")  # 다른 사용자는 영향 없음
+
+    release.set()
+    for job in jobs:
+        await _wait_finished(queue, job.id)
+
+    assert (await queue.submit("analyze", {}, user="u1")).status == JobStatus.QUEUED
+    assert queue.stats["rejected"] == 1
+    await queue.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_leaked_slots_expire(backend):
+    """반환되지 않은 슬롯은 ttl이 지나면 풀리고, 거부된 시도는 슬롯을 남기지 않습니다."""
+    assert await backend.acquire("u1", "leaked", 1, ttl=0)
+    await asyncio.sleep(0.01)
+
+    assert await backend.acquire("u1", "a", 1, ttl=60)
+    assert not await backend.acquire("u1", "b", 1, ttl=60)
+
+    await backend.release("u1", "a")
+    assert await backend.acquire("u1", "c", 1, ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_failure_and_timeout_are_recorded(backend, settings):
+    """핸들러 예외와 시간 초과는 실패 상태와 사유로 저장됩니다."""
+
+    async def broken(params):
+        raise RuntimeError("LLM 오류")
+
+    async def slow(params):
+        await asyncio.sleep(5)
+
+    queue = JobQueue(backend, settings, handlers={"broken": broken, "slow": slow})
+    failed = await _wait_finished(queue, (await queue.submit("broken", {})).id)
+    timed_out = await _wait_finished(queue, (await queue.submit("slow", {})).id)
+    await queue.shutdown()
+
+    assert failed.status == JobStatus.FAILED and failed.error == "LLM 오류"
+    assert timed_out.status == JobStatus.FAILED and "시간 초과" in timed_out.error
+
+
+@pytest.mark.asyncio
+async def test_queued_jobs_run_after_restart(backend, settings):
+    """다른 프로세스가 남긴 대기 작업은 start()한 워커가 처리합니다."""
+    handlers = {"analyze": AsyncMock(return_value={"ok": True})}
+    submitter = JobQueue(backend, settings, handlers=handlers)
+    submitter.start = lambda workers=None: None  # 제출만 하고 종료한 프로세스
+    job = await submitter.submit("analyze", {})
+
+    worker = JobQueue(backend, settings, handlers=handlers)
+    worker.start()
+    finished = await _wait_finished(worker, job.id)
+    await worker.shutdown()
+
+    assert finished.status == JobStatus.SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_stale_running_job_is_requeued(backend, settings):
+    """lease가 만료된 RUNNING 작업은 다시 대기열에 넣어 실행합니다."""
+    handlers = {"analyze": AsyncMock(return_value={"ok": True})}
+    queue = JobQueue(backend, settings, handlers=handlers)
+    job = Job(kind="analyze", status=JobStatus.RUNNING)
+    await backend.save(job, 60)
+    await backend.lease(job.id, 0)  # 실행하던 워커가 죽어 갱신되지 않은 lease
+
+    queue.start()
+    finished = await _wait_finished(queue, job.id)
+    await queue.shutdown()
+
+    assert finished.status == JobStatus.SUCCEEDED
+    assert queue.stats["requeued"] == 1
+    assert await backend.expired_leases() == []
+
+
+@pytest.mark.asyncio
+async def test_unknown_kind_is_rejected(settings):
+    """등록되지 않은 작업 종류는 제출할 수 없습니다."""
+    queue = JobQueue(InMemoryJobBackend(), settings)
+
+    with pytest.raises(JobError):
+        await queue.submit("unknown", {})
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_applies_result_ttl(settings):
+    """Redis 백엔드는 작업 상태를 TTL과 함께 저장합니다."""
+    client = FakeRedis()
+    handlers = {"analyze": AsyncMock(return_value={})}
+    queue = JobQueue(RedisJobBackend(client), settings, handlers=handlers)
+
+    job = await queue.submit("analyze", {})
+    await _wait_finished(queue, job.id)
+    await queue.shutdown()
+
+    assert client.ttls[f"ps:jobs:job:{job.id}"] == 60
+    assert "ps:jobs:slots:anonymous" not in client.hashes
+
+
+@pytest.mark.asyncio
+async def test_jobs_api_submit_and_poll(monkeypatch, settings):
+    """POST /jobs/analyze는 202와 작업 ID를, GET /jobs/{id}는 결과를 반환합니다."""
+    from src.api.main import create_app
+    from src.api.routes import jobs as jobs_routes
+
+    queue = JobQueue(InMemoryJobBackend(), settings)
+    monkeypatch.setattr(jobs_routes, "get_job_queue", lambda: queue)
+    monkeypatch.setattr(
+        jobs_routes, "run_analysis", AsyncMock(side_effect=lambda r: _analysis(r.company_name))
+    )
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/jobs/analyze", json={"company_name": "삼성전자"})
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert response.headers["location"] == f"/jobs/{job_id}"
+
+        await _wait_finished(queue, job_id)
+        body = (await client.get(f"/jobs/{job_id}")).json()
+        missing = await client.get("/jobs/unknown")
+
+    await queue.shutdown()
+
+    assert body["status"] == "succeeded"
+    assert body["result"]["company_name"] == "삼성전자"
+    assert missing.status_code == 404
+
+
+def test_request_user_ignores_client_supplied_header():
+    """동시 작업 한도는 X-User-Id 헤더가 아니라 클라이언트 주소로 적용합니다."""
+    from starlette.requests import Request
+
+    from src.api.routes.jobs import request_user
+
+    request = Request({
+        "type": "http",
+        "headers": [(b"x-user-id", b"spoofed")],
+        "client": ("10.0.0.7", 5000),
+    })
+
+    assert request_user(request) == "10.0.0.7"
+
+
+def _analysis(company_name: str):
+    from datetime import datetime
+
+    from src.api.schemas import CompanyAnalysis
+
+    return CompanyAnalysis(company_name=company_name, summary="요약", generated_at=datetime.now())
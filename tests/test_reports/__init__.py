@@ -0,0 +1 @@
+"""리포트 모듈 테스트."""
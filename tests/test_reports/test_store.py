@@ -0,0 +1,96 @@
+"""ReportStore 테스트."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from config.settings import Settings
+from src.models.schemas import CompanyInfo, CompanyReport
+from src.reports import store as store_module
+from src.reports.store import ReportStore, get_or_analyze
+
+
+def _report(name: str) -> CompanyReport:
+    return CompanyReport(company=CompanyInfo(name=name), summary=f"{name} 요약")
+
+
+@pytest.fixture
+def fresh_store(monkeypatch):
+    """테스트마다 새 기본 저장소를 사용합니다."""
+    store = ReportStore(maxsize=8, ttl=0)
+    monkeypatch.setattr(store_module, "_default_report_store", store)
+    return store
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """호출 횟수를 세는 가짜 에이전트를 주입합니다."""
+    analyze = AsyncMock(side_effect=lambda name: _report(name))
+    monkeypatch.setattr(
+        "src.agents.CompanyInfoAgent", lambda settings=None: type("A", (), {"analyze": analyze})()
+    )
+    return analyze
+
+
+def test_put_get_and_latest_by_company():
+    """analysis_id로 조회하고, 기업명 표기가 달라도 최신 분석을 찾습니다."""
+    store = ReportStore()
+    first = store.put(_report("삼성전자"))
+    second = store.put(_report("삼성전자(주)"))
+
+    assert store.get(first).company.name == "삼성전자"
+    assert store.latest("삼성전자", max_age=60)[0] == second
+    assert store.latest("삼성전자", max_age=-1) is None
+    assert store.latest("LG전자", max_age=60) is None
+
+
+def test_eviction_drops_company_index():
+    """LRU로 밀려난 분석은 기업별 최신 인덱스에서도 제거됩니다."""
+    store = ReportStore(maxsize=1)
+    old = store.put(_report("삼성전자"))
+    store.put(_report("LG전자"))
+
+    assert store.get(old) is None
+    assert store.latest("삼성전자", max_age=60) is None
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_analyze_reuses_fresh_analysis(fresh_store, agent):
+    """신선도 기간 안에서는 에이전트를 다시 실행하지 않습니다."""
+    settings = Settings(report_freshness=60)
+
+    first_id, _, first_cached = await get_or_analyze("삼성전자", settings=settings)
+    second_id, _, second_cached = await get_or_analyze("삼성전자", settings=settings)
+    refreshed_id, _, _ = await get_or_analyze("삼성전자", refresh=True, settings=settings)
+
+    assert (first_cached, second_cached) == (False, True)
+    assert first_id == second_id != refreshed_id
+    assert agent.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_report_endpoints_render_one_analysis_in_many_formats(fresh_store, agent):
+    """HTML 조회 후 Markdown 생성 시 같은 분석을 재사용합니다."""
+    from src.api.main import create_app
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        html = await client.get("/reports/view/삼성전자")
+        markdown = await client.post(
+            "/reports/generate", json={"company_name": "삼성전자", "format": "markdown"}
+        )
+        by_id = await client.post(
+            "/reports/generate",
+            json={"analysis_id": markdown.json()["analysis_id"], "format": "json"},
+        )
+        missing = await client.post("/reports/generate", json={"analysis_id": "unknown"})
+        invalid = await client.post("/reports/generate", json={"format": "html"})
+
+    assert html.status_code == 200 and "삼성전자" in html.text
+    assert markdown.json()["cached"] is True
+    assert by_id.json()["company_name"] == "삼성전자"
+    assert missing.status_code == 404
+    assert invalid.status_code == 422
+    assert agent.await_count == 1
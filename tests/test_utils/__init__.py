@@ -0,0 +1 @@
+"""유틸리티 모듈 테스트."""
@@ -0,0 +1,120 @@
+"""런타임 메트릭 테스트."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.utils.metrics import (
+    MetricsRegistry,
+    cache_metrics,
+    get_registry,
+    instrumented,
+    record_llm_tokens,
+    track,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    """히스토그램은 누적 버킷, 합계, 개수를 Prometheus 형식으로 출력합니다."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("t_latency_seconds", "지연", ("node",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value, node="search_node")
+
+    text = registry.render()
+
+    assert "# TYPE t_latency_seconds histogram" in text
+    assert 't_latency_seconds_bucket{node="search_node",le="0.1"} 1' in text
+    assert 't_latency_seconds_bucket{node="search_node",le="1"} 2' in text
+    assert 't_latency_seconds_bucket{node="search_node",le="+Inf"} 3' in text
+    assert 't_latency_seconds_count{node="search_node"} 3' in text
+
+
+def test_registry_rejects_conflicting_definitions():
+    """같은 이름을 다른 라벨로 다시 정의할 수 없습니다."""
+    registry = MetricsRegistry()
+    registry.counter("t_total", "카운터", ("a",))
+
+    with pytest.raises(ValueError):
+        registry.counter("t_total", "카운터", ("b",))
+
+
+@pytest.mark.asyncio
+async def test_instrumented_records_latency_errors_and_in_flight():
+    """데코레이터는 함수 이름 라벨로 지연 시간, 오류, 진행 중 수를 기록합니다."""
+    registry = get_registry()
+
+    @instrumented("testnode")
+    async def flaky_node(fail: bool):
+        in_flight = registry.gauge("ps_testnode_in_flight", "", ("testnode",))
+        assert in_flight.get(testnode="flaky_node") == 1
+        if fail:
+            raise RuntimeError("실패")
+        return "ok"
+
+    assert await flaky_node(False) == "ok"
+    with pytest.raises(RuntimeError):
+        await flaky_node(True)
+
+    duration = registry.histogram("ps_testnode_duration_seconds", "", ("testnode",))
+    errors = registry.counter("ps_testnode_errors_total", "", ("testnode", "error"))
+    in_flight = registry.gauge("ps_testnode_in_flight", "", ("testnode",))
+    assert duration.get(testnode="flaky_node") == 2
+    assert errors.get(testnode="flaky_node", error="RuntimeError") == 1
+    assert in_flight.get(testnode="flaky_node") == 0
+
+
+def test_track_context_manager_and_llm_tokens():
+    """컨텍스트 매니저와 LLM 토큰 카운터를 기록합니다."""
+    registry = get_registry()
+    with track("testbackend", backend="tavily", operation="search"):
+        pass
+    record_llm_tokens("test-model", {"input_tokens": 120, "output_tokens": 30})
+
+    text = registry.render()
+
+    assert 'ps_testbackend_duration_seconds_count{backend="tavily",operation="search"} 1' in text
+    assert 'ps_llm_tokens_total{model="test-model",type="input"} 120' in text
+    assert 'ps_llm_tokens_total{model="test-model",type="output"} 30' in text
+
+
+def test_cache_metrics_hit_ratio():
+    """캐시 통계를 요청 수와 적중률로 변환합니다."""
+    stats = {"retrieval": {"hits": 3, "misses": 1, "size": 2}}
+    collected = {name: samples for name, _, _, samples in cache_metrics(stats)}
+
+    assert collected["ps_cache_hit_ratio"] == [({"cache": "retrieval"}, 0.75)]
+    assert ({"cache": "retrieval", "result": "miss"}, 1) in collected["ps_cache_requests_total"]
+
+
+def test_cache_sources_render_as_one_family():
+    """여러 모듈이 등록한 캐시 통계는 cache 라벨로 구분되는 한 메트릭으로 출력됩니다."""
+    registry = MetricsRegistry()
+    registry.register_cache_source(lambda: {"retrieval": {"hits": 1, "misses": 1}})
+    registry.register_cache_source(lambda: {})
+    registry.register_cache_source(lambda: {"report": {"hits": 0, "misses": 2}})
+
+    text = registry.render()
+
+    assert text.count("# TYPE ps_cache_hit_ratio gauge") == 1
+    assert 'ps_cache_hit_ratio{cache="retrieval"} 0.5' in text
+    assert 'ps_cache_requests_total{cache="report",result="miss"} 2' in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint():
+    """/metrics는 Prometheus 텍스트 형식으로 응답합니다."""
+    from src.api.main import create_app
+    from src.graph.cache import get_retrieval_cache
+
+    get_retrieval_cache()
+    with track("node", node="search_node"):
+        pass
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'ps_node_duration_seconds_count{node="search_node"}' in response.text
+    assert 'ps_cache_hit_ratio{cache="retrieval"}' in response.text
@@ -0,0 +1,119 @@
+"""실행 프로파일링 테스트."""
+
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from config.settings import settings
+from src.utils.profiling import Profiler, ProfilerBusyError, top_functions
+
+
+def busy_loop(seconds: float) -> int:
+    total = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "profile_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    return tmp_path
+
+
+def test_profiler_writes_pstats_collapsed_and_summary(profile_dir):
+    """pstats, collapsed stack, 상위 함수 요약 파일을 저장합니다."""
+    with Profiler("stock AAPL", interval=0.001) as profiler:
+        busy_loop(0.1)
+
+    result = profiler.result
+    assert result.name == "stock_AAPL"
+    assert result.stats_path.parent == profile_dir
+    assert result.samples > 0
+
+    collapsed = result.collapsed_path.read_text(encoding="utf-8").splitlines()
+    stack, count = collapsed[0].rsplit(" ", 1)
+    assert "busy_loop (" in stack and int(count) > 0
+
+    assert "busy_loop" in result.summary_path.read_text(encoding="utf-8")
+    assert any("busy_loop" in func for func, *_ in top_functions(result.stats_path))
+
+
+def test_only_one_profile_at_a_time(profile_dir):
+    """동시에 두 번째 프로파일은 시작할 수 없습니다."""
+    with Profiler("first"):
+        with pytest.raises(ProfilerBusyError):
+            Profiler("second").start()
+
+    with Profiler("third") as profiler:
+        pass
+    assert profiler.result is not None
+
+
+@pytest.mark.asyncio
+async def test_api_profile_is_admin_only(profile_dir):
+    """?profile=1은 관리자 토큰이 있을 때만 프로파일을 저장합니다."""
+    from src.api.main import create_app
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        plain = await client.get("/health")
+        denied = await client.get("/health?profile=1")
+        profiled = await client.get("/health?profile=1", headers={"X-Admin-Token": "secret"})
+
+        profile_id = profiled.headers["X-Profile-Id"]
+        summary = await client.get(
+            f"/admin/profiles/{profile_id}", headers={"X-Admin-Token": "secret"}
+        )
+        listed = await client.get("/admin/profiles", headers={"X-Admin-Token": "secret"})
+        anonymous = await client.get(f"/admin/profiles/{profile_id}")
+
+    assert plain.status_code == 200 and "X-Profile-Id" not in plain.headers
+    assert denied.status_code == 403
+    assert profiled.status_code == 200
+    assert summary.status_code == 200 and "GET-_health" in summary.text
+    assert listed.json() == [profile_id]
+    assert anonymous.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_admin_token_with_non_ascii_header_is_rejected(profile_dir):
+    """ASCII가 아닌 관리자 토큰 헤더는 오류 없이 403으로 거부합니다."""
+    from src.api.main import create_app
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        headers = {"X-Admin-Token": "ÿsecret".encode("latin-1")}
+        response = await client.get("/admin/profiles", headers=headers)
+
+    assert response.status_code == 403
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_cli_profile_is_shown_after_output_only_on_success(profile_dir, monkeypatch, fail):
+    """--profile 요약은 명령 출력 뒤에 표시하고, 실패하면 표시하지 않습니다."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from typer.testing import CliRunner
+
+    import src.stock
+    from src.main import app
+
+    client = MagicMock()
+    client.get_prices = AsyncMock(
+        side_effect=RuntimeError("down") if fail else None, return_value=[]
+    )
+    monkeypatch.setattr(src.stock, "get_stock_client", lambda settings: client)
+
+    result = CliRunner().invoke(app, ["stock-price", "AAPL", "--profile"])
+
+    if fail:
+        assert result.exit_code == 1
+        assert "프로파일" not in result.output
+    else:
+        assert result.exit_code == 0
+        output = result.output
+        assert output.index("주가 데이터를 찾을 수 없습니다") < output.index("프로파일")
@@ -0,0 +1,129 @@
+"""요청 추적 테스트."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+import src.utils.tracing as tracing
+from src.utils.metrics import instrumented, track
+from src.utils.tracing import (
+    NOOP_SPAN,
+    InMemorySpanExporter,
+    OTLPSpanExporter,
+    Tracer,
+    current_span,
+    parse_traceparent,
+    start_span,
+)
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    """메모리 exporter를 가진 기본 tracer."""
+    exporter = InMemorySpanExporter()
+    monkeypatch.setattr(tracing, "_default_tracer", Tracer([exporter]))
+    return exporter
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_under_root(exporter):
+    """노드와 백엔드 호출 span은 루트 span 아래에 중첩됩니다."""
+
+    @instrumented("node")
+    async def search_node():
+        with track("backend", backend="tavily", operation="search") as tracked:
+            tracked.span.set_attribute("result_count", 3)
+
+    async with start_span("ps analyze", root=True, company="삼성전자"):
+        await search_node()
+
+    root, node, backend = exporter.get_finished_spans()
+
+    assert root.name == "ps analyze" and root.parent_id is None
+    assert node.name == "search_node" and node.parent_id == root.span_id
+    assert backend.name == "tavily.search" and backend.parent_id == node.span_id
+    assert backend.kind == "CLIENT"
+    assert backend.attributes["result_count"] == 3
+    assert {s.trace_id for s in (root, node, backend)} == {root.trace_id}
+    assert root.status == "OK"
+
+
+def test_no_span_without_root_or_exporter(exporter, monkeypatch):
+    """진행 중인 trace가 없거나 추적이 꺼져 있으면 no-op span을 사용합니다."""
+    with track("backend", backend="tavily", operation="search") as tracked:
+        assert tracked.span is NOOP_SPAN
+    assert exporter.spans == []
+
+    monkeypatch.setattr(tracing, "_default_tracer", Tracer())
+    with start_span("ps analyze", root=True) as span:
+        assert span is NOOP_SPAN
+        assert current_span() is NOOP_SPAN
+
+
+def test_error_status_and_traceparent_continuation(exporter):
+    """incoming traceparent를 이어받고 예외는 ERROR 상태로 기록합니다."""
+    header = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    assert parse_traceparent(header) == ("0af7651916cd43dd8448eb211c80319c", "b7ad6b7169203331")
+    assert parse_traceparent("invalid") is None
+
+    with pytest.raises(RuntimeError):
+        with start_span("GET /api/analyze", kind="SERVER", root=True, traceparent=header):
+            raise RuntimeError("실패")
+
+    (span,) = exporter.get_finished_spans()
+    assert span.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert span.parent_id == "b7ad6b7169203331"
+    assert span.status == "ERROR"
+    assert "RuntimeError" in span.status_message
+
+
+def test_otlp_payload_shape(exporter):
+    """OTLP/HTTP JSON 요청 본문 형식으로 변환합니다."""
+    with start_span("job analyze", root=True, job_id="abc", attempts=2, cached=True):
+        pass
+
+    payload = OTLPSpanExporter(service_name="test").payload(exporter.spans)
+    resource_spans = payload["resourceSpans"][0]
+    span = resource_spans["scopeSpans"][0]["spans"][0]
+
+    assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "test"}
+    assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+    assert span["status"] == {"code": 1}
+    assert {"key": "attempts", "value": {"intValue": "2"}} in span["attributes"]
+    assert {"key": "cached", "value": {"boolValue": True}} in span["attributes"]
+
+
+def test_otlp_flushes_on_local_root_with_remote_parent(monkeypatch):
+    """traceparent를 이어받은 루트 span이 끝나도 OTLP 버퍼를 전송합니다."""
+    otlp = OTLPSpanExporter()
+    sent = []
+    monkeypatch.setattr(otlp, "_send", lambda payload: sent.append(payload))
+    monkeypatch.setattr(tracing, "_default_tracer", Tracer([otlp]))
+    header = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+    with start_span("GET /api/analyze", kind="SERVER", root=True, traceparent=header):
+        with start_span("search_node"):
+            pass
+        assert otlp._buffer and sent == []
+    assert otlp._buffer == []  # 루트 span 종료 시 전송
+    otlp.shutdown()
+
+    (payload,) = sent
+    spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [s["name"] for s in spans] == ["search_node", "GET /api/analyze"]
+    assert spans[1]["parentSpanId"] == "b7ad6b7169203331"
+
+
+@pytest.mark.asyncio
+async def test_api_requests_are_traced(exporter):
+    """API 요청마다 SERVER 루트 span을 만들고 traceparent 헤더로 응답합니다."""
+    from src.api.main import create_app
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/health")
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "GET /health"
+    assert span.kind == "SERVER"
+    assert span.attributes["http.status_code"] == 200
+    assert response.headers["traceparent"] == span.traceparent()